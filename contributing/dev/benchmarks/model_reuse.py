@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measures model and client setup across the steps of a multi-agent run.
+
+A THINK Remix style pipeline of agents referring to their model by name runs
+through `Runner.run_async`. Model calls return canned responses without
+network access, but use the `api_client` of the model as `Gemini` does, so
+the benchmark counts the `google.genai.Client`s, and thereby the HTTP
+connection pools, created during the run:
+
+  python contributing/dev/benchmarks/model_reuse.py --steps 20
+
+`--per-call-models` restores the previous behavior of creating a model and a
+client for every LLM call, for comparison.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import os
+import time
+from typing import AsyncGenerator
+from unittest import mock
+
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.agents.sequential_agent import SequentialAgent
+from google.adk.models import google_llm
+from google.adk.models.google_llm import Gemini
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.models.registry import LLMRegistry
+from google.adk.runners import InMemoryRunner
+from google.genai import Client
+from google.genai import types
+
+
+async def _fake_generate_content_async(
+    self: Gemini, llm_request: LlmRequest, stream: bool = False
+) -> AsyncGenerator[LlmResponse, None]:
+  # Sending a request would need the client and its connection pool.
+  assert self.api_client is not None
+  yield LlmResponse(content=types.ModelContent("done"))
+
+
+async def run_benchmark(steps: int) -> dict[str, float]:
+  """Runs a pipeline of `steps` agents and returns setup metrics."""
+  pipeline = SequentialAgent(
+      name="think_remix",
+      sub_agents=[
+          LlmAgent(name=f"phase_{i}", model="gemini-2.5-flash")
+          for i in range(steps)
+      ],
+  )
+  runner = InMemoryRunner(agent=pipeline, app_name="benchmark")
+  session = await runner.session_service.create_session(
+      app_name="benchmark", user_id="user"
+  )
+
+  start = time.perf_counter()
+  async for _ in runner.run_async(
+      user_id="user",
+      session_id=session.id,
+      new_message=types.UserContent("Go"),
+  ):
+    pass
+  elapsed = time.perf_counter() - start
+  return {"seconds": elapsed, "ms_per_step": elapsed * 1000 / steps}
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument("--steps", type=int, default=20)
+  parser.add_argument(
+      "--per-call-models",
+      action="store_true",
+      help="Create a new model and client for every LLM call.",
+  )
+  args = parser.parse_args()
+  # Clients are created offline, the key is never sent.
+  os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+  created_clients = []
+  original_init = Client.__init__
+
+  def counting_init(self, *init_args, **init_kwargs):
+    created_clients.append(self)
+    original_init(self, *init_args, **init_kwargs)
+
+  with contextlib.ExitStack() as stack:
+    stack.enter_context(mock.patch.object(Client, "__init__", counting_init))
+    stack.enter_context(
+        mock.patch.object(
+            Gemini, "generate_content_async", _fake_generate_content_async
+        )
+    )
+    if args.per_call_models:
+      stack.enter_context(
+          mock.patch.object(LLMRegistry, "get_llm", LLMRegistry.new_llm)
+      )
+      stack.enter_context(
+          mock.patch.object(
+              google_llm,
+              "_get_shared_client",
+              lambda http_options: Client(http_options=http_options),
+          )
+      )
+    result = asyncio.run(run_benchmark(args.steps))
+
+  mode = "per-call models" if args.per_call_models else "shared models"
+  print(f"{args.steps} steps, {mode}:")
+  print(f"  clients_created: {len(created_clients)}")
+  for key, value in result.items():
+    print(f"  {key}: {value:,.2f}")
+
+
+if __name__ == "__main__":
+  main()
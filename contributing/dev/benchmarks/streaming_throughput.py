@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measures streamed tokens/sec through `Runner.run_async` in SSE mode.
+
+A fake model streams synthetic `GenerateContentResponse` chunks through
+`StreamingResponseAggregator`, as `Gemini` does, so the benchmark covers the
+aggregation, event creation and SSE serialization overhead of ADK itself:
+
+  python contributing/dev/benchmarks/streaming_throughput.py --chunks 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import AsyncGenerator
+
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.agents.run_config import RunConfig
+from google.adk.agents.run_config import StreamingMode
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.runners import InMemoryRunner
+from google.adk.utils.streaming_utils import event_to_sse
+from google.adk.utils.streaming_utils import StreamingResponseAggregator
+from google.genai import types
+
+
+class FakeStreamingLlm(BaseLlm):
+  """Streams a fixed number of synthetic text chunks."""
+
+  model: str = "fake-streaming"
+  num_chunks: int = 1000
+  tokens_per_chunk: int = 4
+
+  async def generate_content_async(
+      self, llm_request: LlmRequest, stream: bool = False
+  ) -> AsyncGenerator[LlmResponse, None]:
+    aggregator = StreamingResponseAggregator()
+    text = "tok " * self.tokens_per_chunk
+    usage_metadata = types.GenerateContentResponseUsageMetadata(
+        prompt_token_count=10, candidates_token_count=self.tokens_per_chunk
+    )
+    for i in range(self.num_chunks):
+      last = i == self.num_chunks - 1
+      response = types.GenerateContentResponse(
+          candidates=[
+              types.Candidate(
+                  content=types.ModelContent(text),
+                  finish_reason=types.FinishReason.STOP if last else None,
+              )
+          ],
+          usage_metadata=usage_metadata,
+      )
+      async for llm_response in aggregator.process_response(response):
+        yield llm_response
+    if (close_result := aggregator.close()) is not None:
+      yield close_result
+
+
+async def run_benchmark(
+    num_chunks: int, tokens_per_chunk: int, sse: bool
+) -> dict[str, float]:
+  """Streams one model response and returns throughput metrics."""
+  agent = LlmAgent(
+      name="benchmark_agent",
+      model=FakeStreamingLlm(
+          num_chunks=num_chunks, tokens_per_chunk=tokens_per_chunk
+      ),
+  )
+  runner = InMemoryRunner(agent=agent, app_name="benchmark")
+  session = await runner.session_service.create_session(
+      app_name="benchmark", user_id="user"
+  )
+
+  num_partial_events = 0
+  num_sse_bytes = 0
+  start = time.perf_counter()
+  async for event in runner.run_async(
+      user_id="user",
+      session_id=session.id,
+      new_message=types.UserContent("Go"),
+      run_config=RunConfig(streaming_mode=StreamingMode.SSE),
+  ):
+    if event.partial:
+      num_partial_events += 1
+    if sse:
+      num_sse_bytes += len(event_to_sse(event))
+  elapsed = time.perf_counter() - start
+
+  return {
+      "partial_events": num_partial_events,
+      "seconds": elapsed,
+      "tokens_per_second": num_chunks * tokens_per_chunk / elapsed,
+      "events_per_second": num_partial_events / elapsed,
+      "sse_bytes": num_sse_bytes,
+  }
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument("--chunks", type=int, default=2000)
+  parser.add_argument("--tokens-per-chunk", type=int, default=4)
+  parser.add_argument("--repeat", type=int, default=3)
+  parser.add_argument(
+      "--no-sse",
+      action="store_true",
+      help="Skip serializing events as the SSE endpoint does.",
+  )
+  args = parser.parse_args()
+
+  results = [
+      asyncio.run(
+          run_benchmark(args.chunks, args.tokens_per_chunk, not args.no_sse)
+      )
+      for _ in range(args.repeat)
+  ]
+  best = max(results, key=lambda result: result["tokens_per_second"])
+  print(
+      f"{args.chunks} chunks x {args.tokens_per_chunk} tokens, best of"
+      f" {args.repeat}:"
+  )
+  for key, value in best.items():
+    print(f"  {key}: {value:,.1f}")
+
+
+if __name__ == "__main__":
+  main()
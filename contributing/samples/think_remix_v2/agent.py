@@ -32,6 +32,7 @@ from google.adk.tools.tool_context import ToolContext
 from google.genai import types
 
 from .config_loader import get_config
+from .evidence_cache import get_evidence_cache
 from .perplexity_tool import perplexity_search_tool
 from .state_compat import bootstrap_known_state_classes
 from .state_compat import ensure_state_mapping_methods
@@ -184,6 +185,13 @@ def _validate_credibility_score(
   return credibility
 
 
+def _get_content_text(content: Optional[types.Content]) -> str:
+  """Returns the text of a content, e.g. the user's question."""
+  if not content or not content.parts:
+    return ''
+  return ''.join(part.text for part in content.parts if part.text)
+
+
 @tool
 def register_evidence(
     statement: str,
@@ -307,6 +315,13 @@ def register_evidence(
     logger.info('Successfully registered evidence: %s (credibility: %.2f)',
                 fact_id, stored['credibility_score'])
 
+    cache = get_evidence_cache()
+    if cache is not None:
+      cache.put_fact(
+          _get_content_text(getattr(tool_context, 'user_content', None)),
+          stored,
+      )
+
     return stored
   except (ValueError, TypeError, AttributeError, KeyError, RuntimeError) as e:
     # Handle expected errors
@@ -1066,6 +1081,8 @@ def _build_conduct_research_instruction() -> str:
       - IMPORTANT: Keep searches focused due to API rate limits.
         The system automatically handles rate limiting between requests.
       - Each finding must register via register_evidence with research_track tag.
+      - If a CACHED EVIDENCE note lists facts preloaded from earlier research,
+        cite their fact ids and skip searches those facts already answer.
       - Report disconfirmatory_ratio (facts tagged disconfirmatory ÷ total).
       """
   ).strip()
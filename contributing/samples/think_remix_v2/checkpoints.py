@@ -0,0 +1,263 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Checkpoints of workflow nodes, so that re-runs skip finished work.
+
+When a node of the workflow graph finishes, the state it wrote and a hash of
+its inputs are stored under `workflow_checkpoints:<node>` in session state,
+which the session service persists. Each node has its own key, so an event
+only carries the checkpoint of the node that finished. The input hash of a
+node covers the question and the output hashes of the nodes that produced
+the keys it reads in this run, so a node whose output changes invalidates
+the nodes downstream of it.
+When the workflow runs again in the same session, a completed node whose
+input hash is unchanged is restored from its checkpoint instead of running.
+"""
+
+from __future__ import annotations
+
+import copy
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import fields
+from dataclasses import replace
+from datetime import datetime
+from datetime import timezone
+import hashlib
+import json
+import logging
+import time
+from typing import Any
+from typing import AsyncGenerator
+from typing import Mapping
+from typing import Optional
+
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events.event import Event
+from google.adk.events.event_actions import EventActions
+from google.adk.sessions.state import State
+from google.adk.utils.context_utils import Aclosing
+
+from .workflow_graph import WorkflowGraph
+from .workflow_graph import WorkflowNode
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_KEY_PREFIX = 'workflow_checkpoints:'
+
+# Keys shared by every node; restoring an older value would drop entries
+# written by other nodes.
+_SHARED_KEYS = frozenset({
+    'workflow_audit_trail',
+    'workflow_critical_path',
+    'evidence_cache_stats',
+})
+
+
+def checkpoint_key(node_name: str) -> str:
+  """Returns the state key of the checkpoint of a node."""
+  return f'{CHECKPOINT_KEY_PREFIX}{node_name}'
+
+
+def fingerprint(value: Any) -> str:
+  """Returns a stable hash of a JSON-like value."""
+  encoded = json.dumps(
+      value, sort_keys=True, separators=(',', ':'), default=str
+  )
+  return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+@dataclass(frozen=True)
+class PhaseCheckpoint:
+  """The outcome of a workflow node in the run that last ran it."""
+
+  node: str
+  phase: str
+  status: str
+  """Either 'completed' or 'failed'; only completed nodes are restored."""
+  input_hash: str
+  output_hash: str
+  """Hash of the keys the node declares it writes, except the shared ones."""
+  outputs: dict[str, Any]
+  """Every key the node wrote, as it was when the node finished."""
+  duration_seconds: float
+  invocation_id: str
+  updated_at: str
+  error: Optional[str] = None
+
+  def to_dict(self) -> dict[str, Any]:
+    return asdict(self)
+
+  @classmethod
+  def from_dict(cls, data: Any) -> Optional[PhaseCheckpoint]:
+    """Returns the checkpoint stored in state, or None if it is malformed."""
+    if not isinstance(data, Mapping):
+      return None
+    try:
+      return cls(**{
+          field_info.name: data[field_info.name]
+          for field_info in fields(cls)
+          if field_info.name in data
+      })
+    except TypeError:
+      return None
+
+
+class PhaseCheckpointer:
+  """Checkpoints the nodes of a workflow graph and restores unchanged ones.
+
+  Use `graph` in place of the original graph: its nodes record a checkpoint
+  when they finish, whether or not they failed, and are restored by the
+  scheduler if their last checkpoint completed with the same input hash.
+  """
+
+  def __init__(
+      self,
+      graph: WorkflowGraph,
+      state: Mapping[str, Any],
+      question: str,
+      author: str,
+  ):
+    self._question = question
+    self._author = author
+    self._checkpoints: dict[str, Any] = {
+        node.name: state.get(checkpoint_key(node.name)) for node in graph.nodes
+    }
+    self._output_hashes: dict[str, str] = {}
+    self.restored: dict[str, PhaseCheckpoint] = {}
+    """The checkpoints restored in this run, by node name."""
+
+    self._producers: dict[str, dict[str, Optional[str]]] = {}
+    last_writer: dict[str, str] = {}
+    for node in graph.nodes:
+      self._producers[node.name] = {
+          key: last_writer.get(key) for key in node.reads
+      }
+      for key in node.writes:
+        last_writer[key] = node.name
+    self.graph = WorkflowGraph([
+        replace(
+            node,
+            run=self._checkpointed_runner(node),
+            restore=self._restorer(node),
+        )
+        for node in graph.nodes
+    ])
+
+  def input_hash(self, node: WorkflowNode) -> str:
+    """Returns the hash of the question and of the inputs of a node.
+
+    An input is identified by the output hash of the node that produced it
+    in this run, or None if no node did.
+    """
+    return fingerprint({
+        'question': self._question,
+        'node': node.name,
+        'inputs': {
+            key: self._output_hashes.get(producer) if producer else None
+            for key, producer in self._producers[node.name].items()
+        },
+    })
+
+  def _restorer(self, node: WorkflowNode):
+    def restore(ctx: InvocationContext) -> Optional[Event]:
+      checkpoint = PhaseCheckpoint.from_dict(self._checkpoints.get(node.name))
+      if checkpoint is None or checkpoint.status != 'completed':
+        return None
+      if checkpoint.input_hash != self.input_hash(node):
+        logger.info('Checkpoint of node %s is invalidated', node.name)
+        return None
+      self._output_hashes[node.name] = checkpoint.output_hash
+      self.restored[node.name] = checkpoint
+      return Event(
+          invocation_id=ctx.invocation_id,
+          author=self._author,
+          branch=ctx.branch,
+          actions=EventActions(
+              state_delta=copy.deepcopy(checkpoint.outputs)
+          ),
+      )
+
+    return restore
+
+  def _checkpointed_runner(self, node: WorkflowNode):
+    async def run(ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+      input_hash = self.input_hash(node)
+      written = set(node.writes)
+      started_at = time.perf_counter()
+      error = None
+      try:
+        async with Aclosing(node.run(ctx)) as agen:
+          async for event in agen:
+            if event.actions and event.actions.state_delta:
+              written.update(event.actions.state_delta)
+            yield event
+      except Exception as e:  # pylint: disable=broad-exception-caught
+        error = e
+      yield self._record(
+          ctx,
+          node,
+          input_hash,
+          written,
+          time.perf_counter() - started_at,
+          error,
+      )
+      if error is not None:
+        raise error
+
+    return run
+
+  def _record(
+      self,
+      ctx: InvocationContext,
+      node: WorkflowNode,
+      input_hash: str,
+      written: set[str],
+      duration_seconds: float,
+      error: Optional[Exception],
+  ) -> Event:
+    """Returns the event storing the checkpoint of a finished node."""
+    state = ctx.session.state
+    checkpoint = PhaseCheckpoint(
+        node=node.name,
+        phase=node.phase,
+        status='failed' if error is not None else 'completed',
+        input_hash=input_hash,
+        output_hash=fingerprint({
+            key: state.get(key)
+            for key in node.writes
+            if key not in _SHARED_KEYS
+        }),
+        outputs={
+            key: copy.deepcopy(state[key])
+            for key in sorted(written)
+            if key not in _SHARED_KEYS
+            and not key.startswith((CHECKPOINT_KEY_PREFIX, State.TEMP_PREFIX))
+            and key in state
+        },
+        duration_seconds=round(duration_seconds, 3),
+        invocation_id=ctx.invocation_id,
+        updated_at=datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        error=str(error) if error is not None else None,
+    )
+    self._output_hashes[node.name] = checkpoint.output_hash
+    self._checkpoints[node.name] = checkpoint.to_dict()
+    return Event(
+        invocation_id=ctx.invocation_id,
+        author=self._author,
+        branch=ctx.branch,
+        actions=EventActions(
+            state_delta={checkpoint_key(node.name): checkpoint.to_dict()}
+        ),
+    )
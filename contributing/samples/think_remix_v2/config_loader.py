@@ -42,6 +42,8 @@ DEFAULT_CONFIG = {
             'moderate_count': 5,
             'complex_count': 7,
             'max_allocator_attempts': 3,
+            'local_divergence_scoring': True,
+            'llm_divergence_validation': False,
         },
         'validation': {
             'max_persona_validator_attempts': 3,
@@ -55,6 +57,12 @@ DEFAULT_CONFIG = {
             'early_termination_confidence_threshold': 0.80,
             'enable_caching': False,
             'cache_ttl_hours': 24,
+            'cache_path': '~/.cache/think_remix_v2/evidence_cache.sqlite3',
+            'enable_checkpoints': True,
+            'max_concurrent_nodes': 4,
+            'node_concurrency_limits': {
+                'search': 1,
+            },
         },
         'source_credibility_scores': {
             'primary': 0.95,
@@ -146,6 +154,15 @@ class Config:
     assert allocation['moderate_count'] >= 5, 'moderate_count must be at least 5'
     assert allocation['complex_count'] >= 7, 'complex_count must be at least 7'
     
+    optimization = self._config['workflow']['optimization']
+    assert 0.0 <= optimization['early_termination_convergence_threshold'] <= 1.0, (
+        'early_termination_convergence_threshold must be between 0.0 and 1.0'
+    )
+    assert 0.0 <= optimization['early_termination_confidence_threshold'] <= 1.0, (
+        'early_termination_confidence_threshold must be between 0.0 and 1.0'
+    )
+    assert optimization['cache_ttl_hours'] > 0, 'cache_ttl_hours must be > 0'
+    
     # Validate validation settings
     validation = self._config['workflow']['validation']
     assert validation['max_persona_validator_attempts'] > 0, (
@@ -202,6 +219,16 @@ class Config:
     """Minimum null coverage (must be 1.0)."""
     return self.get('workflow.thresholds.null_coverage_min', 1.00)
 
+  @property
+  def local_persona_divergence_scoring(self) -> bool:
+    """Whether to score persona divergence locally before any LLM validation."""
+    return self.get('workflow.persona_allocation.local_divergence_scoring', True)
+
+  @property
+  def llm_persona_validation(self) -> bool:
+    """Whether the LLM validator also checks personas approved locally."""
+    return self.get('workflow.persona_allocation.llm_divergence_validation', False)
+
   @property
   def max_persona_validator_attempts(self) -> int:
     """Maximum attempts for persona validator loop."""
@@ -227,6 +254,55 @@ class Config:
     """Whether to enable early termination."""
     return self.get('workflow.optimization.enable_early_termination', False)
 
+  @property
+  def early_termination_convergence_threshold(self) -> float:
+    """Minimum share of personas agreeing on a conclusion to terminate early."""
+    return self.get(
+        'workflow.optimization.early_termination_convergence_threshold', 0.85
+    )
+
+  @property
+  def early_termination_confidence_threshold(self) -> float:
+    """Minimum mean confidence of the agreeing personas to terminate early."""
+    return self.get(
+        'workflow.optimization.early_termination_confidence_threshold', 0.80
+    )
+
+  @property
+  def enable_caching(self) -> bool:
+    """Whether to cache search results and CER facts across runs."""
+    return self.get('workflow.optimization.enable_caching', False)
+
+  @property
+  def cache_ttl_hours(self) -> float:
+    """Hours after which cached search results and CER facts expire."""
+    return self.get('workflow.optimization.cache_ttl_hours', 24)
+
+  @property
+  def cache_path(self) -> str:
+    """Path of the SQLite database of the evidence cache."""
+    return self.get(
+        'workflow.optimization.cache_path',
+        '~/.cache/think_remix_v2/evidence_cache.sqlite3',
+    )
+
+  @property
+  def enable_checkpoints(self) -> bool:
+    """Whether re-runs in a session restore unchanged workflow nodes."""
+    return self.get('workflow.optimization.enable_checkpoints', True)
+
+  @property
+  def max_concurrent_nodes(self) -> int:
+    """Maximum number of workflow nodes running at the same time."""
+    return self.get('workflow.optimization.max_concurrent_nodes', 4)
+
+  @property
+  def node_concurrency_limits(self) -> dict[str, int]:
+    """Maximum number of running workflow nodes per concurrency group."""
+    return self.get('workflow.optimization.node_concurrency_limits', {
+        'search': 1,
+    })
+
   @property
   def source_credibility_scores(self) -> dict[str, float]:
     """Source credibility scores by type."""
@@ -0,0 +1,267 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Persistent cache of search results and CER facts across THINK Remix runs."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import fields
+from dataclasses import replace
+import json
+import logging
+from pathlib import Path
+import re
+import sqlite3
+import threading
+import time
+from typing import Any
+from typing import Mapping
+from typing import Optional
+from urllib.parse import parse_qsl
+from urllib.parse import urlencode
+from urllib.parse import urlsplit
+from urllib.parse import urlunsplit
+
+from .config_loader import get_config
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS searches (
+  query_key TEXT PRIMARY KEY,
+  response TEXT NOT NULL,
+  latency_seconds REAL NOT NULL,
+  cached_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS facts (
+  query_key TEXT NOT NULL,
+  source_key TEXT NOT NULL,
+  statement TEXT NOT NULL,
+  credibility_score REAL NOT NULL,
+  fact TEXT NOT NULL,
+  cached_at REAL NOT NULL,
+  PRIMARY KEY (query_key, source_key, statement)
+);
+"""
+
+
+def normalize_query(query: str) -> str:
+  """Normalizes a query so that trivially different queries share a key.
+
+  Only case, punctuation and whitespace are ignored: the words and their
+  order, such as "who" or "will" in a question, can change its meaning.
+  """
+  return ' '.join(re.findall(r'[a-z0-9]+', query.lower()))
+
+
+def _search_key(query: str, max_results: Optional[int]) -> str:
+  return json.dumps([normalize_query(query), max_results])
+
+
+def normalize_source_url(url: str) -> str:
+  """Normalizes a source URL so that links to the same page share a key."""
+  url = url.strip()
+  if '://' not in url:
+    url = f'https://{url}'
+  parts = urlsplit(url)
+  if not parts.netloc:
+    return url.lower()
+  host = parts.netloc.lower()
+  if host.startswith('www.'):
+    host = host[len('www.'):]
+  query = urlencode(
+      sorted(
+          (key, value)
+          for key, value in parse_qsl(parts.query)
+          if not key.lower().startswith('utm_')
+      )
+  )
+  path = parts.path.rstrip('/')
+  return urlunsplit(('https', host, path, query, ''))
+
+
+@dataclass
+class EvidenceCacheStats:
+  """Counters of the evidence cache since it was opened.
+
+  The cache is shared by the runs of a process; use `snapshot` and `since`
+  to count the activity of a single run.
+  """
+
+  search_hits: int = 0
+  search_misses: int = 0
+  preloaded_facts: int = 0
+  saved_latency_seconds: float = 0.0
+  """Latency of the original searches that cache hits replaced."""
+
+  def snapshot(self) -> EvidenceCacheStats:
+    """Returns a copy of the counters as they are now."""
+    return replace(self)
+
+  def since(self, snapshot: EvidenceCacheStats) -> EvidenceCacheStats:
+    """Returns the counts added since a snapshot was taken."""
+    return EvidenceCacheStats(**{
+        field_info.name: getattr(self, field_info.name)
+        - getattr(snapshot, field_info.name)
+        for field_info in fields(self)
+    })
+
+  def to_dict(self) -> dict[str, Any]:
+    result = asdict(self)
+    result['saved_latency_seconds'] = round(self.saved_latency_seconds, 3)
+    return result
+
+
+class EvidenceCache:
+  """Caches search results by query and CER facts by question and source.
+
+  Entries older than the TTL are ignored and purged when the cache is
+  opened. Errors of the underlying SQLite database are logged and treated as
+  cache misses, so the cache never fails a run.
+  """
+
+  def __init__(self, path: str | Path, ttl_hours: float):
+    self._path = Path(path).expanduser()
+    self._ttl_seconds = ttl_hours * 3600
+    self._lock = threading.Lock()
+    self.stats = EvidenceCacheStats()
+    self._path.parent.mkdir(parents=True, exist_ok=True)
+    self._connection = sqlite3.connect(
+        str(self._path), check_same_thread=False
+    )
+    with self._lock, self._connection:
+      self._connection.executescript(_SCHEMA)
+    self.purge_expired()
+
+  def _oldest_valid(self) -> float:
+    return time.time() - self._ttl_seconds
+
+  def purge_expired(self) -> int:
+    """Deletes the expired entries and returns how many were deleted."""
+    try:
+      with self._lock, self._connection:
+        deleted = 0
+        for table in ('searches', 'facts'):
+          deleted += self._connection.execute(
+              f'DELETE FROM {table} WHERE cached_at < ?',
+              (self._oldest_valid(),),
+          ).rowcount
+    except sqlite3.Error as e:
+      logger.warning('Could not purge evidence cache %s: %s', self._path, e)
+      return 0
+    if deleted:
+      logger.info('Purged %d expired evidence cache entries', deleted)
+    return deleted
+
+  def get_search(
+      self, query: str, max_results: Optional[int] = None
+  ) -> Optional[dict[str, Any]]:
+    """Returns the cached response of a search, or None."""
+    try:
+      with self._lock:
+        row = self._connection.execute(
+            'SELECT response, latency_seconds FROM searches'
+            ' WHERE query_key = ? AND cached_at >= ?',
+            (_search_key(query, max_results), self._oldest_valid()),
+        ).fetchone()
+    except sqlite3.Error as e:
+      logger.warning('Could not read evidence cache %s: %s', self._path, e)
+      row = None
+    if row is None:
+      self.stats.search_misses += 1
+      return None
+    self.stats.search_hits += 1
+    self.stats.saved_latency_seconds += row[1]
+    return json.loads(row[0])
+
+  def put_search(
+      self,
+      query: str,
+      response: Mapping[str, Any],
+      latency_seconds: float,
+      max_results: Optional[int] = None,
+  ) -> None:
+    """Caches the response of a search and how long it took."""
+    try:
+      with self._lock, self._connection:
+        self._connection.execute(
+            'INSERT OR REPLACE INTO searches VALUES (?, ?, ?, ?)',
+            (
+                _search_key(query, max_results),
+                json.dumps(response),
+                latency_seconds,
+                time.time(),
+            ),
+        )
+    except sqlite3.Error as e:
+      logger.warning('Could not write evidence cache %s: %s', self._path, e)
+
+  def put_fact(self, question: str, fact: Mapping[str, Any]) -> None:
+    """Caches a CER fact registered while researching a question."""
+    try:
+      with self._lock, self._connection:
+        self._connection.execute(
+            'INSERT OR REPLACE INTO facts VALUES (?, ?, ?, ?, ?, ?)',
+            (
+                normalize_query(question),
+                normalize_source_url(str(fact.get('source', ''))),
+                str(fact.get('statement', '')),
+                float(fact.get('credibility_score', 0.0)),
+                json.dumps(fact),
+                time.time(),
+            ),
+        )
+    except sqlite3.Error as e:
+      logger.warning('Could not write evidence cache %s: %s', self._path, e)
+
+  def get_facts(
+      self, question: str, min_credibility: float = 0.0
+  ) -> list[dict[str, Any]]:
+    """Returns the cached facts of a question, oldest first."""
+    try:
+      with self._lock:
+        rows = self._connection.execute(
+            'SELECT fact FROM facts WHERE query_key = ? AND cached_at >= ?'
+            ' AND credibility_score >= ? ORDER BY cached_at',
+            (normalize_query(question), self._oldest_valid(), min_credibility),
+        ).fetchall()
+    except sqlite3.Error as e:
+      logger.warning('Could not read evidence cache %s: %s', self._path, e)
+      return []
+    return [json.loads(row[0]) for row in rows]
+
+  def close(self) -> None:
+    with self._lock:
+      self._connection.close()
+
+
+# Global cache instance
+_cache_instance: Optional[EvidenceCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_evidence_cache() -> Optional[EvidenceCache]:
+  """Returns the evidence cache, or None if caching is disabled."""
+  global _cache_instance
+  config = get_config()
+  if not config.enable_caching:
+    return None
+  with _cache_lock:
+    if _cache_instance is None:
+      _cache_instance = EvidenceCache(
+          config.cache_path, config.cache_ttl_hours
+      )
+  return _cache_instance
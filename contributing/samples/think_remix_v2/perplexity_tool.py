@@ -27,6 +27,7 @@ import requests
 from google.adk.tools.function_tool import FunctionTool
 
 from .config_loader import get_config
+from .evidence_cache import get_evidence_cache
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +63,14 @@ def brave_search(
     # If config loading fails, use function defaults
     logger.warning('Failed to load search config, using defaults: %s', e)
   
+  cache = get_evidence_cache()
+  if cache is not None:
+    cached_response = cache.get_search(query, max_results)
+    if cached_response is not None:
+      logger.info('Evidence cache hit for Brave query: %s', query)
+      return {**cached_response, 'cached': True}
+  started = time.perf_counter()
+  
   api_key = os.getenv('BRAVE_API_KEY')
   if not api_key:
     raise ValueError(
@@ -180,12 +189,18 @@ def brave_search(
       logger.warning('Brave API response missing web.results: %s', list(data.keys()) if isinstance(data, dict) else 'not a dict')
     
     # Ensure we return at least an empty results list
-    return {
+    search_response = {
         'results': results[:max_results],
         'total_results': len(results),
         'query': query,
         'source': 'brave',
     }
+    if cache is not None:
+      # Includes any rate limiting delay, which a cache hit also avoids
+      cache.put_search(
+          query, search_response, time.perf_counter() - started, max_results
+      )
+    return search_response
       
   except requests.HTTPError as e:
     logger.error('Brave API request failed: %s', e)
@@ -3,8 +3,13 @@
 from __future__ import annotations
 
 from collections import Counter
+from dataclasses import asdict
+from dataclasses import dataclass
+import re
+from typing import Any
 from typing import Iterable
 from typing import Mapping
+from typing import Optional
 from typing import Sequence
 
 
@@ -71,3 +76,158 @@ def find_ignored_high_credibility_facts(
 
   return high_credibility_facts
 
+
+@dataclass(frozen=True)
+class ConvergenceAssessment:
+  """How strongly the persona analyses agree on a conclusion."""
+
+  persona_count: int
+  agreeing_persona_ids: tuple[str, ...]
+  consensus_answer: Optional[str]
+  convergence_score: float
+  """Share of personas whose answer agrees with the consensus answer."""
+  mean_confidence: float
+  """Mean confidence, between 0 and 1, of the agreeing personas."""
+  converged: bool
+
+  def to_dict(self) -> dict[str, Any]:
+    result = asdict(self)
+    result['agreeing_persona_ids'] = list(self.agreeing_persona_ids)
+    return result
+
+
+_NEGATIONS = frozenset(
+    {'not', 'no', 'never', 'none', 'nothing', 'neither', 'nor', 'cannot'}
+)
+
+
+def _answer_words(answer: str) -> list[str]:
+  # Contractions such as "won't" are negations as well.
+  return re.findall(r'[a-z0-9]+', re.sub(r"n['’]t\b", ' not', answer.lower()))
+
+
+def _answer_stance(words: Sequence[str]) -> bool:
+  """Returns whether an answer affirms, rather than denies, its claim.
+
+  A leading "yes" or "no" gives the stance of the answer, as the rest of it
+  restates the answer. Otherwise an odd number of negations denies it.
+  """
+  if words and words[0] in ('yes', 'no'):
+    return words[0] == 'yes'
+  return sum(word in _NEGATIONS for word in words) % 2 == 0
+
+
+def _answers_agree(
+    answer: tuple[frozenset[str], bool],
+    other_answer: tuple[frozenset[str], bool],
+    similarity_threshold: float,
+) -> bool:
+  (tokens, stance), (other_tokens, other_stance) = answer, other_answer
+  if not tokens or not other_tokens or stance != other_stance:
+    return False
+  similarity = len(tokens & other_tokens) / len(tokens | other_tokens)
+  return similarity >= similarity_threshold
+
+
+def _normalize_confidences(confidences: list[object]) -> list[float]:
+  """Scales the reported confidences of a set of answers to fractions.
+
+  Personas report percentages, but fractions are accepted as well. The scale
+  is decided for the whole set, so a confidence of 1 means 1% next to
+  percentages and 100% next to fractions: the set is read as fractions only
+  if every confidence is at most 1 and one of them is not a whole number.
+  """
+  values = [
+      float(confidence) if isinstance(confidence, (int, float)) else None
+      for confidence in confidences
+  ]
+  reported = [value for value in values if value is not None]
+  is_fraction = all(value <= 1 for value in reported) and any(
+      not value.is_integer() for value in reported
+  )
+  scale = 1.0 if is_fraction else 100.0
+  return [
+      min(max(value / scale, 0.0), 1.0) if value is not None else 0.0
+      for value in values
+  ]
+
+
+def evaluate_persona_convergence(
+    persona_analyses: Iterable[Mapping[str, object]],
+    *,
+    convergence_threshold: float,
+    confidence_threshold: float,
+    answer_similarity_threshold: float = 0.5,
+) -> ConvergenceAssessment:
+  """Scores how strongly persona conclusions agree.
+
+  Two answers agree when they take the same stance, affirming or denying
+  their claim, and the Jaccard similarity of their word sets reaches
+  `answer_similarity_threshold`. The consensus answer is the one most other
+  answers agree with; personas without a conclusion never agree.
+
+  Args:
+    persona_analyses: Persona analysis payloads in the standardized judgment
+      schema.
+    convergence_threshold: Minimum share of personas agreeing with the
+      consensus answer.
+    confidence_threshold: Minimum mean confidence, between 0 and 1, of the
+      agreeing personas.
+    answer_similarity_threshold: Minimum word overlap of agreeing answers.
+
+  Returns:
+    The assessment; `converged` is set if both thresholds are met by at least
+    two personas.
+  """
+  answers = []
+  confidences = []
+  for analysis in persona_analyses:
+    conclusion = analysis.get('conclusion')
+    if not isinstance(conclusion, Mapping):
+      conclusion = {}
+    answer = conclusion.get('answer')
+    words = _answer_words(answer) if isinstance(answer, str) else []
+    answers.append((
+        str(analysis.get('persona_id', '')),
+        answer if isinstance(answer, str) else '',
+        (frozenset(words), _answer_stance(words)),
+    ))
+    confidences.append(conclusion.get('confidence_percentage'))
+  conclusions = [
+      (*answer, confidence)
+      for answer, confidence in zip(
+          answers, _normalize_confidences(confidences)
+      )
+  ]
+
+  consensus_answer = None
+  agreeing: list[tuple[str, str, tuple[frozenset[str], bool], float]] = []
+  for _, answer, words, _ in conclusions:
+    group = [
+        other
+        for other in conclusions
+        if _answers_agree(words, other[2], answer_similarity_threshold)
+    ]
+    if len(group) > len(agreeing):
+      consensus_answer = answer
+      agreeing = group
+
+  persona_count = len(conclusions)
+  convergence_score = len(agreeing) / persona_count if persona_count else 0.0
+  mean_confidence = (
+      sum(confidence for *_, confidence in agreeing) / len(agreeing)
+      if agreeing
+      else 0.0
+  )
+  return ConvergenceAssessment(
+      persona_count=persona_count,
+      agreeing_persona_ids=tuple(persona_id for persona_id, *_ in agreeing),
+      consensus_answer=consensus_answer,
+      convergence_score=round(convergence_score, 4),
+      mean_confidence=round(mean_confidence, 4),
+      converged=(
+          len(agreeing) >= 2
+          and convergence_score >= convergence_threshold
+          and mean_confidence >= confidence_threshold
+      ),
+  )
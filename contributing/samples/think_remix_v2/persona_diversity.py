@@ -0,0 +1,216 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Local scoring of the cognitive distance between allocated personas.
+
+Personas are compared along three dimensions, each vectorized with TF-IDF
+over the allocated personas: their framework, their assumptions and their
+priorities. The pairwise similarity of two personas is the mean cosine
+similarity of their dimensions.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import re
+from typing import Any
+from typing import Mapping
+from typing import Sequence
+
+import numpy as np
+
+PERSONA_DIMENSIONS: dict[str, tuple[str, ...]] = {
+    'framework': ('epistemological_framework', 'analytical_focus'),
+    'assumptions': ('worldview', 'guiding_question'),
+    'priorities': (
+        'evidence_lens',
+        'time_horizon',
+        'risk_orientation',
+        'diversity_tags',
+    ),
+}
+"""The persona config fields making up each compared dimension."""
+
+_STOPWORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in',
+    'is', 'it', 'of', 'on', 'or', 'that', 'the', 'to', 'what', 'which',
+    'with',
+})
+
+
+def _tokens(persona: Mapping[str, Any], fields: tuple[str, ...]) -> list[str]:
+  text = []
+  for field_name in fields:
+    value = persona.get(field_name)
+    if isinstance(value, (list, tuple)):
+      text.extend(str(item) for item in value)
+    elif value is not None:
+      text.append(str(value))
+  return [
+      token
+      for token in re.findall(r'[a-z0-9]+', ' '.join(text).lower())
+      if token not in _STOPWORDS
+  ]
+
+
+def _tfidf_vectors(documents: list[list[str]]) -> np.ndarray:
+  """Returns the L2-normalized TF-IDF vectors of tokenized documents."""
+  vocabulary = {
+      token: column
+      for column, token in enumerate(sorted({t for d in documents for t in d}))
+  }
+  counts = np.zeros((len(documents), len(vocabulary)))
+  for row, document in enumerate(documents):
+    for token in document:
+      counts[row, vocabulary[token]] += 1
+  document_frequency = np.count_nonzero(counts, axis=0)
+  idf = np.log((1 + len(documents)) / (1 + document_frequency)) + 1
+  weights = counts * idf
+  norms = np.linalg.norm(weights, axis=1, keepdims=True)
+  return np.divide(weights, norms, out=np.zeros_like(weights), where=norms > 0)
+
+
+@dataclass(frozen=True)
+class PersonaDiversityReport:
+  """The pairwise similarity of personas and the diversity checks."""
+
+  persona_ids: tuple[str, ...]
+  similarity: np.ndarray
+  """The (personas x personas) combined similarity matrix."""
+  dimension_similarity: dict[str, np.ndarray]
+  """The similarity matrix of each dimension."""
+  similarity_max: float
+  diversity_checks: dict[str, bool]
+  shared_frameworks: dict[str, tuple[str, ...]]
+  """The ids of the personas sharing each framework used more than once."""
+
+  @property
+  def max_similarity(self) -> float:
+    """The similarity of the most similar pair of personas."""
+    pairs = self.similarity[np.triu_indices(len(self.persona_ids), k=1)]
+    return float(pairs.max()) if pairs.size else 0.0
+
+  @property
+  def redundant_pairs(self) -> list[tuple[int, int]]:
+    """Index pairs of personas at least as similar as the maximum."""
+    rows, columns = np.nonzero(
+        np.triu(self.similarity >= self.similarity_max, k=1)
+    )
+    return list(zip(rows.tolist(), columns.tolist()))
+
+  @property
+  def approved(self) -> bool:
+    return not self.redundant_pairs and self.diversity_checks[
+        'unique_frameworks'
+    ]
+
+  def to_validation(self) -> dict[str, Any]:
+    """Returns the report as a `persona_validation` output."""
+    matrix = []
+    for i in range(len(self.persona_ids)):
+      for j in range(i + 1, len(self.persona_ids)):
+        matrix.append({
+            'pair': [self.persona_ids[i], self.persona_ids[j]],
+            'similarity': round(float(self.similarity[i, j]), 4),
+            'overlap_dimensions': [
+                dimension
+                for dimension, similarity in self.dimension_similarity.items()
+                if similarity[i, j] >= self.similarity_max
+            ],
+        })
+    redundancy_flags = []
+    for i, j in self.redundant_pairs:
+      overlap = [
+          dimension
+          for dimension, similarity in self.dimension_similarity.items()
+          if similarity[i, j] >= self.similarity_max
+      ] or list(self.dimension_similarity)
+      redundancy_flags.append({
+          'persona_ids': [self.persona_ids[i], self.persona_ids[j]],
+          'issue': (
+              f'similarity {self.similarity[i, j]:.2f} is at least'
+              f' {self.similarity_max:.2f}, overlapping in'
+              f' {", ".join(overlap)}'
+          ),
+          'remediation': (
+              f'redesign persona {self.persona_ids[j]} with a different'
+              f' {" and ".join(overlap)}'
+          ),
+      })
+    for framework, persona_ids in self.shared_frameworks.items():
+      redundancy_flags.append({
+          'persona_ids': list(persona_ids[:2]),
+          'issue': f'personas {", ".join(persona_ids)} share {framework}',
+          'remediation': (
+              f'swap the framework of persona {persona_ids[-1]} to an'
+              ' unused one'
+          ),
+      })
+    return {
+        'validation_status': (
+            'approved' if self.approved else 'requires_regeneration'
+        ),
+        'cognitive_distance_matrix': matrix,
+        'redundancy_flags': redundancy_flags,
+        'diversity_checks': dict(self.diversity_checks),
+    }
+
+
+def score_persona_diversity(
+    personas: Sequence[Mapping[str, Any]], similarity_max: float
+) -> PersonaDiversityReport:
+  """Scores the pairwise similarity of persona configs.
+
+  Args:
+    personas: Persona configs as allocated by the persona allocator.
+    similarity_max: Personas with a similarity at least this high are
+      redundant.
+
+  Returns:
+    The diversity report; `approved` is set if no pair of personas is
+    redundant and every persona uses its own framework.
+  """
+  dimension_similarity = {}
+  for dimension, fields in PERSONA_DIMENSIONS.items():
+    vectors = _tfidf_vectors([_tokens(persona, fields) for persona in personas])
+    dimension_similarity[dimension] = vectors @ vectors.T
+  similarity = np.mean(np.stack(list(dimension_similarity.values())), axis=0)
+
+  persona_ids = tuple(str(persona.get('id', '')) for persona in personas)
+  framework_personas: dict[str, list[str]] = {}
+  for persona_id, persona in zip(persona_ids, personas):
+    framework = str(persona.get('epistemological_framework', ''))
+    framework_personas.setdefault(framework, []).append(persona_id)
+  shared_frameworks = {
+      framework: tuple(ids)
+      for framework, ids in framework_personas.items()
+      if len(ids) > 1
+  }
+  return PersonaDiversityReport(
+      persona_ids=persona_ids,
+      similarity=similarity,
+      dimension_similarity=dimension_similarity,
+      similarity_max=similarity_max,
+      shared_frameworks=shared_frameworks,
+      diversity_checks={
+          'unique_frameworks': not shared_frameworks,
+          'long_term_present': any(
+              persona.get('time_horizon') == 'long_term' for persona in personas
+          ),
+          'status_quo_challenger_present': any(
+              'status_quo_challenger' in (persona.get('diversity_tags') or ())
+              for persona in personas
+          ),
+      },
+  )
@@ -268,7 +268,7 @@ class StateManager:
     )
 
   def save_state(self, filepath: str | Path) -> None:
-    """Persists workflow state to disk for offline inspection."""
+    """Persists workflow state and node checkpoints to disk."""
     path = Path(filepath)
     snapshot = {
         key: self.tool_context.state.get(key)
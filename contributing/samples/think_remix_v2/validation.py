@@ -16,15 +16,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
 import logging
 from dataclasses import dataclass
+from typing import Annotated
 from typing import Any
+from typing import Mapping
 from typing import Optional
 from typing import Type
 from typing import TypeVar
+from typing import Union
 
+from pydantic import TypeAdapter
 from pydantic import ValidationError
+import pydantic_core
 
 from . import schemas
 
@@ -32,6 +39,13 @@ logger = logging.getLogger(__name__)
 
 ModelT = TypeVar('ModelT', bound=schemas.ImmutableModel)
 
+# Outputs at least this long are validated in a worker thread so that large
+# payloads don't stall the event loop.
+_OFF_LOOP_MIN_CHARS = 64 * 1024
+
+# Current values longer than this are truncated in repair prompts.
+_MAX_FRAGMENT_CHARS = 2000
+
 
 @dataclass
 class ValidationResult:
@@ -48,14 +62,17 @@ class ValidationResult:
   
   raw_output: Optional[str] = None
   """Raw agent output that was validated."""
+  
+  payload: Optional[dict[str, Any]] = None
+  """Parsed JSON object if the output was valid JSON but failed the schema."""
+  
+  field_errors: Optional[dict[str, list[str]]] = None
+  """Schema errors of each failing top-level field, used for repair prompts."""
 
 
-def parse_json_output(raw_text: str) -> dict[str, Any]:
-  """Parses agent output enforcing strict JSON."""
-  # Try to extract JSON from markdown code blocks if present
+def _strip_code_fence(raw_text: str) -> str:
+  """Removes a markdown code block wrapping the output, if present."""
   text = raw_text.strip()
-  
-  # Remove markdown code blocks
   if text.startswith('```'):
     lines = text.split('\n')
     # Remove first line (```json or ```)
@@ -65,73 +82,310 @@ def parse_json_output(raw_text: str) -> dict[str, Any]:
     if lines and lines[-1].strip().startswith('```'):
       lines = lines[:-1]
     text = '\n'.join(lines)
-  
+  return text
+
+
+def parse_json_output(raw_text: str) -> dict[str, Any]:
+  """Parses agent output enforcing strict JSON."""
+  text = _strip_code_fence(raw_text)
   try:
     return json.loads(text)
   except json.JSONDecodeError as exc:
     raise ValueError(f'Agent output was not valid JSON: {exc}') from exc
 
 
+class CompiledValidator:
+  """Validates agent outputs against a schema with validators built once.
+
+  Validators are cached per schema class (see `get_validator`), so agents
+  sharing a schema and repeated runs of the same agent reuse them. Besides
+  validating complete outputs, the validator checks outputs while they are
+  streamed (see `StreamingValidator`) and builds repair prompts that only
+  contain the fields that failed validation.
+  """
+
+  def __init__(self, schema_class: Type[schemas.ImmutableModel]):
+    self.schema_class = schema_class
+    self._field_adapters: dict[str, TypeAdapter] = {}
+
+  def _field_adapter(self, field_name: str) -> Optional[TypeAdapter]:
+    """Returns the validator of a single top-level field."""
+    adapter = self._field_adapters.get(field_name)
+    if adapter is None:
+      field = self.schema_class.model_fields.get(field_name)
+      if field is None:
+        return None
+      adapter = TypeAdapter(Annotated[field.annotation, field])
+      self._field_adapters[field_name] = adapter
+    return adapter
+
+  def validate(
+      self,
+      raw_output: Union[str, Mapping[str, Any]],
+      agent_name: str = 'unknown',
+  ) -> ValidationResult:
+    """Validates a complete agent output.
+
+    Args:
+      raw_output: Raw text output from agent, or the already parsed object.
+      agent_name: Name of the agent for logging.
+
+    Returns:
+      ValidationResult with validation status and parsed model.
+    """
+    text = raw_output if isinstance(raw_output, str) else None
+    try:
+      if text is None:
+        payload = dict(raw_output)
+      else:
+        payload = parse_json_output(text)
+    except ValueError as e:
+      logger.warning('JSON parsing failed for agent %s: %s', agent_name, e)
+      return ValidationResult(
+          valid=False,
+          error=f'JSON parsing error: {e}',
+          raw_output=text,
+      )
+    return self._validate_payload(payload, text, agent_name)
+
+  def _validate_payload(
+      self,
+      payload: Any,
+      raw_output: Optional[str],
+      agent_name: str,
+  ) -> ValidationResult:
+    try:
+      model = self.schema_class.model_validate(payload)
+    except ValidationError as e:
+      logger.warning('Schema validation failed for agent %s: %s', agent_name, e)
+      # Format validation errors nicely
+      errors = []
+      field_errors: dict[str, list[str]] = {}
+      for error in e.errors():
+        field = '.'.join(str(loc) for loc in error['loc'])
+        msg = error['msg']
+        errors.append(f'{field}: {msg}')
+        if error['loc'] and isinstance(payload, dict):
+          field_errors.setdefault(str(error['loc'][0]), []).append(
+              f'{field}: {msg}'
+          )
+
+      error_msg = 'Schema validation errors:\n' + '\n'.join(errors)
+      is_object = isinstance(payload, dict)
+      return ValidationResult(
+          valid=False,
+          error=error_msg,
+          raw_output=raw_output,
+          payload=payload if is_object else None,
+          field_errors=field_errors if is_object else None,
+      )
+    except (TypeError, AttributeError) as e:
+      logger.error(
+          'Unexpected error during validation for agent %s: %s', agent_name, e
+      )
+      return ValidationResult(
+          valid=False,
+          error=f'Unexpected validation error: {e}',
+          raw_output=raw_output,
+      )
+
+    logger.debug('Validation passed for agent %s', agent_name)
+    return ValidationResult(valid=True, model=model, raw_output=raw_output)
+
+  def check_fields(self, payload: Mapping[str, Any]) -> Optional[str]:
+    """Validates the given top-level fields on their own.
+
+    Args:
+      payload: Complete values of some of the fields of the schema.
+
+    Returns:
+      An error message if any value is invalid, None otherwise.
+    """
+    for field_name, value in payload.items():
+      adapter = self._field_adapter(field_name)
+      if adapter is None:
+        # Schemas allow extra fields.
+        continue
+      try:
+        adapter.validate_python(value)
+      except ValidationError as e:
+        details = '; '.join(error['msg'] for error in e.errors())
+        return f'{field_name}: {details}'
+    return None
+
+  def build_repair_prompt(self, result: ValidationResult) -> Optional[str]:
+    """Builds a prompt asking to correct only the failing fields.
+
+    Args:
+      result: A failed validation result.
+
+    Returns:
+      The repair prompt, or None if the failure can't be repaired field by
+      field, e.g. because the output was not a JSON object.
+    """
+    if result.payload is None or not result.field_errors:
+      return None
+    sections = []
+    for field_name, errors in result.field_errors.items():
+      adapter = self._field_adapter(field_name)
+      if adapter is None:
+        return None
+      if field_name in result.payload:
+        fragment = json.dumps(result.payload[field_name], default=str)
+        if len(fragment) > _MAX_FRAGMENT_CHARS:
+          fragment = fragment[:_MAX_FRAGMENT_CHARS] + '... (truncated)'
+      else:
+        fragment = '(missing)'
+      sections.append(
+          f'Field "{field_name}"\nCurrent value: {fragment}\nErrors:\n'
+          + '\n'.join(f'- {error}' for error in errors)
+          + f'\nJSON schema: {json.dumps(adapter.json_schema())}'
+      )
+    return (
+        'Some fields of a JSON object failed schema validation. Return ONLY a'
+        ' JSON object whose keys are the field names below and whose values'
+        ' are the corrected values - no markdown, no preamble, no commentary.'
+        '\n\n'
+        + '\n\n'.join(sections)
+    )
+
+  def apply_repair(
+      self,
+      result: ValidationResult,
+      repair_output: Union[str, Mapping[str, Any]],
+      agent_name: str = 'unknown',
+  ) -> ValidationResult:
+    """Merges corrected field values into a failed output and revalidates it.
+
+    Args:
+      result: The failed validation result the repair prompt was built from.
+      repair_output: The output produced for the repair prompt.
+      agent_name: Name of the agent for logging.
+
+    Returns:
+      The validation result of the merged output. Its `raw_output` is the
+      merged output serialized as JSON.
+    """
+    try:
+      if isinstance(repair_output, str):
+        patch = parse_json_output(repair_output)
+      else:
+        patch = dict(repair_output)
+      if not isinstance(patch, dict):
+        raise ValueError('expected a JSON object')
+    except ValueError as e:
+      logger.warning(
+          'Repair output of agent %s was not valid: %s', agent_name, e
+      )
+      return ValidationResult(
+          valid=False,
+          error=f'Repair output was not a JSON object: {e}',
+          raw_output=result.raw_output,
+          payload=result.payload,
+          field_errors=result.field_errors,
+      )
+    failing_fields = result.field_errors or {}
+    merged = dict(result.payload or {})
+    merged.update(
+        (key, value) for key, value in patch.items() if key in failing_fields
+    )
+    return self._validate_payload(merged, json.dumps(merged), agent_name)
+
+
+class StreamingValidator:
+  """Validates an agent output incrementally while it is streamed.
+
+  Each top-level field is checked as soon as its value is complete, so an
+  output that can no longer be valid is detected before the model finishes
+  emitting it. Missing required fields can only be detected once the output
+  is complete, by `CompiledValidator.validate`.
+
+  Only the text of a single model turn is validated; call `reset` when a new
+  turn starts. Agents that may call tools can stream prose before a function
+  call, so with `allow_preamble` a turn not starting with a JSON object is
+  left to the final validation instead of failing.
+  """
+
+  def __init__(
+      self, validator: CompiledValidator, allow_preamble: bool = False
+  ):
+    self._validator = validator
+    self._allow_preamble = allow_preamble
+    self.reset()
+
+  def reset(self) -> None:
+    """Discards the streamed text, to validate the next model turn."""
+    self._text = ''
+    self._checked_fields: set[str] = set()
+    self._skipped = False
+    self.error: Optional[str] = None
+    """The first error found in the output streamed so far."""
+
+  def feed(self, chunk: str) -> Optional[str]:
+    """Adds a streamed chunk of the output.
+
+    Args:
+      chunk: The next chunk of text emitted by the model.
+
+    Returns:
+      An error message if the output streamed so far can't be the prefix of
+      a valid output, None otherwise.
+    """
+    if self.error is not None or self._skipped or not chunk:
+      return self.error
+    self._text += chunk
+    text = self._text.lstrip()
+    if text.startswith('`'):
+      # Wait for the complete opening line of the code block.
+      if '\n' not in text:
+        return None
+      text = text.split('\n', 1)[1].lstrip()
+    if not text:
+      return None
+    if not text.startswith('{'):
+      if self._allow_preamble:
+        self._skipped = True
+        return None
+      self.error = (
+          'JSON parsing error: output does not start with a JSON object'
+      )
+      return self.error
+    try:
+      partial = pydantic_core.from_json(text, allow_partial=True)
+    except ValueError as e:
+      self.error = f'JSON parsing error: {e}'
+      return self.error
+    # The value of the last field may still be incomplete.
+    complete_fields = list(partial)[:-1]
+    new_fields = {
+        field: partial[field]
+        for field in complete_fields
+        if field not in self._checked_fields
+    }
+    if new_fields:
+      self._checked_fields.update(new_fields)
+      field_error = self._validator.check_fields(new_fields)
+      if field_error is not None:
+        self.error = f'Schema validation errors:\n{field_error}'
+    return self.error
+
+
 def validate_agent_output(
-    raw_output: str,
+    raw_output: Union[str, Mapping[str, Any]],
     schema_class: Type[ModelT],
     agent_name: str = 'unknown',
 ) -> ValidationResult:
   """Validates agent output against a Pydantic schema.
   
   Args:
-    raw_output: Raw text output from agent.
+    raw_output: Raw text output from agent, or the already parsed object.
     schema_class: Pydantic model class to validate against.
     agent_name: Name of the agent for logging.
   
   Returns:
     ValidationResult with validation status and parsed model.
   """
-  try:
-    # Parse JSON
-    payload = parse_json_output(raw_output)
-    
-    # Validate against schema
-    model = schema_class.model_validate(payload)
-    
-    logger.debug('Validation passed for agent %s', agent_name)
-    return ValidationResult(
-        valid=True,
-        model=model,
-        raw_output=raw_output,
-    )
-    
-  except ValueError as e:
-    logger.warning('JSON parsing failed for agent %s: %s', agent_name, e)
-    return ValidationResult(
-        valid=False,
-        error=f'JSON parsing error: {e}',
-        raw_output=raw_output,
-    )
-    
-  except ValidationError as e:
-    logger.warning('Schema validation failed for agent %s: %s', agent_name, e)
-    # Format validation errors nicely
-    errors = []
-    for error in e.errors():
-      field = '.'.join(str(loc) for loc in error['loc'])
-      msg = error['msg']
-      errors.append(f'{field}: {msg}')
-    
-    error_msg = 'Schema validation errors:\n' + '\n'.join(errors)
-    return ValidationResult(
-        valid=False,
-        error=error_msg,
-        raw_output=raw_output,
-    )
-    
-  except (TypeError, AttributeError) as e:
-    logger.error('Unexpected error during validation for agent %s: %s', agent_name, e)
-    return ValidationResult(
-        valid=False,
-        error=f'Unexpected validation error: {e}',
-        raw_output=raw_output,
-    )
+  return _get_schema_validator(schema_class).validate(raw_output, agent_name)
 
 
 # Mapping of agent output keys to their schema classes
@@ -164,27 +418,55 @@ def get_schema_for_output_key(output_key: str) -> Optional[Type[schemas.Immutabl
   return AGENT_SCHEMA_MAP.get(output_key)
 
 
+@functools.lru_cache(maxsize=None)
+def _get_schema_validator(
+    schema_class: Type[schemas.ImmutableModel],
+) -> CompiledValidator:
+  return CompiledValidator(schema_class)
+
+
+def get_validator(output_key: str) -> Optional[CompiledValidator]:
+  """Gets the cached validator for an agent output key."""
+  schema_class = get_schema_for_output_key(output_key)
+  if schema_class is None:
+    return None
+  return _get_schema_validator(schema_class)
+
+
 def validate_agent_output_by_key(
-    raw_output: str,
+    raw_output: Union[str, Mapping[str, Any]],
     output_key: str,
     agent_name: str = 'unknown',
 ) -> ValidationResult:
   """Validates agent output using the output_key to find the schema.
   
   Args:
-    raw_output: Raw text output from agent.
+    raw_output: Raw text output from agent, or the already parsed object.
     output_key: Output key from agent definition.
     agent_name: Name of the agent for logging.
   
   Returns:
     ValidationResult with validation status.
   """
-  schema_class = get_schema_for_output_key(output_key)
-  if schema_class is None:
+  validator = get_validator(output_key)
+  if validator is None:
     logger.warning('No schema found for output_key %s, skipping validation', output_key)
     return ValidationResult(
         valid=True,  # Don't fail if no schema defined
-        raw_output=raw_output,
+        raw_output=raw_output if isinstance(raw_output, str) else None,
     )
   
-  return validate_agent_output(raw_output, schema_class, agent_name)
+  return validator.validate(raw_output, agent_name)
+
+
+async def validate_agent_output_by_key_async(
+    raw_output: Union[str, Mapping[str, Any]],
+    output_key: str,
+    agent_name: str = 'unknown',
+) -> ValidationResult:
+  """Like `validate_agent_output_by_key`, off the event loop for large outputs."""
+  if isinstance(raw_output, str) and len(raw_output) >= _OFF_LOOP_MIN_CHARS:
+    return await asyncio.to_thread(
+        validate_agent_output_by_key, raw_output, output_key, agent_name
+    )
+  return validate_agent_output_by_key(raw_output, output_key, agent_name)
@@ -16,39 +16,101 @@
 
 from __future__ import annotations
 
+from datetime import datetime
+from datetime import timezone
+import json
 import logging
+import time
+from typing import Any
 from typing import AsyncGenerator
 from typing import ClassVar
 from typing import Optional
 from typing import Type
 
-import json
-
 from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.base_agent import BaseAgentState
 from google.adk.agents.base_agent_config import BaseAgentConfig
 from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.llm_agent import LlmAgent
 from google.adk.agents.parallel_agent import ParallelAgent
 from google.adk.events.event import Event
+from google.adk.events.event_actions import EventActions
 from google.adk.utils.context_utils import Aclosing
 from google.genai import types
 from typing_extensions import override
 
 from . import agent
+from .checkpoints import fingerprint
+from .checkpoints import PhaseCheckpointer
 from .config_loader import get_config
+from .evidence_cache import EvidenceCache
+from .evidence_cache import EvidenceCacheStats
+from .evidence_cache import get_evidence_cache
+from .evidence_cache import normalize_source_url
+from .persona_analysis import evaluate_persona_convergence
 from .state_compat import ensure_state_mapping_methods
 from .state_manager import initialize_state_mapping
-from .validation import validate_agent_output_by_key
+from .validation import CompiledValidator
+from .validation import get_validator
+from .validation import StreamingValidator
+from .validation import validate_agent_output_by_key_async
+from .validation import ValidationResult
+from .workflow_graph import WorkflowGraph
+from .workflow_graph import WorkflowNode
+from .workflow_graph import WorkflowScheduler
 
 logger = logging.getLogger(__name__)
 
 
+def _get_event_text(event: Event) -> str:
+  """Returns the text of an event, excluding thoughts."""
+  if not event.content or not event.content.parts:
+    return ''
+  return ''.join(
+      part.text
+      for part in event.content.parts
+      if part.text and not part.thought
+  )
+
+
+def _get_question(ctx: InvocationContext) -> str:
+  """Returns the text of the user's question."""
+  if not ctx.user_content or not ctx.user_content.parts:
+    return ''
+  return ''.join(part.text for part in ctx.user_content.parts if part.text)
+
+
+def _audit_stops_workflow(ctx: InvocationContext) -> bool:
+  """Returns whether the question audit blocked or needs clarification."""
+  audit_result = ctx.session.state.get('question_audit_result')
+  if not isinstance(audit_result, dict):
+    return False
+  audit_status = str(audit_result.get('audit_status', '')).lower()
+  return audit_status in ('block', 'request_clarification')
+
+
+def _with_audit_event(
+    ctx: InvocationContext, *events: dict[str, Any]
+) -> list[dict[str, Any]]:
+  """Returns the workflow audit trail with events appended."""
+  timestamp = datetime.now(timezone.utc).isoformat(timespec='seconds')
+  return [
+      *ctx.session.state.get('workflow_audit_trail', []),
+      *({'timestamp': timestamp, **event} for event in events),
+  ]
+
+
+_EARLY_TERMINATION_NOTE = (
+    'EARLY TERMINATION: The persona analyses converged on the same'
+    ' conclusion, so disagreement analysis, targeted research, adjudication'
+    ' and the case file were skipped. Base the final judgment on the persona'
+    ' analyses and the CER facts they cite.'
+)
+
+
 class ThinkRemixWorkflowState(BaseAgentState):
   """State for ThinkRemixWorkflowAgent."""
 
-  phase: str = 'initialization'
-  """Current workflow phase."""
-  
   persona_allocator_attempts: int = 0
   """Number of times persona allocator has been called."""
   
@@ -93,54 +155,71 @@ class ThinkRemixWorkflowAgent(BaseAgent):
     
     retry_count = 0
     output_key = getattr(agent_instance, 'output_key', None)
+    validator = get_validator(output_key) if output_key else None
     
     while retry_count <= max_retries:
       # Collect text output from events
       collected_text = []
+      # Check the output while it is streamed so that a retry can start as
+      # soon as it can no longer be valid, unless this is the last attempt.
+      streaming_validator = (
+          StreamingValidator(
+              validator,
+              allow_preamble=bool(getattr(agent_instance, 'tools', None)),
+          )
+          if validator is not None and retry_count < max_retries
+          else None
+      )
+      stream_error = None
       
       # Run the agent
       async with Aclosing(agent_instance.run_async(ctx)) as agen:
         async for event in agen:
           yield event
-          # Collect text from event using ADK's event.text property
-          try:
-            event_text = event.text
+          event_text = _get_event_text(event)
+          if not event.partial:
+            # The model turn is over, e.g. with a function call; the output
+            # is streamed again by the next turn.
+            if streaming_validator is not None:
+              streaming_validator.reset()
             if event_text:
               collected_text.append(event_text)
-          except (AttributeError, Exception):
-            # Fallback: try to extract from content if text property not available
-            pass
+          elif event_text and streaming_validator is not None:
+            stream_error = streaming_validator.feed(event_text)
+            if stream_error is not None:
+              logger.warning(
+                  'Aborting agent %s, its streamed output is invalid: %s',
+                  agent_instance.name,
+                  stream_error,
+              )
+              break
       
       # If no output key, skip validation
       if not output_key:
         break
       
-      # Try to get output from state first (ADK stores it there)
-      agent_output = ctx.session.state.get(output_key)
-      output_text = None
-      
-      if agent_output is not None:
-        # Convert state output to string
-        if isinstance(agent_output, dict):
-          output_text = json.dumps(agent_output)
-        elif isinstance(agent_output, str):
-          output_text = agent_output
-        else:
-          output_text = str(agent_output)
-      elif collected_text:
-        # Fallback to collected text from events
-        output_text = '\n'.join(collected_text)
+      if stream_error is not None:
+        validation_result = ValidationResult(valid=False, error=stream_error)
       else:
-        logger.warning('No output found for key %s from agent %s (checked state and events)',
-                      output_key, agent_instance.name)
-        break
-      
-      # Validate output
-      validation_result = validate_agent_output_by_key(
-          output_text,
-          output_key,
-          agent_instance.name,
-      )
+        # Try to get output from state first (ADK stores it there)
+        agent_output = ctx.session.state.get(output_key)
+        
+        if agent_output is None and collected_text:
+          # Fallback to collected text from events
+          agent_output = '\n'.join(collected_text)
+        elif agent_output is None:
+          logger.warning('No output found for key %s from agent %s (checked state and events)',
+                        output_key, agent_instance.name)
+          break
+        elif not isinstance(agent_output, (str, dict)):
+          agent_output = str(agent_output)
+        
+        # Validate output
+        validation_result = await validate_agent_output_by_key_async(
+            agent_output,
+            output_key,
+            agent_instance.name,
+        )
       
       if validation_result.valid:
         logger.debug('Validation passed for agent %s', agent_instance.name)
@@ -156,6 +235,36 @@ class ThinkRemixWorkflowAgent(BaseAgent):
             max_retries + 1,
             validation_result.error,
         )
+        repair_prompt = (
+            validator.build_repair_prompt(validation_result)
+            if validator is not None
+            else None
+        )
+        if repair_prompt is not None and isinstance(agent_instance, LlmAgent):
+          # Only the failing fields are sent back to the model.
+          repair_result = None
+          async with Aclosing(
+              self._repair_agent_output(
+                  agent_instance,
+                  ctx,
+                  validator,
+                  validation_result,
+                  repair_prompt,
+              )
+          ) as agen:
+            async for event in agen:
+              if isinstance(event, ValidationResult):
+                repair_result = event
+              else:
+                yield event
+          if repair_result is not None and repair_result.valid:
+            logger.info('Repaired output of agent %s', agent_instance.name)
+            break
+          logger.warning(
+              'Repair failed for agent %s: %s. Re-running the agent...',
+              agent_instance.name,
+              repair_result.error if repair_result else 'no output',
+          )
         # Add validation error to context for agent to see
         error_context = (
             f'VALIDATION ERROR: Your previous output failed schema validation. '
@@ -188,6 +297,66 @@ class ThinkRemixWorkflowAgent(BaseAgent):
         )
         break
 
+  async def _repair_agent_output(
+      self,
+      agent_instance: LlmAgent,
+      ctx: InvocationContext,
+      validator: CompiledValidator,
+      validation_result: ValidationResult,
+      repair_prompt: str,
+  ) -> AsyncGenerator[Event | ValidationResult, None]:
+    """Asks the model to correct only the fields that failed validation.
+    
+    The repair runs a copy of the agent without tools, callbacks or
+    conversation history whose instruction is the repair prompt. The merged
+    output is stored under the agent's output key if it is valid.
+    
+    Args:
+      agent_instance: The agent whose output failed validation.
+      ctx: Invocation context.
+      validator: The validator of the agent's output key.
+      validation_result: The failed validation result.
+      repair_prompt: The prompt built from the failing fields.
+    
+    Yields:
+      Events from the repair, then the validation result of the merged output.
+    """
+    update = {
+        'name': f'{agent_instance.name}_repair',
+        'instruction': repair_prompt,
+        'static_instruction': None,
+        'include_contents': 'none',
+        'output_key': None,
+        'tools': [],
+        'sub_agents': [],
+    }
+    for field_name in type(agent_instance).model_fields:
+      if field_name.endswith('_callback'):
+        update[field_name] = None
+    repair_agent = agent_instance.clone(update=update)
+    
+    collected_text = []
+    async with Aclosing(repair_agent.run_async(ctx)) as agen:
+      async for event in agen:
+        yield event
+        event_text = _get_event_text(event)
+        if not event.partial and event_text:
+          collected_text.append(event_text)
+    
+    repair_result = validator.apply_repair(
+        validation_result, ''.join(collected_text), agent_instance.name
+    )
+    if repair_result.valid:
+      yield Event(
+          invocation_id=ctx.invocation_id,
+          author=agent_instance.name,
+          branch=ctx.branch,
+          actions=EventActions(
+              state_delta={agent_instance.output_key: repair_result.raw_output}
+          ),
+      )
+    yield repair_result
+
   @override
   async def _run_async_impl(
       self, ctx: InvocationContext
@@ -233,97 +402,96 @@ class ThinkRemixWorkflowAgent(BaseAgent):
       if ctx.is_resumable:
         yield self._create_agent_state_event(ctx)
     
-    logger.info('Workflow state loaded: phase=%s', workflow_state.phase)
-
-    # Phase 1: Question Processing
-    async for event in self._run_question_processing_phase(ctx, workflow_state):
-      yield event
-      if ctx.should_pause_invocation(event):
-        return
-
-    # Phase 2: Persona Allocation and Validation Loop
-    async for event in self._run_persona_allocation_phase(ctx, workflow_state):
-      yield event
-      if ctx.should_pause_invocation(event):
-        return
-
-    # Phase 3: Dynamic Persona Execution (Parallel)
-    logger.info('>>> Starting Phase 3: Persona Execution')
-    try:
-      async for event in self._run_persona_execution_phase(ctx, workflow_state):
-        yield event
-        if ctx.should_pause_invocation(event):
-          logger.warning('Workflow paused during Phase 3')
-          return
-      logger.info('>>> Phase 3: Persona Execution COMPLETE')
-    except Exception as e:
-      logger.error('Phase 3 failed with error: %s', e, exc_info=True)
-      logger.warning('Continuing to Phase 4 despite Phase 3 error')
-
-    # Phase 4: Analysis and Synthesis
-    logger.info('>>> Starting Phase 4: Analysis and Synthesis')
-    try:
-      async for event in self._run_analysis_phase(ctx, workflow_state):
-        yield event
-        if ctx.should_pause_invocation(event):
-          logger.warning('Workflow paused during Phase 4')
-          return
-      logger.info('>>> Phase 4: Analysis and Synthesis COMPLETE')
-    except Exception as e:
-      logger.error('Phase 4 failed with error: %s', e, exc_info=True)
-      logger.warning('Continuing to Phase 5 despite Phase 4 error')
-
-    # Phase 5: Targeted Research
-    logger.info('>>> Starting Phase 5: Targeted Research')
-    try:
-      async for event in self._run_research_phase(ctx, workflow_state):
-        yield event
-        if ctx.should_pause_invocation(event):
-          logger.warning('Workflow paused during Phase 5')
-          return
-      logger.info('>>> Phase 5: Targeted Research COMPLETE')
-    except Exception as e:
-      logger.error('Phase 5 failed with error: %s', e, exc_info=True)
-      logger.warning('Continuing to Phase 6 despite Phase 5 error')
-
-    # Phase 6: Adjudication and Case File
-    logger.info('>>> Starting Phase 6: Adjudication and Case File')
-    try:
-      async for event in self._run_adjudication_phase(ctx, workflow_state):
-        yield event
-        if ctx.should_pause_invocation(event):
-          logger.warning('Workflow paused during Phase 6')
-          return
-      logger.info('>>> Phase 6: Adjudication and Case File COMPLETE')
-    except Exception as e:
-      logger.error('Phase 6 failed with error: %s', e, exc_info=True)
-      logger.warning('Continuing to Phase 7 despite Phase 6 error')
-
-    # Phase 7: Coverage Validation Loop
-    logger.info('>>> Starting Phase 7: Coverage Validation')
-    try:
-      async for event in self._run_coverage_validation_phase(ctx, workflow_state):
-        yield event
-        if ctx.should_pause_invocation(event):
-          logger.warning('Workflow paused during Phase 7')
-          return
-      logger.info('>>> Phase 7: Coverage Validation COMPLETE')
-    except Exception as e:
-      logger.error('Phase 7 failed with error: %s', e, exc_info=True)
-      logger.warning('Continuing to Phase 8 despite Phase 7 error')
+    logger.info(
+        'Workflow state loaded: %d persona allocator attempts, %d coverage'
+        ' validator attempts',
+        workflow_state.persona_allocator_attempts,
+        workflow_state.coverage_validator_attempts,
+    )
 
-    # Phase 8: Final Synthesis
-    logger.info('>>> Starting Phase 8: Final Synthesis')
-    try:
-      async for event in self._run_final_phase(ctx, workflow_state):
+    cache = get_evidence_cache()
+    # The cache counters are shared by every run of the process.
+    cache_stats_at_start = cache.stats.snapshot() if cache is not None else None
+    graph = self._build_workflow_graph(workflow_state, cache_stats_at_start)
+    checkpointer = None
+    if self._config.enable_checkpoints:
+      checkpointer = PhaseCheckpointer(
+          graph, ctx.session.state, _get_question(ctx), self.name
+      )
+      graph = checkpointer.graph
+    scheduler = WorkflowScheduler(
+        graph,
+        max_concurrency=self._config.max_concurrent_nodes,
+        group_limits=self._config.node_concurrency_limits,
+    )
+    paused = False
+    async with Aclosing(scheduler.run(ctx)) as agen:
+      async for event in agen:
         yield event
         if ctx.should_pause_invocation(event):
-          logger.warning('Workflow paused during Phase 8')
-          return
-      logger.info('>>> Phase 8: Final Synthesis COMPLETE')
-    except Exception as e:
-      logger.error('Phase 8 failed with error: %s', e, exc_info=True)
-      logger.warning('Workflow completed with errors in Phase 8')
+          paused = True
+    
+    report = scheduler.critical_path_report()
+    logger.info(
+        'Critical path %.2fs of %.2fs wall time (%.2fs summed over nodes): %s',
+        report.critical_path_seconds,
+        report.wall_seconds,
+        report.total_node_seconds,
+        ' -> '.join(report.path),
+    )
+    if paused:
+      return
+    state_delta = {'workflow_critical_path': report.to_dict()}
+    audit_events = []
+    skipped = [
+        name
+        for name, timing in report.nodes.items()
+        if timing.status == 'skipped'
+    ]
+    if skipped:
+      ran = [
+          timing.duration
+          for timing in report.nodes.values()
+          if timing.status == 'completed'
+      ]
+      # Skipped nodes are assumed to take as long as the nodes that ran.
+      seconds_saved = sum(ran) / len(ran) * len(skipped) if ran else 0.0
+      logger.info(
+          'Early termination skipped %d nodes, saving an estimated %.2fs',
+          len(skipped),
+          seconds_saved,
+      )
+      audit_events.append({
+          'event': 'early_termination_savings',
+          'skipped_nodes': skipped,
+          'estimated_node_seconds_saved': round(seconds_saved, 3),
+          'wall_seconds': round(report.wall_seconds, 3),
+      })
+    if checkpointer is not None and checkpointer.restored:
+      seconds_saved = sum(
+          checkpoint.duration_seconds
+          for checkpoint in checkpointer.restored.values()
+      )
+      logger.info(
+          'Restored %d nodes from checkpoints, saving an estimated %.2fs',
+          len(checkpointer.restored),
+          seconds_saved,
+      )
+      audit_events.append({
+          'event': 'checkpoint_resume',
+          'restored_nodes': list(checkpointer.restored),
+          'estimated_node_seconds_saved': round(seconds_saved, 3),
+      })
+    if audit_events:
+      state_delta['workflow_audit_trail'] = _with_audit_event(
+          ctx, *audit_events
+      )
+    yield Event(
+        invocation_id=ctx.invocation_id,
+        author=self.name,
+        branch=ctx.branch,
+        actions=EventActions(state_delta=state_delta),
+    )
     
     logger.info('=== THINK Remix v2.0 Workflow COMPLETE ===')
 
@@ -331,55 +499,355 @@ class ThinkRemixWorkflowAgent(BaseAgent):
       ctx.set_agent_state(self.name, end_of_agent=True)
       yield self._create_agent_state_event(ctx)
 
-  async def _run_question_processing_phase(
+  def _build_workflow_graph(
       self,
-      ctx: InvocationContext,
       workflow_state: ThinkRemixWorkflowState,
-  ) -> AsyncGenerator[Event, None]:
-    """Phase 1: Question audit, analysis, null generation, and initial research."""
-    logger.info('=== Phase 1: Question Processing ===')
-    workflow_state.phase = 'question_processing'
+      cache_stats_at_start: Optional[EvidenceCacheStats] = None,
+  ) -> WorkflowGraph:
+    """Declares the workflow nodes and the state keys they read and write.
     
-    # Question Audit Gate
-    async for event in self._run_agent_with_validation(
-        agent.question_audit_agent, ctx
-    ):
-      yield event
-
-    # Check audit result and branch
-    audit_result = ctx.session.state.get('question_audit_result')
-    if audit_result and isinstance(audit_result, dict):
-      audit_status = audit_result.get('audit_status', '').lower()
-      if audit_status == 'block':
-        # Workflow stops - audit gate callback should have handled this
-        return
-      if audit_status == 'request_clarification':
-        # Workflow stops - clarification needed
-        return
-
-    # Analyze Question
-    async for event in self._run_agent_with_validation(
-        agent.analyze_question_agent, ctx
-    ):
-      yield event
+    Nodes are declared in the order of the sequential workflow; the
+    scheduler runs any nodes whose inputs are already available concurrently.
+    Agents also see earlier outputs in the conversation history, so the reads
+    list every output an agent's instruction refers to. Nodes appending to
+    the workflow audit trail, directly or through their tools, declare it as
+    a write, so their appends never run concurrently and overwrite each other.
+    """
+    def agent_node(
+        agent_instance: BaseAgent,
+        phase: str,
+        reads: tuple[str, ...],
+        **kwargs,
+    ) -> WorkflowNode:
+      return WorkflowNode(
+          name=agent_instance.name,
+          run=lambda ctx: self._run_agent_node(agent_instance, ctx),
+          reads=reads,
+          writes=(agent_instance.output_key,),
+          phase=phase,
+          **kwargs,
+      )
 
-    # Generate Null Hypotheses
-    async for event in self._run_agent_with_validation(
-        agent.generate_nulls_agent, ctx
-    ):
-      yield event
+    def research_node(
+        agent_instance: BaseAgent,
+        phase: str,
+        reads: tuple[str, ...],
+        preload_cached_evidence: bool = False,
+    ) -> WorkflowNode:
+      return WorkflowNode(
+          name=agent_instance.name,
+          run=lambda ctx: self._run_research_node(
+              agent_instance,
+              ctx,
+              preload_cached_evidence,
+              cache_stats_at_start,
+          ),
+          reads=(*reads, 'cer_registry'),
+          writes=(
+              agent_instance.output_key,
+              'cer_registry',
+              'workflow_audit_trail',
+          ),
+          phase=phase,
+          concurrency_group='search',
+      )
 
-    # Gather Insights (comprehensive research)
-    async for event in self._run_agent_with_validation(
-        agent.gather_insights_agent, ctx
-    ):
-      yield event
+    return WorkflowGraph([
+        agent_node(
+            agent.question_audit_agent,
+            'question_processing',
+            reads=(),
+            stops_workflow=_audit_stops_workflow,
+        ),
+        agent_node(
+            agent.analyze_question_agent,
+            'question_processing',
+            reads=('question_audit_result',),
+        ),
+        agent_node(
+            agent.generate_nulls_agent,
+            'question_processing',
+            reads=('question_analysis',),
+        ),
+        research_node(
+            agent.gather_insights_agent,
+            'question_processing',
+            reads=('question_analysis',),
+        ),
+        WorkflowNode(
+            name='persona_allocation',
+            run=lambda ctx: self._run_persona_allocation_phase(
+                ctx, workflow_state
+            ),
+            reads=('question_analysis',),
+            writes=('persona_allocation', 'persona_validation'),
+            phase='persona_allocation',
+        ),
+        WorkflowNode(
+            name='persona_execution',
+            run=lambda ctx: self._run_persona_execution_phase(
+                ctx, workflow_state
+            ),
+            reads=(
+                'persona_allocation',
+                'cer_registry',
+                'null_hypotheses_result',
+            ),
+            writes=(
+                'persona_analyses',
+                'persona_convergence',
+                'workflow_audit_trail',
+            ),
+            phase='persona_execution',
+            skip_to=self._early_termination_target,
+        ),
+        agent_node(
+            agent.evidence_consistency_enforcer_agent,
+            'analysis',
+            reads=('persona_analyses', 'cer_registry'),
+        ),
+        agent_node(
+            agent.synthesis_agent,
+            'analysis',
+            reads=('persona_analyses', 'cer_registry'),
+        ),
+        agent_node(
+            agent.adversarial_injector_agent,
+            'analysis',
+            reads=('persona_analyses', 'cer_registry'),
+        ),
+        agent_node(
+            agent.analyze_disagreement_agent,
+            'analysis',
+            reads=(
+                'persona_allocation',
+                'persona_analyses',
+                'synthesis_result',
+                'adversarial_result',
+            ),
+        ),
+        agent_node(
+            agent.analyze_blindspots_agent,
+            'analysis',
+            reads=('persona_analyses', 'cer_registry'),
+        ),
+        agent_node(
+            agent.search_inquiry_strategist_agent,
+            'research',
+            reads=('disagreement_analysis', 'blindspot_analysis'),
+        ),
+        research_node(
+            agent.conduct_research_agent,
+            'research',
+            reads=('synthesis_result', 'search_inquiry_plan'),
+            preload_cached_evidence=True,
+        ),
+        agent_node(
+            agent.null_adjudicator_agent,
+            'adjudication',
+            reads=(
+                'null_hypotheses_result',
+                'persona_analyses',
+                'cer_registry',
+            ),
+        ),
+        agent_node(
+            agent.evidence_adjudicator_agent,
+            'adjudication',
+            reads=(
+                'disagreement_analysis',
+                'null_adjudications',
+                'cer_registry',
+            ),
+        ),
+        agent_node(
+            agent.case_file_agent,
+            'adjudication',
+            reads=(
+                'null_hypotheses_result',
+                'gather_insights_result',
+                'disagreement_analysis',
+                'blindspot_analysis',
+                'evidence_adjudication',
+                'cer_registry',
+            ),
+        ),
+        WorkflowNode(
+            name='coverage_validation',
+            run=lambda ctx: self._run_coverage_validation_phase(
+                ctx, workflow_state
+            ),
+            reads=(
+                'case_file',
+                'gather_insights_result',
+                'disagreement_analysis',
+                'null_adjudications',
+            ),
+            writes=('coverage_validation', 'case_file'),
+            phase='coverage_validation',
+        ),
+        agent_node(
+            agent.robustness_calculator_agent,
+            'final',
+            reads=('case_file', 'null_adjudications', 'cer_registry'),
+        ),
+        agent_node(
+            agent.qa_agent,
+            'final',
+            reads=(
+                'question_audit_result',
+                'question_analysis',
+                'null_hypotheses_result',
+                'gather_insights_result',
+                'persona_allocation',
+                'persona_validation',
+                'case_file',
+            ),
+        ),
+        agent_node(
+            agent.final_arbiter_agent,
+            'final',
+            reads=('case_file', 'robustness_metrics', 'qa_notes'),
+        ),
+    ])
+
+  async def _run_agent_node(
+      self,
+      agent_instance: BaseAgent,
+      ctx: InvocationContext,
+  ) -> AsyncGenerator[Event, None]:
+    """Runs a single agent of the workflow graph."""
+    async with Aclosing(
+        self._run_agent_with_validation(agent_instance, ctx)
+    ) as agen:
+      async for event in agen:
+        yield event
+
+  async def _run_research_node(
+      self,
+      agent_instance: BaseAgent,
+      ctx: InvocationContext,
+      preload_cached_evidence: bool = False,
+      cache_stats_at_start: Optional[EvidenceCacheStats] = None,
+  ) -> AsyncGenerator[Event, None]:
+    """Runs a research agent and checks that it registered CER facts.
+
+    The evidence cache activity since `cache_stats_at_start`, the start of
+    the run, is recorded under `evidence_cache_stats`.
+    """
+    cache = get_evidence_cache()
+    if cache is not None and preload_cached_evidence:
+      async for event in self._preload_cached_evidence(ctx, cache):
+        yield event
+    
+    async with Aclosing(
+        self._run_agent_node(agent_instance, ctx)
+    ) as agen:
+      async for event in agen:
+        yield event
     
-    # Validate CER facts were registered
     cer_registry = ctx.session.state.get('cer_registry', [])
-    logger.info('After gather_insights: CER registry contains %d facts', len(cer_registry))
+    logger.info('After %s: CER registry contains %d facts',
+                agent_instance.name, len(cer_registry))
     if len(cer_registry) == 0:
-      logger.warning('No CER facts registered during gather_insights phase!')
+      logger.warning('No CER facts registered during %s!', agent_instance.name)
+    
+    if cache is not None:
+      stats = (
+          cache.stats.since(cache_stats_at_start)
+          if cache_stats_at_start is not None
+          else cache.stats
+      ).to_dict()
+      logger.info('Evidence cache after %s: %s', agent_instance.name, stats)
+      yield Event(
+          invocation_id=ctx.invocation_id,
+          author=self.name,
+          branch=ctx.branch,
+          actions=EventActions(state_delta={'evidence_cache_stats': stats}),
+      )
+
+  async def _preload_cached_evidence(
+      self, ctx: InvocationContext, cache: EvidenceCache
+  ) -> AsyncGenerator[Event, None]:
+    """Registers high-credibility facts cached for the same question.
+    
+    The preloaded facts get new fact ids in this run's CER registry. The
+    research agent is told about them so it can skip redundant searches.
+    """
+    cached_facts = cache.get_facts(
+        _get_question(ctx),
+        min_credibility=self._config.cer_credibility_bedrock,
+    )
+    if not cached_facts:
+      return
+    
+    cer_registry = list(ctx.session.state.get('cer_registry', []))
+    known_facts = {
+        (normalize_source_url(str(fact.get('source', ''))),
+         fact.get('statement'))
+        for fact in cer_registry
+    }
+    sequences = dict(ctx.session.state.get('cer_daily_sequences', {}))
+    now = datetime.now(timezone.utc)
+    date_token = now.strftime('%Y%m%d')
+    registered_at = now.isoformat(timespec='seconds')
+    preloaded = []
+    for fact in cached_facts:
+      key = (
+          normalize_source_url(str(fact.get('source', ''))),
+          fact.get('statement'),
+      )
+      if key in known_facts:
+        continue
+      known_facts.add(key)
+      next_sequence = sequences.get(date_token, 1)
+      sequences[date_token] = next_sequence + 1
+      preloaded.append({
+          **fact,
+          'fact_id': f'CER-{date_token}-{next_sequence:03d}',
+          'registered_at': registered_at,
+          'metadata': {
+              **(fact.get('metadata') or {}),
+              'cached_fact_id': fact.get('fact_id'),
+          },
+      })
+    if not preloaded:
+      return
+    
+    cache.stats.preloaded_facts += len(preloaded)
+    logger.info('Preloaded %d cached CER facts', len(preloaded))
+    note = '\n'.join([
+        'CACHED EVIDENCE: These verified facts from earlier research on this'
+        ' question were registered in the CER. Cite them and skip searches'
+        ' they already answer:',
+        *(
+            f'- {fact["fact_id"]}: {fact.get("statement", "")}'
+            f' ({fact.get("source", "")})'
+            for fact in preloaded
+        ),
+    ])
+    yield Event(
+        invocation_id=ctx.invocation_id,
+        author=self.name,
+        branch=ctx.branch,
+        content=types.Content(role='model', parts=[types.Part(text=note)]),
+        actions=EventActions(
+            state_delta={
+                'cer_registry': [*cer_registry, *preloaded],
+                'cer_daily_sequences': sequences,
+                'cer_next_id': (
+                    ctx.session.state.get('cer_next_id', 1) + len(preloaded)
+                ),
+                'workflow_audit_trail': _with_audit_event(
+                    ctx,
+                    {
+                        'event': 'preload_cached_evidence',
+                        'fact_ids': [fact['fact_id'] for fact in preloaded],
+                    },
+                ),
+            }
+        ),
+    )
 
   async def _run_persona_allocation_phase(
       self,
@@ -388,7 +856,6 @@ class ThinkRemixWorkflowAgent(BaseAgent):
   ) -> AsyncGenerator[Event, None]:
     """Phase 2: Persona allocation with validation loop."""
     logger.info('=== Phase 2: Persona Allocation ===')
-    workflow_state.phase = 'persona_allocation'
     max_attempts = self._config.max_persona_validator_attempts
 
     while workflow_state.persona_allocator_attempts < max_attempts:
@@ -400,6 +867,48 @@ class ThinkRemixWorkflowAgent(BaseAgent):
       ):
         yield event
 
+      # Score persona diversity locally before any LLM validation
+      local_validation = None
+      if self._config.local_persona_divergence_scoring:
+        local_validation = self._score_persona_divergence(ctx)
+      if local_validation is not None:
+        approved = local_validation['validation_status'] == 'approved'
+        content = None
+        if not approved:
+          content = types.Content(
+              role='model',
+              parts=[
+                  types.Part(
+                      text=(
+                          'PERSONA DIVERGENCE VALIDATION FAILED: Regenerate'
+                          ' the personas to resolve these redundancy flags:'
+                          f' {json.dumps(local_validation["redundancy_flags"])}'
+                      )
+                  )
+              ],
+          )
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=content,
+            actions=EventActions(
+                state_delta={'persona_validation': local_validation}
+            ),
+        )
+        if not approved:
+          if workflow_state.persona_allocator_attempts >= max_attempts:
+            logger.warning('Persona validation failed after %d attempts, proceeding anyway',
+                          max_attempts)
+            break
+          logger.info('Persona validation failed locally, retrying allocation (attempt %d/%d)',
+                      workflow_state.persona_allocator_attempts, max_attempts)
+          continue
+        if not self._config.llm_persona_validation:
+          logger.info('Persona diversity approved locally after %d attempts',
+                      workflow_state.persona_allocator_attempts)
+          break
+
       # Run Persona Validator
       async for event in self._run_agent_with_validation(
           agent.persona_validator_agent, ctx
@@ -426,6 +935,49 @@ class ThinkRemixWorkflowAgent(BaseAgent):
         logger.warning('No persona validation result found, proceeding')
         break
 
+  def _score_persona_divergence(
+      self, ctx: InvocationContext
+  ) -> Optional[dict[str, Any]]:
+    """Scores the allocated personas locally as a `persona_validation` output.
+    
+    Returns:
+      The validation, or None if the allocation cannot be scored locally, in
+      which case the LLM validator is used.
+    """
+    try:
+      from .persona_diversity import score_persona_diversity
+    except ImportError:
+      logger.warning('NumPy is not installed, validating persona divergence '
+                     'with the LLM validator')
+      return None
+    
+    allocation = ctx.session.state.get('persona_allocation')
+    if allocation is None:
+      return None
+    if not isinstance(allocation, (str, dict)):
+      allocation = str(allocation)
+    result = get_validator('persona_allocation').validate(
+        allocation, agent.persona_allocator_agent.name
+    )
+    if not result.valid:
+      logger.warning('Cannot score invalid persona allocation locally: %s',
+                     result.error)
+      return None
+    
+    started = time.perf_counter()
+    report = score_persona_diversity(
+        [persona.model_dump() for persona in result.model.personas],
+        self._config.persona_similarity_max,
+    )
+    logger.info(
+        'Scored %d personas locally in %.1fms: max similarity %.2f, %s',
+        len(report.persona_ids),
+        (time.perf_counter() - started) * 1000,
+        report.max_similarity,
+        'approved' if report.approved else 'requires regeneration',
+    )
+    return report.to_validation()
+
   async def _run_persona_execution_phase(
       self,
       ctx: InvocationContext,
@@ -433,7 +985,6 @@ class ThinkRemixWorkflowAgent(BaseAgent):
   ) -> AsyncGenerator[Event, None]:
     """Phase 3: Dynamically create and execute persona agents in parallel."""
     logger.info('=== Phase 3: Persona Execution ===')
-    workflow_state.phase = 'persona_execution'
     
     # Get persona allocation result
     allocation_result = ctx.session.state.get('persona_allocation')
@@ -500,189 +1051,86 @@ class ThinkRemixWorkflowAgent(BaseAgent):
         logger.debug('Found persona analysis in state: %s', output_key)
       else:
         logger.warning('Missing persona analysis in state: %s', output_key)
+    
+    if self._config.enable_early_termination:
+      async for event in self._evaluate_persona_convergence(ctx):
+        yield event
 
-  async def _run_analysis_phase(
-      self,
-      ctx: InvocationContext,
-      workflow_state: ThinkRemixWorkflowState,
+  async def _evaluate_persona_convergence(
+      self, ctx: InvocationContext
   ) -> AsyncGenerator[Event, None]:
-    """Phase 4: Evidence consistency, synthesis, adversarial, disagreement analysis."""
-    logger.info('=== Phase 4: Analysis and Synthesis ===')
-    workflow_state.phase = 'analysis'
+    """Decides whether the personas agree strongly enough to skip ahead.
     
-    # Check if persona analyses exist (required for synthesis/adversarial)
+    The decision is stored under `persona_convergence`. If the personas
+    converged, it is also recorded in the workflow audit trail, and the
+    final arbiter is told why the intermediate phases were skipped.
+    """
+    convergence_threshold = (
+        self._config.early_termination_convergence_threshold
+    )
+    confidence_threshold = self._config.early_termination_confidence_threshold
     persona_analyses = ctx.session.state.get('persona_analyses', [])
-    logger.info('Phase 4: Found %d persona analyses in state', len(persona_analyses))
-    
-    if len(persona_analyses) == 0:
-      logger.warning(
-          'No persona analyses found! Phase 3 may have failed. '
-          'Checking for persona analysis output keys in state...'
+    assessment = evaluate_persona_convergence(
+        persona_analyses,
+        convergence_threshold=convergence_threshold,
+        confidence_threshold=confidence_threshold,
+    )
+    logger.info(
+        'Persona convergence %.2f (threshold %.2f), confidence %.2f'
+        ' (threshold %.2f): %s',
+        assessment.convergence_score,
+        convergence_threshold,
+        assessment.mean_confidence,
+        confidence_threshold,
+        'terminating early' if assessment.converged else 'continuing',
+    )
+    decision = {
+        **assessment.to_dict(),
+        'convergence_threshold': convergence_threshold,
+        'confidence_threshold': confidence_threshold,
+        'persona_analyses_hash': fingerprint(persona_analyses),
+    }
+    state_delta = {'persona_convergence': decision}
+    content = None
+    if assessment.converged:
+      state_delta['workflow_audit_trail'] = _with_audit_event(
+          ctx,
+          {
+              'event': 'early_termination',
+              'convergence_score': assessment.convergence_score,
+              'mean_confidence': assessment.mean_confidence,
+              'agreeing_persona_ids': list(assessment.agreeing_persona_ids),
+          },
       )
-      # Check for persona analysis output keys
-      allocation_result = ctx.session.state.get('persona_allocation', {})
-      personas = allocation_result.get('personas', [])
-      found_outputs = 0
-      for persona_config in personas:
-        persona_id = persona_config.get('id')
-        if persona_id:
-          output_key = f'persona_analysis_{persona_id}'
-          if output_key in ctx.session.state:
-            found_outputs += 1
-            logger.info('Found persona analysis output key: %s', output_key)
-      if found_outputs == 0:
-        logger.error(
-            'No persona analyses found in any format! '
-            'Synthesis and adversarial agents may fail. Continuing anyway...'
-        )
-    
-    # Evidence Consistency Enforcer
-    try:
-      async for event in self._run_agent_with_validation(
-          agent.evidence_consistency_enforcer_agent, ctx
-      ):
-        yield event
-    except Exception as e:
-      logger.error('Error in evidence_consistency_enforcer: %s', e, exc_info=True)
-      # Continue workflow even if this fails
-
-    # Run Synthesis and Adversarial in parallel
-    # ParallelAgent handles branching internally, so we can use the same ctx
-    # Note: Validation happens after parallel execution completes
-    try:
-      parallel_analysis_agent = ParallelAgent(
-          name='parallel_synthesis_adversarial',
-          sub_agents=[
-              agent.synthesis_agent,
-              agent.adversarial_injector_agent,
-          ],
+      content = types.Content(
+          role='model', parts=[types.Part(text=_EARLY_TERMINATION_NOTE)]
       )
-
-      async with Aclosing(parallel_analysis_agent.run_async(ctx)) as agen:
-        async for event in agen:
-          yield event
-    except Exception as e:
-      logger.error('Error in parallel synthesis/adversarial execution: %s', e, exc_info=True)
-      # Continue workflow even if parallel execution fails
-    
-    # Validate parallel agent outputs
-    for sub_agent in [agent.synthesis_agent, agent.adversarial_injector_agent]:
-      output_key = getattr(sub_agent, 'output_key', None)
-      if output_key:
-        output = ctx.session.state.get(output_key)
-        if output:
-          if isinstance(output, dict):
-            output_text = json.dumps(output)
-          elif isinstance(output, str):
-            output_text = output
-          else:
-            output_text = str(output)
-          validation_result = validate_agent_output_by_key(
-              output_text, output_key, sub_agent.name
-          )
-          if not validation_result.valid:
-            logger.warning('Validation failed for parallel agent %s: %s',
-                          sub_agent.name, validation_result.error)
-        else:
-          logger.debug('No output found in state for parallel agent %s (key: %s)',
-                      sub_agent.name, output_key)
-
-    # Analyze Disagreement
-    try:
-      async for event in self._run_agent_with_validation(
-          agent.analyze_disagreement_agent, ctx
-      ):
-        yield event
-    except Exception as e:
-      logger.error('Error in analyze_disagreement: %s', e, exc_info=True)
-      # Continue workflow even if this fails
-
-    # Analyze Blindspots
-    try:
-      async for event in self._run_agent_with_validation(
-          agent.analyze_blindspots_agent, ctx
-      ):
-        yield event
-    except Exception as e:
-      logger.error('Error in analyze_blindspots: %s', e, exc_info=True)
-      # Continue workflow even if this fails
-    
-    logger.info('=== Phase 4: Analysis and Synthesis COMPLETE ===')
-
-  async def _run_research_phase(
-      self,
-      ctx: InvocationContext,
-      workflow_state: ThinkRemixWorkflowState,
-  ) -> AsyncGenerator[Event, None]:
-    """Phase 5: Search inquiry strategist and targeted research."""
-    logger.info('=== Phase 5: Targeted Research ===')
-    workflow_state.phase = 'research'
-    
-    # Search Inquiry Strategist
-    async for event in self._run_agent_with_validation(
-        agent.search_inquiry_strategist_agent, ctx
-    ):
-      yield event
-
-    # Conduct Research (dual-track)
-    async for event in self._run_agent_with_validation(
-        agent.conduct_research_agent, ctx
-    ):
-      yield event
-    
-    # Validate additional CER facts were registered
-    cer_registry = ctx.session.state.get('cer_registry', [])
-    logger.info('After conduct_research: CER registry contains %d facts', len(cer_registry))
-
-  async def _run_adjudication_phase(
-      self,
-      ctx: InvocationContext,
-      workflow_state: ThinkRemixWorkflowState,
-  ) -> AsyncGenerator[Event, None]:
-    """Phase 6: Evidence adjudication, null adjudication, and case file creation."""
-    logger.info('=== Phase 6: Adjudication and Case File ===')
-    workflow_state.phase = 'adjudication'
-    
-    # Run Evidence Adjudicator and Null Adjudicator in parallel
-    parallel_adjudication_agent = ParallelAgent(
-        name='parallel_adjudication',
-        sub_agents=[
-            agent.evidence_adjudicator_agent,
-            agent.null_adjudicator_agent,
-        ],
+    yield Event(
+        invocation_id=ctx.invocation_id,
+        author=self.name,
+        branch=ctx.branch,
+        content=content,
+        actions=EventActions(state_delta=state_delta),
     )
 
-    async with Aclosing(parallel_adjudication_agent.run_async(ctx)) as agen:
-      async for event in agen:
-        yield event
+  def _early_termination_target(
+      self, ctx: InvocationContext
+  ) -> Optional[str]:
+    """Returns the node to skip to if the current persona analyses converged.
     
-    # Validate parallel agent outputs
-    for sub_agent in [agent.evidence_adjudicator_agent, agent.null_adjudicator_agent]:
-      output_key = getattr(sub_agent, 'output_key', None)
-      if output_key:
-        output = ctx.session.state.get(output_key)
-        if output:
-          if isinstance(output, dict):
-            output_text = json.dumps(output)
-          elif isinstance(output, str):
-            output_text = output
-          else:
-            output_text = str(output)
-          validation_result = validate_agent_output_by_key(
-              output_text, output_key, sub_agent.name
-          )
-          if not validation_result.valid:
-            logger.warning('Validation failed for parallel agent %s: %s',
-                          sub_agent.name, validation_result.error)
-        else:
-          logger.debug('No output found in state for parallel agent %s (key: %s)',
-                      sub_agent.name, output_key)
-
-    # Case File
-    async for event in self._run_agent_with_validation(
-        agent.case_file_agent, ctx
+    A decision left in state for other analyses, e.g. by an earlier run, is
+    ignored; a decision restored with its analyses from a checkpoint is not.
+    """
+    decision = ctx.session.state.get('persona_convergence')
+    if (
+        self._config.enable_early_termination
+        and isinstance(decision, dict)
+        and decision.get('persona_analyses_hash')
+        == fingerprint(ctx.session.state.get('persona_analyses', []))
+        and decision.get('converged')
     ):
-      yield event
+      return agent.final_arbiter_agent.name
+    return None
 
   async def _run_coverage_validation_phase(
       self,
@@ -691,7 +1139,6 @@ class ThinkRemixWorkflowAgent(BaseAgent):
   ) -> AsyncGenerator[Event, None]:
     """Phase 7: Coverage validation loop (regenerate case file if needed)."""
     logger.info('=== Phase 7: Coverage Validation ===')
-    workflow_state.phase = 'coverage_validation'
     max_attempts = self._config.max_coverage_validator_attempts
 
     while workflow_state.coverage_validator_attempts < max_attempts:
@@ -728,33 +1175,6 @@ class ThinkRemixWorkflowAgent(BaseAgent):
         logger.warning('No coverage validation result found, proceeding')
         break
 
-  async def _run_final_phase(
-      self,
-      ctx: InvocationContext,
-      workflow_state: ThinkRemixWorkflowState,
-  ) -> AsyncGenerator[Event, None]:
-    """Phase 8: Robustness calculation, QA, and final arbiter."""
-    logger.info('=== Phase 8: Final Synthesis ===')
-    workflow_state.phase = 'final'
-    
-    # Robustness Calculator
-    async for event in self._run_agent_with_validation(
-        agent.robustness_calculator_agent, ctx
-    ):
-      yield event
-
-    # QA Agent
-    async for event in self._run_agent_with_validation(
-        agent.qa_agent, ctx
-    ):
-      yield event
-
-    # Final Arbiter
-    async for event in self._run_agent_with_validation(
-        agent.final_arbiter_agent, ctx
-    ):
-      yield event
-
   @override
   async def _run_live_impl(
       self, ctx: InvocationContext
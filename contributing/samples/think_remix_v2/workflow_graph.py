@@ -0,0 +1,406 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Dependency-driven scheduling of THINK Remix workflow nodes.
+
+Each node declares the state keys it reads and writes. A node depends on the
+nodes declared before it that last wrote the keys it reads or writes, and on
+the earlier readers of the keys it overwrites, so every node reads the same
+declared keys as when the nodes run one after another in declaration order.
+The scheduler starts every node as soon as its dependencies are done.
+
+Nodes run in the branch of the invocation, so that agents see the outputs of
+the nodes before them in their conversation history. The history of an agent
+can therefore also contain events of nodes running concurrently with it;
+nodes must only rely on the state keys they declare.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from dataclasses import field
+import logging
+import time
+from typing import Any
+from typing import AsyncGenerator
+from typing import Callable
+from typing import Mapping
+from typing import Optional
+from typing import Sequence
+
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events.event import Event
+from google.adk.utils.context_utils import Aclosing
+
+logger = logging.getLogger(__name__)
+
+NodeRunner = Callable[[InvocationContext], AsyncGenerator[Event, None]]
+
+
+@dataclass(frozen=True)
+class WorkflowNode:
+  """A step of the workflow and the state keys it reads and writes."""
+
+  name: str
+  run: NodeRunner
+  reads: tuple[str, ...] = ()
+  writes: tuple[str, ...] = ()
+  phase: str = ''
+  """The workflow phase the node belongs to, for logging and reporting."""
+  concurrency_group: Optional[str] = None
+  """Nodes of a group share the group's concurrency limit."""
+  stops_workflow: Optional[Callable[[InvocationContext], bool]] = None
+  """Checked once the node is done; no further nodes start if it is true."""
+  skip_to: Optional[Callable[[InvocationContext], Optional[str]]] = None
+  """Checked once the node is done; if it returns the name of a later node,
+  the nodes declared before that one that have not started are skipped."""
+  restore: Optional[Callable[[InvocationContext], Optional[Event]]] = None
+  """Checked once the node's dependencies are done; if it returns an event,
+  the event is yielded in place of running the node."""
+
+
+class WorkflowGraph:
+  """The dependencies between workflow nodes derived from their state keys."""
+
+  def __init__(self, nodes: Sequence[WorkflowNode]):
+    names = [node.name for node in nodes]
+    if len(set(names)) != len(names):
+      raise ValueError(f'Workflow node names must be unique: {names}')
+    self.nodes = tuple(nodes)
+    self.dependencies: dict[str, tuple[str, ...]] = {}
+    last_writer: dict[str, str] = {}
+    readers: dict[str, list[str]] = {}
+    for node in self.nodes:
+      dependencies = []
+      for key in (*node.reads, *node.writes):
+        if key in last_writer:
+          dependencies.append(last_writer[key])
+      for key in node.writes:
+        dependencies.extend(readers.pop(key, []))
+      self.dependencies[node.name] = tuple(
+          dict.fromkeys(
+              dependency
+              for dependency in dependencies
+              if dependency != node.name
+          )
+      )
+      for key in node.reads:
+        readers.setdefault(key, []).append(node.name)
+      for key in node.writes:
+        last_writer[key] = node.name
+
+  def get_node(self, name: str) -> WorkflowNode:
+    for node in self.nodes:
+      if node.name == name:
+        return node
+    raise KeyError(name)
+
+
+@dataclass
+class NodeTiming:
+  """When a node ran, relative to the start of the workflow."""
+
+  start: float
+  end: Optional[float] = None
+  status: str = 'running'
+  """One of 'running', 'completed', 'failed', 'skipped' or 'restored'."""
+  phase: str = ''
+  """The workflow phase of the node."""
+
+  @property
+  def duration(self) -> float:
+    return (self.end if self.end is not None else self.start) - self.start
+
+
+@dataclass
+class CriticalPathReport:
+  """The longest chain of dependent nodes of a workflow run.
+
+  The wall time of a run is bounded below by its critical path; the sum of
+  node durations is what running the nodes one after another would cost.
+  """
+
+  path: list[str]
+  critical_path_seconds: float
+  wall_seconds: float
+  total_node_seconds: float
+  nodes: dict[str, NodeTiming] = field(default_factory=dict)
+
+  def to_dict(self) -> dict[str, Any]:
+    return {
+        'path': list(self.path),
+        'critical_path_seconds': round(self.critical_path_seconds, 3),
+        'wall_seconds': round(self.wall_seconds, 3),
+        'total_node_seconds': round(self.total_node_seconds, 3),
+        'nodes': {
+            name: {
+                'start': round(timing.start, 3),
+                'duration': round(timing.duration, 3),
+                'status': timing.status,
+                'phase': timing.phase,
+            }
+            for name, timing in self.nodes.items()
+        },
+    }
+
+
+_NODE_DONE = object()
+
+
+class WorkflowScheduler:
+  """Runs the nodes of a workflow graph as soon as their inputs exist.
+
+  Events of concurrently running nodes are yielded as they are produced, and
+  a node is resumed only after its event has been processed by the caller,
+  so every state delta is applied before a dependent node starts. A failed
+  node is logged and its dependents still run, like the phases of the
+  sequential workflow did.
+  """
+
+  def __init__(
+      self,
+      graph: WorkflowGraph,
+      max_concurrency: Optional[int] = None,
+      group_limits: Optional[Mapping[str, int]] = None,
+  ):
+    self._graph = graph
+    self._max_concurrency = max_concurrency
+    self._group_limits = dict(group_limits or {})
+    self._timings: dict[str, NodeTiming] = {}
+    self._started_at: Optional[float] = None
+    self._finished_at: Optional[float] = None
+
+  @property
+  def timings(self) -> dict[str, NodeTiming]:
+    return dict(self._timings)
+
+  def _dependencies_done(self, node: WorkflowNode) -> bool:
+    return all(
+        self._timings.get(dependency) is not None
+        and self._timings[dependency].end is not None
+        for dependency in self._graph.dependencies[node.name]
+    )
+
+  def _is_ready(self, node: WorkflowNode, running: dict[str, Any]) -> bool:
+    if not self._dependencies_done(node):
+      return False
+    if self._max_concurrency and len(running) >= self._max_concurrency:
+      return False
+    limit = self._group_limits.get(node.concurrency_group)
+    if node.concurrency_group is not None and limit:
+      in_group = sum(
+          1
+          for name in running
+          if self._graph.get_node(name).concurrency_group
+          == node.concurrency_group
+      )
+      if in_group >= limit:
+        return False
+    return True
+
+  async def _run_node(
+      self,
+      node: WorkflowNode,
+      ctx: InvocationContext,
+      queue: asyncio.Queue,
+      resume_signal: asyncio.Event,
+  ) -> None:
+    try:
+      async with Aclosing(node.run(ctx)) as agen:
+        async for event in agen:
+          resume_signal.clear()
+          await queue.put((node.name, event))
+          await resume_signal.wait()
+    except Exception as e:  # pylint: disable=broad-exception-caught
+      await queue.put((node.name, e))
+      return
+    await queue.put((node.name, _NODE_DONE))
+
+  def _skip_until(self, target: str, pending: list[WorkflowNode]) -> None:
+    """Skips the pending nodes declared before the target node."""
+    target_node = self._graph.get_node(target)
+    for node in list(pending):
+      if node is target_node:
+        break
+      pending.remove(node)
+      now = self._now()
+      self._timings[node.name] = NodeTiming(
+          start=now, end=now, status='skipped', phase=node.phase
+      )
+      logger.info('Skipping node %s', node.name)
+
+  def _restore_next(
+      self,
+      ctx: InvocationContext,
+      pending: list[WorkflowNode],
+      checked: set[str],
+  ) -> Optional[tuple[WorkflowNode, Event]]:
+    """Restores the first pending node that can be restored, if any.
+
+    A node is checked once, as soon as its dependencies are done.
+    """
+    for node in pending:
+      if (
+          node.restore is None
+          or node.name in checked
+          or not self._dependencies_done(node)
+      ):
+        continue
+      checked.add(node.name)
+      event = node.restore(ctx)
+      if event is not None:
+        pending.remove(node)
+        now = self._now()
+        self._timings[node.name] = NodeTiming(
+            start=now, end=now, status='restored', phase=node.phase
+        )
+        return node, event
+    return None
+
+  def _stops_after(
+      self,
+      node: WorkflowNode,
+      ctx: InvocationContext,
+      pending: list[WorkflowNode],
+  ) -> bool:
+    """Handles a finished node and returns whether it stopped the workflow."""
+    if node.stops_workflow is not None and node.stops_workflow(ctx):
+      logger.info('Node %s stopped the workflow', node.name)
+      return True
+    if node.skip_to is not None and (target := node.skip_to(ctx)):
+      self._skip_until(target, pending)
+    return False
+
+  def _now(self) -> float:
+    return time.perf_counter() - self._started_at
+
+  async def run(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+    """Runs the graph and yields the events of its nodes."""
+    self._timings = {}
+    self._started_at = time.perf_counter()
+    self._finished_at = None
+    queue: asyncio.Queue = asyncio.Queue()
+    pending = list(self._graph.nodes)
+    running: dict[str, tuple[asyncio.Task, asyncio.Event]] = {}
+    restore_checked: set[str] = set()
+    stopped = False
+    try:
+      while True:
+        if not stopped and not ctx.end_invocation:
+          if restored := self._restore_next(ctx, pending, restore_checked):
+            node, event = restored
+            logger.info('>>> Restored node %s from its checkpoint', node.name)
+            yield event
+            stopped = self._stops_after(node, ctx, pending)
+            continue
+          for node in list(pending):
+            if self._is_ready(node, running):
+              pending.remove(node)
+              resume_signal = asyncio.Event()
+              self._timings[node.name] = NodeTiming(
+                  start=self._now(), phase=node.phase
+              )
+              logger.info(
+                  '>>> Starting node %s (%s)', node.name, node.phase or '-'
+              )
+              running[node.name] = (
+                  asyncio.create_task(
+                      self._run_node(node, ctx, queue, resume_signal)
+                  ),
+                  resume_signal,
+              )
+        if not running:
+          break
+
+        name, item = await queue.get()
+        if isinstance(item, Event):
+          yield item
+          if ctx.should_pause_invocation(item):
+            logger.warning('Workflow paused during node %s', name)
+            stopped = True
+          running[name][1].set()
+          continue
+
+        running.pop(name)
+        timing = self._timings[name]
+        timing.end = self._now()
+        node = self._graph.get_node(name)
+        if item is _NODE_DONE:
+          timing.status = 'completed'
+          logger.info(
+              '>>> Node %s COMPLETE in %.2fs', name, timing.duration
+          )
+          stopped = self._stops_after(node, ctx, pending)
+        else:
+          timing.status = 'failed'
+          logger.error(
+              'Node %s failed with error: %s', name, item, exc_info=item
+          )
+          logger.warning('Continuing with the dependents of node %s', name)
+
+      if pending and not stopped and not ctx.end_invocation:
+        logger.error(
+            'Workflow nodes never became ready: %s',
+            [node.name for node in pending],
+        )
+    finally:
+      for task, _ in running.values():
+        task.cancel()
+      self._finished_at = time.perf_counter()
+
+  def _ran_dependencies(self, name: str) -> set[str]:
+    """Returns the dependencies of a node that ran, looking past skipped ones."""
+    dependencies = set()
+    for dependency in self._graph.dependencies[name]:
+      timing = self._timings.get(dependency)
+      if timing is None or timing.end is None:
+        continue
+      if timing.status == 'skipped':
+        dependencies |= self._ran_dependencies(dependency)
+      else:
+        dependencies.add(dependency)
+    return dependencies
+
+  def critical_path_report(self) -> CriticalPathReport:
+    """Reports the critical path of the last run."""
+    finished = {
+        name: timing
+        for name, timing in self._timings.items()
+        if timing.end is not None and timing.status != 'skipped'
+    }
+    path = []
+    current = max(finished, key=lambda name: finished[name].end, default=None)
+    while current is not None:
+      path.append(current)
+      current = max(
+          self._ran_dependencies(current),
+          key=lambda name: finished[name].end,
+          default=None,
+      )
+    path.reverse()
+    wall_seconds = 0.0
+    if self._started_at is not None:
+      wall_seconds = (
+          self._finished_at or time.perf_counter()
+      ) - self._started_at
+    return CriticalPathReport(
+        path=path,
+        critical_path_seconds=sum(finished[name].duration for name in path),
+        wall_seconds=wall_seconds,
+        total_node_seconds=sum(
+            timing.duration for timing in finished.values()
+        ),
+        nodes=dict(self._timings),
+    )
@@ -0,0 +1,313 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+module containing utilities for passing large binary parts over A2A as artifact
+references instead of inline bytes
+"""
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import logging
+import threading
+from typing import Optional
+
+from google.genai import types as genai_types
+
+from ...artifacts import artifact_util
+from ...artifacts.base_artifact_service import BaseArtifactService
+from ..experimental import a2a_experimental
+
+logger = logging.getLogger('google_adk.' + __name__)
+
+A2A_BLOB_ARTIFACT_PREFIX = 'a2a_blob_'
+A2A_BLOB_APP_NAME = 'a2a_blobs'
+DEFAULT_MIN_REFERENCE_SIZE_BYTES = 256 * 1024
+DEFAULT_MAX_DIGEST_CACHE_BYTES = 64 * 1024 * 1024
+
+
+def _blob_filename(sha256: str) -> str:
+  return f'{A2A_BLOB_ARTIFACT_PREFIX}{sha256}'
+
+
+def _blob_scope(context_id: str) -> dict[str, str]:
+  """Returns the artifact scope the blobs of an A2A context are stored in.
+
+  The app, user and session IDs of the two peers differ, so blobs are kept
+  under the A2A context ID, which both of them know.
+  """
+  return {
+      'app_name': A2A_BLOB_APP_NAME,
+      'user_id': context_id,
+      'session_id': context_id,
+  }
+
+
+@a2a_experimental
+class ArtifactPartReferencer:
+  """Exchanges large inline parts as content-addressed artifact references.
+
+  Inline data parts of at least `min_size_bytes` are saved once to the artifact
+  service under a filename derived from the SHA-256 of their bytes, and are
+  replaced by a `file_data` part pointing at the artifact URI. Blobs are kept
+  in a scope derived from the A2A context ID of the conversation. Both A2A
+  peers must share the artifact storage (e.g. the same GCS bucket), so the
+  receiver can resolve the reference back into inline data. A reference is
+  only resolved within the A2A context it is received in, so a peer cannot
+  read the blobs of other conversations by naming their URIs. Blobs that are
+  already stored are never uploaded again, and repeated conversions of the
+  same bytes hit an in-process cache.
+  """
+
+  def __init__(
+      self,
+      *,
+      min_size_bytes: int = DEFAULT_MIN_REFERENCE_SIZE_BYTES,
+      max_cache_entries: int = 256,
+      max_digest_cache_bytes: int = DEFAULT_MAX_DIGEST_CACHE_BYTES,
+  ):
+    """Initializes the ArtifactPartReferencer.
+
+    Args:
+      min_size_bytes: The minimum size of inline data to pass by reference.
+      max_cache_entries: The maximum number of stored blob versions to
+        remember.
+      max_digest_cache_bytes: The maximum total size of the recently hashed
+        bytes kept alive by the digest cache.
+    """
+    self._min_size_bytes = min_size_bytes
+    self._max_cache_entries = max_cache_entries
+    self._max_digest_cache_bytes = max_digest_cache_bytes
+    self._lock = threading.Lock()
+    # id(data) -> (data, sha256). The bytes are kept alive so the id is stable.
+    self._digests: collections.OrderedDict[int, tuple[bytes, str]] = (
+        collections.OrderedDict()
+    )
+    self._digest_cache_bytes = 0
+    # (context_id, sha256) -> stored artifact version.
+    self._stored_versions: collections.OrderedDict[tuple[str, str], int] = (
+        collections.OrderedDict()
+    )
+
+  def _should_reference(self, part: genai_types.Part) -> bool:
+    return bool(
+        part.inline_data
+        and part.inline_data.data
+        and len(part.inline_data.data) >= self._min_size_bytes
+    )
+
+  def _sha256(self, data: bytes) -> str:
+    with self._lock:
+      entry = self._digests.get(id(data))
+      if entry is not None and entry[0] is data:
+        self._digests.move_to_end(id(data))
+        return entry[1]
+    digest = hashlib.sha256(data).hexdigest()
+    if len(data) > self._max_digest_cache_bytes:
+      return digest
+    with self._lock:
+      previous = self._digests.pop(id(data), None)
+      if previous is not None:
+        self._digest_cache_bytes -= len(previous[0])
+      self._digests[id(data)] = (data, digest)
+      self._digest_cache_bytes += len(data)
+      while self._digest_cache_bytes > self._max_digest_cache_bytes:
+        evicted, _ = self._digests.popitem(last=False)[1]
+        self._digest_cache_bytes -= len(evicted)
+    return digest
+
+  def _remember_version(self, key: tuple[str, str], version: int):
+    with self._lock:
+      self._stored_versions[key] = version
+      self._stored_versions.move_to_end(key)
+      while len(self._stored_versions) > self._max_cache_entries:
+        self._stored_versions.popitem(last=False)
+
+  def _make_reference(
+      self,
+      part: genai_types.Part,
+      *,
+      context_id: str,
+      sha256: str,
+      version: int,
+  ) -> genai_types.Part:
+    return genai_types.Part(
+        file_data=genai_types.FileData(
+            file_uri=artifact_util.get_artifact_uri(
+                **_blob_scope(context_id),
+                filename=_blob_filename(sha256),
+                version=version,
+            ),
+            mime_type=part.inline_data.mime_type,
+            display_name=part.inline_data.display_name,
+        ),
+        video_metadata=part.video_metadata,
+    )
+
+  def get_reference(
+      self,
+      part: genai_types.Part,
+      *,
+      context_id: str,
+  ) -> Optional[genai_types.Part]:
+    """Returns the reference to a part that has already been stored, if any.
+
+    This never touches the artifact service, so it can be used from the
+    synchronous part converters after `reference_parts` has stored the blobs.
+
+    Args:
+      part: The part to look up.
+      context_id: The A2A context ID the blob was stored under.
+
+    Returns:
+      A `file_data` part referencing the stored blob, or None if the part is
+      too small or has not been stored yet.
+    """
+    if not self._should_reference(part):
+      return None
+    sha256 = self._sha256(part.inline_data.data)
+    with self._lock:
+      version = self._stored_versions.get((context_id, sha256))
+    if version is None:
+      return None
+    return self._make_reference(
+        part, context_id=context_id, sha256=sha256, version=version
+    )
+
+  async def reference_parts(
+      self,
+      parts: list[genai_types.Part],
+      *,
+      artifact_service: BaseArtifactService,
+      context_id: str,
+  ) -> list[genai_types.Part]:
+    """Stores large inline parts and replaces them with references.
+
+    Args:
+      parts: The parts to convert.
+      artifact_service: The artifact service shared with the A2A peer.
+      context_id: The A2A context ID the parts are sent in.
+
+    Returns:
+      The parts, with large inline data parts replaced by references.
+    """
+    result = []
+    for part in parts:
+      if not self._should_reference(part):
+        result.append(part)
+        continue
+      sha256 = self._sha256(part.inline_data.data)
+      key = (context_id, sha256)
+      with self._lock:
+        version = self._stored_versions.get(key)
+      if version is None:
+        filename = _blob_filename(sha256)
+        versions = await artifact_service.list_versions(
+            **_blob_scope(context_id), filename=filename
+        )
+        if versions:
+          # The blob is content addressed, so any stored version will do.
+          version = max(versions)
+        else:
+          version = await artifact_service.save_artifact(
+              **_blob_scope(context_id),
+              filename=filename,
+              artifact=genai_types.Part(inline_data=part.inline_data),
+              custom_metadata={'sha256': sha256},
+          )
+        self._remember_version(key, version)
+      result.append(
+          self._make_reference(
+              part, context_id=context_id, sha256=sha256, version=version
+          )
+      )
+    return result
+
+  async def resolve_parts(
+      self,
+      parts: list[genai_types.Part],
+      *,
+      artifact_service: BaseArtifactService,
+      context_id: str,
+  ) -> list[genai_types.Part]:
+    """Replaces blob references with the inline data they point to.
+
+    References outside the A2A context, references that cannot be loaded, and
+    references whose bytes don't match the hash in their filename are left as
+    they are.
+
+    Args:
+      parts: The parts to resolve.
+      artifact_service: The artifact service shared with the A2A peer.
+      context_id: The A2A context ID the parts were received in.
+
+    Returns:
+      The parts, with blob references replaced by inline data.
+    """
+    result = []
+    for part in parts:
+      parsed_uri = (
+          artifact_util.parse_artifact_uri(part.file_data.file_uri)
+          if part.file_data
+          else None
+      )
+      if not parsed_uri or not parsed_uri.filename.startswith(
+          A2A_BLOB_ARTIFACT_PREFIX
+      ):
+        result.append(part)
+        continue
+      if {
+          'app_name': parsed_uri.app_name,
+          'user_id': parsed_uri.user_id,
+          'session_id': parsed_uri.session_id,
+      } != _blob_scope(context_id):
+        logger.warning(
+            'Not resolving A2A blob reference outside context %s: %s',
+            context_id,
+            part.file_data.file_uri,
+        )
+        result.append(part)
+        continue
+      artifact = await artifact_service.load_artifact(
+          app_name=parsed_uri.app_name,
+          user_id=parsed_uri.user_id,
+          filename=parsed_uri.filename,
+          session_id=parsed_uri.session_id,
+          version=parsed_uri.version,
+      )
+      expected_sha256 = parsed_uri.filename[len(A2A_BLOB_ARTIFACT_PREFIX) :]
+      if (
+          not artifact
+          or not artifact.inline_data
+          or self._sha256(artifact.inline_data.data) != expected_sha256
+      ):
+        logger.warning(
+            'Cannot resolve A2A blob reference: %s', part.file_data.file_uri
+        )
+        result.append(part)
+        continue
+      result.append(
+          genai_types.Part(
+              inline_data=genai_types.Blob(
+                  data=artifact.inline_data.data,
+                  mime_type=part.file_data.mime_type
+                  or artifact.inline_data.mime_type,
+                  display_name=part.file_data.display_name,
+              ),
+              video_metadata=part.video_metadata,
+          )
+      )
+    return result
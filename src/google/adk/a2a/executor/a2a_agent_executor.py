@@ -48,9 +48,12 @@ except ImportError as e:
   else:
     raise e
 from google.adk.runners import Runner
+from google.genai import types as genai_types
 from pydantic import BaseModel
 from typing_extensions import override
 
+from ...events.event import Event
+from ..converters.artifact_reference import ArtifactPartReferencer
 from ..converters.event_converter import AdkEventToA2AEventsConverter
 from ..converters.event_converter import convert_event_to_a2a_events
 from ..converters.part_converter import A2APartToGenAIPartConverter
@@ -81,6 +84,13 @@ class A2aAgentExecutorConfig(BaseModel):
       convert_a2a_request_to_agent_run_request
   )
   event_converter: AdkEventToA2AEventsConverter = convert_event_to_a2a_events
+  artifact_reference_min_size_bytes: Optional[int] = None
+  """If set, inline data parts of at least this many bytes in the agent's
+  events are stored in the runner's artifact service and published as
+  content-addressed artifact references, and blob references in requests are
+  resolved back into inline data. Blobs are stored under the A2A context ID of
+  the request, and the A2A client must share the artifact storage. References
+  to blobs of other contexts are left unresolved."""
 
 
 @a2a_experimental
@@ -99,6 +109,11 @@ class A2aAgentExecutor(AgentExecutor):
     super().__init__()
     self._runner = runner
     self._config = config or A2aAgentExecutorConfig()
+    self._part_referencer: Optional[ArtifactPartReferencer] = None
+    if self._config.artifact_reference_min_size_bytes is not None:
+      self._part_referencer = ArtifactPartReferencer(
+          min_size_bytes=self._config.artifact_reference_min_size_bytes
+      )
 
   async def _resolve_runner(self) -> Runner:
     """Resolve the runner, handling cases where it's a callable that returns a Runner."""
@@ -190,6 +205,31 @@ class A2aAgentExecutor(AgentExecutor):
             'Failed to publish failure event: %s', enqueue_error, exc_info=True
         )
 
+  async def _reference_large_parts(
+      self, event: Event, runner: Runner, context_id: str
+  ) -> Event:
+    """Returns the event with large inline parts replaced by references."""
+    if (
+        not self._part_referencer
+        or not runner.artifact_service
+        or not event.content
+        or not event.content.parts
+    ):
+      return event
+    parts = await self._part_referencer.reference_parts(
+        event.content.parts,
+        artifact_service=runner.artifact_service,
+        context_id=context_id,
+    )
+    if all(new is old for new, old in zip(parts, event.content.parts)):
+      return event
+    # Copy the event, the one in the session keeps its inline data.
+    return event.model_copy(
+        update={
+            'content': genai_types.Content(role=event.content.role, parts=parts)
+        }
+    )
+
   async def _handle_request(
       self,
       context: RequestContext,
@@ -204,6 +244,18 @@ class A2aAgentExecutor(AgentExecutor):
         self._config.a2a_part_converter,
     )
 
+    if (
+        self._part_referencer
+        and runner.artifact_service
+        and run_request.new_message
+        and run_request.new_message.parts
+    ):
+      run_request.new_message.parts = await self._part_referencer.resolve_parts(
+          run_request.new_message.parts,
+          artifact_service=runner.artifact_service,
+          context_id=context.context_id,
+      )
+
     # ensure the session exists
     session = await self._prepare_session(context, run_request, runner)
 
@@ -235,6 +287,9 @@ class A2aAgentExecutor(AgentExecutor):
     task_result_aggregator = TaskResultAggregator()
     async with Aclosing(runner.run_async(**vars(run_request))) as agen:
       async for adk_event in agen:
+        adk_event = await self._reference_large_parts(
+            adk_event, runner, context.context_id
+        )
         for a2a_event in self._config.event_converter(
             adk_event,
             invocation_context,
@@ -14,8 +14,11 @@
 
 from __future__ import annotations
 
+from typing import AsyncIterable
+from typing import Iterable
 from typing import Optional
 from typing import TYPE_CHECKING
+from typing import Union
 
 from typing_extensions import override
 
@@ -106,6 +109,38 @@ class CallbackContext(ReadonlyContext):
     self._event_actions.artifact_delta[filename] = version
     return version
 
+  async def save_artifact_stream(
+      self,
+      filename: str,
+      *,
+      chunks: Union[Iterable[bytes], AsyncIterable[bytes]],
+      mime_type: str,
+  ) -> int:
+    """Saves a binary artifact produced in chunks and records it as delta.
+
+    Args:
+      filename: The filename of the artifact.
+      chunks: The bytes of the artifact, in order.
+      mime_type: The MIME type of the artifact.
+
+    Returns:
+     The version of the artifact.
+    """
+    if self._invocation_context.artifact_service is None:
+      raise ValueError("Artifact service is not initialized.")
+    version = (
+        await self._invocation_context.artifact_service.save_artifact_stream(
+            app_name=self._invocation_context.app_name,
+            user_id=self._invocation_context.user_id,
+            session_id=self._invocation_context.session.id,
+            filename=filename,
+            chunks=chunks,
+            mime_type=mime_type,
+        )
+    )
+    self._event_actions.artifact_delta[filename] = version
+    return version
+
   async def list_artifacts(self) -> list[str]:
     """Lists the filenames of the artifacts attached to the current session."""
     if self._invocation_context.artifact_service is None:
@@ -0,0 +1,76 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel
+from pydantic import ConfigDict
+from pydantic import Field
+
+from ..utils.feature_decorator import experimental
+
+
+@experimental
+class ContextBudgetConfig(BaseModel):
+  """Configuration for fitting the conversation history into a token budget.
+
+  When set on the run config, the contents of LLM requests are assembled from
+  the newest event backwards until the budget is met, so older history is
+  neither copied nor sent. Tokens are estimated from the size of the contents,
+  at about 4 characters per token.
+
+  Attributes:
+      max_tokens: Estimated token budget of the conversation history
+      max_function_response_tokens: Function responses estimated larger than
+        this are elided
+  """
+
+  model_config = ConfigDict(
+      extra="forbid",
+  )
+
+  max_tokens: int = Field(
+      gt=0,
+      description=(
+          "Estimated token budget of the conversation history. The contents"
+          " of the latest turn are always kept, even if they exceed it."
+      ),
+  )
+
+  max_function_response_tokens: Optional[int] = Field(
+      default=None,
+      gt=0,
+      description=(
+          "Function responses estimated larger than this many tokens are"
+          " replaced with a truncated preview. None keeps them whole."
+      ),
+  )
+
+
+class ContextBudgetReport(BaseModel):
+  """How the conversation history of an LLM request was fit into its budget."""
+
+  kept_tokens: int = 0
+  """Estimated tokens of the contents sent to the model."""
+
+  dropped_tokens: int = 0
+  """Estimated tokens of the history dropped or elided to meet the budget."""
+
+  dropped_contents: int = 0
+  """Number of the oldest contents dropped from the history."""
+
+  elided_function_responses: int = 0
+  """Number of oversized function responses replaced with a preview."""
@@ -30,6 +30,8 @@ from ..auth.credential_service.base_credential_service import BaseCredentialServ
 from ..events.event import Event
 from ..memory.base_memory_service import BaseMemoryService
 from ..plugins.plugin_manager import PluginManager
+from ..sessions._event_index import EMPTY_AGENT_STATE
+from ..sessions._event_index import get_event_index
 from ..sessions.base_session_service import BaseSessionService
 from ..sessions.session import Session
 from ..tools.base_tool import BaseTool
@@ -213,6 +215,9 @@ class InvocationContext(BaseModel):
   of this invocation.
   """
 
+  _realtime_cache_sizes: dict[str, Any] = PrivateAttr(default_factory=dict)
+  """The incrementally tracked sizes of the realtime caches, by cache type."""
+
   @property
   def is_resumable(self) -> bool:
     """Returns whether the current invocation is resumable."""
@@ -283,6 +288,25 @@ class InvocationContext(BaseModel):
     """
     if not self.is_resumable:
       return
+    event_index = get_event_index(self.session)
+    if (
+        event_index is not None
+        and not self.agent_states
+        and not self.end_of_agents
+    ):
+      # The index folds the agent states of the invocation as events are
+      # appended, so there is nothing to replay.
+      agent_states, end_of_agents = event_index.get_invocation_agent_states(
+          self.invocation_id
+      )
+      for author, agent_state in agent_states.items():
+        self.agent_states[author] = (
+            BaseAgentState()
+            if agent_state is EMPTY_AGENT_STATE
+            else agent_state
+        )
+      self.end_of_agents.update(end_of_agents)
+      return
     for event in self._get_events(current_invocation=True):
       if event.actions.end_of_agent:
         self.end_of_agents[event.author] = True
@@ -341,6 +365,19 @@ class InvocationContext(BaseModel):
     Returns:
       A list of events from the current session.
     """
+    event_index = (
+        get_event_index(self.session)
+        if current_invocation or current_branch
+        else None
+    )
+    if event_index is not None:
+      if not current_invocation:
+        return event_index.get_branch_events(self.branch)
+      results = event_index.get_invocation_events(self.invocation_id)
+      if current_branch:
+        results = [event for event in results if event.branch == self.branch]
+      return results
+
     results = self.session.events
     if current_invocation:
       results = [
@@ -399,13 +436,31 @@ class InvocationContext(BaseModel):
       return None
     function_call_id = function_responses[0].id
 
-    events = self._get_events(current_invocation=True)
+    event_index = get_event_index(self.session)
+    if event_index is None:
+      events = self._get_events(current_invocation=True)
+      # The last event is function_response_event, so we search backwards from
+      # the one before it.
+      for event in reversed(events[:-1]):
+        if any(fc.id == function_call_id for fc in event.get_function_calls()):
+          return event
+      return None
+
+    positions = event_index.get_invocation_positions(self.invocation_id)
+    if not positions:
+      return None
     # The last event is function_response_event, so we search backwards from the
     # one before it.
-    for event in reversed(events[:-1]):
-      if any(fc.id == function_call_id for fc in event.get_function_calls()):
+    position = positions[-1]
+    while True:
+      position = event_index.find_function_call_position(
+          function_call_id, before=position
+      )
+      if position is None:
+        return None
+      event = event_index.events[position]
+      if event.invocation_id == self.invocation_id:
         return event
-    return None
 
 
 def new_invocation_context_id() -> str:
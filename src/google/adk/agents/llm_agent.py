@@ -499,7 +499,7 @@ class LlmAgent(BaseAgent):
     if isinstance(self.model, BaseLlm):
       return self.model
     elif self.model:  # model is non-empty str
-      return LLMRegistry.new_llm(self.model)
+      return LLMRegistry.get_llm(self.model)
     else:  # find model from ancestors.
       ancestor_agent = self.parent_agent
       while ancestor_agent is not None:
@@ -59,6 +59,7 @@ except ImportError:
 from google.genai import types as genai_types
 import httpx
 
+from ..a2a.converters.artifact_reference import ArtifactPartReferencer
 from ..a2a.converters.event_converter import convert_a2a_message_to_event
 from ..a2a.converters.event_converter import convert_a2a_task_to_event
 from ..a2a.converters.event_converter import convert_event_to_a2a_message
@@ -74,6 +75,7 @@ from ..events.event import Event
 from ..flows.llm_flows.contents import _is_other_agent_reply
 from ..flows.llm_flows.contents import _present_other_agent_message
 from ..flows.llm_flows.functions import find_matching_function_call
+from ..sessions._event_index import get_event_index
 from .base_agent import BaseAgent
 
 __all__ = [
@@ -131,6 +133,7 @@ class RemoteA2aAgent(BaseAgent):
       genai_part_converter: GenAIPartToA2APartConverter = convert_genai_part_to_a2a_part,
       a2a_part_converter: A2APartToGenAIPartConverter = convert_a2a_part_to_genai_part,
       a2a_client_factory: Optional[A2AClientFactory] = None,
+      artifact_reference_min_size_bytes: Optional[int] = None,
       **kwargs: Any,
   ) -> None:
     """Initialize RemoteA2aAgent.
@@ -144,6 +147,13 @@ class RemoteA2aAgent(BaseAgent):
       timeout: HTTP timeout in seconds
       a2a_client_factory: Optional A2AClientFactory object (will create own if
         not provided)
+      artifact_reference_min_size_bytes: Optional size threshold. If set,
+        inline data parts of at least this many bytes are stored in the
+        artifact service and sent as content-addressed artifact references,
+        and blob references in responses are resolved back into inline data.
+        Blobs are stored under the A2A context ID of the conversation, and the
+        remote agent must share the artifact storage. Only references within
+        that context are resolved.
       **kwargs: Additional arguments passed to BaseAgent
 
     Raises:
@@ -169,6 +179,11 @@ class RemoteA2aAgent(BaseAgent):
     self._genai_part_converter = genai_part_converter
     self._a2a_part_converter = a2a_part_converter
     self._a2a_client_factory: Optional[A2AClientFactory] = a2a_client_factory
+    self._part_referencer: Optional[ArtifactPartReferencer] = None
+    if artifact_reference_min_size_bytes is not None:
+      self._part_referencer = ArtifactPartReferencer(
+          min_size_bytes=artifact_reference_min_size_bytes
+      )
 
     # Validate and store agent card reference
     if isinstance(agent_card, AgentCard):
@@ -316,59 +331,169 @@ class RemoteA2aAgent(BaseAgent):
           f"Failed to initialize remote A2A agent {self.name}: {e}"
       ) from e
 
-  def _create_a2a_request_for_user_function_response(
+  def _find_function_call_for_user_response(
       self, ctx: InvocationContext
+  ) -> Optional[Event]:
+    """Finds the function call the last user event responds to, if any."""
+    if not ctx.session.events or ctx.session.events[-1].author != "user":
+      return None
+    return find_matching_function_call(
+        ctx.session.events, event_index=get_event_index(ctx.session)
+    )
+
+  def _create_a2a_request_for_user_function_response(
+      self, ctx: InvocationContext, reference_context_id: Optional[str] = None
   ) -> Optional[A2AMessage]:
     """Create A2A request for user function response if applicable.
 
     Args:
       ctx: The invocation context
+      reference_context_id: The A2A context ID large parts were stored under,
+        if any.
 
     Returns:
       SendMessageRequest if function response found, None otherwise
     """
-    if not ctx.session.events or ctx.session.events[-1].author != "user":
-      return None
-    function_call_event = find_matching_function_call(ctx.session.events)
+    function_call_event = self._find_function_call_for_user_response(ctx)
     if not function_call_event:
       return None
 
     a2a_message = convert_event_to_a2a_message(
-        ctx.session.events[-1], ctx, Role.user, self._genai_part_converter
+        ctx.session.events[-1],
+        ctx,
+        Role.user,
+        self._get_genai_part_converter(reference_context_id),
     )
     if function_call_event.custom_metadata:
       metadata = function_call_event.custom_metadata
       a2a_message.task_id = metadata.get(A2A_METADATA_PREFIX + "task_id")
       a2a_message.context_id = metadata.get(A2A_METADATA_PREFIX + "context_id")
+    a2a_message.context_id = a2a_message.context_id or reference_context_id
 
     return a2a_message
 
-  def _construct_message_parts_from_session(
+  def _get_events_to_send(
       self, ctx: InvocationContext
+  ) -> tuple[list[Event], Optional[str]]:
+    """Gets the session events the remote agent has not seen yet.
+
+    Args:
+      ctx: The invocation context
+
+    Returns:
+      The events since the last reply of this agent, in order, and the context
+      ID of that reply.
+    """
+    context_id = None
+    event_index = get_event_index(ctx.session)
+    if event_index is not None:
+      position = event_index.get_last_position_by_author(self.name)
+      last_reply = (
+          ctx.session.events[position] if position is not None else None
+      )
+      events_to_process = ctx.session.events[
+          position + 1 if position is not None else 0 :
+      ]
+    else:
+      last_reply = None
+      events_to_process = []
+      for event in reversed(ctx.session.events):
+        if event.author == self.name:
+          last_reply = event
+          break
+        events_to_process.append(event)
+      events_to_process.reverse()
+    # stop on content generated by current a2a agent given it should already
+    # be in remote session
+    if last_reply and last_reply.custom_metadata:
+      metadata = last_reply.custom_metadata
+      context_id = metadata.get(A2A_METADATA_PREFIX + "context_id")
+    return events_to_process, context_id
+
+  def _get_genai_part_converter(
+      self, reference_context_id: Optional[str] = None
+  ) -> GenAIPartToA2APartConverter:
+    """Gets the GenAI part converter, sending stored blobs by reference."""
+    if not self._part_referencer or not reference_context_id:
+      return self._genai_part_converter
+
+    def convert(part: genai_types.Part) -> Optional[A2APart]:
+      reference = self._part_referencer.get_reference(
+          part, context_id=reference_context_id
+      )
+      return self._genai_part_converter(reference or part)
+
+    return convert
+
+  async def _store_large_parts(self, ctx: InvocationContext) -> Optional[str]:
+    """Stores the large parts about to be sent in the artifact service.
+
+    Args:
+      ctx: The invocation context
+
+    Returns:
+      The A2A context ID the parts were stored under, or None if parts are not
+      sent by reference. A new conversation gets a new context ID, which is
+      sent with the request so the remote agent resolves the references in the
+      same context.
+    """
+    if not self._part_referencer or not ctx.artifact_service:
+      return None
+    events_to_send, context_id = self._get_events_to_send(ctx)
+    function_call_event = self._find_function_call_for_user_response(ctx)
+    if function_call_event:
+      metadata = function_call_event.custom_metadata or {}
+      context_id = metadata.get(A2A_METADATA_PREFIX + "context_id")
+    context_id = context_id or str(uuid.uuid4())
+    for event in events_to_send:
+      if event.content and event.content.parts:
+        await self._part_referencer.reference_parts(
+            event.content.parts,
+            artifact_service=ctx.artifact_service,
+            context_id=context_id,
+        )
+    return context_id
+
+  async def _resolve_part_references(
+      self, event: Event, ctx: InvocationContext
+  ) -> None:
+    """Replaces blob references in a response event with inline data."""
+    context_id = (event.custom_metadata or {}).get(
+        A2A_METADATA_PREFIX + "context_id"
+    )
+    if (
+        not self._part_referencer
+        or not ctx.artifact_service
+        or not context_id
+        or not event.content
+        or not event.content.parts
+    ):
+      return
+    event.content.parts = await self._part_referencer.resolve_parts(
+        event.content.parts,
+        artifact_service=ctx.artifact_service,
+        context_id=context_id,
+    )
+
+  def _construct_message_parts_from_session(
+      self, ctx: InvocationContext, reference_context_id: Optional[str] = None
   ) -> tuple[list[A2APart], Optional[str]]:
     """Construct A2A message parts from session events.
 
     Args:
       ctx: The invocation context
+      reference_context_id: The A2A context ID large parts were stored under,
+        if any.
 
     Returns:
       List of A2A parts extracted from session events, context ID
     """
     message_parts: list[A2APart] = []
-    context_id = None
+    events_to_process, context_id = self._get_events_to_send(ctx)
+    context_id = context_id or reference_context_id
+    genai_part_converter = self._get_genai_part_converter(reference_context_id)
 
-    events_to_process = []
-    for event in reversed(ctx.session.events):
-      if event.author == self.name:
-        # stop on content generated by current a2a agent given it should already
-        # be in remote session
-        if event.custom_metadata:
-          metadata = event.custom_metadata
-          context_id = metadata.get(A2A_METADATA_PREFIX + "context_id")
-        break
-      events_to_process.append(event)
-
-    for event in reversed(events_to_process):
+    for event in events_to_process:
       if _is_other_agent_reply(self.name, event):
         event = _present_other_agent_message(event)
 
@@ -376,7 +501,7 @@ class RemoteA2aAgent(BaseAgent):
         continue
 
       for part in event.content.parts:
-        converted_part = self._genai_part_converter(part)
+        converted_part = genai_part_converter(part)
         if converted_part:
           message_parts.append(converted_part)
         else:
@@ -489,11 +614,15 @@ class RemoteA2aAgent(BaseAgent):
       )
       return
 
+    reference_context_id = await self._store_large_parts(ctx)
+
     # Create A2A request for function response or regular message
-    a2a_request = self._create_a2a_request_for_user_function_response(ctx)
+    a2a_request = self._create_a2a_request_for_user_function_response(
+        ctx, reference_context_id
+    )
     if not a2a_request:
       message_parts, context_id = self._construct_message_parts_from_session(
-          ctx
+          ctx, reference_context_id
       )
 
       if not message_parts:
@@ -526,6 +655,7 @@ class RemoteA2aAgent(BaseAgent):
         event = await self._handle_a2a_response(a2a_response, ctx)
         if not event:
           continue
+        await self._resolve_part_references(event, ctx)
 
         # Add metadata about the request and response
         event.custom_metadata = event.custom_metadata or {}
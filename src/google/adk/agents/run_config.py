@@ -26,6 +26,8 @@ from pydantic import ConfigDict
 from pydantic import Field
 from pydantic import field_validator
 
+from .context_budget_config import ContextBudgetConfig
+
 logger = logging.getLogger('google_adk.' + __name__)
 
 
@@ -122,6 +124,12 @@ class RunConfig(BaseModel):
   custom_metadata: Optional[dict[str, Any]] = None
   """Custom metadata for the current invocation."""
 
+  context_budget_config: Optional[ContextBudgetConfig] = None
+  """If set, fits the conversation history of LLM requests into a token budget.
+
+  The report of each request is set on `LlmRequest.context_budget_report`.
+  """
+
   @field_validator('max_llm_calls', mode='after')
   @classmethod
   def validate_max_llm_calls(cls, value: int) -> int:
@@ -105,3 +105,10 @@ class App(BaseModel):
   The config of the resumability for the application.
   If configured, will be applied to all agents in the app.
   """
+
+  event_checkpoint_interval: Optional[int] = Field(default=None, ge=1)
+  """
+  The number of session events between two checkpoints of the session-scoped
+  state and artifact versions. Rewinding a session rebuilds the state from the
+  nearest checkpoint. If not set, a checkpoint is taken every 50 events.
+  """
@@ -18,6 +18,7 @@ import logging
 
 from google.adk.apps.app import App
 from google.adk.apps.llm_event_summarizer import LlmEventSummarizer
+from google.adk.sessions._event_index import get_event_index
 from google.adk.sessions.base_session_service import BaseSessionService
 from google.adk.sessions.session import Session
 
@@ -107,7 +108,13 @@ async def _run_compaction_for_sliding_window(
     return None
   # Find the last compaction event and its range.
   last_compacted_end_timestamp = 0.0
-  for event in reversed(events):
+  event_index = get_event_index(session)
+  compaction_events = (
+      [events[position] for position in event_index.get_compaction_positions()]
+      if event_index is not None
+      else events
+  )
+  for event in reversed(compaction_events):
     if (
         event.actions
         and event.actions.compaction
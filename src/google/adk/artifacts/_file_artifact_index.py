@@ -0,0 +1,148 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A SQLite index of the artifact versions stored by FileArtifactService."""
+
+from __future__ import annotations
+
+import contextlib
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+
+INDEX_FILENAME = "artifact_index.sqlite3"
+"""The name of the index database within the artifact root directory."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifact_versions (
+  scope TEXT NOT NULL,
+  artifact_path TEXT NOT NULL,
+  version INTEGER NOT NULL,
+  file_name TEXT,
+  PRIMARY KEY (scope, artifact_path, version)
+);
+CREATE TABLE IF NOT EXISTS index_state (
+  key TEXT PRIMARY KEY,
+  value TEXT NOT NULL
+);
+"""
+
+IndexRow = tuple[str, str, int, Optional[str]]
+"""A version row: scope, artifact path, version and original filename."""
+
+
+class FileArtifactIndex:
+  """Lists artifacts and their versions without walking the directory tree.
+
+  Versions are keyed by their scope, the scope root directory relative to the
+  artifact root, and by the artifact directory relative to the scope root.
+  Each thread uses its own connection and every operation its own
+  transaction, so the index can be used from the worker threads of the service
+  and shared by processes using the same root.
+  """
+
+  def __init__(self, root_dir: Path):
+    self._db_path = root_dir / INDEX_FILENAME
+    self._local = threading.local()
+    with self._connect() as conn:
+      conn.executescript(_SCHEMA)
+
+  @contextlib.contextmanager
+  def _connect(self) -> Iterator[sqlite3.Connection]:
+    conn = getattr(self._local, "conn", None)
+    if conn is None:
+      conn = sqlite3.connect(self._db_path, timeout=30)
+      self._local.conn = conn
+    with conn:
+      yield conn
+
+  def is_built(self) -> bool:
+    """Whether the index has been built from the artifacts on disk."""
+    with self._connect() as conn:
+      return (
+          conn.execute(
+              "SELECT 1 FROM index_state WHERE key = 'built'"
+          ).fetchone()
+          is not None
+      )
+
+  def replace_all(self, rows: Iterable[IndexRow]) -> None:
+    """Replaces the indexed versions and marks the index as built."""
+    with self._connect() as conn:
+      conn.execute("DELETE FROM artifact_versions")
+      conn.executemany(
+          "INSERT OR REPLACE INTO artifact_versions VALUES (?, ?, ?, ?)", rows
+      )
+      conn.execute("INSERT OR REPLACE INTO index_state VALUES ('built', '1')")
+
+  def add_version(
+      self,
+      scope: str,
+      artifact_path: str,
+      version: int,
+      file_name: Optional[str],
+  ) -> None:
+    """Records a saved artifact version."""
+    with self._connect() as conn:
+      conn.execute(
+          "INSERT OR REPLACE INTO artifact_versions VALUES (?, ?, ?, ?)",
+          (scope, artifact_path, version, file_name),
+      )
+
+  def remove_artifact(self, scope: str, artifact_path: str) -> None:
+    """Forgets all versions of a deleted artifact."""
+    with self._connect() as conn:
+      conn.execute(
+          "DELETE FROM artifact_versions WHERE scope = ? AND artifact_path = ?",
+          (scope, artifact_path),
+      )
+
+  def list_versions(self, scope: str, artifact_path: str) -> list[int]:
+    """Returns the versions of an artifact, in ascending order."""
+    with self._connect() as conn:
+      rows = conn.execute(
+          "SELECT version FROM artifact_versions WHERE scope = ? AND"
+          " artifact_path = ? ORDER BY version",
+          (scope, artifact_path),
+      ).fetchall()
+    return [version for (version,) in rows]
+
+  def get_latest_version(self, scope: str, artifact_path: str) -> Optional[int]:
+    """Returns the latest version of an artifact, or None if it has none."""
+    with self._connect() as conn:
+      (version,) = conn.execute(
+          "SELECT MAX(version) FROM artifact_versions WHERE scope = ? AND"
+          " artifact_path = ?",
+          (scope, artifact_path),
+      ).fetchone()
+    return version
+
+  def list_artifacts(self, scope: str) -> list[tuple[str, Optional[str]]]:
+    """Returns the artifacts of a scope.
+
+    Returns:
+      The artifact path and the filename saved with the latest version of each
+      artifact of the scope.
+    """
+    with self._connect() as conn:
+      return conn.execute(
+          "SELECT artifact_path, file_name FROM artifact_versions AS v WHERE"
+          " scope = ? AND version = (SELECT MAX(version) FROM"
+          " artifact_versions WHERE scope = v.scope AND artifact_path ="
+          " v.artifact_path)",
+          (scope,),
+      ).fetchall()
@@ -16,8 +16,12 @@
 from __future__ import annotations
 
 import re
+from typing import AsyncIterable
+from typing import AsyncIterator
+from typing import Iterable
 from typing import NamedTuple
 from typing import Optional
+from typing import Union
 
 from google.genai import types
 
@@ -114,3 +118,24 @@ def is_artifact_ref(artifact: types.Part) -> bool:
       and artifact.file_data.file_uri
       and artifact.file_data.file_uri.startswith("artifact://")
   )
+
+
+async def iter_chunks(
+    chunks: Union[Iterable[bytes], AsyncIterable[bytes]],
+) -> AsyncIterator[bytes]:
+  """Iterates over a sync or async iterable of byte chunks.
+
+  Args:
+    chunks: The byte chunks.
+
+  Yields:
+    The non-empty chunks, in order.
+  """
+  if isinstance(chunks, AsyncIterable):
+    async for chunk in chunks:
+      if chunk:
+        yield chunk
+  else:
+    for chunk in chunks:
+      if chunk:
+        yield chunk
@@ -15,9 +15,14 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+import dataclasses
 from datetime import datetime
 from typing import Any
+from typing import AsyncIterable
+from typing import AsyncIterator
+from typing import Iterable
 from typing import Optional
+from typing import Union
 
 from google.genai import types
 from pydantic import alias_generators
@@ -25,6 +30,11 @@ from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
 
+from . import artifact_util
+
+DEFAULT_STREAM_CHUNK_SIZE = 1024 * 1024
+"""The default number of bytes per chunk when streaming an artifact."""
+
 
 class ArtifactVersion(BaseModel):
   """Metadata describing a specific version of an artifact."""
@@ -60,6 +70,18 @@ class ArtifactVersion(BaseModel):
   )
 
 
+@dataclasses.dataclass
+class ArtifactStream:
+  """The content of an artifact version, read in chunks."""
+
+  mime_type: Optional[str]
+  """The MIME type of a binary artifact, or None for a text artifact."""
+  chunks: AsyncIterator[bytes]
+  """The content, in order. Text artifacts are encoded as UTF-8."""
+  size: Optional[int] = None
+  """The size of the content in bytes, if known."""
+
+
 class BaseArtifactService(ABC):
   """Abstract base class for artifact services."""
 
@@ -96,6 +118,49 @@ class BaseArtifactService(ABC):
       This is incremented by 1 after each successful save.
     """
 
+  async def save_artifact_stream(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      chunks: Union[Iterable[bytes], AsyncIterable[bytes]],
+      mime_type: str,
+      session_id: Optional[str] = None,
+      custom_metadata: Optional[dict[str, Any]] = None,
+  ) -> int:
+    """Saves a binary artifact whose bytes are produced in chunks.
+
+    The default implementation gathers the chunks and calls `save_artifact`.
+    Services that can write incrementally override it so the artifact is never
+    held in memory as a whole.
+
+    Args:
+      app_name: The app name.
+      user_id: The user ID.
+      filename: The filename of the artifact.
+      chunks: The bytes of the artifact, in order.
+      mime_type: The MIME type of the artifact.
+      session_id: The session ID. If `None`, the artifact is user-scoped.
+      custom_metadata: custom metadata to associate with the artifact.
+
+    Returns:
+      The revision ID, as returned by `save_artifact`.
+    """
+    data = bytearray()
+    async for chunk in artifact_util.iter_chunks(chunks):
+      data += chunk
+    return await self.save_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        filename=filename,
+        artifact=types.Part(
+            inline_data=types.Blob(data=bytes(data), mime_type=mime_type)
+        ),
+        session_id=session_id,
+        custom_metadata=custom_metadata,
+    )
+
   @abstractmethod
   async def load_artifact(
       self,
@@ -123,6 +188,59 @@ class BaseArtifactService(ABC):
       The artifact or None if not found.
     """
 
+  async def load_artifact_stream(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+      version: Optional[int] = None,
+      chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+  ) -> Optional[ArtifactStream]:
+    """Gets an artifact whose content is read in chunks.
+
+    The default implementation loads the artifact with `load_artifact` and
+    slices it. Services backed by files or remote storage override it so the
+    artifact is never held in memory as a whole.
+
+    Args:
+      app_name: The app name.
+      user_id: The user ID.
+      filename: The filename of the artifact.
+      session_id: The session ID. If `None`, load the user-scoped artifact.
+      version: The version of the artifact. If None, the latest version will be
+        returned.
+      chunk_size: The maximum number of bytes per chunk.
+
+    Returns:
+      The artifact stream or None if not found.
+    """
+    artifact = await self.load_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        filename=filename,
+        session_id=session_id,
+        version=version,
+    )
+    if artifact is None:
+      return None
+    if artifact.inline_data is not None:
+      data = artifact.inline_data.data or b""
+      mime_type = artifact.inline_data.mime_type or "application/octet-stream"
+    elif artifact.text is not None:
+      data = artifact.text.encode("utf-8")
+      mime_type = None
+    else:
+      return None
+
+    async def chunks():
+      view = memoryview(data)
+      for start in range(0, len(data), chunk_size):
+        yield bytes(view[start : start + chunk_size])
+
+    return ArtifactStream(mime_type=mime_type, chunks=chunks(), size=len(data))
+
   @abstractmethod
   async def list_artifact_keys(
       self, *, app_name: str, user_id: str, session_id: Optional[str] = None
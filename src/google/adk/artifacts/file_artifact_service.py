@@ -14,14 +14,20 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import itertools
 import logging
+import mmap
 import os
 from pathlib import Path
 from pathlib import PurePosixPath
 from pathlib import PureWindowsPath
 import shutil
 from typing import Any
+from typing import AsyncIterable
+from typing import Iterable
 from typing import Optional
+from typing import Union
 from urllib.parse import unquote
 from urllib.parse import urlparse
 
@@ -32,11 +38,18 @@ from pydantic import Field
 from pydantic import ValidationError
 from typing_extensions import override
 
+from . import artifact_util
+from ._file_artifact_index import FileArtifactIndex
+from .base_artifact_service import ArtifactStream
 from .base_artifact_service import ArtifactVersion
 from .base_artifact_service import BaseArtifactService
+from .base_artifact_service import DEFAULT_STREAM_CHUNK_SIZE
 
 logger = logging.getLogger("google_adk." + __name__)
 
+_STREAM_WRITE_BUFFER_SIZE = 1024 * 1024
+"""The number of bytes buffered before a streamed artifact is written."""
+
 
 def _iter_artifact_dirs(root: Path) -> list[Path]:
   """Returns artifact directory paths beneath a root."""
@@ -51,6 +64,35 @@ def _iter_artifact_dirs(root: Path) -> list[Path]:
   return artifact_dirs
 
 
+def _link_file(blob_path: Path, content_path: Path) -> bool:
+  """Hard-links a blob to the content path of a version.
+
+  Falls back to copying the blob on filesystems without hard links.
+
+  Returns:
+    False if the blob does not exist.
+  """
+  try:
+    os.link(blob_path, content_path)
+  except FileNotFoundError:
+    return False
+  except OSError:
+    try:
+      shutil.copyfile(blob_path, content_path)
+    except FileNotFoundError:
+      return False
+  return True
+
+
+def _map_file(path: Path) -> Optional[mmap.mmap]:
+  """Memory-maps a file read-only, or returns None for an empty file."""
+  with path.open("rb") as f:
+    if os.fstat(f.fileno()).st_size == 0:
+      # Empty files cannot be mapped.
+      return None
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
 def _file_uri_to_path(uri: str) -> Optional[Path]:
   """Converts a file:// URI to a filesystem path."""
   parsed = urlparse(uri)
@@ -181,6 +223,12 @@ class FileArtifactVersion(ArtifactVersion):
   file_name: str = Field(
       description="Original filename supplied by the caller."
   )
+  content_sha256: Optional[str] = Field(
+      default=None,
+      description=(
+          "SHA-256 digest of the payload, keying the blob it is linked to."
+      ),
+  )
 
 
 class FileArtifactService(BaseArtifactService):
@@ -202,6 +250,18 @@ class FileArtifactService(BaseArtifactService):
   # │               │                       └── metadata.json
   # │               └── artifacts/
   # │                   └── {artifact_path}/...
+  # └── blobs/
+  #     └── sha256/
+  #         └── {digest[:2]}/
+  #             └── {digest}
+  #
+  # Version payloads are hard links to the content-addressed blob of their
+  # SHA-256 digest, so identical content is stored once. A blob is removed
+  # once no version links to it anymore.
+  #
+  # The versions are indexed in a SQLite database at the root, so listings and
+  # latest version lookups don't walk the tree. The index is built from the
+  # tree when missing; `rebuild_index` rebuilds it after out-of-band changes.
   #
   # Artifact paths are derived from the provided filenames: separators create
   # nested directories, and path traversal is rejected to keep the layout
@@ -216,6 +276,84 @@ class FileArtifactService(BaseArtifactService):
     """
     self.root_dir = Path(root_dir).expanduser().resolve()
     self.root_dir.mkdir(parents=True, exist_ok=True)
+    self._index = FileArtifactIndex(self.root_dir)
+    if not self._index.is_built():
+      self._rebuild_index_sync()
+
+  async def rebuild_index(self) -> int:
+    """Rebuilds the artifact index from the artifacts on disk.
+
+    Use this after artifacts were added or removed without the service, e.g.
+    when restoring a backup. Saves and deletes made while the index is rebuilt
+    may be missed.
+
+    Returns:
+      The number of indexed artifact versions.
+    """
+    return await asyncio.to_thread(self._rebuild_index_sync)
+
+  def _rebuild_index_sync(self) -> int:
+    apps_dir = self.root_dir / "apps"
+    rows = []
+    for scope_root in itertools.chain(
+        apps_dir.glob("*/users/*/artifacts"),
+        apps_dir.glob("*/users/*/sessions/*/artifacts"),
+    ):
+      scope = self._scope_key(scope_root)
+      for artifact_dir in _iter_artifact_dirs(scope_root):
+        artifact_path = artifact_dir.relative_to(scope_root).as_posix()
+        for version in _list_versions_on_disk(artifact_dir):
+          metadata = _read_metadata(_metadata_path(artifact_dir, version))
+          rows.append((
+              scope,
+              artifact_path,
+              version,
+              metadata.file_name if metadata else None,
+          ))
+    self._index.replace_all(rows)
+    logger.info(
+        "Indexed %d artifact versions under %s", len(rows), self.root_dir
+    )
+    return len(rows)
+
+  def _scope_key(self, scope_root: Path) -> str:
+    """Returns the key of a scope in the index."""
+    return scope_root.relative_to(self.root_dir).as_posix()
+
+  def _index_key(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+  ) -> tuple[str, str]:
+    """Returns the scope and artifact path keying an artifact in the index."""
+    scope_root = self._scope_root(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+    )
+    _, relative = _resolve_scoped_artifact_path(scope_root, filename)
+    return self._scope_key(scope_root), relative.as_posix()
+
+  def _resolve_version(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+      version: Optional[int],
+  ) -> Optional[int]:
+    """Returns the given or latest version, or None if it does not exist."""
+    scope, artifact_path = self._index_key(
+        app_name, user_id, session_id, filename
+    )
+    if version is None:
+      return self._index.get_latest_version(scope, artifact_path)
+    if version in self._index.list_versions(scope, artifact_path):
+      return version
+    return None
 
   def _base_root(self, app_name: str, user_id: str) -> Path:
     """Returns the artifacts root directory for an app/user combination."""
@@ -306,15 +444,6 @@ class FileArtifactService(BaseArtifactService):
     payload_path = _versions_dir(artifact_dir) / str(version) / stored_filename
     return payload_path.resolve().as_uri()
 
-  def _latest_metadata(
-      self, artifact_dir: Path
-  ) -> Optional[FileArtifactVersion]:
-    """Loads metadata for the most recent version."""
-    versions = _list_versions_on_disk(artifact_dir)
-    if not versions:
-      return None
-    return _read_metadata(_metadata_path(artifact_dir, versions[-1]))
-
   @override
   async def save_artifact(
       self,
@@ -354,6 +483,104 @@ class FileArtifactService(BaseArtifactService):
       custom_metadata: Optional[dict[str, Any]],
   ) -> int:
     """Saves an artifact to disk and returns its version."""
+    if artifact.inline_data:
+      data = artifact.inline_data.data or b""
+      mime_type = (
+          artifact.inline_data.mime_type
+          if artifact.inline_data.mime_type
+          else "application/octet-stream"
+      )
+    elif artifact.text is not None:
+      data = artifact.text.encode("utf-8")
+      mime_type = None
+    else:
+      raise ValueError("Artifact must have either inline_data or text content.")
+
+    next_version, content_path = self._create_version_dir(
+        app_name, user_id, filename, session_id
+    )
+    try:
+      content_sha256 = hashlib.sha256(data).hexdigest()
+      self._link_content(content_sha256, content_path, data=data)
+    except BaseException:
+      shutil.rmtree(content_path.parent, ignore_errors=True)
+      raise
+
+    self._finish_version(
+        app_name,
+        user_id,
+        filename,
+        session_id,
+        next_version,
+        content_path,
+        mime_type,
+        custom_metadata,
+        content_sha256,
+    )
+    return next_version
+
+  def _blob_path(self, content_sha256: str) -> Path:
+    """Returns the path of the content-addressed blob of a SHA-256 digest."""
+    return (
+        self.root_dir / "blobs" / "sha256" / content_sha256[:2] / content_sha256
+    )
+
+  def _link_content(
+      self,
+      content_sha256: str,
+      content_path: Path,
+      *,
+      data: Optional[bytes] = None,
+      partial_path: Optional[Path] = None,
+  ) -> None:
+    """Links the content of a version to its content-addressed blob.
+
+    The blob is only written if no stored version has the same content. The
+    content is given either as `data` or as a complete file at
+    `partial_path`, which is consumed.
+    """
+    blob_path = self._blob_path(content_sha256)
+    # A blob collected by a concurrent delete between the existence check and
+    # the link is written again.
+    for _ in range(2):
+      if not blob_path.exists():
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        if partial_path is not None:
+          partial_path.replace(blob_path)
+          partial_path = None
+        else:
+          temp_path = content_path.with_name(content_path.name + ".blob")
+          temp_path.write_bytes(data)
+          temp_path.replace(blob_path)
+      if _link_file(blob_path, content_path):
+        break
+    else:
+      raise FileNotFoundError(f"Artifact blob {blob_path} vanished.")
+    if partial_path is not None:
+      partial_path.unlink(missing_ok=True)
+
+  def _collect_blobs(self, content_hashes: Iterable[str]) -> None:
+    """Removes the blobs no longer linked from any version."""
+    for content_sha256 in content_hashes:
+      blob_path = self._blob_path(content_sha256)
+      try:
+        if blob_path.stat().st_nlink == 1:
+          blob_path.unlink()
+      except FileNotFoundError:
+        pass
+
+  def _create_version_dir(
+      self,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str],
+  ) -> tuple[int, Path]:
+    """Creates the directory of the next version of an artifact.
+
+    Returns:
+      The new version and the path its content must be written to.
+    """
     artifact_dir = self._artifact_dir(
         app_name=app_name,
         user_id=user_id,
@@ -368,46 +595,110 @@ class FileArtifactService(BaseArtifactService):
     versions_dir.mkdir(parents=True, exist_ok=True)
     version_dir = versions_dir / str(next_version)
     version_dir.mkdir()
+    return next_version, version_dir / artifact_dir.name
 
-    stored_filename = artifact_dir.name
-    content_path = version_dir / stored_filename
-
-    if artifact.inline_data:
-      content_path.write_bytes(artifact.inline_data.data)
-      mime_type = (
-          artifact.inline_data.mime_type
-          if artifact.inline_data.mime_type
-          else "application/octet-stream"
-      )
-    elif artifact.text is not None:
-      content_path.write_text(artifact.text, encoding="utf-8")
-      mime_type = None
-    else:
-      raise ValueError("Artifact must have either inline_data or text content.")
-
+  def _finish_version(
+      self,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str],
+      version: int,
+      content_path: Path,
+      mime_type: Optional[str],
+      custom_metadata: Optional[dict[str, Any]],
+      content_sha256: Optional[str] = None,
+  ) -> None:
+    """Writes the metadata of a version whose content has been written."""
     canonical_uri = self._canonical_uri(
         app_name=app_name,
         user_id=user_id,
         session_id=session_id,
         filename=filename,
-        version=next_version,
+        version=version,
     )
     _write_metadata(
-        version_dir / "metadata.json",
+        content_path.parent / "metadata.json",
         filename=filename,
         mime_type=mime_type,
-        version=next_version,
+        version=version,
         canonical_uri=canonical_uri,
         custom_metadata=custom_metadata,
+        content_sha256=content_sha256,
+    )
+    self._index.add_version(
+        *self._index_key(app_name, user_id, session_id, filename),
+        version,
+        filename,
     )
 
     logger.debug(
         "Saved artifact %s version %d to %s",
         filename,
-        next_version,
-        version_dir,
+        version,
+        content_path.parent,
     )
-    return next_version
+
+  @override
+  async def save_artifact_stream(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      chunks: Union[Iterable[bytes], AsyncIterable[bytes]],
+      mime_type: str,
+      session_id: Optional[str] = None,
+      custom_metadata: Optional[dict[str, Any]] = None,
+  ) -> int:
+    """Writes a binary artifact to disk as its chunks arrive.
+
+    Chunks are buffered up to `_STREAM_WRITE_BUFFER_SIZE` bytes before being
+    written, so memory stays bounded regardless of the artifact size. The
+    content is written to a partial file that is renamed once complete, and
+    the version is removed if the chunks raise.
+    """
+    version, content_path = await asyncio.to_thread(
+        self._create_version_dir, app_name, user_id, filename, session_id
+    )
+    partial_path = content_path.with_name(content_path.name + ".partial")
+    content_hash = hashlib.sha256()
+    try:
+      with await asyncio.to_thread(partial_path.open, "wb") as f:
+        buffer = bytearray()
+        async for chunk in artifact_util.iter_chunks(chunks):
+          content_hash.update(chunk)
+          buffer += chunk
+          if len(buffer) >= _STREAM_WRITE_BUFFER_SIZE:
+            await asyncio.to_thread(f.write, buffer)
+            buffer = bytearray()
+        if buffer:
+          await asyncio.to_thread(f.write, buffer)
+      content_sha256 = content_hash.hexdigest()
+      await asyncio.to_thread(
+          self._link_content,
+          content_sha256,
+          content_path,
+          partial_path=partial_path,
+      )
+    except BaseException:
+      await asyncio.to_thread(
+          shutil.rmtree, content_path.parent, ignore_errors=True
+      )
+      raise
+    await asyncio.to_thread(
+        self._finish_version,
+        app_name,
+        user_id,
+        filename,
+        session_id,
+        version,
+        content_path,
+        mime_type or "application/octet-stream",
+        custom_metadata,
+        content_sha256,
+    )
+    return version
 
   @override
   async def load_artifact(
@@ -437,26 +728,46 @@ class FileArtifactService(BaseArtifactService):
       version: Optional[int],
   ) -> Optional[types.Part]:
     """Loads an artifact from disk."""
+    content = self._find_content_sync(
+        app_name, user_id, filename, session_id, version
+    )
+    if content is None:
+      return None
+    content_path, mime_type = content
+
+    if mime_type:
+      data = content_path.read_bytes()
+      return types.Part(inline_data=types.Blob(mime_type=mime_type, data=data))
+
+    text = content_path.read_text(encoding="utf-8")
+    return types.Part(text=text)
+
+  def _find_content_sync(
+      self,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str],
+      version: Optional[int],
+  ) -> Optional[tuple[Path, Optional[str]]]:
+    """Locates the content of an artifact version on disk.
+
+    Returns:
+      The path of the content and the MIME type of a binary artifact, None for
+      a text artifact; or None if the artifact version is not found.
+    """
     artifact_dir = self._artifact_dir(
         app_name=app_name,
         user_id=user_id,
         session_id=session_id,
         filename=filename,
     )
-    if not artifact_dir.exists():
-      return None
-
-    versions = _list_versions_on_disk(artifact_dir)
-    if not versions:
+    version_to_load = self._resolve_version(
+        app_name, user_id, session_id, filename, version
+    )
+    if version_to_load is None:
       return None
 
-    if version is None:
-      version_to_load = versions[-1]
-    else:
-      if version not in versions:
-        return None
-      version_to_load = version
-
     version_dir = _versions_dir(artifact_dir) / str(version_to_load)
     metadata = _read_metadata(_metadata_path(artifact_dir, version_to_load))
     mime_type = metadata.mime_type if metadata else None
@@ -467,21 +778,66 @@ class FileArtifactService(BaseArtifactService):
       if uri_path and uri_path.exists():
         content_path = uri_path
 
-    if mime_type:
-      if not content_path.exists():
-        logger.warning(
-            "Binary artifact %s missing at %s", filename, content_path
-        )
-        return None
-      data = content_path.read_bytes()
-      return types.Part(inline_data=types.Blob(mime_type=mime_type, data=data))
-
     if not content_path.exists():
-      logger.warning("Text artifact %s missing at %s", filename, content_path)
+      logger.warning(
+          "%s artifact %s missing at %s",
+          "Binary" if mime_type else "Text",
+          filename,
+          content_path,
+      )
       return None
+    return content_path, mime_type
 
-    text = content_path.read_text(encoding="utf-8")
-    return types.Part(text=text)
+  @override
+  async def load_artifact_stream(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+      version: Optional[int] = None,
+      chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+  ) -> Optional[ArtifactStream]:
+    """Reads an artifact from disk in chunks.
+
+    The content is memory-mapped, so only the chunk being consumed is copied
+    into memory, and the stream stays readable if the artifact is deleted
+    while it is consumed.
+    """
+    content = await asyncio.to_thread(
+        self._find_content_sync,
+        app_name,
+        user_id,
+        filename,
+        session_id,
+        version,
+    )
+    if content is None:
+      return None
+    content_path, mime_type = content
+    try:
+      mapped = await asyncio.to_thread(_map_file, content_path)
+    except FileNotFoundError:
+      return None
+
+    async def chunks():
+      if mapped is None:
+        return
+      try:
+        for start in range(0, len(mapped), chunk_size):
+          # Copied off the event loop, as reading the mapping may hit disk.
+          yield await asyncio.to_thread(
+              mapped.__getitem__, slice(start, start + chunk_size)
+          )
+      finally:
+        mapped.close()
+
+    return ArtifactStream(
+        mime_type=mime_type,
+        chunks=chunks(),
+        size=len(mapped) if mapped is not None else 0,
+    )
 
   @override
   async def list_artifact_keys(
@@ -511,22 +867,16 @@ class FileArtifactService(BaseArtifactService):
 
     if session_id:
       session_root = _session_artifacts_dir(base_root, session_id)
-      for artifact_dir in _iter_artifact_dirs(session_root):
-        metadata = self._latest_metadata(artifact_dir)
-        if metadata and metadata.file_name:
-          filenames.add(str(metadata.file_name))
-        else:
-          rel = artifact_dir.relative_to(session_root)
-          filenames.add(rel.as_posix())
+      for artifact_path, file_name in self._index.list_artifacts(
+          self._scope_key(session_root)
+      ):
+        filenames.add(file_name or artifact_path)
 
     user_root = _user_artifacts_dir(base_root)
-    for artifact_dir in _iter_artifact_dirs(user_root):
-      metadata = self._latest_metadata(artifact_dir)
-      if metadata and metadata.file_name:
-        filenames.add(str(metadata.file_name))
-      else:
-        rel = artifact_dir.relative_to(user_root)
-        filenames.add(f"user:{rel.as_posix()}")
+    for artifact_path, file_name in self._index.list_artifacts(
+        self._scope_key(user_root)
+    ):
+      filenames.add(file_name or f"user:{artifact_path}")
 
     return sorted(filenames)
 
@@ -570,8 +920,17 @@ class FileArtifactService(BaseArtifactService):
         filename=filename,
     )
     if artifact_dir.exists():
+      content_hashes = set()
+      for version in _list_versions_on_disk(artifact_dir):
+        metadata = _read_metadata(_metadata_path(artifact_dir, version))
+        if metadata and metadata.content_sha256:
+          content_hashes.add(metadata.content_sha256)
       shutil.rmtree(artifact_dir)
+      self._collect_blobs(content_hashes)
       logger.debug("Deleted artifact %s at %s", filename, artifact_dir)
+    self._index.remove_artifact(
+        *self._index_key(app_name, user_id, session_id, filename)
+    )
 
   @override
   async def list_versions(
@@ -598,13 +957,9 @@ class FileArtifactService(BaseArtifactService):
       filename: str,
       session_id: Optional[str],
   ) -> list[int]:
-    artifact_dir = self._artifact_dir(
-        app_name=app_name,
-        user_id=user_id,
-        session_id=session_id,
-        filename=filename,
+    return self._index.list_versions(
+        *self._index_key(app_name, user_id, session_id, filename)
     )
-    return _list_versions_on_disk(artifact_dir)
 
   @override
   async def list_artifact_versions(
@@ -637,7 +992,9 @@ class FileArtifactService(BaseArtifactService):
         session_id=session_id,
         filename=filename,
     )
-    versions = _list_versions_on_disk(artifact_dir)
+    versions = self._index.list_versions(
+        *self._index_key(app_name, user_id, session_id, filename)
+    )
     artifact_versions: list[ArtifactVersion] = []
     for version in versions:
       metadata_path = _metadata_path(artifact_dir, version)
@@ -688,15 +1045,11 @@ class FileArtifactService(BaseArtifactService):
         session_id=session_id,
         filename=filename,
     )
-    versions = _list_versions_on_disk(artifact_dir)
-    if not versions:
+    version_to_read = self._resolve_version(
+        app_name, user_id, session_id, filename, version
+    )
+    if version_to_read is None:
       return None
-    if version is None:
-      version_to_read = versions[-1]
-    else:
-      if version not in versions:
-        return None
-      version_to_read = version
 
     metadata_path = _metadata_path(artifact_dir, version_to_read)
     metadata = _read_metadata(metadata_path)
@@ -718,10 +1071,12 @@ def _write_metadata(
     version: int,
     canonical_uri: str,
     custom_metadata: Optional[dict[str, Any]],
+    content_sha256: Optional[str] = None,
 ) -> None:
   """Persists metadata describing an artifact version."""
   metadata = FileArtifactVersion(
       file_name=filename,
+      content_sha256=content_sha256,
       mime_type=mime_type,
       canonical_uri=canonical_uri,
       version=version,
@@ -19,23 +19,55 @@ The blob name format used depends on whether the filename has a user namespace:
     {app_name}/{user_id}/user/{filename}/{version}
   - For regular session-scoped files:
     {app_name}/{user_id}/{session_id}/{filename}/{version}
+
+The content of versions saved with `save_artifact` is stored once per SHA-256
+digest, in a shared object named `_adk_blobs/sha256/{digest}`. Version blobs
+are then empty and name their content in the `contentSha256` metadata entry.
+Shared objects count the versions pointing at them in their
+`referenceCount` metadata entry, and are deleted with the last of them.
 """
+
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 from typing import Any
+from typing import AsyncIterable
+from typing import Iterable
 from typing import Optional
+from typing import Union
 
+from google.api_core import exceptions
 from google.cloud import storage
 from google.genai import types
 from typing_extensions import override
 
+from . import artifact_util
+from .base_artifact_service import ArtifactStream
 from .base_artifact_service import ArtifactVersion
 from .base_artifact_service import BaseArtifactService
+from .base_artifact_service import DEFAULT_STREAM_CHUNK_SIZE
 
 logger = logging.getLogger("google_adk." + __name__)
 
+_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+"""The size of the chunks of resumable uploads, a multiple of 256 KiB."""
+
+_CONTENT_BLOB_PREFIX = "_adk_blobs/sha256"
+_CONTENT_SHA256_KEY = "contentSha256"
+_REFERENCE_COUNT_KEY = "referenceCount"
+_MAX_REFERENCE_UPDATE_ATTEMPTS = 8
+"""How often a reference count update is retried after a concurrent one."""
+
+
+def _reference_count(blob: storage.Blob) -> int:
+  """Returns the number of versions pointing at a shared content blob."""
+  try:
+    return int((blob.metadata or {}).get(_REFERENCE_COUNT_KEY, 0))
+  except ValueError:
+    return 0
+
 
 class GcsArtifactService(BaseArtifactService):
   """An artifact service implementation using Google Cloud Storage (GCS)."""
@@ -72,6 +104,48 @@ class GcsArtifactService(BaseArtifactService):
         custom_metadata,
     )
 
+  @override
+  async def save_artifact_stream(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      chunks: Union[Iterable[bytes], AsyncIterable[bytes]],
+      mime_type: str,
+      session_id: Optional[str] = None,
+      custom_metadata: Optional[dict[str, Any]] = None,
+  ) -> int:
+    """Uploads a binary artifact as its chunks arrive.
+
+    The chunks are sent as a resumable upload in `_UPLOAD_CHUNK_SIZE` parts,
+    so memory stays bounded regardless of the artifact size. The upload is
+    cancelled, leaving no version behind, if the chunks raise. As the digest
+    of the content is only known once it is uploaded, streamed versions hold
+    their content instead of sharing it.
+    """
+    version, blob = await asyncio.to_thread(
+        self._prepare_blob,
+        app_name,
+        user_id,
+        session_id,
+        filename,
+        custom_metadata,
+    )
+    writer = blob.open(
+        "wb",
+        chunk_size=_UPLOAD_CHUNK_SIZE,
+        content_type=mime_type or "application/octet-stream",
+    )
+    try:
+      async for chunk in artifact_util.iter_chunks(chunks):
+        await asyncio.to_thread(writer.write, chunk)
+    except BaseException:
+      await asyncio.to_thread(writer.terminate)
+      raise
+    await asyncio.to_thread(writer.close)
+    return version
+
   @override
   async def load_artifact(
       self,
@@ -91,6 +165,51 @@ class GcsArtifactService(BaseArtifactService):
         version,
     )
 
+  @override
+  async def load_artifact_stream(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+      version: Optional[int] = None,
+      chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+  ) -> Optional[ArtifactStream]:
+    """Downloads an artifact in ranged chunks.
+
+    Every chunk is read from the blob generation found when the stream was
+    opened, so a concurrent overwrite fails the stream instead of mixing
+    contents.
+    """
+    version_blob = await asyncio.to_thread(
+        self._get_version_blob,
+        app_name,
+        user_id,
+        session_id,
+        filename,
+        version,
+    )
+    if version_blob is None:
+      return None
+    blob = await asyncio.to_thread(self._get_content_blob, version_blob)
+    if blob is None:
+      return None
+    size = blob.size or 0
+
+    async def chunks():
+      for start in range(0, size, chunk_size):
+        yield await asyncio.to_thread(
+            blob.download_as_bytes,
+            start=start,
+            end=min(start + chunk_size, size) - 1,
+            if_generation_match=blob.generation,
+        )
+
+    return ArtifactStream(
+        mime_type=version_blob.content_type, chunks=chunks(), size=size
+    )
+
   @override
   async def list_artifact_keys(
       self, *, app_name: str, user_id: str, session_id: Optional[str] = None
@@ -189,15 +308,101 @@ class GcsArtifactService(BaseArtifactService):
         f"{self._get_blob_prefix(app_name, user_id, filename, session_id)}/{version}"
     )
 
-  def _save_artifact(
+  def _get_content_blob_name(self, content_sha256: str) -> str:
+    """Returns the name of the shared blob holding content of a digest."""
+    return f"{_CONTENT_BLOB_PREFIX}/{content_sha256}"
+
+  def _get_content_blob(
+      self, version_blob: storage.Blob
+  ) -> Optional[storage.Blob]:
+    """Returns the blob holding the content of a version, if it exists."""
+    content_sha256 = (version_blob.metadata or {}).get(_CONTENT_SHA256_KEY)
+    if content_sha256 is None:
+      # Streamed versions, and versions saved before content was shared,
+      # hold their content.
+      return version_blob
+    return self.bucket.get_blob(self._get_content_blob_name(content_sha256))
+
+  def _add_content_reference(self, content_sha256: str, data: bytes) -> None:
+    """Counts a new version pointing at content, uploading it if missing.
+
+    Updates are conditional on the generation or metageneration read, so a
+    concurrent save or delete of the same content makes the update retry
+    instead of losing a reference.
+    """
+    blob_name = self._get_content_blob_name(content_sha256)
+    for _ in range(_MAX_REFERENCE_UPDATE_ATTEMPTS):
+      blob = self.bucket.get_blob(blob_name)
+      try:
+        if blob is None:
+          blob = self.bucket.blob(blob_name)
+          blob.metadata = {_REFERENCE_COUNT_KEY: "1"}
+          blob.upload_from_string(
+              data=data,
+              content_type="application/octet-stream",
+              if_generation_match=0,
+          )
+        else:
+          blob.metadata = {
+              **(blob.metadata or {}),
+              _REFERENCE_COUNT_KEY: str(_reference_count(blob) + 1),
+          }
+          blob.patch(if_metageneration_match=blob.metageneration)
+        return
+      except (exceptions.NotFound, exceptions.PreconditionFailed):
+        continue
+    raise RuntimeError(
+        f"Could not add a reference to {blob_name} after"
+        f" {_MAX_REFERENCE_UPDATE_ATTEMPTS} concurrent updates."
+    )
+
+  def _remove_content_reference(self, content_sha256: str) -> None:
+    """Uncounts a deleted version, deleting content no longer pointed at."""
+    blob_name = self._get_content_blob_name(content_sha256)
+    for _ in range(_MAX_REFERENCE_UPDATE_ATTEMPTS):
+      blob = self.bucket.get_blob(blob_name)
+      if blob is None:
+        return
+      reference_count = _reference_count(blob) - 1
+      try:
+        if reference_count <= 0:
+          blob.delete(if_metageneration_match=blob.metageneration)
+        else:
+          blob.metadata = {
+              **(blob.metadata or {}),
+              _REFERENCE_COUNT_KEY: str(reference_count),
+          }
+          blob.patch(if_metageneration_match=blob.metageneration)
+        return
+      except (exceptions.NotFound, exceptions.PreconditionFailed):
+        continue
+    # The content is kept rather than risking a version losing it.
+    logger.warning(
+        "Could not remove a reference to %s after %d concurrent updates.",
+        blob_name,
+        _MAX_REFERENCE_UPDATE_ATTEMPTS,
+    )
+
+  def _prepare_blob(
       self,
       app_name: str,
       user_id: str,
       session_id: Optional[str],
       filename: str,
-      artifact: types.Part,
-      custom_metadata: Optional[dict[str, Any]] = None,
-  ) -> int:
+      custom_metadata: Optional[dict[str, Any]],
+  ) -> tuple[int, storage.Blob]:
+    """Returns the next version of an artifact and the blob to upload it to.
+
+    Args:
+      app_name: The name of the application.
+      user_id: The ID of the user.
+      session_id: The ID of the session.
+      filename: The name of the artifact file.
+      custom_metadata: The custom metadata of the new version.
+
+    Returns:
+      The next version and its blob, whose metadata is the custom metadata.
+    """
     versions = self._list_versions(
         app_name=app_name,
         user_id=user_id,
@@ -210,19 +415,24 @@ class GcsArtifactService(BaseArtifactService):
         app_name, user_id, filename, version, session_id
     )
     blob = self.bucket.blob(blob_name)
-    if custom_metadata:
-      blob.metadata = {k: str(v) for k, v in custom_metadata.items()}
+    blob.metadata = {k: str(v) for k, v in (custom_metadata or {}).items()}
+    return version, blob
 
+  def _save_artifact(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+      artifact: types.Part,
+      custom_metadata: Optional[dict[str, Any]] = None,
+  ) -> int:
     if artifact.inline_data:
-      blob.upload_from_string(
-          data=artifact.inline_data.data,
-          content_type=artifact.inline_data.mime_type,
-      )
+      data = artifact.inline_data.data
+      content_type = artifact.inline_data.mime_type
     elif artifact.text:
-      blob.upload_from_string(
-          data=artifact.text,
-          content_type="text/plain",
-      )
+      data = artifact.text.encode("utf-8")
+      content_type = "text/plain"
     elif artifact.file_data:
       raise NotImplementedError(
           "Saving artifact with file_data is not supported yet in"
@@ -231,6 +441,20 @@ class GcsArtifactService(BaseArtifactService):
     else:
       raise ValueError("Artifact must have either inline_data or text.")
 
+    version, blob = self._prepare_blob(
+        app_name, user_id, session_id, filename, custom_metadata
+    )
+    # The content is uploaded only if no version of any artifact has it yet;
+    # the version blob just points at it.
+    content_sha256 = hashlib.sha256(data).hexdigest()
+    self._add_content_reference(content_sha256, data)
+    blob.metadata = {**blob.metadata, _CONTENT_SHA256_KEY: content_sha256}
+    try:
+      blob.upload_from_string(data=b"", content_type=content_type)
+    except BaseException:
+      self._remove_content_reference(content_sha256)
+      raise
+
     return version
 
   def _load_artifact(
@@ -252,19 +476,47 @@ class GcsArtifactService(BaseArtifactService):
         return None
       version = max(versions)
 
-    blob_name = self._get_blob_name(
-        app_name, user_id, filename, version, session_id
+    version_blob = self.bucket.get_blob(
+        self._get_blob_name(app_name, user_id, filename, version, session_id)
     )
-    blob = self.bucket.blob(blob_name)
+    if version_blob is None:
+      return None
+    blob = self._get_content_blob(version_blob)
+    if blob is None:
+      return None
 
     artifact_bytes = blob.download_as_bytes()
     if not artifact_bytes:
       return None
     artifact = types.Part.from_bytes(
-        data=artifact_bytes, mime_type=blob.content_type
+        data=artifact_bytes, mime_type=version_blob.content_type
     )
     return artifact
 
+  def _get_version_blob(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+      version: Optional[int],
+  ) -> Optional[storage.Blob]:
+    """Fetches the blob of an artifact version with its properties."""
+    if version is None:
+      versions = self._list_versions(
+          app_name=app_name,
+          user_id=user_id,
+          session_id=session_id,
+          filename=filename,
+      )
+      if not versions:
+        return None
+      version = max(versions)
+
+    return self.bucket.get_blob(
+        self._get_blob_name(app_name, user_id, filename, version, session_id)
+    )
+
   def _list_artifact_keys(
       self, app_name: str, user_id: str, session_id: Optional[str]
   ) -> list[str]:
@@ -303,18 +555,16 @@ class GcsArtifactService(BaseArtifactService):
       session_id: Optional[str],
       filename: str,
   ) -> None:
-    versions = self._list_versions(
-        app_name=app_name,
-        user_id=user_id,
-        session_id=session_id,
-        filename=filename,
-    )
-    for version in versions:
-      blob_name = self._get_blob_name(
-          app_name, user_id, filename, version, session_id
-      )
-      blob = self.bucket.blob(blob_name)
+    prefix = self._get_blob_prefix(app_name, user_id, filename, session_id)
+    for blob in self.storage_client.list_blobs(
+        self.bucket, prefix=f"{prefix}/"
+    ):
+      content_sha256 = (blob.metadata or {}).get(_CONTENT_SHA256_KEY)
       blob.delete()
+      # The version is gone first, so a failure here leaks content instead
+      # of leaving a version without it.
+      if content_sha256 is not None:
+        self._remove_content_reference(content_sha256)
     return
 
   def _list_versions(
@@ -357,33 +607,31 @@ class GcsArtifactService(BaseArtifactService):
       filename: str,
       version: Optional[int] = None,
   ) -> Optional[ArtifactVersion]:
-    if version is None:
-      versions = self._list_versions(
-          app_name=app_name,
-          user_id=user_id,
-          session_id=session_id,
-          filename=filename,
-      )
-      if not versions:
-        return None
-      version = max(versions)
-
-    blob_name = self._get_blob_name(
-        app_name, user_id, filename, version, session_id
+    blob = self._get_version_blob(
+        app_name, user_id, session_id, filename, version
     )
-    blob = self.bucket.get_blob(blob_name)
-
     if not blob:
       return None
-
-    canonical_uri = f"gs://{self.bucket_name}/{blob.name}"
-
+    version = int(blob.name.split("/")[-1])
+    return self._to_artifact_version(blob, version)
+
+  def _to_artifact_version(
+      self, blob: storage.Blob, version: int
+  ) -> ArtifactVersion:
+    """Describes a version blob, whose canonical URI names its content."""
+    metadata = dict(blob.metadata or {})
+    content_sha256 = metadata.pop(_CONTENT_SHA256_KEY, None)
+    content_blob_name = (
+        self._get_content_blob_name(content_sha256)
+        if content_sha256 is not None
+        else blob.name
+    )
     return ArtifactVersion(
         version=version,
-        canonical_uri=canonical_uri,
+        canonical_uri=f"gs://{self.bucket_name}/{content_blob_name}",
         create_time=blob.time_created.timestamp(),
         mime_type=blob.content_type,
-        custom_metadata=blob.metadata if blob.metadata else {},
+        custom_metadata=metadata,
     )
 
   def _list_artifact_versions_sync(
@@ -407,15 +655,7 @@ class GcsArtifactService(BaseArtifactService):
         )
         continue
 
-      canonical_uri = f"gs://{self.bucket_name}/{blob.name}"
-      av = ArtifactVersion(
-          version=version,
-          canonical_uri=canonical_uri,
-          create_time=blob.time_created.timestamp(),
-          mime_type=blob.content_type,
-          custom_metadata=blob.metadata if blob.metadata else {},
-      )
-      artifact_versions.append(av)
+      artifact_versions.append(self._to_artifact_version(blob, version))
 
     artifact_versions.sort(key=lambda x: x.version)
     return artifact_versions
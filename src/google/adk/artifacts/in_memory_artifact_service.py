@@ -14,6 +14,7 @@
 from __future__ import annotations
 
 import dataclasses
+import hashlib
 import logging
 from typing import Any
 from typing import Optional
@@ -22,6 +23,7 @@ from google.adk.artifacts import artifact_util
 from google.genai import types
 from pydantic import BaseModel
 from pydantic import Field
+from pydantic import PrivateAttr
 from typing_extensions import override
 
 from .base_artifact_service import ArtifactVersion
@@ -37,10 +39,12 @@ class _ArtifactEntry:
   Attributes:
     data: The actual data of the artifact.
     artifact_version: Metadata about this specific version of the artifact.
+    content_sha256: The SHA-256 digest of the inline data, if any.
   """
 
   data: types.Part
   artifact_version: ArtifactVersion
+  content_sha256: Optional[str] = None
 
 
 class InMemoryArtifactService(BaseArtifactService, BaseModel):
@@ -51,6 +55,34 @@ class InMemoryArtifactService(BaseArtifactService, BaseModel):
   """
 
   artifacts: dict[str, list[_ArtifactEntry]] = Field(default_factory=dict)
+  _blobs: dict[str, bytes] = PrivateAttr(default_factory=dict)
+  """The inline data shared by the versions with the same content."""
+  _blob_refs: dict[str, int] = PrivateAttr(default_factory=dict)
+  """The number of versions referencing each blob."""
+
+  def _share_blob(self, artifact: types.Part) -> tuple[types.Part, str]:
+    """Points the inline data of an artifact at the stored identical bytes."""
+    data = artifact.inline_data.data
+    content_sha256 = hashlib.sha256(data).hexdigest()
+    shared = self._blobs.setdefault(content_sha256, data)
+    self._blob_refs[content_sha256] = self._blob_refs.get(content_sha256, 0) + 1
+    if shared is not data:
+      artifact = artifact.model_copy(
+          update={
+              "inline_data": artifact.inline_data.model_copy(
+                  update={"data": shared}
+              )
+          }
+      )
+    return artifact, content_sha256
+
+  def _release_blob(self, content_sha256: str) -> None:
+    refs = self._blob_refs.get(content_sha256, 0) - 1
+    if refs > 0:
+      self._blob_refs[content_sha256] = refs
+    else:
+      self._blob_refs.pop(content_sha256, None)
+      self._blobs.pop(content_sha256, None)
 
   def _file_has_user_namespace(self, filename: str) -> bool:
     """Checks if the filename has a user namespace.
@@ -118,8 +150,11 @@ class InMemoryArtifactService(BaseArtifactService, BaseModel):
     if custom_metadata:
       artifact_version.custom_metadata = custom_metadata
 
+    content_sha256 = None
     if artifact.inline_data is not None:
       artifact_version.mime_type = artifact.inline_data.mime_type
+      if artifact.inline_data.data:
+        artifact, content_sha256 = self._share_blob(artifact)
     elif artifact.text is not None:
       artifact_version.mime_type = "text/plain"
     elif artifact.file_data is not None:
@@ -136,7 +171,11 @@ class InMemoryArtifactService(BaseArtifactService, BaseModel):
       raise ValueError("Not supported artifact type.")
 
     self.artifacts[path].append(
-        _ArtifactEntry(data=artifact, artifact_version=artifact_version)
+        _ArtifactEntry(
+            data=artifact,
+            artifact_version=artifact_version,
+            content_sha256=content_sha256,
+        )
     )
     return version
 
@@ -222,7 +261,9 @@ class InMemoryArtifactService(BaseArtifactService, BaseModel):
     path = self._artifact_path(app_name, user_id, filename, session_id)
     if not self.artifacts.get(path):
       return None
-    self.artifacts.pop(path, None)
+    for entry in self.artifacts.pop(path, None):
+      if entry.content_sha256:
+        self._release_blob(entry.content_sha256)
 
   @override
   async def list_versions(
@@ -28,6 +28,8 @@ from .auth_schemes import AuthSchemeType
 from .auth_schemes import ExtendedOAuth2
 from .auth_schemes import OpenIdConnectWithConfig
 from .auth_tool import AuthConfig
+from .credential_refresh_coordinator import CredentialRefreshCoordinator
+from .credential_refresh_coordinator import get_default_refresh_coordinator
 from .exchanger.base_credential_exchanger import BaseCredentialExchanger
 from .exchanger.credential_exchanger_registry import CredentialExchangerRegistry
 from .oauth2_discovery import OAuth2DiscoveryManager
@@ -47,8 +49,14 @@ class CredentialManager:
 
   This class is only for use by Agent Development Kit.
 
+  Concurrent refreshes of the same OAuth2 credential are coalesced, and
+  credentials close to expiry are refreshed in the background, by a
+  `CredentialRefreshCoordinator` shared by all managers of the process.
+
   Args:
       auth_config: Configuration containing authentication scheme and credentials
+      refresh_coordinator: The coordinator of credential refreshes. Defaults
+        to the process-wide coordinator.
 
   Example:
       ```python
@@ -78,8 +86,12 @@ class CredentialManager:
   def __init__(
       self,
       auth_config: AuthConfig,
+      refresh_coordinator: Optional[CredentialRefreshCoordinator] = None,
   ):
     self._auth_config = auth_config
+    self._refresh_coordinator = (
+        refresh_coordinator or get_default_refresh_coordinator()
+    )
     self._exchanger_registry = CredentialExchangerRegistry()
     self._refresher_registry = CredentialRefresherRegistry()
     self._discovery_manager = OAuth2DiscoveryManager()
@@ -232,15 +244,9 @@ class CredentialManager:
     if not refresher:
       return credential, False
 
-    if await refresher.is_refresh_needed(
-        credential, self._auth_config.auth_scheme
-    ):
-      refreshed_credential = await refresher.refresh(
-          credential, self._auth_config.auth_scheme
-      )
-      return refreshed_credential, True
-
-    return credential, False
+    return await self._refresh_coordinator.refresh(
+        credential, self._auth_config.auth_scheme, refresher
+    )
 
   def _is_credential_ready(self) -> bool:
     """Check if credential is ready to use without further processing."""
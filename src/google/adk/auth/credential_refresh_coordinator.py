@@ -0,0 +1,203 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Coordinates credential refreshes across concurrent callers."""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import logging
+import time
+from typing import Optional
+
+from ..utils.feature_decorator import experimental
+from .auth_credential import AuthCredential
+from .auth_credential import OAuth2Auth
+from .auth_schemes import AuthScheme
+from .refresher.base_credential_refresher import BaseCredentialRefresher
+
+logger = logging.getLogger("google_adk." + __name__)
+
+DEFAULT_PROACTIVE_REFRESH_SECONDS = 300
+"""Credentials expiring within this many seconds are refreshed ahead of time."""
+
+_RefreshKey = tuple[str, str, str, str]
+
+
+def _get_refresh_key(credential: AuthCredential) -> Optional[_RefreshKey]:
+  """Identifies the token state of a refreshable OAuth2 credential."""
+  oauth2 = getattr(credential, "oauth2", None)
+  if not isinstance(oauth2, OAuth2Auth) or not oauth2.refresh_token:
+    return None
+  return (
+      str(credential.auth_type),
+      oauth2.client_id or "",
+      oauth2.refresh_token,
+      oauth2.access_token or "",
+  )
+
+
+@experimental
+class CredentialRefreshCoordinator:
+  """Coalesces and anticipates refreshes of OAuth2 credentials.
+
+  Concurrent refreshes of the same credential, e.g. from parallel function
+  calls of tools sharing it, are coalesced into a single in-flight token
+  request whose result is shared by every caller. Credentials expiring within
+  `proactive_refresh_seconds` are refreshed in the background while callers
+  keep using the current access token; the refreshed credential is handed out
+  to the next caller presenting the old one.
+
+  Credentials without a refresh token are passed to the refresher as is.
+  """
+
+  def __init__(
+      self,
+      *,
+      proactive_refresh_seconds: float = DEFAULT_PROACTIVE_REFRESH_SECONDS,
+      max_cached_credentials: int = 256,
+  ):
+    """Initializes the CredentialRefreshCoordinator.
+
+    Args:
+      proactive_refresh_seconds: Credentials expiring within this many seconds
+        are refreshed in the background. Zero disables proactive refreshes.
+      max_cached_credentials: The maximum number of refreshed credentials to
+        remember for callers still presenting the credential they replace.
+    """
+    self._proactive_refresh_seconds = proactive_refresh_seconds
+    self._max_cached_credentials = max_cached_credentials
+    self._in_flight: dict[_RefreshKey, asyncio.Task[AuthCredential]] = {}
+    self._refreshed: collections.OrderedDict[_RefreshKey, AuthCredential] = (
+        collections.OrderedDict()
+    )
+    self._background_tasks: set[asyncio.Task[AuthCredential]] = set()
+
+  async def refresh(
+      self,
+      credential: AuthCredential,
+      auth_scheme: Optional[AuthScheme],
+      refresher: BaseCredentialRefresher,
+  ) -> tuple[AuthCredential, bool]:
+    """Returns a usable credential, refreshing it if needed.
+
+    Args:
+      credential: The credential to refresh.
+      auth_scheme: The auth scheme of the credential.
+      refresher: The refresher for the credential type.
+
+    Returns:
+      The credential to use and whether it differs from `credential`.
+    """
+    key = _get_refresh_key(credential)
+    if key is None:
+      if await refresher.is_refresh_needed(credential, auth_scheme):
+        return await refresher.refresh(credential, auth_scheme), True
+      return credential, False
+
+    credential, key, was_refreshed = self._get_latest(credential, key)
+    if await refresher.is_refresh_needed(credential, auth_scheme):
+      task = self._get_or_start_refresh(key, credential, auth_scheme, refresher)
+      # Shielded so a cancelled caller doesn't cancel the shared refresh.
+      refreshed = await asyncio.shield(task)
+      return refreshed.model_copy(deep=True), True
+
+    if self._expires_soon(credential):
+      task = self._get_or_start_refresh(key, credential, auth_scheme, refresher)
+      if task not in self._background_tasks:
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_background_refresh_done)
+    return credential, was_refreshed
+
+  def _get_latest(
+      self, credential: AuthCredential, key: _RefreshKey
+  ) -> tuple[AuthCredential, _RefreshKey, bool]:
+    """Follows the credentials that replaced `credential`, if any."""
+    was_refreshed = False
+    seen = set()
+    while key in self._refreshed and key not in seen:
+      seen.add(key)
+      self._refreshed.move_to_end(key)
+      credential = self._refreshed[key].model_copy(deep=True)
+      key = _get_refresh_key(credential)
+      was_refreshed = True
+    return credential, key, was_refreshed
+
+  def _expires_soon(self, credential: AuthCredential) -> bool:
+    expires_at = credential.oauth2.expires_at
+    return (
+        self._proactive_refresh_seconds > 0
+        and expires_at is not None
+        and expires_at - time.time() < self._proactive_refresh_seconds
+    )
+
+  def _get_or_start_refresh(
+      self,
+      key: _RefreshKey,
+      credential: AuthCredential,
+      auth_scheme: Optional[AuthScheme],
+      refresher: BaseCredentialRefresher,
+  ) -> asyncio.Task[AuthCredential]:
+    loop = asyncio.get_running_loop()
+    task = self._in_flight.get(key)
+    if task is None or task.done() or task.get_loop() is not loop:
+      task = loop.create_task(
+          self._run_refresh(
+              key, credential.model_copy(deep=True), auth_scheme, refresher
+          )
+      )
+      self._in_flight[key] = task
+    return task
+
+  async def _run_refresh(
+      self,
+      key: _RefreshKey,
+      credential: AuthCredential,
+      auth_scheme: Optional[AuthScheme],
+      refresher: BaseCredentialRefresher,
+  ) -> AuthCredential:
+    try:
+      refreshed = await refresher.refresh(credential, auth_scheme)
+      refreshed_key = _get_refresh_key(refreshed)
+      # Refreshers return the original credential when the refresh failed.
+      if refreshed_key is not None and refreshed_key != key:
+        self._refreshed[key] = refreshed.model_copy(deep=True)
+        self._refreshed.move_to_end(key)
+        while len(self._refreshed) > self._max_cached_credentials:
+          self._refreshed.popitem(last=False)
+      return refreshed
+    finally:
+      if self._in_flight.get(key) is asyncio.current_task():
+        del self._in_flight[key]
+
+  def _on_background_refresh_done(
+      self, task: asyncio.Task[AuthCredential]
+  ) -> None:
+    self._background_tasks.discard(task)
+    if not task.cancelled() and task.exception():
+      logger.warning(
+          "Background credential refresh failed: %s", task.exception()
+      )
+
+
+_default_refresh_coordinator: Optional[CredentialRefreshCoordinator] = None
+
+
+def get_default_refresh_coordinator() -> CredentialRefreshCoordinator:
+  """Returns the process-wide credential refresh coordinator."""
+  global _default_refresh_coordinator
+  if _default_refresh_coordinator is None:
+    _default_refresh_coordinator = CredentialRefreshCoordinator()
+  return _default_refresh_coordinator
@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from typing import Optional
@@ -82,6 +83,11 @@ class OAuth2CredentialRefresher(BaseCredentialRefresher):
     """Refresh the OAuth2 credential.
     If refresh failed, return the original credential.
 
+    The credential is refreshed regardless of its expiry, so callers can
+    refresh ahead of time; use `is_refresh_needed` to refresh only expired
+    credentials. The token request runs in a worker thread so it doesn't block
+    the event loop.
+
     Args:
         auth_credential: The OAuth2 credential to refresh.
         auth_scheme: The OAuth2 authentication scheme (optional for Google OAuth2 JSON).
@@ -96,31 +102,29 @@ class OAuth2CredentialRefresher(BaseCredentialRefresher):
       if not AUTHLIB_AVAILABLE:
         return auth_credential
 
-      if not auth_credential.oauth2:
+      if not auth_credential.oauth2.refresh_token:
+        logger.warning("Cannot refresh OAuth2 tokens without a refresh token")
         return auth_credential
 
-      if OAuth2Token({
-          "expires_at": auth_credential.oauth2.expires_at,
-          "expires_in": auth_credential.oauth2.expires_in,
-      }).is_expired():
-        client, token_endpoint = create_oauth2_session(
-            auth_scheme, auth_credential
+      client, token_endpoint = create_oauth2_session(
+          auth_scheme, auth_credential
+      )
+      if not client:
+        logger.warning("Could not create OAuth2 session for token refresh")
+        return auth_credential
+
+      try:
+        tokens = await asyncio.to_thread(
+            client.refresh_token,
+            url=token_endpoint,
+            refresh_token=auth_credential.oauth2.refresh_token,
         )
-        if not client:
-          logger.warning("Could not create OAuth2 session for token refresh")
-          return auth_credential
-
-        try:
-          tokens = client.refresh_token(
-              url=token_endpoint,
-              refresh_token=auth_credential.oauth2.refresh_token,
-          )
-          update_credential_with_tokens(auth_credential, tokens)
-          logger.debug("Successfully refreshed OAuth2 tokens")
-        except Exception as e:
-          # TODO reconsider whether we should raise error when refresh failed.
-          logger.error("Failed to refresh OAuth2 tokens: %s", e)
-          # Return original credential on failure
-          return auth_credential
+        update_credential_with_tokens(auth_credential, tokens)
+        logger.debug("Successfully refreshed OAuth2 tokens")
+      except Exception as e:
+        # TODO reconsider whether we should raise error when refresh failed.
+        logger.error("Failed to refresh OAuth2 tokens: %s", e)
+        # Return original credential on failure
+        return auth_credential
 
     return auth_credential
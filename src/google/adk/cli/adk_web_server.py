@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import asyncio
+import base64
 from contextlib import asynccontextmanager
 import importlib
 import json
@@ -61,6 +62,7 @@ from ..agents.live_request_queue import LiveRequestQueue
 from ..agents.run_config import RunConfig
 from ..agents.run_config import StreamingMode
 from ..apps.app import App
+from ..artifacts.base_artifact_service import ArtifactStream
 from ..artifacts.base_artifact_service import BaseArtifactService
 from ..auth.credential_service.base_credential_service import BaseCredentialService
 from ..errors.already_exists_error import AlreadyExistsError
@@ -86,6 +88,7 @@ from ..runners import Runner
 from ..sessions.base_session_service import BaseSessionService
 from ..sessions.session import Session
 from ..utils.context_utils import Aclosing
+from ..utils.streaming_utils import event_to_sse
 from .cli_eval import EVAL_SESSION_ID_PREFIX
 from .utils import cleanup
 from .utils import common
@@ -387,6 +390,29 @@ def _setup_instrumentation_lib_if_installed():
     )
 
 
+async def _stream_blob_part_json(
+    stream: ArtifactStream,
+) -> typing.AsyncIterator[bytes]:
+  """Encodes a binary artifact stream as the JSON of a `types.Part`.
+
+  The base64 payload is encoded chunk by chunk, so the response never holds
+  the whole artifact.
+  """
+  yield (
+      '{"inlineData":{"mimeType":%s,"data":"' % json.dumps(stream.mime_type)
+  ).encode()
+  # Base64 encodes 3-byte groups, so partial groups carry over to the next
+  # chunk to keep padding at the very end.
+  remainder = b""
+  async for chunk in stream.chunks:
+    data = remainder + chunk
+    cut = len(data) - len(data) % 3
+    remainder = data[cut:]
+    if cut:
+      yield base64.urlsafe_b64encode(data[:cut])
+  yield base64.urlsafe_b64encode(remainder) + b'"}}'
+
+
 class AdkWebServer:
   """Helper class for setting up and running the ADK web server on FastAPI.
 
@@ -1254,6 +1280,29 @@ class AdkWebServer:
             status_code=400, detail=MISSING_EVAL_DEPENDENCIES_MESSAGE
         ) from e
 
+    async def _load_artifact_response(
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        artifact_name: str,
+        version: Optional[int],
+    ) -> types.Part | StreamingResponse:
+      stream = await self.artifact_service.load_artifact_stream(
+          app_name=app_name,
+          user_id=user_id,
+          session_id=session_id,
+          filename=artifact_name,
+          version=version,
+      )
+      if not stream:
+        raise HTTPException(status_code=404, detail="Artifact not found")
+      if stream.mime_type is None:
+        text = b"".join([chunk async for chunk in stream.chunks])
+        return types.Part(text=text.decode("utf-8"))
+      return StreamingResponse(
+          _stream_blob_part_json(stream), media_type="application/json"
+      )
+
     @app.get(
         "/apps/{app_name}/users/{user_id}/sessions/{session_id}/artifacts/{artifact_name}",
         response_model_exclude_none=True,
@@ -1265,16 +1314,9 @@ class AdkWebServer:
         artifact_name: str,
         version: Optional[int] = Query(None),
     ) -> Optional[types.Part]:
-      artifact = await self.artifact_service.load_artifact(
-          app_name=app_name,
-          user_id=user_id,
-          session_id=session_id,
-          filename=artifact_name,
-          version=version,
+      return await _load_artifact_response(
+          app_name, user_id, session_id, artifact_name, version
       )
-      if not artifact:
-        raise HTTPException(status_code=404, detail="Artifact not found")
-      return artifact
 
     @app.get(
         "/apps/{app_name}/users/{user_id}/sessions/{session_id}/artifacts/{artifact_name}/versions/{version_id}",
@@ -1287,16 +1329,9 @@ class AdkWebServer:
         artifact_name: str,
         version_id: int,
     ) -> Optional[types.Part]:
-      artifact = await self.artifact_service.load_artifact(
-          app_name=app_name,
-          user_id=user_id,
-          session_id=session_id,
-          filename=artifact_name,
-          version=version_id,
+      return await _load_artifact_response(
+          app_name, user_id, session_id, artifact_name, version_id
       )
-      if not artifact:
-        raise HTTPException(status_code=404, detail="Artifact not found")
-      return artifact
 
     @app.get(
         "/apps/{app_name}/users/{user_id}/sessions/{session_id}/artifacts",
@@ -1420,13 +1455,11 @@ class AdkWebServer:
           ) as agen:
             async for event in agen:
               # Format as SSE data
-              sse_event = event.model_dump_json(
-                  exclude_none=True, by_alias=True
-              )
+              sse_event = event_to_sse(event)
               logger.debug(
                   "Generated event in agent run streaming: %s", sse_event
               )
-              yield f"data: {sse_event}\n\n"
+              yield sse_event
         except Exception as e:
           logger.exception("Error in event_generator: %s", e)
           # You might want to yield an error event here
@@ -135,10 +135,21 @@ def conformance():
         exists=True, dir_okay=True, file_okay=False, resolve_path=True
     ),
 )
+@click.option(
+    "--recordings_format",
+    type=click.Choice(["jsonl", "yaml"], case_sensitive=False),
+    default="jsonl",
+    show_default=True,
+    help=(
+        "Format of the recorded interactions: 'jsonl' is indexed and fast to"
+        " replay, 'yaml' is easier to review."
+    ),
+)
 @click.pass_context
 def cli_conformance_record(
     ctx,
     paths: tuple[str, ...],
+    recordings_format: str,
 ):
   """Generate ADK conformance test YAML files from TestCaseInput specifications.
 
@@ -178,7 +189,54 @@ def cli_conformance_record(
 
   # Default to tests/ directory if no paths provided
   test_paths = [Path(p) for p in paths] if paths else [Path("tests").resolve()]
-  asyncio.run(run_conformance_record(test_paths))
+  asyncio.run(
+      run_conformance_record(
+          test_paths, recordings_format=recordings_format.lower()
+      )
+  )
+
+
+@conformance.command("convert", cls=HelpfulCommand)
+@click.argument(
+    "paths",
+    nargs=-1,
+    type=click.Path(
+        exists=True, dir_okay=True, file_okay=False, resolve_path=True
+    ),
+)
+@click.option(
+    "--to",
+    "to_format",
+    type=click.Choice(["jsonl", "yaml"], case_sensitive=False),
+    required=True,
+    help="Format to convert the recorded interactions to.",
+)
+def cli_conformance_convert(paths: tuple[str, ...], to_format: str):
+  """Convert recorded interactions between YAML and JSON Lines.
+
+  JSON Lines recordings (generated-recordings.jsonl) are indexed per agent and
+  loaded lazily, which makes replaying large test suites faster. YAML
+  recordings (generated-recordings.yaml) are easier to read and review.
+
+  PATHS: One or more directories containing test cases. If no paths are
+  provided, defaults to 'tests/' directory.
+
+  Examples:
+
+  Review recordings: adk conformance convert --to=yaml tests/core
+  """
+  from .plugins.recordings_store import convert_recordings
+
+  test_paths = [Path(p) for p in paths] if paths else [Path("tests").resolve()]
+  num_converted = 0
+  for test_path in test_paths:
+    for spec_file in test_path.rglob("spec.yaml"):
+      if convert_recordings(spec_file.parent, to_format.lower()):
+        num_converted += 1
+  click.echo(
+      f"Recordings of {num_converted} test case(s) are stored as"
+      f" {to_format.lower()}."
+  )
 
 
 @conformance.command("test", cls=HelpfulCommand)
@@ -231,7 +289,8 @@ def cli_conformance_test(
   category/
     test_name/
       spec.yaml                    # Test specification
-      generated-recordings.yaml    # Recorded interactions (replay mode)
+      generated-recordings.jsonl   # Recorded interactions (replay mode),
+                                   # or generated-recordings.yaml
       generated-session.yaml       # Session data (replay mode)
 
   EXAMPLES:
@@ -274,6 +333,162 @@ def cli_conformance_test(
   asyncio.run(run_conformance_test(test_paths=test_paths, mode=mode.lower()))
 
 
+@main.command("bench", cls=HelpfulCommand)
+@click.argument(
+    "paths",
+    nargs=-1,
+    type=click.Path(
+        exists=True, file_okay=False, dir_okay=True, resolve_path=True
+    ),
+)
+@click.option(
+    "--agents_dir",
+    type=click.Path(
+        exists=True, dir_okay=True, file_okay=False, resolve_path=True
+    ),
+    default=".",
+    show_default=True,
+    help="The directory containing the agents under test.",
+)
+@click.option(
+    "--model_latency_ms",
+    type=click.FloatRange(min=0),
+    default=0.0,
+    show_default=True,
+    help="Synthetic latency added to every replayed LLM response.",
+)
+@click.option(
+    "--tool_latency_ms",
+    type=click.FloatRange(min=0),
+    default=0.0,
+    show_default=True,
+    help="Synthetic latency added to every replayed tool response.",
+)
+@click.option(
+    "--iterations",
+    type=click.IntRange(min=1),
+    default=5,
+    show_default=True,
+    help="Measured runs per test case; medians are reported.",
+)
+@click.option(
+    "--warmup",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Unmeasured runs per test case before the measured ones.",
+)
+@click.option(
+    "--trace_allocations/--no_trace_allocations",
+    default=True,
+    show_default=True,
+    help="Trace memory allocations in an additional run per test case.",
+)
+@click.option(
+    "--session_service_uri",
+    help=(
+        "Optional. The URI of the session service to measure the write cost"
+        " of. Defaults to the in-memory session service."
+    ),
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, writable=True, resolve_path=True),
+    help="Optional. Path to write the results to, e.g. to use as a baseline.",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False, resolve_path=True),
+    help="Optional. Path of stored results to compare the results against.",
+)
+@click.option(
+    "--max_regression",
+    type=click.FloatRange(min=0),
+    default=0.1,
+    show_default=True,
+    help="Tolerated relative regression of a metric against the baseline.",
+)
+def cli_bench(
+    paths: tuple[str, ...],
+    agents_dir: str,
+    model_latency_ms: float,
+    tool_latency_ms: float,
+    iterations: int,
+    warmup: int,
+    trace_allocations: bool,
+    session_service_uri: Optional[str],
+    output: Optional[str],
+    baseline: Optional[str],
+    max_regression: float,
+):
+  """Benchmark the framework overhead of agents without live models.
+
+  Replays the recordings of conformance test cases through a Runner, with
+  optional synthetic model and tool latency, and reports the wall time, CPU
+  time, allocations and events per second of each test case and of each of its
+  agents, and the cost of the session service writes.
+
+  PATHS can be any number of folders containing test cases with recordings,
+  see `adk conformance test`. If no paths are provided, defaults to searching
+  the 'tests' folder.
+
+  EXAMPLES:
+
+  \b
+  # Store a baseline, then compare against it
+  adk bench --agents_dir=agents --output=baseline.json tests/think_remix
+  adk bench --agents_dir=agents --baseline=baseline.json tests/think_remix
+
+  \b
+  # Simulate 500 ms model and 50 ms tool latency
+  adk bench --model_latency_ms=500 --tool_latency_ms=50 tests/think_remix
+  """
+  from .conformance.cli_bench import BenchReport
+  from .conformance.cli_bench import compare_to_baseline
+  from .conformance.cli_bench import run_bench
+
+  test_paths = [Path(p) for p in paths] if paths else [Path("tests").resolve()]
+  report = asyncio.run(
+      run_bench(
+          test_paths,
+          agents_dir,
+          session_service_uri=session_service_uri,
+          model_latency_ms=model_latency_ms,
+          tool_latency_ms=tool_latency_ms,
+          iterations=iterations,
+          warmup=warmup,
+          trace_allocations=trace_allocations,
+      )
+  )
+
+  if output:
+    Path(output).write_text(report.model_dump_json(indent=2), encoding="utf-8")
+    click.echo(f"Results written to '{output}'.")
+
+  if baseline:
+    baseline_report = BenchReport.model_validate_json(
+        Path(baseline).read_text(encoding="utf-8")
+    )
+    if (
+        baseline_report.model_latency_ms != model_latency_ms
+        or baseline_report.tool_latency_ms != tool_latency_ms
+    ):
+      click.secho(
+          "Warning: the baseline was measured with a different synthetic"
+          " latency.",
+          fg="yellow",
+          err=True,
+      )
+    regressions = compare_to_baseline(report, baseline_report, max_regression)
+    if regressions:
+      for regression in regressions:
+        click.secho(regression, fg="red", err=True)
+      raise click.ClickException(
+          f"{len(regressions)} metric(s) regressed against the baseline"
+      )
+    click.secho("No regressions against the baseline.", fg="green")
+
+
 @main.command("create", cls=HelpfulCommand)
 @click.option(
     "--model",
@@ -837,6 +1052,34 @@ def cli_add_eval_case(
     raise click.ClickException(f"Failed to add eval case(s): {e}") from e
 
 
+@main.group("artifacts")
+def artifacts():
+  """Manage locally stored artifacts."""
+  pass
+
+
+@artifacts.command("rebuild_index", cls=HelpfulCommand)
+@click.argument(
+    "artifact_root",
+    type=click.Path(
+        exists=True, dir_okay=True, file_okay=False, resolve_path=True
+    ),
+)
+def cli_rebuild_artifact_index(artifact_root: str):
+  """Rebuilds the listing index of a local artifact directory.
+
+  ARTIFACT_ROOT: The root directory of a file artifact service, e.g. the path
+  of a file:// artifact service URI.
+  """
+  from ..artifacts.file_artifact_service import FileArtifactService
+
+  artifact_service = FileArtifactService(root_dir=artifact_root)
+  num_versions = asyncio.run(artifact_service.rebuild_index())
+  click.echo(
+      f"Indexed {num_versions} artifact version(s) under '{artifact_root}'."
+  )
+
+
 def web_options():
   """Decorator to add web UI options to click commands."""
 
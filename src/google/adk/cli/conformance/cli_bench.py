@@ -0,0 +1,596 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""CLI implementation for benchmarking agents replayed from recordings."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import functools
+from pathlib import Path
+import statistics
+import time
+import tracemalloc
+from typing import Any
+from typing import Optional
+from typing import TYPE_CHECKING
+from typing import Union
+
+import click
+from google.genai import types
+from pydantic import BaseModel
+from pydantic import Field
+from typing_extensions import override
+
+from ...agents.base_agent import BaseAgent
+from ...agents.callback_context import CallbackContext
+from ...apps.app import App
+from ...artifacts.in_memory_artifact_service import InMemoryArtifactService
+from ...events.event import Event
+from ...memory.in_memory_memory_service import InMemoryMemoryService
+from ...models.llm_request import LlmRequest
+from ...models.llm_response import LlmResponse
+from ...plugins.base_plugin import BasePlugin
+from ...runners import Runner
+from ...sessions.base_session_service import BaseSessionService
+from ..plugins.recordings_store import get_recordings_file
+from ..plugins.replay_plugin import ReplayPlugin
+from ._generated_file_utils import load_test_case
+from .test_case import TestCase
+from .test_case import UserMessage
+
+if TYPE_CHECKING:
+  from ...agents.invocation_context import InvocationContext
+  from ...tools.base_tool import BaseTool
+  from ...tools.tool_context import ToolContext
+
+_BENCH_USER_ID = "adk_bench_user"
+
+
+class PhaseStats(BaseModel):
+  """Averaged measurements of one agent over the runs of a test case.
+
+  Measurements of an agent include those of its sub-agents. Agents running in
+  parallel are measured over the same period of time.
+  """
+
+  wall_ms: float = 0.0
+  """Wall time from the start to the end of the agent, per run."""
+
+  cpu_ms: float = 0.0
+  """Process CPU time while the agent ran, per run."""
+
+  events: float = 0.0
+  """Events authored by the agent, per run."""
+
+  alloc_kib: Optional[float] = None
+  """Growth of the traced memory while the agent ran, if traced."""
+
+
+class BenchCaseResult(BaseModel):
+  """Benchmark result of a single test case."""
+
+  name: str
+  """The category and name of the test case, e.g. `core/description_001`."""
+
+  iterations: int
+  """The number of measured runs."""
+
+  wall_ms: float
+  """Median wall time of a run, including the synthetic latency."""
+
+  cpu_ms: float
+  """Median process CPU time of a run, i.e. the framework overhead."""
+
+  events: int
+  """Events yielded by a run."""
+
+  events_per_sec: float
+  """Events yielded per second of median wall time."""
+
+  session_writes: int
+  """Events appended to the session service by a run."""
+
+  session_write_ms: float
+  """Median time spent appending events to the session service in a run."""
+
+  peak_alloc_kib: Optional[float] = None
+  """Peak traced memory of a run, if traced."""
+
+  retained_alloc_kib: Optional[float] = None
+  """Traced memory still allocated at the end of a run, if traced."""
+
+  phases: dict[str, PhaseStats] = Field(default_factory=dict)
+  """Measurements per agent, keyed by agent name, in order of first start."""
+
+
+class BenchReport(BaseModel):
+  """Results of a benchmark, stored as the baseline of later benchmarks."""
+
+  model_latency_ms: float = 0.0
+  """Synthetic latency added to every replayed LLM response."""
+
+  tool_latency_ms: float = 0.0
+  """Synthetic latency added to every replayed tool response."""
+
+  cases: list[BenchCaseResult] = Field(default_factory=list)
+  """Results per test case."""
+
+
+@dataclasses.dataclass
+class _PhaseTotals:
+  runs: int = 0
+  wall: float = 0.0
+  cpu: float = 0.0
+  events: int = 0
+  alloc: Optional[int] = None
+
+
+@dataclasses.dataclass
+class _RunStats:
+  wall: float
+  cpu: float
+  events: int
+  session_writes: int
+  session_write_time: float
+
+
+class _LatencyReplayPlugin(ReplayPlugin):
+  """Replays recordings after a synthetic model or tool latency."""
+
+  def __init__(self, *, model_latency: float, tool_latency: float):
+    super().__init__(name="adk_bench_replay")
+    self._model_latency = model_latency
+    self._tool_latency = tool_latency
+
+  @override
+  async def before_model_callback(
+      self, *, callback_context: CallbackContext, llm_request: LlmRequest
+  ) -> Optional[LlmResponse]:
+    response = await super().before_model_callback(
+        callback_context=callback_context, llm_request=llm_request
+    )
+    if response is not None and self._model_latency:
+      await asyncio.sleep(self._model_latency)
+    return response
+
+  @override
+  async def before_tool_callback(
+      self,
+      *,
+      tool: BaseTool,
+      tool_args: dict[str, Any],
+      tool_context: ToolContext,
+  ) -> Optional[dict]:
+    response = await super().before_tool_callback(
+        tool=tool, tool_args=tool_args, tool_context=tool_context
+    )
+    if response is not None and self._tool_latency:
+      await asyncio.sleep(self._tool_latency)
+    return response
+
+
+class _PhaseTimingPlugin(BasePlugin):
+  """Measures the agents of the runs it observes."""
+
+  def __init__(self) -> None:
+    super().__init__(name="adk_bench_timing")
+    self.trace_allocations = False
+    self.phases: dict[str, _PhaseTotals] = {}
+    # key: (invocation_id, agent_name) -> (wall, cpu, traced memory) at start
+    self._started: dict[tuple[str, str], tuple[float, float, int]] = {}
+
+  @override
+  async def before_agent_callback(
+      self, *, agent: BaseAgent, callback_context: CallbackContext
+  ) -> Optional[types.Content]:
+    self.phases.setdefault(agent.name, _PhaseTotals())
+    self._started[(callback_context.invocation_id, agent.name)] = (
+        time.perf_counter(),
+        time.process_time(),
+        self._traced_memory(),
+    )
+    return None
+
+  @override
+  async def after_agent_callback(
+      self, *, agent: BaseAgent, callback_context: CallbackContext
+  ) -> Optional[types.Content]:
+    started = self._started.pop(
+        (callback_context.invocation_id, agent.name), None
+    )
+    if started is None:
+      return None
+    wall, cpu, memory = started
+    totals = self.phases[agent.name]
+    totals.runs += 1
+    totals.wall += time.perf_counter() - wall
+    totals.cpu += time.process_time() - cpu
+    if self.trace_allocations:
+      totals.alloc = (totals.alloc or 0) + self._traced_memory() - memory
+    return None
+
+  @override
+  async def on_event_callback(
+      self, *, invocation_context: InvocationContext, event: Event
+  ) -> Optional[Event]:
+    if event.author in self.phases:
+      self.phases[event.author].events += 1
+    return None
+
+  def _traced_memory(self) -> int:
+    if not self.trace_allocations:
+      return 0
+    return tracemalloc.get_traced_memory()[0]
+
+
+def _discover_bench_cases(paths: list[Path]) -> list[TestCase]:
+  """Discovers the test cases with recordings under the given paths."""
+  test_cases = []
+  for path in paths:
+    for spec_file in path.rglob("spec.yaml"):
+      test_case_dir = spec_file.parent
+      category = test_case_dir.parent.name
+      name = test_case_dir.name
+      if get_recordings_file(test_case_dir) is None:
+        click.secho(
+            f"Skipping {category}/{name}: no recordings", fg="yellow", err=True
+        )
+        continue
+      test_cases.append(
+          TestCase(
+              category=category,
+              name=name,
+              dir=test_case_dir,
+              test_spec=load_test_case(test_case_dir),
+          )
+      )
+  return sorted(test_cases, key=lambda tc: (tc.category, tc.name))
+
+
+def _get_user_content(
+    user_message: UserMessage,
+    user_message_index: int,
+    function_call_ids: dict[str, str],
+) -> types.Content:
+  """Builds the content of a user message, as the conformance tests do."""
+  if user_message.content is None:
+    if user_message.text is None:
+      raise ValueError(
+          f"UserMessage at index {user_message_index} has neither text nor"
+          " content"
+      )
+    return types.UserContent(parts=[types.Part(text=user_message.text)])
+
+  content = user_message.content.model_copy(deep=True)
+  # Responses to long-running tools refer to calls of the current run.
+  if content.parts and (
+      function_response := content.parts[0].function_response
+  ):
+    if function_response.name not in function_call_ids:
+      raise ValueError(
+          f"Function response for {function_response.name} does not match any"
+          " pending function call."
+      )
+    function_response.id = function_call_ids[function_response.name]
+  return content
+
+
+def _time_session_writes(
+    session_service: BaseSessionService,
+) -> list[float]:
+  """Records the duration of every event appended to the session service."""
+  durations: list[float] = []
+  append_event = session_service.append_event
+
+  @functools.wraps(append_event)
+  async def timed_append_event(*args, **kwargs):
+    start = time.perf_counter()
+    try:
+      return await append_event(*args, **kwargs)
+    finally:
+      durations.append(time.perf_counter() - start)
+
+  session_service.append_event = timed_append_event
+  return durations
+
+
+class BenchRunner:
+  """Runs test cases through a `Runner`, replaying their recordings."""
+
+  def __init__(
+      self,
+      agent_or_app: Union[BaseAgent, App],
+      session_service: BaseSessionService,
+      *,
+      model_latency: float = 0.0,
+      tool_latency: float = 0.0,
+  ):
+    if isinstance(agent_or_app, App):
+      app = agent_or_app
+    else:
+      app = App(name=agent_or_app.name, root_agent=agent_or_app)
+    self._timing_plugin = _PhaseTimingPlugin()
+    self._runner = Runner(
+        app=app.model_copy(
+            update={
+                "plugins": (
+                    app.plugins
+                    + [
+                        self._timing_plugin,
+                        _LatencyReplayPlugin(
+                            model_latency=model_latency,
+                            tool_latency=tool_latency,
+                        ),
+                    ]
+                )
+            }
+        ),
+        session_service=session_service,
+        artifact_service=InMemoryArtifactService(),
+        memory_service=InMemoryMemoryService(),
+    )
+    self._session_writes = _time_session_writes(session_service)
+
+  async def run_case(
+      self,
+      test_case: TestCase,
+      *,
+      iterations: int = 5,
+      warmup: int = 1,
+      trace_allocations: bool = True,
+  ) -> BenchCaseResult:
+    """Benchmarks a test case.
+
+    Args:
+      test_case: The test case to replay.
+      iterations: The number of measured runs.
+      warmup: The number of runs before the measured ones, e.g. to import
+        lazily loaded modules.
+      trace_allocations: Whether to trace memory allocations in an additional
+        run. Runs are slower while tracing, so the other runs are not traced.
+
+    Returns:
+      The medians of the measured runs and the per-agent averages.
+    """
+    for _ in range(warmup):
+      await self._run_once(test_case)
+
+    self._timing_plugin.phases.clear()
+    runs = [await self._run_once(test_case) for _ in range(iterations)]
+    phases = {
+        name: PhaseStats(
+            wall_ms=totals.wall * 1000 / iterations,
+            cpu_ms=totals.cpu * 1000 / iterations,
+            events=totals.events / iterations,
+        )
+        for name, totals in self._timing_plugin.phases.items()
+    }
+
+    wall = statistics.median(run.wall for run in runs)
+    result = BenchCaseResult(
+        name=f"{test_case.category}/{test_case.name}",
+        iterations=iterations,
+        wall_ms=wall * 1000,
+        cpu_ms=statistics.median(run.cpu for run in runs) * 1000,
+        events=runs[-1].events,
+        events_per_sec=runs[-1].events / wall if wall else 0.0,
+        session_writes=runs[-1].session_writes,
+        session_write_ms=statistics.median(
+            run.session_write_time for run in runs
+        )
+        * 1000,
+        phases=phases,
+    )
+    if trace_allocations:
+      await self._trace_allocations(test_case, result)
+    return result
+
+  async def _trace_allocations(
+      self, test_case: TestCase, result: BenchCaseResult
+  ) -> None:
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+      tracemalloc.start()
+    self._timing_plugin.phases.clear()
+    self._timing_plugin.trace_allocations = True
+    try:
+      tracemalloc.reset_peak()
+      start = tracemalloc.get_traced_memory()[0]
+      await self._run_once(test_case)
+      current, peak = tracemalloc.get_traced_memory()
+    finally:
+      self._timing_plugin.trace_allocations = False
+      if not was_tracing:
+        tracemalloc.stop()
+
+    result.peak_alloc_kib = (peak - start) / 1024
+    result.retained_alloc_kib = (current - start) / 1024
+    for name, totals in self._timing_plugin.phases.items():
+      if name in result.phases and totals.alloc is not None:
+        result.phases[name].alloc_kib = totals.alloc / 1024 / totals.runs
+
+  async def _run_once(self, test_case: TestCase) -> _RunStats:
+    """Runs all user messages of a test case in a new session."""
+    session_service = self._runner.session_service
+    app_name = self._runner.app_name
+    session = await session_service.create_session(
+        app_name=app_name,
+        user_id=_BENCH_USER_ID,
+        state=test_case.test_spec.initial_state,
+    )
+    self._session_writes.clear()
+    function_call_ids: dict[str, str] = {}
+    num_events = 0
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    for user_message_index, user_message in enumerate(
+        test_case.test_spec.user_messages
+    ):
+      state_delta = dict(user_message.state_delta or {})
+      state_delta["_adk_replay_config"] = {
+          "dir": str(test_case.dir),
+          "user_message_index": user_message_index,
+      }
+      async for event in self._runner.run_async(
+          user_id=_BENCH_USER_ID,
+          session_id=session.id,
+          new_message=_get_user_content(
+              user_message, user_message_index, function_call_ids
+          ),
+          state_delta=state_delta,
+      ):
+        num_events += 1
+        for function_call in event.get_function_calls():
+          function_call_ids[function_call.name] = function_call.id
+    run_stats = _RunStats(
+        wall=time.perf_counter() - wall_start,
+        cpu=time.process_time() - cpu_start,
+        events=num_events,
+        session_writes=len(self._session_writes),
+        session_write_time=sum(self._session_writes),
+    )
+
+    await session_service.delete_session(
+        app_name=app_name, user_id=_BENCH_USER_ID, session_id=session.id
+    )
+    return run_stats
+
+
+_LOWER_IS_BETTER = (
+    "wall_ms",
+    "cpu_ms",
+    "session_write_ms",
+    "peak_alloc_kib",
+    "retained_alloc_kib",
+)
+_HIGHER_IS_BETTER = ("events_per_sec",)
+
+
+def compare_to_baseline(
+    report: BenchReport, baseline: BenchReport, max_regression: float
+) -> list[str]:
+  """Compares benchmark results to a baseline.
+
+  Args:
+    report: The current results.
+    baseline: The stored results to compare against.
+    max_regression: The tolerated relative regression of every metric, e.g.
+      0.1 for 10%.
+
+  Returns:
+    A description of every metric of a test case that regressed by more than
+    `max_regression`. Test cases missing from either report are skipped.
+  """
+  baseline_cases = {case.name: case for case in baseline.cases}
+  regressions = []
+  for case in report.cases:
+    if (baseline_case := baseline_cases.get(case.name)) is None:
+      continue
+    for metric in _LOWER_IS_BETTER + _HIGHER_IS_BETTER:
+      current = getattr(case, metric)
+      previous = getattr(baseline_case, metric)
+      if current is None or not previous:
+        continue
+      change = (current - previous) / previous
+      if metric in _HIGHER_IS_BETTER:
+        change = -change
+      if change > max_regression:
+        regressions.append(
+            f"{case.name}: {metric} regressed by {change:.1%}"
+            f" ({previous:,.2f} -> {current:,.2f})"
+        )
+  return regressions
+
+
+async def run_bench(
+    test_paths: list[Path],
+    agents_dir: str,
+    *,
+    session_service_uri: Optional[str] = None,
+    model_latency_ms: float = 0.0,
+    tool_latency_ms: float = 0.0,
+    iterations: int = 5,
+    warmup: int = 1,
+    trace_allocations: bool = True,
+) -> BenchReport:
+  """Benchmarks the test cases with recordings under the given paths."""
+  from ..service_registry import get_service_registry
+  from ..utils.agent_loader import AgentLoader
+
+  test_cases = _discover_bench_cases(test_paths)
+  if not test_cases:
+    click.secho("No test cases found!", fg="yellow", err=True)
+
+  agent_loader = AgentLoader(agents_dir)
+  report = BenchReport(
+      model_latency_ms=model_latency_ms, tool_latency_ms=tool_latency_ms
+  )
+  for test_case in test_cases:
+    if session_service_uri:
+      session_service = get_service_registry().create_session_service(
+          session_service_uri, agents_dir=agents_dir
+      )
+      if not session_service:
+        from ...sessions.database_session_service import DatabaseSessionService
+
+        session_service = DatabaseSessionService(db_url=session_service_uri)
+    else:
+      from ...sessions.in_memory_session_service import InMemorySessionService
+
+      session_service = InMemorySessionService()
+
+    click.echo(f"Benchmarking {test_case.category}/{test_case.name}...")
+    bench_runner = BenchRunner(
+        agent_loader.load_agent(test_case.test_spec.agent),
+        session_service,
+        model_latency=model_latency_ms / 1000,
+        tool_latency=tool_latency_ms / 1000,
+    )
+    result = await bench_runner.run_case(
+        test_case,
+        iterations=iterations,
+        warmup=warmup,
+        trace_allocations=trace_allocations,
+    )
+    report.cases.append(result)
+    _print_case_result(result)
+  return report
+
+
+def _print_case_result(result: BenchCaseResult) -> None:
+  """Prints the result of a single test case."""
+  click.echo(
+      f"  wall: {result.wall_ms:,.2f} ms, cpu: {result.cpu_ms:,.2f} ms,"
+      f" events: {result.events} ({result.events_per_sec:,.1f}/s)"
+  )
+  click.echo(
+      f"  session writes: {result.session_writes}"
+      f" ({result.session_write_ms:,.2f} ms)"
+  )
+  if result.peak_alloc_kib is not None:
+    click.echo(
+        f"  allocations: {result.peak_alloc_kib:,.1f} KiB peak,"
+        f" {result.retained_alloc_kib:,.1f} KiB retained"
+    )
+  for name, phase in result.phases.items():
+    line = (
+        f"    {name}: wall {phase.wall_ms:,.2f} ms, cpu {phase.cpu_ms:,.2f}"
+        f" ms, events {phase.events:g}"
+    )
+    if phase.alloc_kib is not None:
+      line += f", alloc {phase.alloc_kib:,.1f} KiB"
+    click.echo(line)
@@ -23,6 +23,9 @@ from google.genai import types
 
 from ...utils.yaml_utils import dump_pydantic_to_yaml
 from ..adk_web_server import RunAgentRequest
+from ..plugins.recordings_store import convert_recordings
+from ..plugins.recordings_store import RecordingsFormat
+from ..plugins.recordings_store import remove_recordings
 from ._generated_file_utils import load_test_case
 from .adk_web_server_client import AdkWebServerClient
 from .test_case import TestCase
@@ -31,6 +34,7 @@ from .test_case import TestCase
 async def _create_conformance_test_files(
     test_case: TestCase,
     user_id: str = "adk_conformance_test_user",
+    recordings_format: RecordingsFormat = "jsonl",
 ) -> Path:
   """Generate conformance test files from TestCase."""
   # Clean existing generated files
@@ -38,10 +42,9 @@ async def _create_conformance_test_files(
 
   # Remove existing generated files to ensure clean state
   generated_session_file = test_case_dir / "generated-session.yaml"
-  generated_recordings_file = test_case_dir / "generated-recordings.yaml"
 
   generated_session_file.unlink(missing_ok=True)
-  generated_recordings_file.unlink(missing_ok=True)
+  remove_recordings(test_case_dir)
 
   async with AdkWebServerClient() as client:
     # Create a new session for the test
@@ -130,14 +133,20 @@ async def _create_conformance_test_files(
         },
     )
 
+    # Recordings are written as JSON Lines while recording
+    convert_recordings(test_case_dir, recordings_format)
+
     return generated_session_file
 
 
-async def run_conformance_record(paths: list[Path]) -> None:
+async def run_conformance_record(
+    paths: list[Path], recordings_format: RecordingsFormat = "jsonl"
+) -> None:
   """Generate conformance tests from TestCaseInput files.
 
   Args:
     paths: list of directories containing test cases input files (spec.yaml).
+    recordings_format: The format to store the recordings in.
   """
   click.echo("Generating ADK conformance tests...")
 
@@ -171,7 +180,9 @@ async def run_conformance_record(paths: list[Path]) -> None:
 
     for test_case in test_cases.values():
       try:
-        await _create_conformance_test_files(test_case)
+        await _create_conformance_test_files(
+            test_case, recordings_format=recordings_format
+        )
         click.secho(
             "Generated conformance test files for:"
             f" {test_case.category}/{test_case.name}",
@@ -25,6 +25,7 @@ import click
 from google.genai import types
 
 from ..adk_web_server import RunAgentRequest
+from ..plugins.recordings_store import get_recordings_file
 from ._generated_file_utils import load_recorded_session
 from ._generated_file_utils import load_test_case
 from ._replay_validators import compare_events
@@ -90,10 +91,7 @@ class ConformanceTestRunner:
         name = test_case_dir.name
 
         # Skip if recordings missing in replay mode
-        if (
-            self.mode == "replay"
-            and not (test_case_dir / "generated-recordings.yaml").exists()
-        ):
+        if self.mode == "replay" and get_recordings_file(test_case_dir) is None:
           click.secho(
               f"Skipping {category}/{name}: no recordings",
               fg="yellow",
@@ -17,26 +17,26 @@
 from __future__ import annotations
 
 import logging
-from pathlib import Path
 from typing import Any
 from typing import Optional
 from typing import TYPE_CHECKING
 
 from google.genai import types
 from pydantic import BaseModel
+from pydantic import ConfigDict
 from pydantic import Field
 from typing_extensions import override
-import yaml
 
 from ...agents.callback_context import CallbackContext
 from ...models.llm_request import LlmRequest
 from ...models.llm_response import LlmResponse
 from ...plugins.base_plugin import BasePlugin
-from ...utils.yaml_utils import dump_pydantic_to_yaml
 from .recordings_schema import LlmRecording
 from .recordings_schema import Recording
-from .recordings_schema import Recordings
 from .recordings_schema import ToolRecording
+from .recordings_store import convert_recordings
+from .recordings_store import JSONL_RECORDINGS_FILENAME
+from .recordings_store import RecordingsWriter
 
 if TYPE_CHECKING:
   from ...agents.invocation_context import InvocationContext
@@ -49,9 +49,11 @@ logger = logging.getLogger("google_adk." + __name__)
 class _InvocationRecordingState(BaseModel):
   """Per-invocation recording state to isolate concurrent runs."""
 
+  model_config = ConfigDict(arbitrary_types_allowed=True)
+
   test_case_path: str
   user_message_index: int
-  records: Recordings
+  writer: RecordingsWriter
 
   # Track pending recordings per agent/call
   # key: agent_name
@@ -143,6 +145,7 @@ class RecordingsPlugin(BasePlugin):
       if pending_recording.llm_recording is not None:
         pending_recording.llm_recording.llm_response = llm_response
         logger.debug("Completed LLM recording for agent %s", agent_name)
+      self._write_completed_recordings(state)
     else:
       logger.warning(
           "No pending LLM recording found for agent %s, skipping response",
@@ -240,6 +243,7 @@ class RecordingsPlugin(BasePlugin):
           tool.name,
           function_call_id,
       )
+      self._write_completed_recordings(state)
     else:
       logger.warning(
           "No pending tool recording found for id %s, skipping result",
@@ -294,32 +298,25 @@ class RecordingsPlugin(BasePlugin):
 
     try:
       for pending in state.pending_recordings_order:
-        if pending.llm_recording is not None:
-          if pending.llm_recording.llm_response is not None:
-            state.records.recordings.append(pending)
-          else:
-            logger.warning(
-                "Incomplete LLM recording for agent %s, skipping",
-                pending.agent_name,
-            )
+        if self._is_complete(pending):
+          state.writer.append(pending)
+        elif pending.llm_recording is not None:
+          logger.warning(
+              "Incomplete LLM recording for agent %s, skipping",
+              pending.agent_name,
+          )
         elif pending.tool_recording is not None:
-          if pending.tool_recording.tool_response is not None:
-            state.records.recordings.append(pending)
-          else:
-            logger.warning(
-                "Incomplete tool recording for agent %s, skipping",
-                pending.agent_name,
-            )
-
-      dump_pydantic_to_yaml(
-          state.records,
-          f"{state.test_case_path}/generated-recordings.yaml",
-          sort_keys=False,
-      )
+          logger.warning(
+              "Incomplete tool recording for agent %s, skipping",
+              pending.agent_name,
+          )
+      state.pending_recordings_order.clear()
+
+      state.writer.write_index()
       logger.info(
-          "Saved %d recordings to %s/generated-recordings.yaml",
-          len(state.records.recordings),
+          "Saved recordings to %s/%s",
           state.test_case_path,
+          JSONL_RECORDINGS_FILENAME,
       )
     except Exception as e:
       logger.error("Failed to save interactions: %s", e)
@@ -368,27 +365,17 @@ class RecordingsPlugin(BasePlugin):
     if not case_dir or msg_index is None:
       raise ValueError("Recording parameters are missing from session state")
 
-    # Load or create recordings
-    recordings_file = Path(case_dir) / "generated-recordings.yaml"
-
-    if recordings_file.exists():
-      try:
-        with recordings_file.open("r", encoding="utf-8") as f:
-          recordings_data = yaml.safe_load(f)
-        records = Recordings.model_validate(recordings_data)
-      except Exception as e:
-        logger.error(
-            "Failed to load recordings from %s: %s", recordings_file, e
-        )
-        records = Recordings(recordings=[])
-    else:
-      records = Recordings(recordings=[])
+    # Append to existing recordings, converting legacy YAML recordings
+    try:
+      convert_recordings(case_dir, "jsonl")
+    except Exception as e:
+      logger.error("Failed to convert recordings in %s: %s", case_dir, e)
 
     # Create and store invocation state
     state = _InvocationRecordingState(
         test_case_path=case_dir,
         user_message_index=msg_index,
-        records=records,
+        writer=RecordingsWriter(case_dir),
     )
     self._invocation_states[invocation_id] = state
     logger.debug(
@@ -398,3 +385,24 @@ class RecordingsPlugin(BasePlugin):
         msg_index,
     )
     return state
+
+  def _is_complete(self, recording: Recording) -> bool:
+    """Check if the response of a recording has been recorded."""
+    if recording.llm_recording is not None:
+      return recording.llm_recording.llm_response is not None
+    if recording.tool_recording is not None:
+      return recording.tool_recording.tool_response is not None
+    return False
+
+  def _write_completed_recordings(
+      self, state: _InvocationRecordingState
+  ) -> None:
+    """Write completed recordings, keeping them in order of their requests."""
+    pending_order = state.pending_recordings_order
+    completed = 0
+    while completed < len(pending_order) and self._is_complete(
+        pending_order[completed]
+    ):
+      state.writer.append(pending_order[completed])
+      completed += 1
+    del pending_order[:completed]
@@ -0,0 +1,269 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Storage of ADK recordings as YAML or as indexed JSON Lines."""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import Literal
+from typing import Optional
+from typing import Union
+
+import yaml
+
+from ...utils.yaml_utils import dump_pydantic_to_yaml
+from .recordings_schema import Recording
+from .recordings_schema import Recordings
+
+logger = logging.getLogger("google_adk." + __name__)
+
+YAML_RECORDINGS_FILENAME = "generated-recordings.yaml"
+"""Recordings as a single YAML document, for reading and reviewing."""
+
+JSONL_RECORDINGS_FILENAME = "generated-recordings.jsonl"
+"""Recordings as one JSON object per line, in chronological order."""
+
+JSONL_INDEX_FILENAME = "generated-recordings.index.json"
+"""The per-agent index of the JSON Lines recordings."""
+
+RecordingsFormat = Literal["jsonl", "yaml"]
+
+# agent_name -> user_message_index -> [(offset, length)] of its lines
+_AgentIndex = dict[str, dict[int, list[tuple[int, int]]]]
+
+
+def get_recordings_file(case_dir: Union[str, Path]) -> Optional[Path]:
+  """Returns the recordings file of a test case, preferring JSON Lines."""
+  for filename in (JSONL_RECORDINGS_FILENAME, YAML_RECORDINGS_FILENAME):
+    if (recordings_file := Path(case_dir) / filename).exists():
+      return recordings_file
+  return None
+
+
+def remove_recordings(case_dir: Union[str, Path]) -> None:
+  """Removes the recordings of a test case in any format."""
+  for filename in (
+      JSONL_RECORDINGS_FILENAME,
+      JSONL_INDEX_FILENAME,
+      YAML_RECORDINGS_FILENAME,
+  ):
+    (Path(case_dir) / filename).unlink(missing_ok=True)
+
+
+def _scan_jsonl(recordings_file: Path) -> _AgentIndex:
+  """Indexes the lines of a JSON Lines recordings file."""
+  index: _AgentIndex = {}
+  offset = 0
+  with recordings_file.open("rb") as f:
+    for line in f:
+      if line.strip():
+        data = json.loads(line)
+        index.setdefault(data["agent_name"], {}).setdefault(
+            data["user_message_index"], []
+        ).append((offset, len(line)))
+      offset += len(line)
+  return index
+
+
+def _load_jsonl_index(case_dir: Path) -> _AgentIndex:
+  """Loads the index of the JSON Lines recordings, rebuilding it if stale."""
+  recordings_file = case_dir / JSONL_RECORDINGS_FILENAME
+  index_file = case_dir / JSONL_INDEX_FILENAME
+  try:
+    data = json.loads(index_file.read_text(encoding="utf-8"))
+    if data["size"] == recordings_file.stat().st_size:
+      return {
+          agent_name: {
+              int(user_message_index): [tuple(entry) for entry in entries]
+              for user_message_index, entries in agent_entries.items()
+          }
+          for agent_name, agent_entries in data["agents"].items()
+      }
+    logger.debug("Recordings index of %s is stale, rebuilding", case_dir)
+  except FileNotFoundError:
+    pass
+  except (ValueError, KeyError, TypeError) as e:
+    logger.warning("Ignoring invalid recordings index %s: %s", index_file, e)
+  return _scan_jsonl(recordings_file)
+
+
+class RecordingsReader:
+  """Looks up the recordings of an agent for a user message.
+
+  JSON Lines recordings are located through their per-agent index and only
+  parsed when first looked up. YAML recordings are parsed when opened.
+  """
+
+  def __init__(
+      self,
+      recordings_file: Path,
+      index: _AgentIndex,
+      recordings: Optional[list[Recording]] = None,
+  ):
+    self._recordings_file = recordings_file
+    self._index = index
+    self._recordings = recordings
+    self._cache: dict[tuple[str, int], list[Recording]] = {}
+
+  @classmethod
+  def open(cls, case_dir: Union[str, Path]) -> RecordingsReader:
+    """Opens the recordings of a test case.
+
+    Raises:
+      FileNotFoundError: If the test case has no recordings.
+    """
+    case_dir = Path(case_dir)
+    if (recordings_file := get_recordings_file(case_dir)) is None:
+      raise FileNotFoundError(f"No recordings found in {case_dir}")
+
+    if recordings_file.name == JSONL_RECORDINGS_FILENAME:
+      return cls(recordings_file, _load_jsonl_index(case_dir))
+
+    with recordings_file.open("r", encoding="utf-8") as f:
+      recordings = Recordings.model_validate(yaml.safe_load(f)).recordings
+    index: _AgentIndex = {}
+    for position, recording in enumerate(recordings):
+      index.setdefault(recording.agent_name, {}).setdefault(
+          recording.user_message_index, []
+      ).append((position, 0))
+    return cls(recordings_file, index, recordings)
+
+  @property
+  def recordings_file(self) -> Path:
+    return self._recordings_file
+
+  def __len__(self) -> int:
+    return sum(
+        len(entries)
+        for agent_entries in self._index.values()
+        for entries in agent_entries.values()
+    )
+
+  def get_agent_recordings(
+      self, user_message_index: int, agent_name: str
+  ) -> list[Recording]:
+    """Returns the recordings of an agent for a user message, in order."""
+    key = (agent_name, user_message_index)
+    if (recordings := self._cache.get(key)) is not None:
+      return recordings
+
+    entries = self._index.get(agent_name, {}).get(user_message_index, [])
+    if self._recordings is not None:
+      recordings = [self._recordings[position] for position, _ in entries]
+    else:
+      recordings = []
+      with self._recordings_file.open("rb") as f:
+        for offset, length in entries:
+          f.seek(offset)
+          recordings.append(Recording.model_validate_json(f.read(length)))
+    self._cache[key] = recordings
+    return recordings
+
+  def read_all(self) -> Recordings:
+    """Returns all recordings, in chronological order."""
+    if self._recordings is not None:
+      return Recordings(recordings=list(self._recordings))
+    with self._recordings_file.open("rb") as f:
+      return Recordings(
+          recordings=[
+              Recording.model_validate_json(line) for line in f if line.strip()
+          ]
+      )
+
+
+class RecordingsWriter:
+  """Appends recordings to the JSON Lines recordings of a test case.
+
+  Every recording is written as soon as it is appended. The index is updated
+  by `write_index`; readers rebuild a missing or stale index, e.g. after an
+  interrupted recording.
+  """
+
+  def __init__(self, case_dir: Union[str, Path]):
+    self._case_dir = Path(case_dir)
+    self._recordings_file = self._case_dir / JSONL_RECORDINGS_FILENAME
+    if self._recordings_file.exists():
+      self._index = _load_jsonl_index(self._case_dir)
+      self._size = self._recordings_file.stat().st_size
+    else:
+      self._index = {}
+      self._size = 0
+
+  def append(self, recording: Recording) -> None:
+    """Writes a recording after the previously written ones."""
+    line = (
+        recording.model_dump_json(exclude_none=True, exclude_defaults=True)
+        + "\n"
+    ).encode("utf-8")
+    self._case_dir.mkdir(parents=True, exist_ok=True)
+    with self._recordings_file.open("ab") as f:
+      f.write(line)
+    self._index.setdefault(recording.agent_name, {}).setdefault(
+        recording.user_message_index, []
+    ).append((self._size, len(line)))
+    self._size += len(line)
+
+  def write_index(self) -> None:
+    """Writes the per-agent index of the recordings written so far."""
+    (self._case_dir / JSONL_INDEX_FILENAME).write_text(
+        json.dumps({
+            "size": self._size,
+            "agents": {
+                agent_name: {
+                    str(user_message_index): entries
+                    for user_message_index, entries in agent_entries.items()
+                }
+                for agent_name, agent_entries in self._index.items()
+            },
+        }),
+        encoding="utf-8",
+    )
+
+
+def convert_recordings(
+    case_dir: Union[str, Path], to_format: RecordingsFormat
+) -> Optional[Path]:
+  """Converts the recordings of a test case to the given format.
+
+  The recordings in the other format are removed once converted.
+
+  Returns:
+    The converted recordings file, or None if the test case has no
+    recordings.
+  """
+  case_dir = Path(case_dir)
+  if (recordings_file := get_recordings_file(case_dir)) is None:
+    return None
+  if (to_format == "jsonl") == (
+      recordings_file.name == JSONL_RECORDINGS_FILENAME
+  ):
+    return recordings_file
+
+  recordings = RecordingsReader.open(case_dir).read_all()
+  if to_format == "yaml":
+    converted_file = case_dir / YAML_RECORDINGS_FILENAME
+    dump_pydantic_to_yaml(recordings, converted_file, sort_keys=False)
+    (case_dir / JSONL_RECORDINGS_FILENAME).unlink()
+    (case_dir / JSONL_INDEX_FILENAME).unlink(missing_ok=True)
+    return converted_file
+
+  writer = RecordingsWriter(case_dir)
+  for recording in recordings.recordings:
+    writer.append(recording)
+  writer.write_index()
+  recordings_file.unlink()
+  return case_dir / JSONL_RECORDINGS_FILENAME
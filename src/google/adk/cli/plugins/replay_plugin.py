@@ -24,9 +24,9 @@ from typing import TYPE_CHECKING
 
 from google.genai import types
 from pydantic import BaseModel
+from pydantic import ConfigDict
 from pydantic import Field
 from typing_extensions import override
-import yaml
 
 from ...agents.callback_context import CallbackContext
 from ...models.llm_request import LlmRequest
@@ -34,8 +34,9 @@ from ...models.llm_response import LlmResponse
 from ...plugins.base_plugin import BasePlugin
 from .recordings_schema import LlmRecording
 from .recordings_schema import Recording
-from .recordings_schema import Recordings
 from .recordings_schema import ToolRecording
+from .recordings_store import get_recordings_file
+from .recordings_store import RecordingsReader
 
 if TYPE_CHECKING:
   from ...agents.invocation_context import InvocationContext
@@ -60,9 +61,11 @@ class ReplayConfigError(Exception):
 class _InvocationReplayState(BaseModel):
   """Per-invocation replay state to isolate concurrent runs."""
 
+  model_config = ConfigDict(arbitrary_types_allowed=True)
+
   test_case_path: str
   user_message_index: int
-  recordings: Recordings
+  recordings: RecordingsReader
 
   # Per-agent replay indices for parallel execution
   # key: agent_name -> current replay index for that agent
@@ -79,6 +82,10 @@ class ReplayPlugin(BasePlugin):
     # key: invocation_id -> _InvocationReplayState
     self._invocation_states: dict[str, _InvocationReplayState] = {}
 
+    # Reuse opened recordings across the user messages of a test case
+    # key: recordings file -> (modification time, size, reader)
+    self._readers: dict[Path, tuple[int, int, RecordingsReader]] = {}
+
   @override
   async def before_run_callback(
       self, *, invocation_context: InvocationContext
@@ -203,15 +210,13 @@ class ReplayPlugin(BasePlugin):
       )
 
     # Load recordings
-    recordings_file = Path(case_dir) / "generated-recordings.yaml"
+    recordings_file = get_recordings_file(case_dir)
 
-    if not recordings_file.exists():
-      raise ReplayConfigError(f"Recordings file not found: {recordings_file}")
+    if recordings_file is None:
+      raise ReplayConfigError(f"Recordings file not found in: {case_dir}")
 
     try:
-      with recordings_file.open("r", encoding="utf-8") as f:
-        recordings_data = yaml.safe_load(f)
-      recordings = Recordings.model_validate(recordings_data)
+      recordings = self._open_recordings(recordings_file)
     except Exception as e:
       raise ReplayConfigError(
           f"Failed to load recordings from {recordings_file}: {e}"
@@ -230,10 +235,20 @@ class ReplayPlugin(BasePlugin):
         invocation_id,
         case_dir,
         msg_index,
-        len(recordings.recordings),
+        len(recordings),
     )
     return state
 
+  def _open_recordings(self, recordings_file: Path) -> RecordingsReader:
+    """Opens recordings, reusing the reader while the file is unchanged."""
+    stat = recordings_file.stat()
+    cached = self._readers.get(recordings_file)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+      return cached[2]
+    reader = RecordingsReader.open(recordings_file.parent)
+    self._readers[recordings_file] = (stat.st_mtime_ns, stat.st_size, reader)
+    return reader
+
   def _get_next_recording_for_agent(
       self,
       state: _InvocationReplayState,
@@ -243,15 +258,10 @@ class ReplayPlugin(BasePlugin):
     # Get current agent index
     current_agent_index = state.agent_replay_indices.get(agent_name, 0)
 
-    # Filter ALL recordings for this agent and user message index (strict order)
-    agent_recordings = [
-        recording
-        for recording in state.recordings.recordings
-        if (
-            recording.agent_name == agent_name
-            and recording.user_message_index == state.user_message_index
-        )
-    ]
+    # All recordings for this agent and user message index (strict order)
+    agent_recordings = state.recordings.get_agent_recordings(
+        state.user_message_index, agent_name
+    )
 
     # Check if we have enough recordings for this agent
     if current_agent_index >= len(agent_recordings):
@@ -19,6 +19,7 @@ import logging
 from .base_code_executor import BaseCodeExecutor
 from .built_in_code_executor import BuiltInCodeExecutor
 from .code_executor_context import CodeExecutorContext
+from .process_pool_code_executor import ProcessPoolCodeExecutor
 from .unsafe_local_code_executor import UnsafeLocalCodeExecutor
 
 logger = logging.getLogger('google_adk.' + __name__)
@@ -27,6 +28,7 @@ __all__ = [
     'BaseCodeExecutor',
     'BuiltInCodeExecutor',
     'CodeExecutorContext',
+    'ProcessPoolCodeExecutor',
     'UnsafeLocalCodeExecutor',
     'VertexAiCodeExecutor',
     'ContainerCodeExecutor',
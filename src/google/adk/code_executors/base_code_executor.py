@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import abc
+import asyncio
 from typing import List
 
 from pydantic import BaseModel
@@ -90,3 +91,25 @@ class BaseCodeExecutor(BaseModel):
       The code execution result.
     """
     pass
+
+  async def execute_code_async(
+      self,
+      invocation_context: InvocationContext,
+      code_execution_input: CodeExecutionInput,
+  ) -> CodeExecutionResult:
+    """Executes code without blocking the event loop.
+
+    The code execution flow calls this method. By default it runs
+    `execute_code` in a worker thread; executors with a natively asynchronous
+    backend can override it.
+
+    Args:
+      invocation_context: The invocation context of the code execution.
+      code_execution_input: The code execution input.
+
+    Returns:
+      The code execution result.
+    """
+    return await asyncio.to_thread(
+        self.execute_code, invocation_context, code_execution_input
+    )
@@ -15,14 +15,21 @@
 from __future__ import annotations
 
 import atexit
+import collections
+import dataclasses
+import hashlib
 import logging
 import os
+import threading
+import time
+from typing import Any
 from typing import Optional
 
 import docker
 from docker.client import DockerClient
 from docker.models.containers import Container
 from pydantic import Field
+from pydantic import PrivateAttr
 from typing_extensions import override
 
 from ..agents.invocation_context import InvocationContext
@@ -32,11 +39,42 @@ from .code_execution_utils import CodeExecutionResult
 
 logger = logging.getLogger('google_adk.' + __name__)
 DEFAULT_IMAGE_TAG = 'adk-code-executor:latest'
+BUILD_CONTEXT_HASH_LABEL = 'com.google.adk.build-context-hash'
+
+
+def _hash_build_context(docker_path: str) -> str:
+  """Returns a SHA-256 over the relative paths and contents of a build context."""
+  sha = hashlib.sha256()
+  for root, dirs, files in os.walk(docker_path):
+    dirs.sort()
+    for file_name in sorted(files):
+      file_path = os.path.join(root, file_name)
+      sha.update(os.path.relpath(file_path, docker_path).encode('utf-8'))
+      sha.update(b'\0')
+      with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+          sha.update(chunk)
+      sha.update(b'\0')
+  return sha.hexdigest()
+
+
+@dataclasses.dataclass
+class _Lease:
+  """A container leased to a session."""
+
+  container: Container
+  last_used: float
+  busy: bool = False
 
 
 class ContainerCodeExecutor(BaseCodeExecutor):
   """A code executor that uses a custom container to execute code.
 
+  The executor keeps a pool of running containers. Each session leases its own
+  container on its first code execution and keeps it until the lease has been
+  idle for `idle_timeout_seconds`, so sessions are isolated from each other and
+  run concurrently. `pool_size` containers are kept warm for new sessions.
+
   Attributes:
     base_url: Optional. The base url of the user hosted Docker client.
     image: The tag of the predefined image or custom image to run on the
@@ -44,6 +82,10 @@ class ContainerCodeExecutor(BaseCodeExecutor):
     docker_path: The path to the directory containing the Dockerfile. If set,
       build the image from the dockerfile path instead of using the predefined
       image. Either docker_path or image must be set.
+    pool_size: The number of warm containers kept ready for new sessions.
+    max_containers: The maximum number of running containers.
+    idle_timeout_seconds: How long a session lease may stay idle before its
+      container is removed.
   """
 
   base_url: Optional[str] = None
@@ -61,7 +103,26 @@ class ContainerCodeExecutor(BaseCodeExecutor):
   """
   The path to the directory containing the Dockerfile.
   If set, build the image from the dockerfile path instead of using the
-  predefined image. Either docker_path or image must be set.
+  predefined image. Either docker_path or image must be set. The build is
+  skipped when an image built from the same build context already exists.
+  """
+
+  pool_size: int = 1
+  """
+  The number of warm containers kept ready for new sessions.
+  """
+
+  max_containers: int = 4
+  """
+  The maximum number of running containers. When the limit is reached, the
+  least recently used idle lease is reclaimed, or the execution waits for a
+  container to become available.
+  """
+
+  idle_timeout_seconds: Optional[float] = 600
+  """
+  How long a session lease may stay idle before its container is removed, or
+  None to keep leases until the executor is closed.
   """
 
   # Overrides the BaseCodeExecutor attribute: this executor cannot be stateful.
@@ -72,13 +133,22 @@ class ContainerCodeExecutor(BaseCodeExecutor):
   optimize_data_file: bool = Field(default=False, frozen=True, exclude=True)
 
   _client: DockerClient = None
-  _container: Container = None
+  _lock: threading.Condition = PrivateAttr(default_factory=threading.Condition)
+  _warm_containers: list[Container] = PrivateAttr(default_factory=list)
+  _leases: collections.OrderedDict[str, _Lease] = PrivateAttr(
+      default_factory=collections.OrderedDict
+  )
+  _starting_session_ids: set[str] = PrivateAttr(default_factory=set)
+  _num_containers: int = PrivateAttr(default=0)
+  _num_warming: int = PrivateAttr(default=0)
+  _closed: bool = PrivateAttr(default=False)
 
   def __init__(
       self,
       base_url: Optional[str] = None,
       image: Optional[str] = None,
       docker_path: Optional[str] = None,
+      client: Optional[Any] = None,
       **data,
   ):
     """Initializes the ContainerCodeExecutor.
@@ -90,6 +160,8 @@ class ContainerCodeExecutor(BaseCodeExecutor):
       docker_path: The path to the directory containing the Dockerfile. If set,
         build the image from the dockerfile path instead of using the predefined
         image. Either docker_path or image must be set.
+      client: Optional. The Docker client to use instead of one created from
+        `base_url` or the environment.
       **data: The data to initialize the ContainerCodeExecutor.
     """
     if not image and not docker_path:
@@ -104,20 +176,28 @@ class ContainerCodeExecutor(BaseCodeExecutor):
       )
 
     super().__init__(**data)
+    if self.pool_size > self.max_containers:
+      raise ValueError('`pool_size` cannot be larger than `max_containers`.')
     self.base_url = base_url
     self.image = image if image else DEFAULT_IMAGE_TAG
     self.docker_path = os.path.abspath(docker_path) if docker_path else None
 
-    self._client = (
-        docker.from_env()
-        if not self.base_url
-        else docker.DockerClient(base_url=self.base_url)
-    )
-    # Initialize the container.
-    self.__init_container()
+    if client is not None:
+      self._client = client
+    else:
+      self._client = (
+          docker.from_env()
+          if not self.base_url
+          else docker.DockerClient(base_url=self.base_url)
+      )
 
-    # Close the container when the on exit.
-    atexit.register(self.__cleanup_container)
+    if self.docker_path:
+      self._build_docker_image()
+    # Start the warm containers.
+    self._fill_pool()
+
+    # Close the containers on exit.
+    atexit.register(self.close)
 
   @override
   def execute_code(
@@ -127,10 +207,15 @@ class ContainerCodeExecutor(BaseCodeExecutor):
   ) -> CodeExecutionResult:
     output = ''
     error = ''
-    exec_result = self._container.exec_run(
-        ['python3', '-c', code_execution_input.code],
-        demux=True,
-    )
+    session_id = invocation_context.session.id
+    container = self._acquire_container(session_id)
+    try:
+      exec_result = container.exec_run(
+          ['python3', '-c', code_execution_input.code],
+          demux=True,
+      )
+    finally:
+      self._release_container(session_id)
     logger.debug('Executed code:\n```\n%s\n```', code_execution_input.code)
 
     if exec_result.output and exec_result.output[0]:
@@ -150,51 +235,227 @@ class ContainerCodeExecutor(BaseCodeExecutor):
     )
 
   def _build_docker_image(self):
-    """Builds the Docker image."""
+    """Builds the Docker image, unless an up-to-date one already exists."""
     if not self.docker_path:
       raise ValueError('Docker path is not set.')
     if not os.path.exists(self.docker_path):
       raise FileNotFoundError(f'Invalid Docker path: {self.docker_path}')
 
+    context_hash = _hash_build_context(self.docker_path)
+    cached_images = self._client.images.list(
+        filters={'label': f'{BUILD_CONTEXT_HASH_LABEL}={context_hash}'}
+    )
+    if cached_images:
+      cached_images[0].tag(self.image)
+      logger.info(
+          'Docker image: %s is up to date with %s.',
+          self.image,
+          self.docker_path,
+      )
+      return
+
     logger.info('Building Docker image...')
     self._client.images.build(
         path=self.docker_path,
         tag=self.image,
         rm=True,
+        labels={BUILD_CONTEXT_HASH_LABEL: context_hash},
     )
     logger.info('Docker image: %s built.', self.image)
 
-  def _verify_python_installation(self):
+  def _verify_python_installation(self, container: Container):
     """Verifies the container has python3 installed."""
-    exec_result = self._container.exec_run(['which', 'python3'])
+    exec_result = container.exec_run(['which', 'python3'])
     if exec_result.exit_code != 0:
       raise ValueError('python3 is not installed in the container.')
 
-  def __init_container(self):
-    """Initializes the container."""
+  def _start_container(self) -> Container:
+    """Starts a new container."""
     if not self._client:
       raise RuntimeError('Docker client is not initialized.')
 
-    if self.docker_path:
-      self._build_docker_image()
-
     logger.info('Starting container for ContainerCodeExecutor...')
-    self._container = self._client.containers.run(
+    container = self._client.containers.run(
         image=self.image,
         detach=True,
         tty=True,
     )
-    logger.info('Container %s started.', self._container.id)
+    logger.info('Container %s started.', container.id)
 
     # Verify the container is able to run python3.
-    self._verify_python_installation()
+    try:
+      self._verify_python_installation(container)
+    except Exception:
+      self._remove_container(container)
+      raise
+    return container
 
-  def __cleanup_container(self):
-    """Closes the container on exit."""
-    if not self._container:
+  def _remove_container(self, container: Container):
+    """Stops and removes a container."""
+    logger.info('[Cleanup] Stopping the container...')
+    try:
+      container.stop()
+      container.remove()
+    except docker.errors.APIError as e:
+      logger.warning('Failed to remove container %s: %s', container.id, e)
       return
+    logger.info('Container %s stopped and removed.', container.id)
 
-    logger.info('[Cleanup] Stopping the container...')
-    self._container.stop()
-    self._container.remove()
-    logger.info('Container %s stopped and removed.', self._container.id)
+  def _fill_pool(self):
+    """Starts containers until `pool_size` warm containers are ready."""
+    with self._lock:
+      missing = max(
+          0,
+          min(
+              self.pool_size - len(self._warm_containers),
+              self.max_containers - self._num_containers,
+          ),
+      )
+      self._num_containers += missing
+      self._num_warming += missing
+    for _ in range(missing):
+      try:
+        container = self._start_container()
+      except Exception:
+        with self._lock:
+          self._num_containers -= 1
+          self._num_warming -= 1
+          self._lock.notify_all()
+        raise
+      with self._lock:
+        self._num_warming -= 1
+        closed = self._closed
+        if not closed:
+          self._warm_containers.append(container)
+        self._lock.notify_all()
+      if closed:
+        self._remove_container(container)
+
+  def _fill_pool_in_background(self):
+    try:
+      self._fill_pool()
+    except Exception as e:  # pylint: disable=broad-exception-caught
+      logger.warning('Failed to start a warm container: %s', e)
+
+  def _acquire_container(self, session_id: str) -> Container:
+    """Gets the container leased to the session, leasing one if needed."""
+    expired = self._pop_expired_leases()
+    to_remove = []
+    start_new = False
+    with self._lock:
+      while True:
+        if self._closed:
+          raise RuntimeError('ContainerCodeExecutor is closed.')
+        lease = self._leases.get(session_id)
+        if session_id in self._starting_session_ids or lease is not None:
+          if lease is None or lease.busy:
+            # Executions of one session run one at a time in its container.
+            self._lock.wait()
+            continue
+          break
+        if self._warm_containers:
+          lease = _Lease(container=self._warm_containers.pop(), last_used=0)
+          self._leases[session_id] = lease
+          break
+        if self._num_containers < self.max_containers:
+          self._num_containers += 1
+          self._starting_session_ids.add(session_id)
+          start_new = True
+          break
+        if self._num_warming:
+          # A warm container is on its way, no need to reclaim a lease.
+          self._lock.wait()
+          continue
+        idle_session_ids = [
+            leased_session_id
+            for leased_session_id, idle_lease in self._leases.items()
+            if not idle_lease.busy
+        ]
+        if idle_session_ids:
+          to_remove.append(self._leases.pop(idle_session_ids[0]).container)
+          self._num_containers -= 1
+          continue
+        self._lock.wait()
+      if lease is not None:
+        lease.busy = True
+        lease.last_used = time.monotonic()
+        self._leases.move_to_end(session_id)
+
+    for container in expired + to_remove:
+      self._remove_container(container)
+
+    if start_new:
+      try:
+        container = self._start_container()
+      except Exception:
+        with self._lock:
+          self._num_containers -= 1
+          self._starting_session_ids.discard(session_id)
+          self._lock.notify_all()
+        raise
+      with self._lock:
+        self._starting_session_ids.discard(session_id)
+        closed = self._closed
+        if not closed:
+          self._leases[session_id] = _Lease(
+              container=container, last_used=time.monotonic(), busy=True
+          )
+        self._lock.notify_all()
+      if closed:
+        self._remove_container(container)
+        raise RuntimeError('ContainerCodeExecutor is closed.')
+      return container
+
+    # Replace the warm container this session just leased.
+    if len(self._warm_containers) < self.pool_size:
+      threading.Thread(
+          target=self._fill_pool_in_background, daemon=True
+      ).start()
+    return lease.container
+
+  def _release_container(self, session_id: str):
+    with self._lock:
+      lease = self._leases.get(session_id)
+      if lease is not None:
+        lease.busy = False
+        lease.last_used = time.monotonic()
+      self._lock.notify_all()
+
+  def _pop_expired_leases(self) -> list[Container]:
+    """Removes the leases idle for longer than the idle timeout."""
+    if self.idle_timeout_seconds is None:
+      return []
+    deadline = time.monotonic() - self.idle_timeout_seconds
+    with self._lock:
+      expired_session_ids = [
+          session_id
+          for session_id, lease in self._leases.items()
+          if not lease.busy and lease.last_used < deadline
+      ]
+      containers = [
+          self._leases.pop(session_id).container
+          for session_id in expired_session_ids
+      ]
+      self._num_containers -= len(containers)
+      if containers:
+        self._lock.notify_all()
+    return containers
+
+  def reap_idle_containers(self):
+    """Removes the containers of leases idle for longer than the timeout."""
+    for container in self._pop_expired_leases():
+      self._remove_container(container)
+
+  def close(self):
+    """Stops and removes all containers."""
+    with self._lock:
+      self._closed = True
+      containers = self._warm_containers + [
+          lease.container for lease in self._leases.values()
+      ]
+      self._warm_containers = []
+      self._leases = collections.OrderedDict()
+      self._num_containers = 0
+      self._lock.notify_all()
+    for container in containers:
+      self._remove_container(container)
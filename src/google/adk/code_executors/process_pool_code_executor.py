@@ -0,0 +1,412 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import atexit
+import collections
+from contextlib import redirect_stderr
+from contextlib import redirect_stdout
+import importlib
+import io
+import logging
+import multiprocessing
+from multiprocessing.connection import Connection
+import threading
+from typing import Any
+from typing import Optional
+
+from pydantic import Field
+from pydantic import PrivateAttr
+from typing_extensions import override
+
+from ..agents.invocation_context import InvocationContext
+from .base_code_executor import BaseCodeExecutor
+from .code_execution_utils import CodeExecutionInput
+from .code_execution_utils import CodeExecutionResult
+from .unsafe_local_code_executor import _prepare_globals
+
+try:
+  import resource
+except ImportError:  # Not available on Windows.
+  resource = None
+
+logger = logging.getLogger('google_adk.' + __name__)
+
+_WORKER_START_TIMEOUT_SECONDS = 120
+
+
+def _set_cpu_time_limit(cpu_time_limit_seconds: Optional[int]) -> None:
+  """Limits the CPU time the worker may use from now on."""
+  if resource is None:
+    return
+  _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+  if cpu_time_limit_seconds is None:
+    soft = hard
+  else:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft = int(usage.ru_utime + usage.ru_stime) + cpu_time_limit_seconds + 1
+    if hard != resource.RLIM_INFINITY:
+      soft = min(soft, hard)
+  resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _worker_main(
+    conn: Connection,
+    preload_modules: list[str],
+    memory_limit_bytes: Optional[int],
+) -> None:
+  """Entry point of a worker process.
+
+  The worker imports the preloaded modules once, then executes code snippets
+  received over the connection until it is asked to stop. Globals persist
+  between snippets unless the parent asks for a reset.
+  """
+  if memory_limit_bytes is not None and resource is not None:
+    resource.setrlimit(
+        resource.RLIMIT_AS, (memory_limit_bytes, memory_limit_bytes)
+    )
+  for module_name in preload_modules:
+    try:
+      importlib.import_module(module_name)
+    except ImportError:
+      pass
+  conn.send(('ready',))
+
+  globals_: dict[str, Any] = {}
+  while True:
+    try:
+      message = conn.recv()
+    except EOFError:
+      return
+    if message[0] == 'stop':
+      return
+    _, code, reset_globals, cpu_time_limit_seconds = message
+    if reset_globals:
+      globals_ = {}
+    _prepare_globals(code, globals_)
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    error = ''
+    _set_cpu_time_limit(cpu_time_limit_seconds)
+    try:
+      with redirect_stdout(stdout), redirect_stderr(stderr):
+        exec(code, globals_)
+    except MemoryError:
+      error = 'Memory limit exceeded.'
+    except BaseException as e:  # pylint: disable=broad-exception-caught
+      error = str(e)
+    finally:
+      _set_cpu_time_limit(None)
+    conn.send(('result', stdout.getvalue(), stderr.getvalue() + error))
+
+
+class _Worker:
+  """A handle on a warm worker process owned by the parent."""
+
+  def __init__(
+      self,
+      context: multiprocessing.context.BaseContext,
+      preload_modules: list[str],
+      memory_limit_bytes: Optional[int],
+  ):
+    self.conn, child_conn = context.Pipe()
+    self.process = context.Process(
+        target=_worker_main,
+        args=(child_conn, preload_modules, memory_limit_bytes),
+        daemon=True,
+    )
+    self.process.start()
+    child_conn.close()
+    self._ready = False
+
+  def _wait_ready(self) -> None:
+    if self._ready:
+      return
+    if not self.conn.poll(_WORKER_START_TIMEOUT_SECONDS):
+      raise RuntimeError('Code execution worker failed to start.')
+    self.conn.recv()
+    self._ready = True
+
+  def run(
+      self,
+      code: str,
+      reset_globals: bool,
+      timeout_seconds: Optional[float],
+      cpu_time_limit_seconds: Optional[int],
+  ) -> tuple[str, str]:
+    """Runs code in the worker and returns its (stdout, stderr).
+
+    Raises:
+      TimeoutError: If the code did not finish within `timeout_seconds`.
+      EOFError: If the worker died, e.g. because it exceeded the CPU limit.
+    """
+    self._wait_ready()
+    self.conn.send(('exec', code, reset_globals, cpu_time_limit_seconds))
+    if not self.conn.poll(timeout_seconds):
+      raise TimeoutError()
+    _, stdout, stderr = self.conn.recv()
+    return stdout, stderr
+
+  def stop(self) -> None:
+    try:
+      self.conn.send(('stop',))
+    except (BrokenPipeError, OSError):
+      pass
+    self.process.join(timeout=1)
+    self.terminate()
+
+  def terminate(self) -> None:
+    if self.process.is_alive():
+      self.process.kill()
+      self.process.join()
+    self.conn.close()
+
+
+class ProcessPoolCodeExecutor(BaseCodeExecutor):
+  """A code executor that runs code in a pool of warm local worker processes.
+
+  Unlike UnsafeLocalCodeExecutor, each snippet runs in a separate process, so
+  concurrent executions do not interleave their output, a slow snippet does not
+  stall the event loop, and wall-time, CPU-time and memory limits can be
+  enforced. Workers import `preload_modules` once when they start.
+
+  This executor is NOT a security sandbox: the code runs with the permissions
+  of the current user on the local machine.
+
+  When `stateful` is True, each execution id (by default the session id) is
+  pinned to its own worker process, so variables defined by one code block are
+  visible to the following ones in the same session.
+  """
+
+  # Overrides the BaseCodeExecutor attribute: this executor cannot
+  # optimize_data_file.
+  optimize_data_file: bool = Field(default=False, frozen=True, exclude=True)
+
+  pool_size: int = 2
+  """The number of warm workers kept ready for stateless executions."""
+
+  max_workers: int = 8
+  """The maximum number of worker processes, including session workers.
+
+  When the limit is reached, the least recently used idle session worker is
+  recycled, discarding the state of that session.
+  """
+
+  preload_modules: list[str] = ['numpy', 'pandas']
+  """Modules imported by every worker when it starts.
+
+  Modules that are not installed are skipped.
+  """
+
+  timeout_seconds: Optional[float] = 60
+  """The wall-time limit of one code execution, or None for no limit."""
+
+  cpu_time_limit_seconds: Optional[int] = None
+  """The CPU-time limit of one code execution, or None for no limit."""
+
+  memory_limit_mb: Optional[int] = None
+  """The address space limit of each worker process, or None for no limit."""
+
+  start_method: str = 'spawn'
+  """The multiprocessing start method used to create workers."""
+
+  _lock: threading.Condition = PrivateAttr(default_factory=threading.Condition)
+  _idle_workers: list[_Worker] = PrivateAttr(default_factory=list)
+  _session_workers: collections.OrderedDict[str, _Worker] = PrivateAttr(
+      default_factory=collections.OrderedDict
+  )
+  _busy_session_ids: set[str] = PrivateAttr(default_factory=set)
+  _num_workers: int = PrivateAttr(default=0)
+  _num_starting: int = PrivateAttr(default=0)
+  _closed: bool = PrivateAttr(default=False)
+
+  def __init__(self, **data):
+    """Initializes the ProcessPoolCodeExecutor."""
+    if 'optimize_data_file' in data and data['optimize_data_file']:
+      raise ValueError(
+          'Cannot set `optimize_data_file=True` in ProcessPoolCodeExecutor.'
+      )
+    super().__init__(**data)
+    if self.pool_size > self.max_workers:
+      raise ValueError('`pool_size` cannot be larger than `max_workers`.')
+    atexit.register(self.close)
+
+  def _new_worker(self) -> _Worker:
+    return _Worker(
+        multiprocessing.get_context(self.start_method),
+        self.preload_modules,
+        self.memory_limit_mb * 1024 * 1024 if self.memory_limit_mb else None,
+    )
+
+  def warm_up(self) -> None:
+    """Starts workers until `pool_size` warm workers are idle."""
+    with self._lock:
+      missing = max(
+          0,
+          min(
+              self.pool_size - len(self._idle_workers) - self._num_starting,
+              self.max_workers - self._num_workers,
+          ),
+      )
+      self._num_workers += missing
+      self._num_starting += missing
+    for _ in range(missing):
+      try:
+        worker = self._new_worker()
+      except Exception:  # pylint: disable=broad-exception-caught
+        logger.exception('Failed to start a code execution worker.')
+        worker = None
+      with self._lock:
+        self._num_starting -= 1
+        if worker is None:
+          self._num_workers -= 1
+        else:
+          self._idle_workers.append(worker)
+        self._lock.notify_all()
+
+  def _acquire_worker(
+      self, execution_id: Optional[str]
+  ) -> tuple[_Worker, bool]:
+    """Gets the worker for the execution, waiting if all workers are busy.
+
+    Returns:
+      The worker, and whether its globals must be reset before running code.
+    """
+    with self._lock:
+      while True:
+        if self._closed:
+          raise RuntimeError('ProcessPoolCodeExecutor is closed.')
+        if execution_id is not None:
+          # Executions of one session run one at a time on its worker.
+          if execution_id in self._busy_session_ids:
+            self._lock.wait()
+            continue
+          worker = self._session_workers.get(execution_id)
+          if worker is not None:
+            self._session_workers.move_to_end(execution_id)
+            self._busy_session_ids.add(execution_id)
+            return worker, False
+        if self._idle_workers:
+          worker = self._idle_workers.pop()
+          break
+        if self._num_workers < self.max_workers:
+          self._num_workers += 1
+          worker = None
+          break
+        if self._num_starting:
+          # A worker that is warming up will be available soon.
+          self._lock.wait()
+          continue
+        evictable = [
+            session_id
+            for session_id in self._session_workers
+            if session_id not in self._busy_session_ids
+        ]
+        if evictable:
+          logger.info(
+              'Recycling the code execution worker of session %s.',
+              evictable[0],
+          )
+          self._session_workers.pop(evictable[0]).terminate()
+          self._num_workers -= 1
+          continue
+        self._lock.wait()
+      if execution_id is not None:
+        self._busy_session_ids.add(execution_id)
+
+    if worker is None:
+      try:
+        worker = self._new_worker()
+      except BaseException:
+        with self._lock:
+          self._num_workers -= 1
+          if execution_id is not None:
+            self._busy_session_ids.discard(execution_id)
+          self._lock.notify_all()
+        raise
+    if execution_id is not None:
+      with self._lock:
+        self._session_workers[execution_id] = worker
+    return worker, True
+
+  def _release_worker(
+      self, worker: _Worker, execution_id: Optional[str], healthy: bool
+  ) -> None:
+    with self._lock:
+      if execution_id is not None:
+        self._busy_session_ids.discard(execution_id)
+        if not healthy:
+          self._session_workers.pop(execution_id, None)
+      if not healthy:
+        self._num_workers -= 1
+      elif execution_id is None:
+        self._idle_workers.append(worker)
+      self._lock.notify_all()
+    if not healthy:
+      worker.terminate()
+    # Keep the pool warm for the next stateless executions.
+    if not self._closed and len(self._idle_workers) < self.pool_size:
+      threading.Thread(target=self.warm_up, daemon=True).start()
+
+  @override
+  def execute_code(
+      self,
+      invocation_context: InvocationContext,
+      code_execution_input: CodeExecutionInput,
+  ) -> CodeExecutionResult:
+    logger.debug('Executing code:\n```\n%s\n```', code_execution_input.code)
+    execution_id = code_execution_input.execution_id if self.stateful else None
+    worker, reset_globals = self._acquire_worker(execution_id)
+    healthy = False
+    output = ''
+    error = ''
+    try:
+      output, error = worker.run(
+          code_execution_input.code,
+          reset_globals=reset_globals,
+          timeout_seconds=self.timeout_seconds,
+          cpu_time_limit_seconds=self.cpu_time_limit_seconds,
+      )
+      healthy = True
+    except TimeoutError:
+      error = f'Code execution timed out after {self.timeout_seconds} seconds.'
+    except (EOFError, OSError):
+      error = (
+          'Code execution worker exited unexpectedly, it may have exceeded'
+          ' its CPU time or memory limit.'
+      )
+    finally:
+      self._release_worker(worker, execution_id, healthy)
+
+    if not healthy and execution_id is not None:
+      error += ' The state of previous code executions was lost.'
+
+    return CodeExecutionResult(
+        stdout=output,
+        stderr=error,
+        output_files=[],
+    )
+
+  def close(self) -> None:
+    """Stops all worker processes."""
+    with self._lock:
+      self._closed = True
+      workers = self._idle_workers + list(self._session_workers.values())
+      self._idle_workers = []
+      self._session_workers = collections.OrderedDict()
+      self._num_workers = 0
+      self._lock.notify_all()
+    for worker in workers:
+      worker.stop()
@@ -83,3 +83,14 @@ class UnsafeLocalCodeExecutor(BaseCodeExecutor):
         stderr=error,
         output_files=[],
     )
+
+  @override
+  async def execute_code_async(
+      self,
+      invocation_context: InvocationContext,
+      code_execution_input: CodeExecutionInput,
+  ) -> CodeExecutionResult:
+    # `redirect_stdout` swaps the process-global stdout, so running the code in
+    # a worker thread would capture output of unrelated threads. Use
+    # ProcessPoolCodeExecutor for isolated, non-blocking local execution.
+    return self.execute_code(invocation_context, code_execution_input)
@@ -238,7 +238,7 @@ async def _run_pre_processor(
         content=code_content,
     )
 
-    code_execution_result = code_executor.execute_code(
+    code_execution_result = await code_executor.execute_code_async(
         invocation_context,
         CodeExecutionInput(
             code=code_str,
@@ -346,7 +346,7 @@ async def _run_post_processor(
       actions=EventActions(),
   )
 
-  code_execution_result = code_executor.execute_code(
+  code_execution_result = await code_executor.execute_code_async(
       invocation_context,
       CodeExecutionInput(
           code=code_str,
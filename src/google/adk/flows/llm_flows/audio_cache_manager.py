@@ -28,6 +28,40 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger('google_adk.' + __name__)
 
+_CACHE_LIST_ATTRS = {
+    'input': 'input_realtime_cache',
+    'output': 'output_realtime_cache',
+}
+
+
+class _CacheSize:
+  """The size of a realtime cache, tracked incrementally as chunks arrive."""
+
+  def __init__(self):
+    self._cache: list[RealtimeCacheEntry] | None = None
+    self._last_entry: RealtimeCacheEntry | None = None
+    self._num_entries = 0
+    self._num_bytes = 0
+
+  def sync(self, cache: list[RealtimeCacheEntry]) -> int:
+    """Returns the number of bytes in the cache, counting only new chunks."""
+    if (
+        cache is not self._cache
+        or len(cache) < self._num_entries
+        or (
+            self._num_entries
+            and cache[self._num_entries - 1] is not self._last_entry
+        )
+    ):
+      self._cache = cache
+      self._num_entries = 0
+      self._num_bytes = 0
+    for position in range(self._num_entries, len(cache)):
+      self._num_bytes += len(cache[position].data.data or b'')
+    self._num_entries = len(cache)
+    self._last_entry = cache[-1] if cache else None
+    return self._num_bytes
+
 
 class AudioCacheManager:
   """Manages audio caching and flushing for live streaming flows."""
@@ -81,6 +115,89 @@ class AudioCacheManager:
         len(cache),
     )
 
+  def _get_cache_num_bytes(
+      self,
+      invocation_context: InvocationContext,
+      cache_type: str,
+      cache: list[RealtimeCacheEntry],
+  ) -> int:
+    """Returns the number of audio bytes in a cache."""
+    sizes = getattr(invocation_context, '_realtime_cache_sizes', None)
+    if not isinstance(sizes, dict):
+      return sum(len(entry.data.data or b'') for entry in cache)
+    return sizes.setdefault(cache_type, _CacheSize()).sync(cache)
+
+  def _is_over_limits(
+      self,
+      num_bytes: int,
+      first_timestamp: float,
+      *,
+      max_bytes: float,
+      max_duration_seconds: float,
+  ) -> bool:
+    return (
+        num_bytes > max_bytes
+        or time.time() - first_timestamp > max_duration_seconds
+    )
+
+  async def flush_caches_if_needed(
+      self,
+      invocation_context: InvocationContext,
+      cache_type: str,
+  ) -> None:
+    """Flush a cache early if it grew past the configured size or duration.
+
+    This bounds the memory of long live sessions without turn boundaries: once
+    the cache holds more than `max_cache_size_bytes` or spans more than
+    `max_cache_duration_seconds`, its chunks are flushed as an audio segment.
+    If the cache can't be flushed, e.g. without an artifact service, it acts
+    as a ring buffer and drops its oldest chunks down to half of the limits.
+
+    Args:
+      invocation_context: The invocation context containing audio caches.
+      cache_type: Type of audio cache to check, either 'input' or 'output'.
+
+    Raises:
+      ValueError: If cache_type is not 'input' or 'output'.
+    """
+    if cache_type not in _CACHE_LIST_ATTRS:
+      raise ValueError("cache_type must be either 'input' or 'output'")
+    cache_attr = _CACHE_LIST_ATTRS[cache_type]
+    cache = getattr(invocation_context, cache_attr)
+    if not cache:
+      return
+    num_bytes = self._get_cache_num_bytes(invocation_context, cache_type, cache)
+    if not self._is_over_limits(
+        num_bytes,
+        cache[0].timestamp,
+        max_bytes=self.config.max_cache_size_bytes,
+        max_duration_seconds=self.config.max_cache_duration_seconds,
+    ):
+      return
+
+    flush_success = await self._flush_cache_to_services(
+        invocation_context, cache, f'{cache_type}_audio'
+    )
+    if flush_success:
+      setattr(invocation_context, cache_attr, [])
+      return
+
+    num_dropped = 0
+    while num_dropped < len(cache) and self._is_over_limits(
+        num_bytes,
+        cache[num_dropped].timestamp,
+        max_bytes=self.config.max_cache_size_bytes / 2,
+        max_duration_seconds=self.config.max_cache_duration_seconds / 2,
+    ):
+      num_bytes -= len(cache[num_dropped].data.data or b'')
+      num_dropped += 1
+    del cache[:num_dropped]
+    logger.warning(
+        'Dropped the %d oldest %s audio chunks that could not be flushed.',
+        num_dropped,
+        cache_type,
+    )
+
   async def flush_caches(
       self,
       invocation_context: InvocationContext,
@@ -145,28 +262,24 @@ class AudioCacheManager:
       return False
 
     try:
-      # Combine audio chunks into a single file
-      combined_audio_data = b''
       mime_type = audio_cache[0].data.mime_type if audio_cache else 'audio/pcm'
 
-      for entry in audio_cache:
-        combined_audio_data += entry.data.data
-
       # Generate filename with timestamp from first audio chunk (when recording started)
       timestamp = int(audio_cache[0].timestamp * 1000)  # milliseconds
       filename = f"adk_live_audio_storage_{cache_type}_{timestamp}.{mime_type.split('/')[-1]}"
 
-      # Save to artifact service
-      combined_audio_part = types.Part(
-          inline_data=types.Blob(data=combined_audio_data, mime_type=mime_type)
-      )
-
-      revision_id = await invocation_context.artifact_service.save_artifact(
-          app_name=invocation_context.app_name,
-          user_id=invocation_context.user_id,
-          session_id=invocation_context.session.id,
-          filename=filename,
-          artifact=combined_audio_part,
+      # Stream the chunks to the artifact service rather than concatenating
+      # them into a single buffer.
+      audio_chunks = [entry.data.data for entry in audio_cache]
+      revision_id = (
+          await invocation_context.artifact_service.save_artifact_stream(
+              app_name=invocation_context.app_name,
+              user_id=invocation_context.user_id,
+              session_id=invocation_context.session.id,
+              filename=filename,
+              chunks=audio_chunks,
+              mime_type=mime_type,
+          )
       )
 
       # Create artifact reference for session service
@@ -194,7 +307,7 @@ class AudioCacheManager:
           'Successfully flushed %s cache: %d chunks, %d bytes, saved as %s',
           cache_type,
           len(audio_cache),
-          len(combined_audio_data),
+          sum(len(chunk or b'') for chunk in audio_chunks),
           filename,
       )
       return audio_event
@@ -217,13 +330,23 @@ class AudioCacheManager:
     input_count = len(invocation_context.input_realtime_cache or [])
     output_count = len(invocation_context.output_realtime_cache or [])
 
-    input_bytes = sum(
-        len(entry.data.data)
-        for entry in (invocation_context.input_realtime_cache or [])
+    input_bytes = (
+        self._get_cache_num_bytes(
+            invocation_context,
+            'input',
+            invocation_context.input_realtime_cache,
+        )
+        if input_count
+        else 0
     )
-    output_bytes = sum(
-        len(entry.data.data)
-        for entry in (invocation_context.output_realtime_cache or [])
+    output_bytes = (
+        self._get_cache_num_bytes(
+            invocation_context,
+            'output',
+            invocation_context.output_realtime_cache,
+        )
+        if output_count
+        else 0
     )
 
     return {
@@ -249,6 +372,7 @@ class AudioCacheConfig:
 
     Args:
       max_cache_size_bytes: Maximum cache size in bytes before auto-flush.
+        Caches that can't be flushed are capped at this size.
       max_cache_duration_seconds: Maximum duration to keep data in cache.
       auto_flush_threshold: Number of chunks that triggers auto-flush.
     """
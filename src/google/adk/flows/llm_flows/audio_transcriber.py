@@ -13,21 +13,239 @@
 # limitations under the License.
 from __future__ import annotations
 
+import abc
+import asyncio
+import dataclasses
+from typing import AsyncGenerator
+from typing import AsyncIterable
+from typing import Optional
 from typing import TYPE_CHECKING
+from typing import Union
 
 from google.cloud import speech
 from google.genai import types as genai_types
 
 if TYPE_CHECKING:
   from ...agents.invocation_context import InvocationContext
+  from ...agents.transcription_entry import TranscriptionEntry
+
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+"""The default number of speaker segments transcribed concurrently."""
+
+
+def _default_recognition_config() -> speech.RecognitionConfig:
+  return speech.RecognitionConfig(
+      encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+      sample_rate_hertz=16000,
+      language_code='en-US',
+  )
+
+
+@dataclasses.dataclass(frozen=True)
+class Transcript:
+  """A transcript of streamed audio."""
+
+  text: str
+  """The transcribed text."""
+  is_final: bool
+  """Whether the text is final, or an interim result that may still change."""
+
+
+class BaseSpeechRecognizer(abc.ABC):
+  """The speech recognition backend of an AudioTranscriber."""
+
+  @abc.abstractmethod
+  async def recognize(self, audio: bytes) -> list[str]:
+    """Transcribes a segment of audio.
+
+    Args:
+      audio: The audio to transcribe.
+
+    Returns:
+      The transcripts of the consecutive portions of the audio.
+    """
+
+  async def streaming_recognize(
+      self, audio_chunks: AsyncIterable[bytes]
+  ) -> AsyncGenerator[Transcript, None]:
+    """Transcribes audio as it is streamed.
+
+    Backends without a streaming API transcribe the whole audio once the stream
+    ends.
+
+    Args:
+      audio_chunks: The audio, in chunks.
+
+    Yields:
+      Interim and final transcripts, in order.
+    """
+    audio = b''.join([chunk async for chunk in audio_chunks])
+    if audio:
+      for text in await self.recognize(audio):
+        yield Transcript(text=text, is_final=True)
+
+
+class GoogleCloudSpeechRecognizer(BaseSpeechRecognizer):
+  """Recognizes speech with Google Cloud Speech-to-Text."""
+
+  def __init__(
+      self,
+      *,
+      client: Optional[speech.SpeechClient] = None,
+      async_client: Optional[speech.SpeechAsyncClient] = None,
+      config: Optional[speech.RecognitionConfig] = None,
+      interim_results: bool = True,
+  ):
+    """Initializes the GoogleCloudSpeechRecognizer.
+
+    Args:
+      client: The client used to transcribe segments. Created on first use if
+        not set.
+      async_client: The client used to transcribe streams. Created on first use
+        if not set.
+      config: The recognition config. Defaults to 16kHz LINEAR16 en-US audio.
+      interim_results: Whether streaming recognition yields interim results.
+    """
+    self._client = client
+    self._async_client = async_client
+    self._config = config or _default_recognition_config()
+    self._interim_results = interim_results
+
+  async def recognize(self, audio: bytes) -> list[str]:
+    if self._client is None:
+      self._client = speech.SpeechClient()
+    # The client is synchronous, so it must not block the event loop.
+    response = await asyncio.to_thread(
+        self._client.recognize,
+        config=self._config,
+        audio=speech.RecognitionAudio(content=audio),
+    )
+    return [
+        result.alternatives[0].transcript
+        for result in response.results
+        if result.alternatives
+    ]
+
+  async def streaming_recognize(
+      self, audio_chunks: AsyncIterable[bytes]
+  ) -> AsyncGenerator[Transcript, None]:
+    if self._async_client is None:
+      self._async_client = speech.SpeechAsyncClient()
+
+    streaming_config = speech.StreamingRecognitionConfig(
+        config=self._config, interim_results=self._interim_results
+    )
+
+    async def requests():
+      yield speech.StreamingRecognizeRequest(streaming_config=streaming_config)
+      async for chunk in audio_chunks:
+        if chunk:
+          yield speech.StreamingRecognizeRequest(audio_content=chunk)
+
+    responses = await self._async_client.streaming_recognize(
+        requests=requests()
+    )
+    async for response in responses:
+      for result in response.results:
+        if result.alternatives:
+          yield Transcript(
+              text=result.alternatives[0].transcript,
+              is_final=result.is_final,
+          )
+
+
+def _bundle_audio(
+    transcription_cache: list[TranscriptionEntry],
+) -> list[tuple[str, Union[bytes, genai_types.Content]]]:
+  """Merges consecutive audio segments of the same speaker.
+
+  Segments are joined once per speaker turn rather than concatenated chunk by
+  chunk, which would copy the audio quadratically.
+  """
+  bundled_audio = []
+  current_speaker = None
+  current_audio_segments: list[bytes] = []
+
+  for transcription_entry in transcription_cache:
+    speaker, audio_data = (
+        transcription_entry.role,
+        transcription_entry.data,
+    )
+
+    if isinstance(audio_data, genai_types.Content):
+      if current_speaker is not None:
+        bundled_audio.append(
+            (current_speaker, b''.join(current_audio_segments))
+        )
+        current_speaker = None
+        current_audio_segments = []
+      bundled_audio.append((speaker, audio_data))
+      continue
+
+    if not audio_data.data:
+      continue
+
+    if speaker == current_speaker:
+      current_audio_segments.append(audio_data.data)
+    else:
+      if current_speaker is not None:
+        bundled_audio.append(
+            (current_speaker, b''.join(current_audio_segments))
+        )
+      current_speaker = speaker
+      current_audio_segments = [audio_data.data]
+
+  # Append the last audio segment if any
+  if current_speaker is not None:
+    bundled_audio.append((current_speaker, b''.join(current_audio_segments)))
+  return bundled_audio
+
+
+def _to_contents(
+    speaker: str, transcripts: list[str]
+) -> list[genai_types.Content]:
+  role = speaker.lower()
+  return [
+      genai_types.Content(role=role, parts=[genai_types.Part(text=transcript)])
+      for transcript in transcripts
+  ]
 
 
 class AudioTranscriber:
   """Transcribes audio using Google Cloud Speech-to-Text."""
 
-  def __init__(self, init_client=False):
+  def __init__(
+      self,
+      init_client=False,
+      *,
+      recognizer: Optional[BaseSpeechRecognizer] = None,
+      max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+  ):
+    """Initializes the AudioTranscriber.
+
+    Args:
+      init_client: Whether to create the Speech-to-Text client used by
+        `transcribe_file` right away.
+      recognizer: The speech recognition backend used by `transcribe` and
+        `transcribe_stream`. Defaults to Google Cloud Speech-to-Text.
+      max_concurrent_requests: The maximum number of speaker segments that
+        `transcribe` sends to the recognizer at once.
+    """
+    if max_concurrent_requests < 1:
+      raise ValueError('max_concurrent_requests must be positive.')
     if init_client:
       self.client = speech.SpeechClient()
+    self._recognizer = recognizer
+    self._max_concurrent_requests = max_concurrent_requests
+
+  @property
+  def recognizer(self) -> BaseSpeechRecognizer:
+    """The speech recognition backend."""
+    if self._recognizer is None:
+      self._recognizer = GoogleCloudSpeechRecognizer(
+          client=getattr(self, 'client', None)
+      )
+    return self._recognizer
 
   def transcribe_file(
       self, invocation_context: InvocationContext
@@ -37,6 +255,9 @@ class AudioTranscriber:
     The ordering of speakers will be preserved. Audio blobs will be merged for
     the same speaker as much as we can do reduce the transcription latency.
 
+    This transcribes the segments one by one and blocks; prefer `transcribe`
+    from async code.
+
     Args:
         invocation_context: The invocation context to access the transcription
           cache.
@@ -44,67 +265,79 @@ class AudioTranscriber:
     Returns:
         A list of Content objects containing the transcribed text.
     """
+    bundled_audio = _bundle_audio(invocation_context.transcription_cache or [])
 
-    bundled_audio = []
-    current_speaker = None
-    current_audio_data = b''
-    contents = []
+    # reset cache
+    invocation_context.transcription_cache = []
 
-    # Step1: merge audio blobs
-    for transcription_entry in invocation_context.transcription_cache or []:
-      speaker, audio_data = (
-          transcription_entry.role,
-          transcription_entry.data,
-      )
+    contents = []
+    for speaker, data in bundled_audio:
+      if isinstance(data, bytes):
+        response = self.client.recognize(
+            config=_default_recognition_config(),
+            audio=speech.RecognitionAudio(content=data),
+        )
+        contents.extend(
+            _to_contents(
+                speaker,
+                [
+                    result.alternatives[0].transcript
+                    for result in response.results
+                ],
+            )
+        )
+      else:
+        # don't need to transcribe model which are already text
+        contents.append(data)
 
-      if isinstance(audio_data, genai_types.Content):
-        if current_speaker is not None:
-          bundled_audio.append((current_speaker, current_audio_data))
-          current_speaker = None
-          current_audio_data = b''
-        bundled_audio.append((speaker, audio_data))
-        continue
+    return contents
 
-      if not audio_data.data:
-        continue
+  async def transcribe(
+      self, invocation_context: InvocationContext
+  ) -> list[genai_types.Content]:
+    """Transcribes the cached audio, bundling segments from the same speaker.
 
-      if speaker == current_speaker:
-        current_audio_data += audio_data.data
-      else:
-        if current_speaker is not None:
-          bundled_audio.append((current_speaker, current_audio_data))
-        current_speaker = speaker
-        current_audio_data = audio_data.data
+    Speaker segments are transcribed concurrently, up to
+    `max_concurrent_requests` at a time, and the ordering of speakers is
+    preserved.
 
-    # Append the last audio segment if any
-    if current_speaker is not None:
-      bundled_audio.append((current_speaker, current_audio_data))
+    Args:
+      invocation_context: The invocation context to access the transcription
+        cache.
 
-    # reset cache
+    Returns:
+      A list of Content objects containing the transcribed text.
+    """
+    bundled_audio = _bundle_audio(invocation_context.transcription_cache or [])
     invocation_context.transcription_cache = []
 
-    # Step2: transcription
-    for speaker, data in bundled_audio:
-      if isinstance(data, genai_types.Blob):
-        audio = speech.RecognitionAudio(content=data)
+    recognizer = self.recognizer
+    semaphore = asyncio.Semaphore(self._max_concurrent_requests)
 
-        config = speech.RecognitionConfig(
-            encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-            sample_rate_hertz=16000,
-            language_code='en-US',
-        )
+    async def transcribe_segment(
+        speaker: str, data: Union[bytes, genai_types.Content]
+    ) -> list[genai_types.Content]:
+      if not isinstance(data, bytes):
+        # don't need to transcribe model which are already text
+        return [data]
+      async with semaphore:
+        return _to_contents(speaker, await recognizer.recognize(data))
 
-        response = self.client.recognize(config=config, audio=audio)
+    results = await asyncio.gather(
+        *(transcribe_segment(speaker, data) for speaker, data in bundled_audio)
+    )
+    return [content for contents in results for content in contents]
 
-        for result in response.results:
-          transcript = result.alternatives[0].transcript
+  async def transcribe_stream(
+      self, audio_chunks: AsyncIterable[bytes]
+  ) -> AsyncGenerator[Transcript, None]:
+    """Transcribes streamed audio incrementally.
 
-          parts = [genai_types.Part(text=transcript)]
-          role = speaker.lower()
-          content = genai_types.Content(role=role, parts=parts)
-          contents.append(content)
-      else:
-        # don't need to transcribe model which are already text
-        contents.append(data)
+    Args:
+      audio_chunks: The audio of a single speaker, in chunks.
 
-    return contents
+    Yields:
+      Interim and final transcripts as they are recognized.
+    """
+    async for transcript in self.recognizer.streaming_recognize(audio_chunks):
+      yield transcript
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 from abc import ABC
 import asyncio
+import copy
 import datetime
 import inspect
 import logging
@@ -260,6 +261,9 @@ class BaseLlmFlow(ABC):
         self.audio_cache_manager.cache_audio(
             invocation_context, live_request.blob, cache_type='input'
         )
+        await self.audio_cache_manager.flush_caches_if_needed(
+            invocation_context, cache_type='input'
+        )
 
         await llm_connection.send_realtime(live_request.blob)
 
@@ -339,6 +343,9 @@ class BaseLlmFlow(ABC):
                   self.audio_cache_manager.cache_audio(
                       invocation_context, audio_blob, cache_type='output'
                   )
+                  await self.audio_cache_manager.flush_caches_if_needed(
+                      invocation_context, cache_type='output'
+                  )
 
                 yield event
         # Give opportunity for other tasks to run.
@@ -784,12 +791,16 @@ class BaseLlmFlow(ABC):
               )
           ) as agen:
             async for llm_response in agen:
-              trace_call_llm(
-                  invocation_context,
-                  model_response_event.id,
-                  llm_request,
-                  llm_response,
-              )
+              # Every response overwrites the span attributes, so only the
+              # final, aggregated response is traced rather than serializing
+              # the whole request for each streamed chunk.
+              if not llm_response.partial:
+                trace_call_llm(
+                    invocation_context,
+                    model_response_event.id,
+                    llm_request,
+                    llm_response,
+                )
               # Runs after_model_callback if it exists.
               if altered_llm_response := await self._handle_after_model_callback(
                   invocation_context, llm_response, model_response_event
@@ -906,6 +917,28 @@ class BaseLlmFlow(ABC):
       llm_response: LlmResponse,
       model_response_event: Event,
   ) -> Event:
+    if llm_response.partial:
+      # Partial events are created for every streamed chunk, so they skip the
+      # dump and re-validation round trip. The fields are already validated.
+      return model_response_event.model_copy(
+          update={
+              **{
+                  name: value
+                  for name in type(llm_response).model_fields
+                  if (value := getattr(llm_response, name)) is not None
+              },
+              # A shallow copy with fresh containers is enough to keep the
+              # partial event from sharing mutable actions with the template.
+              'actions': model_response_event.actions.model_copy(
+                  update={
+                      name: copy.copy(value)
+                      for name, value in model_response_event.actions
+                      if isinstance(value, (dict, list))
+                  }
+              ),
+          }
+      )
+
     model_response_event = Event.model_validate({
         **model_response_event.model_dump(exclude_none=True),
         **llm_response.model_dump(exclude_none=True),
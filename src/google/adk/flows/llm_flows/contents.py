@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import copy
+import json
 import logging
 from typing import AsyncGenerator
 from typing import Optional
@@ -22,6 +23,8 @@ from typing import Optional
 from google.genai import types
 from typing_extensions import override
 
+from ...agents.context_budget_config import ContextBudgetConfig
+from ...agents.context_budget_config import ContextBudgetReport
 from ...agents.invocation_context import InvocationContext
 from ...events.event import Event
 from ...models.llm_request import LlmRequest
@@ -32,6 +35,12 @@ from .functions import REQUEST_EUC_FUNCTION_CALL_NAME
 
 logger = logging.getLogger('google_adk.' + __name__)
 
+_CHARS_PER_TOKEN = 4
+"""Rough number of characters per token used to estimate context sizes."""
+
+_MEDIA_PART_TOKENS = 258
+"""Estimated tokens of an inline or file data part, e.g. an image."""
+
 
 class _ContentLlmRequestProcessor(BaseLlmRequestProcessor):
   """Builds the contents for the LLM request."""
@@ -50,19 +59,38 @@ class _ContentLlmRequestProcessor(BaseLlmRequestProcessor):
 
     if agent.include_contents == 'default':
       # Include full conversation history
-      llm_request.contents = _get_contents(
+      context_events = _get_context_events(
           invocation_context.branch,
           invocation_context.session.events,
           agent.name,
       )
     else:
       # Include current turn context only (no conversation history)
-      llm_request.contents = _get_current_turn_contents(
+      context_events = _get_current_turn_events(
           invocation_context.branch,
           invocation_context.session.events,
           agent.name,
       )
 
+    run_config = invocation_context.run_config
+    context_budget = run_config.context_budget_config if run_config else None
+    if context_budget is None:
+      llm_request.contents = _events_to_contents(context_events)
+    else:
+      llm_request.contents, report = _assemble_contents_within_budget(
+          context_events, context_budget
+      )
+      llm_request.context_budget_report = report
+      logger.debug(
+          'Context budget of agent %s: kept %d tokens, dropped %d tokens and'
+          ' %d contents, elided %d function responses.',
+          agent.name,
+          report.kept_tokens,
+          report.dropped_tokens,
+          report.dropped_contents,
+          report.elided_function_responses,
+      )
+
     # Add instruction-related contents to proper position in conversation
     await _add_instructions_to_user_content(
         invocation_context, llm_request, instruction_related_contents
@@ -340,6 +368,26 @@ def _get_contents(
   Returns:
     A list of processed contents.
   """
+  return _events_to_contents(
+      _get_context_events(current_branch, events, agent_name)
+  )
+
+
+def _get_context_events(
+    current_branch: Optional[str], events: list[Event], agent_name: str = ''
+) -> list[Event]:
+  """Get the events whose contents make up the LLM request.
+
+  Applies filtering and rearrangement to events.
+
+  Args:
+    current_branch: The current branch of the agent.
+    events: Events to process.
+    agent_name: The name of the agent.
+
+  Returns:
+    The events to convert to contents, in order.
+  """
   accumulated_input_transcription = ''
   accumulated_output_transcription = ''
 
@@ -426,13 +474,15 @@ def _get_contents(
   result_events = _rearrange_events_for_latest_function_response(
       filtered_events
   )
-  result_events = _rearrange_events_for_async_function_responses_in_history(
+  return _rearrange_events_for_async_function_responses_in_history(
       result_events
   )
 
-  # Convert events to contents
+
+def _events_to_contents(events: list[Event]) -> list[types.Content]:
+  """Copies the contents of events for the LLM request."""
   contents = []
-  for event in result_events:
+  for event in events:
     content = copy.deepcopy(event.content)
     if content:
       remove_client_function_call_id(content)
@@ -440,10 +490,154 @@ def _get_contents(
   return contents
 
 
-def _get_current_turn_contents(
+def _estimate_part_tokens(part: types.Part) -> int:
+  """Estimates the tokens of a content part from its size."""
+  if part.inline_data or part.file_data:
+    return _MEDIA_PART_TOKENS
+  chars = 0
+  if part.text:
+    chars += len(part.text)
+  if part.function_call:
+    chars += len(part.function_call.name or '')
+    chars += len(json.dumps(part.function_call.args, default=str))
+  if part.function_response:
+    chars += len(part.function_response.name or '')
+    chars += len(json.dumps(part.function_response.response, default=str))
+  if part.executable_code and part.executable_code.code:
+    chars += len(part.executable_code.code)
+  if part.code_execution_result and part.code_execution_result.output:
+    chars += len(part.code_execution_result.output)
+  return -(-chars // _CHARS_PER_TOKEN)
+
+
+def _is_turn_start(content: types.Content) -> bool:
+  """Whether the history can start at the content without orphaning a call."""
+  return content.role == 'user' and not _content_contains_function_response(
+      content
+  )
+
+
+def _elide_function_response(
+    part: types.Part, tokens: int, max_tokens: int
+) -> types.Part:
+  """Replaces an oversized function response with a truncated preview."""
+  function_response = part.function_response
+  preview = json.dumps(function_response.response, default=str)[
+      : max_tokens * _CHARS_PER_TOKEN
+  ]
+  return types.Part(
+      function_response=types.FunctionResponse(
+          id=function_response.id,
+          name=function_response.name,
+          response={
+              'elided_response': preview,
+              'note': (
+                  f'Elided {tokens - max_tokens} of {tokens} estimated tokens'
+                  ' of this response to fit the context budget.'
+              ),
+          },
+      )
+  )
+
+
+def _assemble_contents_within_budget(
+    events: list[Event], context_budget: ContextBudgetConfig
+) -> tuple[list[types.Content], ContextBudgetReport]:
+  """Copies the contents of the newest events that fit into a token budget.
+
+  The events are walked newest-first and only the contents that are kept are
+  copied. The history always starts at a user turn, so that function calls
+  and responses stay paired, and the latest turn is kept even if it exceeds
+  the budget. Oversized function responses are elided in the copies.
+
+  Args:
+    events: The events to convert to contents, in order.
+    context_budget: The token budget.
+
+  Returns:
+    The contents to send and the report of the tokens kept and dropped.
+  """
+  max_response_tokens = context_budget.max_function_response_tokens
+  history = [event.content for event in events if event.content]
+
+  part_tokens: dict[int, list[int]] = {}
+
+  def estimate_parts(index: int) -> list[int]:
+    if index not in part_tokens:
+      part_tokens[index] = [
+          _estimate_part_tokens(part) for part in history[index].parts or []
+      ]
+    return part_tokens[index]
+
+  def estimate_sent(index: int) -> int:
+    """Estimates the tokens of a content as sent, after elision."""
+    return sum(
+        min(tokens, max_response_tokens)
+        if max_response_tokens is not None and part.function_response
+        else tokens
+        for part, tokens in zip(
+            history[index].parts or [], estimate_parts(index)
+        )
+    )
+
+  start = len(history)
+  kept_tokens = 0
+  while start > 0:
+    tokens = estimate_sent(start - 1)
+    if (
+        start < len(history)
+        and kept_tokens + tokens > context_budget.max_tokens
+    ):
+      break
+    start -= 1
+    kept_tokens += tokens
+  if start > 0:
+    # Start the kept history at a user turn.
+    turn_start = next(
+        (i for i in range(start, len(history)) if _is_turn_start(history[i])),
+        None,
+    )
+    if turn_start is None:
+      while start > 0 and not _is_turn_start(history[start]):
+        start -= 1
+        kept_tokens += estimate_sent(start)
+    else:
+      for i in range(start, turn_start):
+        kept_tokens -= estimate_sent(i)
+      start = turn_start
+
+  report = ContextBudgetReport(
+      kept_tokens=kept_tokens,
+      dropped_tokens=sum(sum(estimate_parts(i)) for i in range(start)),
+      dropped_contents=start,
+  )
+  contents = []
+  for index in range(start, len(history)):
+    content = history[index]
+    parts = []
+    for part, tokens in zip(content.parts or [], part_tokens[index]):
+      if (
+          max_response_tokens is not None
+          and part.function_response
+          and tokens > max_response_tokens
+      ):
+        parts.append(
+            _elide_function_response(part, tokens, max_response_tokens)
+        )
+        report.elided_function_responses += 1
+        report.dropped_tokens += tokens - max_response_tokens
+      else:
+        parts.append(copy.deepcopy(part))
+    content = content.model_copy(update={'parts': parts})
+    remove_client_function_call_id(content)
+    contents.append(content)
+  return contents, report
+
+
+def _get_current_turn_events(
     current_branch: Optional[str], events: list[Event], agent_name: str = ''
-) -> list[types.Content]:
-  """Get contents for the current turn only (no conversation history).
+) -> list[Event]:
+  """Get events for the current turn only (no conversation history).
 
   When include_contents='none', we want to include:
   - The current user input
@@ -459,8 +653,8 @@ def _get_current_turn_contents(
     agent_name: The name of the agent.
 
   Returns:
-    A list of contents for the current turn only, preserving context needed
-    for proper tool execution while excluding conversation history.
+    The events of the current turn only, preserving context needed for proper
+    tool execution while excluding conversation history.
   """
   # Find the latest event that starts the current turn and process from there
   for i in range(len(events) - 1, -1, -1):
@@ -468,7 +662,7 @@ def _get_current_turn_contents(
     if _should_include_event_in_context(current_branch, event) and (
         event.author == 'user' or _is_other_agent_reply(agent_name, event)
     ):
-      return _get_contents(current_branch, events[i:], agent_name)
+      return _get_context_events(current_branch, events[i:], agent_name)
 
   return []
 
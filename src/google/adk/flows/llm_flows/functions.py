@@ -35,6 +35,7 @@ from ...agents.invocation_context import InvocationContext
 from ...auth.auth_tool import AuthToolArguments
 from ...events.event import Event
 from ...events.event_actions import EventActions
+from ...sessions._event_index import EventIndex
 from ...telemetry.tracing import trace_merged_tool_calls
 from ...telemetry.tracing import trace_tool_call
 from ...telemetry.tracing import tracer
@@ -874,8 +875,19 @@ def merge_parallel_function_response_events(
 
 def find_matching_function_call(
     events: list[Event],
+    *,
+    event_index: Optional[EventIndex] = None,
 ) -> Optional[Event]:
-  """Finds the function call event that matches the function response id of the last event."""
+  """Finds the function call event that matches the function response id of the last event.
+
+  Args:
+    events: The session events.
+    event_index: Optional index synced with `events`, used to look up the
+      function call instead of scanning the events.
+
+  Returns:
+    The matching function call event, or None if not found.
+  """
   if not events:
     return None
 
@@ -891,6 +903,11 @@ def find_matching_function_call(
         for part in last_event.content.parts
         if part.function_response
     )
+    if event_index is not None:
+      position = event_index.find_function_call_position(
+          function_call_id, before=len(events) - 1
+      )
+      return events[position] if position is not None else None
     for i in range(len(events) - 2, -1, -1):
       event = events[i]
       # looking for the system long running request euc function call
@@ -21,11 +21,14 @@ from functools import cached_property
 import logging
 import os
 import sys
+import threading
+from typing import Any
 from typing import AsyncGenerator
 from typing import cast
 from typing import Optional
 from typing import TYPE_CHECKING
 from typing import Union
+import weakref
 
 from google.genai import Client
 from google.genai import types
@@ -33,6 +36,7 @@ from typing_extensions import override
 
 from .. import version
 from ..utils.context_utils import Aclosing
+from ..utils.context_utils import get_loop_scope
 from ..utils.streaming_utils import StreamingResponseAggregator
 from ..utils.variant_utils import GoogleLLMVariant
 from .base_llm import BaseLlm
@@ -49,6 +53,39 @@ _NEW_LINE = '\n'
 _EXCLUDED_PART_FIELD = {'inline_data': {'data'}}
 _AGENT_ENGINE_TELEMETRY_TAG = 'remote_reasoning_engine'
 _AGENT_ENGINE_TELEMETRY_ENV_VARIABLE_NAME = 'GOOGLE_CLOUD_AGENT_ENGINE_ID'
+_CLIENT_ENV_VARIABLE_PREFIXES = ('GOOGLE_', 'GEMINI_')
+
+_shared_clients: weakref.WeakKeyDictionary[
+    Any, dict[tuple[str, ...], Client]
+] = weakref.WeakKeyDictionary()
+"""Shared clients, by event loop (or thread) and then by client options."""
+_shared_clients_lock = threading.Lock()
+
+
+def _get_shared_client(http_options: types.HttpOptions) -> Client:
+  """Returns the client shared by the models using the same http options.
+
+  Sharing clients reuses their HTTP connection pools across model instances.
+  Clients read their backend, project and credentials from the environment,
+  so the relevant environment variables are part of the key. The async
+  connections of a client belong to the event loop that opened them, so
+  clients are only shared within the running loop, or thread outside of one.
+  """
+  key = (
+      http_options.model_dump_json(exclude_none=True),
+      *sorted(
+          f'{name}={value}'
+          for name, value in os.environ.items()
+          if name.startswith(_CLIENT_ENV_VARIABLE_PREFIXES)
+      ),
+  )
+  with _shared_clients_lock:
+    clients = _shared_clients.setdefault(get_loop_scope(), {})
+    client = clients.get(key)
+    if client is None:
+      client = Client(http_options=http_options)
+      clients[key] = client
+  return client
 
 
 class Gemini(BaseLlm):
@@ -200,8 +237,8 @@ class Gemini(BaseLlm):
     Returns:
       The api client.
     """
-    return Client(
-        http_options=types.HttpOptions(
+    return _get_shared_client(
+        types.HttpOptions(
             headers=self._tracking_headers,
             retry_options=self.retry_options,
         )
@@ -239,8 +276,8 @@ class Gemini(BaseLlm):
 
   @cached_property
   def _live_api_client(self) -> Client:
-    return Client(
-        http_options=types.HttpOptions(
+    return _get_shared_client(
+        types.HttpOptions(
             headers=self._tracking_headers, api_version=self._live_api_version
         )
     )
@@ -23,6 +23,7 @@ from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
 
+from ..agents.context_budget_config import ContextBudgetReport
 from ..agents.context_cache_config import ContextCacheConfig
 from ..tools.base_tool import BaseTool
 from .cache_metadata import CacheMetadata
@@ -91,6 +92,9 @@ class LlmRequest(BaseModel):
   cacheable_contents_token_count: Optional[int] = None
   """Token count from previous request's prompt, used for cache size validation."""
 
+  context_budget_report: Optional[ContextBudgetReport] = None
+  """How the contents were fit into the context budget of the run, if any."""
+
   def append_instructions(
       self, instructions: Union[list[str], types.Content]
   ) -> list[types.Content]:
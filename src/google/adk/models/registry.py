@@ -19,7 +19,12 @@ from __future__ import annotations
 from functools import lru_cache
 import logging
 import re
+import threading
+from typing import Any
 from typing import TYPE_CHECKING
+import weakref
+
+from ..utils.context_utils import get_loop_scope
 
 if TYPE_CHECKING:
   from .base_llm import BaseLlm
@@ -34,6 +39,16 @@ Key is the regex that matches the model name.
 Value is the class that implements the model.
 """
 
+_compiled_patterns: dict[str, re.Pattern[str]] = {}
+"""The compiled regexes of `_llm_registry_dict`."""
+
+_llm_instances: weakref.WeakKeyDictionary[Any, dict[str, BaseLlm]] = (
+    weakref.WeakKeyDictionary()
+)
+"""Shared LLM instances, by event loop (or thread) and then by model name."""
+
+_llm_instances_lock = threading.Lock()
+
 
 class LLMRegistry:
   """Registry for LLMs."""
@@ -51,6 +66,29 @@ class LLMRegistry:
 
     return LLMRegistry.resolve(model)(model=model)
 
+  @staticmethod
+  def get_llm(model: str) -> BaseLlm:
+    """Returns the process-wide LLM instance of a model.
+
+    Unlike `new_llm`, repeated calls with the same model name return the same
+    instance, so the clients and connection pools it holds are reused across
+    LLM calls. As those connections belong to an event loop, instances are
+    only shared within the running loop, or thread outside of one.
+
+    Args:
+        model: The model name.
+
+    Returns:
+        The shared LLM instance.
+    """
+    with _llm_instances_lock:
+      llms = _llm_instances.setdefault(get_loop_scope(), {})
+      llm = llms.get(model)
+      if llm is None:
+        llm = LLMRegistry.new_llm(model)
+        llms[model] = llm
+    return llm
+
   @staticmethod
   def _register(model_name_regex: str, llm_cls: type[BaseLlm]):
     """Registers a new LLM class.
@@ -69,6 +107,11 @@ class LLMRegistry:
       )
 
     _llm_registry_dict[model_name_regex] = llm_cls
+    _compiled_patterns[model_name_regex] = re.compile(model_name_regex)
+    # Models may now resolve to a different class.
+    LLMRegistry.resolve.cache_clear()
+    with _llm_instances_lock:
+      _llm_instances.clear()
 
   @staticmethod
   def register(llm_cls: type[BaseLlm]):
@@ -82,7 +125,7 @@ class LLMRegistry:
       LLMRegistry._register(regex, llm_cls)
 
   @staticmethod
-  @lru_cache(maxsize=32)
+  @lru_cache(maxsize=256)
   def resolve(model: str) -> type[BaseLlm]:
     """Resolves the model to a BaseLlm subclass.
 
@@ -96,7 +139,7 @@ class LLMRegistry:
     """
 
     for regex, llm_class in _llm_registry_dict.items():
-      if re.compile(regex).fullmatch(model):
+      if _compiled_patterns[regex].fullmatch(model):
         return llm_class
 
     raise ValueError(f'Model {model} not found.')
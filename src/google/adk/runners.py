@@ -55,6 +55,7 @@ from .memory.in_memory_memory_service import InMemoryMemoryService
 from .platform.thread import create_thread
 from .plugins.base_plugin import BasePlugin
 from .plugins.plugin_manager import PluginManager
+from .sessions._event_index import get_event_index
 from .sessions.base_session_service import BaseSessionService
 from .sessions.in_memory_session_service import InMemorySessionService
 from .sessions.session import Session
@@ -152,6 +153,9 @@ class Runner:
     self.memory_service = memory_service
     self.credential_service = credential_service
     self.plugin_manager = PluginManager(plugins=plugins)
+    self._event_checkpoint_interval = (
+        app.event_checkpoint_interval if app else None
+    )
     (
         self._agent_origin_app_name,
         self._agent_origin_dir,
@@ -458,10 +462,20 @@ class Runner:
       raise ValueError(f'Session not found: {session_id}')
 
     rewind_event_index = -1
-    for i, event in enumerate(session.events):
-      if event.invocation_id == rewind_before_invocation_id:
-        rewind_event_index = i
-        break
+    event_index = get_event_index(
+        session, checkpoint_interval=self._event_checkpoint_interval
+    )
+    if event_index is not None:
+      positions = event_index.get_invocation_positions(
+          rewind_before_invocation_id
+      )
+      if positions:
+        rewind_event_index = positions[0]
+    else:
+      for i, event in enumerate(session.events):
+        if event.invocation_id == rewind_before_invocation_id:
+          rewind_event_index = i
+          break
 
     if rewind_event_index == -1:
       raise ValueError(
@@ -497,16 +511,23 @@ class Runner:
       self, session: Session, rewind_event_index: int
   ) -> dict[str, Any]:
     """Computes the state delta to reverse changes."""
-    state_at_rewind_point: dict[str, Any] = {}
-    for i in range(rewind_event_index):
-      if session.events[i].actions.state_delta:
-        for k, v in session.events[i].actions.state_delta.items():
-          if k.startswith('app:') or k.startswith('user:'):
-            continue
-          if v is None:
-            state_at_rewind_point.pop(k, None)
-          else:
-            state_at_rewind_point[k] = v
+    event_index = get_event_index(
+        session, checkpoint_interval=self._event_checkpoint_interval
+    )
+    if event_index is not None:
+      # Replays the events after the nearest checkpoint only.
+      state_at_rewind_point = event_index.get_state_at(rewind_event_index)
+    else:
+      state_at_rewind_point: dict[str, Any] = {}
+      for i in range(rewind_event_index):
+        if session.events[i].actions.state_delta:
+          for k, v in session.events[i].actions.state_delta.items():
+            if k.startswith('app:') or k.startswith('user:'):
+              continue
+            if v is None:
+              state_at_rewind_point.pop(k, None)
+            else:
+              state_at_rewind_point[k] = v
 
     current_state = session.state
     rewind_state_delta = {}
@@ -534,16 +555,25 @@ class Runner:
     if not self.artifact_service:
       return {}
 
-    versions_at_rewind_point: dict[str, int] = {}
-    for i in range(rewind_event_index):
-      event = session.events[i]
-      if event.actions.artifact_delta:
-        versions_at_rewind_point.update(event.actions.artifact_delta)
+    event_index = get_event_index(
+        session, checkpoint_interval=self._event_checkpoint_interval
+    )
+    if event_index is not None:
+      versions_at_rewind_point = event_index.get_artifact_versions_at(
+          rewind_event_index
+      )
+      current_versions = event_index.get_current_artifact_versions()
+    else:
+      versions_at_rewind_point: dict[str, int] = {}
+      for i in range(rewind_event_index):
+        event = session.events[i]
+        if event.actions.artifact_delta:
+          versions_at_rewind_point.update(event.actions.artifact_delta)
 
-    current_versions: dict[str, int] = {}
-    for event in session.events:
-      if event.actions.artifact_delta:
-        current_versions.update(event.actions.artifact_delta)
+      current_versions: dict[str, int] = {}
+      for event in session.events:
+        if event.actions.artifact_delta:
+          current_versions.update(event.actions.artifact_delta)
 
     rewind_artifact_delta = {}
     for filename, vn in current_versions.items():
@@ -866,7 +896,8 @@ class Runner:
     # the agent that returned the corresponding function call regardless the
     # type of the agent. e.g. a remote a2a agent may surface a credential
     # request as a special long running function tool call.
-    event = find_matching_function_call(session.events)
+    event_index = get_event_index(session)
+    event = find_matching_function_call(session.events, event_index=event_index)
     if event and event.author:
       return root_agent.find_agent(event.author)
 
@@ -878,7 +909,15 @@ class Runner:
         return False
       return True
 
-    for event in filter(_event_filter, reversed(session.events)):
+    if event_index is not None:
+      # Only the last reply of each author can change the outcome.
+      replies = (
+          session.events[position]
+          for _, position in event_index.get_authors_by_last_reply()
+      )
+    else:
+      replies = filter(_event_filter, reversed(session.events))
+    for event in replies:
       if event.author == root_agent.name:
         # Found root agent.
         return root_agent
@@ -1086,7 +1125,7 @@ class Runner:
 
     # Step 1: Maybe retrieve a previous user message for the invocation.
     user_message = new_message or self._find_user_message_for_invocation(
-        session.events, invocation_id
+        session, invocation_id
     )
     if not user_message:
       raise ValueError(
@@ -1120,9 +1159,15 @@ class Runner:
     return invocation_context
 
   def _find_user_message_for_invocation(
-      self, events: list[Event], invocation_id: str
+      self, session: Session, invocation_id: str
   ) -> Optional[types.Content]:
     """Finds the user message that started a specific invocation."""
+    event_index = get_event_index(session)
+    events = (
+        event_index.get_invocation_events(invocation_id)
+        if event_index is not None
+        else session.events
+    )
     for event in events:
       if (
           event.invocation_id == invocation_id
@@ -0,0 +1,365 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Incrementally maintained lookups over the events of a session."""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+from typing import Any
+from typing import Optional
+from typing import TYPE_CHECKING
+
+from ..events.event import Event
+
+if TYPE_CHECKING:
+  from .session import Session
+
+DEFAULT_CHECKPOINT_INTERVAL = 50
+"""The default number of events between two state checkpoints."""
+
+EMPTY_AGENT_STATE = object()
+"""Marks an agent that generated content without saving an agent state."""
+
+
+@dataclasses.dataclass(frozen=True)
+class StateCheckpoint:
+  """The session-scoped state and artifact versions before an event."""
+
+  position: int
+  """The position of the first event not reflected in the checkpoint."""
+  state: dict[str, Any]
+  """The session state, without app and user scoped keys."""
+  artifact_versions: dict[str, int]
+  """The latest version of each artifact."""
+
+
+@dataclasses.dataclass
+class _InvocationAgentStates:
+  """The agent states of an invocation, folded over its events."""
+
+  agent_states: dict[str, Any] = dataclasses.field(default_factory=dict)
+  end_of_agents: dict[str, bool] = dataclasses.field(default_factory=dict)
+
+
+class EventIndex:
+  """Position lookups over a list of session events.
+
+  The index is kept in sync with the event list it was last synced with: new
+  events appended to the list are indexed incrementally, and the index is
+  rebuilt if the list was replaced or its already indexed events changed.
+  Positions refer to the event list.
+
+  Every `checkpoint_interval` events, the session-scoped state and artifact
+  versions are checkpointed, so the state at any position can be rebuilt by
+  replaying only the events after the nearest checkpoint.
+  """
+
+  def __init__(self, checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL):
+    if checkpoint_interval < 1:
+      raise ValueError('checkpoint_interval must be positive.')
+    self._checkpoint_interval = checkpoint_interval
+    self._reset(None)
+
+  def __eq__(self, other: object) -> bool:
+    # The index is derived from the events, so it never makes two sessions
+    # differ.
+    return isinstance(other, EventIndex)
+
+  __hash__ = None
+
+  def __deepcopy__(self, memo: dict[int, Any]) -> EventIndex:
+    # The index is derived from the events, so a copied session (e.g. one
+    # returned by InMemorySessionService) rebuilds it on its first sync
+    # instead of copying every lookup and checkpoint.
+    return EventIndex(self._checkpoint_interval)
+
+  def _reset(self, events: Optional[list[Event]]) -> None:
+    self._events = events
+    self._last_indexed_event: Optional[Event] = None
+    self._num_indexed = 0
+    self._invocation_positions: dict[str, list[int]] = collections.defaultdict(
+        list
+    )
+    self._branch_positions: dict[Optional[str], list[int]] = (
+        collections.defaultdict(list)
+    )
+    self._function_call_positions: dict[str, list[int]] = (
+        collections.defaultdict(list)
+    )
+    self._function_response_positions: dict[str, list[int]] = (
+        collections.defaultdict(list)
+    )
+    self._last_position_by_author: dict[str, int] = {}
+    self._last_reply_position_by_author: dict[str, int] = {}
+    self._compaction_positions: list[int] = []
+    self._rewind_positions: list[int] = []
+    self._state: dict[str, Any] = {}
+    self._artifact_versions: dict[str, int] = {}
+    self._checkpoints: list[StateCheckpoint] = [
+        StateCheckpoint(position=0, state={}, artifact_versions={})
+    ]
+    self._invocation_agent_states: dict[str, _InvocationAgentStates] = {}
+
+  @property
+  def checkpoint_interval(self) -> int:
+    """The number of events between two state checkpoints."""
+    return self._checkpoint_interval
+
+  def set_checkpoint_interval(self, checkpoint_interval: int) -> None:
+    """Changes the checkpoint interval, re-indexing on the next sync."""
+    if checkpoint_interval < 1:
+      raise ValueError('checkpoint_interval must be positive.')
+    if checkpoint_interval != self._checkpoint_interval:
+      self._checkpoint_interval = checkpoint_interval
+      self._reset(None)
+
+  @property
+  def events(self) -> list[Event]:
+    """The indexed events."""
+    return self._events if self._events is not None else []
+
+  def sync(self, events: list[Event]) -> EventIndex:
+    """Indexes the events appended since the last sync.
+
+    Args:
+      events: The session events.
+
+    Returns:
+      The index itself.
+    """
+    if (
+        events is not self._events
+        or len(events) < self._num_indexed
+        or (
+            self._num_indexed
+            and events[self._num_indexed - 1] is not self._last_indexed_event
+        )
+    ):
+      self._reset(events)
+    for position in range(self._num_indexed, len(events)):
+      self._add(position, events[position])
+    self._num_indexed = len(events)
+    if events:
+      self._last_indexed_event = events[-1]
+    return self
+
+  def _add(self, position: int, event: Event) -> None:
+    if event.invocation_id:
+      self._invocation_positions[event.invocation_id].append(position)
+    self._branch_positions[event.branch].append(position)
+    self._last_position_by_author[event.author] = position
+    if (
+        event.author != 'user'
+        and event.actions.agent_state is None
+        and not event.actions.end_of_agent
+    ):
+      self._last_reply_position_by_author[event.author] = position
+    for function_call in event.get_function_calls():
+      if function_call.id:
+        self._function_call_positions[function_call.id].append(position)
+    for function_response in event.get_function_responses():
+      if function_response.id:
+        self._function_response_positions[function_response.id].append(position)
+    if event.actions.compaction:
+      self._compaction_positions.append(position)
+    if event.actions.rewind_before_invocation_id:
+      self._rewind_positions.append(position)
+
+    _apply_state_delta(self._state, event)
+    if event.actions.artifact_delta:
+      self._artifact_versions.update(event.actions.artifact_delta)
+    if (position + 1) % self._checkpoint_interval == 0:
+      self._checkpoints.append(
+          StateCheckpoint(
+              position=position + 1,
+              state=dict(self._state),
+              artifact_versions=dict(self._artifact_versions),
+          )
+      )
+
+    if event.invocation_id:
+      folded = self._invocation_agent_states.setdefault(
+          event.invocation_id, _InvocationAgentStates()
+      )
+      if event.actions.end_of_agent:
+        folded.end_of_agents[event.author] = True
+        folded.agent_states.pop(event.author, None)
+      elif event.actions.agent_state is not None:
+        folded.agent_states[event.author] = event.actions.agent_state
+        folded.end_of_agents[event.author] = False
+      elif (
+          event.author != 'user'
+          and event.content
+          and not folded.agent_states.get(event.author)
+      ):
+        folded.agent_states[event.author] = EMPTY_AGENT_STATE
+        folded.end_of_agents[event.author] = False
+
+  def get_invocation_positions(self, invocation_id: str) -> list[int]:
+    """Returns the positions of the events of an invocation, in order."""
+    return self._invocation_positions.get(invocation_id, [])
+
+  def get_invocation_events(self, invocation_id: str) -> list[Event]:
+    """Returns the events of an invocation, in order."""
+    return [
+        self._events[position]
+        for position in self.get_invocation_positions(invocation_id)
+    ]
+
+  def get_branch_events(self, branch: Optional[str]) -> list[Event]:
+    """Returns the events of a branch, in order."""
+    return [
+        self._events[position]
+        for position in self._branch_positions.get(branch, [])
+    ]
+
+  def find_function_call_position(
+      self, function_call_id: str, *, before: Optional[int] = None
+  ) -> Optional[int]:
+    """Returns the position of the last event calling the function call id.
+
+    Args:
+      function_call_id: The function call id.
+      before: If set, only consider events before this position.
+
+    Returns:
+      The position of the function call event, or None if not found.
+    """
+    for position in reversed(
+        self._function_call_positions.get(function_call_id, [])
+    ):
+      if before is None or position < before:
+        return position
+    return None
+
+  def get_function_response_positions(self, function_call_id: str) -> list[int]:
+    """Returns the positions of the events responding to a function call id."""
+    return self._function_response_positions.get(function_call_id, [])
+
+  def get_last_position_by_author(self, author: str) -> Optional[int]:
+    """Returns the position of the last event of an author."""
+    return self._last_position_by_author.get(author)
+
+  def get_authors_by_last_reply(self) -> list[tuple[str, int]]:
+    """Returns the non-user authors and the position of their last reply.
+
+    Events carrying only agent state changes are not replies. The authors are
+    ordered from the most recent reply to the oldest.
+    """
+    return sorted(
+        self._last_reply_position_by_author.items(),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+
+  def get_state_at(self, position: int) -> dict[str, Any]:
+    """Returns the session-scoped state before the event at a position.
+
+    Args:
+      position: The position of the event.
+
+    Returns:
+      The session state without app and user scoped keys, as of right before
+      the event at `position`.
+    """
+    checkpoint = self._get_checkpoint(position)
+    state = dict(checkpoint.state)
+    for event_position in range(checkpoint.position, position):
+      _apply_state_delta(state, self._events[event_position])
+    return state
+
+  def get_artifact_versions_at(self, position: int) -> dict[str, int]:
+    """Returns the latest artifact versions before the event at a position."""
+    checkpoint = self._get_checkpoint(position)
+    versions = dict(checkpoint.artifact_versions)
+    for event_position in range(checkpoint.position, position):
+      artifact_delta = self._events[event_position].actions.artifact_delta
+      if artifact_delta:
+        versions.update(artifact_delta)
+    return versions
+
+  def get_current_artifact_versions(self) -> dict[str, int]:
+    """Returns the latest version of each artifact after all indexed events."""
+    return dict(self._artifact_versions)
+
+  def _get_checkpoint(self, position: int) -> StateCheckpoint:
+    index = min(
+        position // self._checkpoint_interval, len(self._checkpoints) - 1
+    )
+    return self._checkpoints[index]
+
+  def get_invocation_agent_states(
+      self, invocation_id: str
+  ) -> tuple[dict[str, Any], dict[str, bool]]:
+    """Returns the agent states and end of agent flags of an invocation.
+
+    Agents that generated content without saving an agent state are mapped to
+    `EMPTY_AGENT_STATE`.
+
+    Args:
+      invocation_id: The invocation id.
+
+    Returns:
+      The agent states and the end of agent flags, by agent name, as of the
+      last event of the invocation.
+    """
+    folded = self._invocation_agent_states.get(invocation_id)
+    if folded is None:
+      return {}, {}
+    return dict(folded.agent_states), dict(folded.end_of_agents)
+
+  def get_compaction_positions(self) -> list[int]:
+    """Returns the positions of the compaction events, in order."""
+    return self._compaction_positions
+
+  def get_rewind_positions(self) -> list[int]:
+    """Returns the positions of the rewind events, in order."""
+    return self._rewind_positions
+
+
+def _apply_state_delta(state: dict[str, Any], event: Event) -> None:
+  """Applies the session-scoped keys of the state delta of an event."""
+  if not event.actions.state_delta:
+    return
+  for key, value in event.actions.state_delta.items():
+    if key.startswith('app:') or key.startswith('user:'):
+      continue
+    if value is None:
+      state.pop(key, None)
+    else:
+      state[key] = value
+
+
+def get_event_index(
+    session: Session, *, checkpoint_interval: Optional[int] = None
+) -> Optional[EventIndex]:
+  """Returns the event index of a session, synced with its events.
+
+  Args:
+    session: The session.
+    checkpoint_interval: If set, the number of events between two state
+      checkpoints of the index.
+
+  Returns:
+    The index kept on the session, or None for session-like objects that don't
+    carry one, in which case callers scan the events.
+  """
+  index = getattr(session, '_event_index', None)
+  if not isinstance(index, EventIndex):
+    return None
+  if checkpoint_interval is not None:
+    index.set_checkpoint_interval(checkpoint_interval)
+  return index.sync(session.events)
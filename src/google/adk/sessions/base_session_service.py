@@ -22,6 +22,7 @@ from pydantic import BaseModel
 from pydantic import Field
 
 from ..events.event import Event
+from ._event_index import get_event_index
 from .session import Session
 from .state import State
 
@@ -109,6 +110,7 @@ class BaseSessionService(abc.ABC):
     event = self._trim_temp_delta_state(event)
     self._update_session_state(session, event)
     session.events.append(event)
+    get_event_index(session)
     return event
 
   def _trim_temp_delta_state(self, event: Event) -> Event:
@@ -20,8 +20,10 @@ from pydantic import alias_generators
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
+from pydantic import PrivateAttr
 
 from ..events.event import Event
+from ._event_index import EventIndex
 
 
 class Session(BaseModel):
@@ -48,3 +50,6 @@ class Session(BaseModel):
   call/response, etc."""
   last_update_time: float = 0.0
   """The last update time of the session."""
+
+  _event_index: EventIndex = PrivateAttr(default_factory=EventIndex)
+  """Lookups over `events`, see `_event_index.get_event_index`."""
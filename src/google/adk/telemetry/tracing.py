@@ -258,6 +258,15 @@ def trace_call_llm(
       'gcp.vertex.agent.session_id', invocation_context.session.id
   )
   span.set_attribute('gcp.vertex.agent.event_id', event_id)
+  if llm_request.context_budget_report is not None:
+    span.set_attribute(
+        'gcp.vertex.agent.context_tokens_kept',
+        llm_request.context_budget_report.kept_tokens,
+    )
+    span.set_attribute(
+        'gcp.vertex.agent.context_tokens_dropped',
+        llm_request.context_budget_report.dropped_tokens,
+    )
   # Consider removing once GenAI SDK provides a way to record this info.
   if _should_add_request_response_to_spans():
     span.set_attribute(
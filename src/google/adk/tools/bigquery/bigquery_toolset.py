@@ -21,6 +21,7 @@ from typing import Union
 from google.adk.agents.readonly_context import ReadonlyContext
 from typing_extensions import override
 
+from . import client
 from . import data_insights_tool
 from . import metadata_tool
 from . import query_tool
@@ -49,6 +50,8 @@ class BigQueryToolset(BaseToolset):
     self._tool_settings = (
         bigquery_tool_config if bigquery_tool_config else BigQueryToolConfig()
     )
+    self._client_cache = client.BigQueryClientCache()
+    self._statement_cache = query_tool.StatementTypeCache()
 
   def _is_tool_selected(
       self, tool: BaseTool, readonly_context: ReadonlyContext
@@ -81,7 +84,11 @@ class BigQueryToolset(BaseToolset):
             metadata_tool.list_dataset_ids,
             metadata_tool.list_table_ids,
             metadata_tool.get_job_info,
-            query_tool.get_execute_sql(self._tool_settings),
+            query_tool.get_execute_sql(
+                self._tool_settings,
+                client_cache=self._client_cache,
+                statement_cache=self._statement_cache,
+            ),
             query_tool.forecast,
             query_tool.analyze_contribution,
             query_tool.detect_anomalies,
@@ -97,4 +104,4 @@ class BigQueryToolset(BaseToolset):
 
   @override
   async def close(self):
-    pass
+    self._client_cache.clear()
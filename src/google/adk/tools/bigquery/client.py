@@ -14,6 +14,8 @@
 
 from __future__ import annotations
 
+import collections
+import threading
 from typing import Optional
 
 import google.api_core.client_info
@@ -67,3 +69,76 @@ def get_bigquery_client(
   )
 
   return bigquery_client
+
+
+class BigQueryClientCache:
+  """A bounded, thread-safe cache of BigQuery clients.
+
+  Creating a `bigquery.Client` sets up a new HTTP session, so tools that run
+  many queries should reuse clients across calls. Clients are keyed by
+  (project, credentials, location, user agent). The credentials object is
+  compared by identity and held by the cache entry, so a credential that gets
+  replaced (e.g. after a new OAuth flow) gets a fresh client.
+  """
+
+  def __init__(self, max_size: int = 16):
+    self._max_size = max_size
+    self._clients: collections.OrderedDict[
+        tuple, tuple[Credentials, bigquery.Client]
+    ] = collections.OrderedDict()
+    self._lock = threading.Lock()
+
+  def get_client(
+      self,
+      *,
+      project: Optional[str],
+      credentials: Credentials,
+      location: Optional[str] = None,
+      user_agent: Optional[Union[str, List[str]]] = None,
+  ) -> bigquery.Client:
+    """Get a cached BigQuery client, creating one if needed.
+
+    Args:
+      project: The GCP project ID.
+      credentials: The credentials to use for the request.
+      location: The location of the BigQuery client.
+      user_agent: The user agent to use for the request.
+
+    Returns:
+      A BigQuery client.
+    """
+    if isinstance(user_agent, list):
+      user_agent_key = tuple(user_agent)
+    else:
+      user_agent_key = user_agent
+    key = (project, id(credentials), location, user_agent_key)
+
+    with self._lock:
+      entry = self._clients.get(key)
+      if entry is not None and entry[0] is credentials:
+        self._clients.move_to_end(key)
+        return entry[1]
+
+    bigquery_client = get_bigquery_client(
+        project=project,
+        credentials=credentials,
+        location=location,
+        user_agent=user_agent,
+    )
+
+    with self._lock:
+      self._clients[key] = (credentials, bigquery_client)
+      self._clients.move_to_end(key)
+      # Evicted clients may still be in use by an in-flight query, so they are
+      # left for garbage collection rather than closed here.
+      while len(self._clients) > self._max_size:
+        self._clients.popitem(last=False)
+    return bigquery_client
+
+  def clear(self) -> None:
+    """Close and drop all cached clients."""
+    with self._lock:
+      clients = [entry[1] for entry in self._clients.values()]
+      self._clients.clear()
+    for bigquery_client in clients:
+      bigquery_client.close()
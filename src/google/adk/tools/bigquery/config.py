@@ -67,6 +67,17 @@ class BigQueryToolConfig(BaseModel):
   By default, the query result will be limited to 50 rows.
   """
 
+  max_query_result_bytes: Optional[int] = None
+  """Maximum size in bytes of the query result rows returned inline.
+
+  By default, there is no size limit besides `max_query_result_rows`. If set,
+  only the rows that fit in this many bytes of JSON are returned to the agent.
+  When the tool runs as part of `BigQueryToolset` and an artifact service is
+  available, the complete result, including rows past `max_query_result_rows`,
+  is streamed row by row into a JSON Lines artifact, and only the inline
+  preview is returned to the agent.
+  """
+
   application_name: Optional[str] = None
   """Name of the application using the BigQuery tools.
 
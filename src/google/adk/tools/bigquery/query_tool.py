@@ -14,10 +14,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import collections
 import functools
+import hashlib
 import json
+import tempfile
+import threading
 import types
+from typing import Any
 from typing import Callable
+from typing import IO
 from typing import Optional
 import uuid
 
@@ -30,6 +37,106 @@ from .config import BigQueryToolConfig
 from .config import WriteMode
 
 BIGQUERY_SESSION_INFO_KEY = "bigquery_session_info"
+_RESULT_SPILL_CHUNK_SIZE = 1024 * 1024
+
+
+class StatementTypeCache:
+  """A bounded, thread-safe cache of dry-run query classifications.
+
+  The guardrails of the blocked and protected write modes classify every query
+  with a dry run before executing it. The classification only depends on the
+  query text (and the BigQuery session for protected writes), so it is cached
+  by a hash of the exact query text to save a round trip when the same query
+  runs again. The text is not normalized: even whitespace is significant in
+  SQL, e.g. a newline ends a `--` comment.
+  """
+
+  def __init__(self, max_size: int = 256):
+    self._max_size = max_size
+    self._entries: collections.OrderedDict[
+        tuple, tuple[Optional[str], Optional[str]]
+    ] = collections.OrderedDict()
+    self._lock = threading.Lock()
+    self.hits = 0
+    self.misses = 0
+
+  def get(self, key: tuple) -> Optional[tuple[Optional[str], Optional[str]]]:
+    """Return the (statement type, destination dataset) cached for key."""
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is None:
+        self.misses += 1
+        return None
+      self._entries.move_to_end(key)
+      self.hits += 1
+      return entry
+
+  def put(
+      self,
+      key: tuple,
+      statement_type: Optional[str],
+      destination_dataset_id: Optional[str],
+  ) -> None:
+    """Cache the classification of the query identified by key."""
+    with self._lock:
+      self._entries[key] = (statement_type, destination_dataset_id)
+      self._entries.move_to_end(key)
+      while len(self._entries) > self._max_size:
+        self._entries.popitem(last=False)
+
+
+def _query_digest(query: str) -> str:
+  """Return the digest of the exact query text, used as a cache key."""
+  return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def _classify_query(
+    bq_client: bigquery.Client,
+    query: str,
+    project_id: str,
+    job_config: bigquery.QueryJobConfig,
+    statement_cache: Optional[StatementTypeCache],
+    cache_key: tuple,
+) -> tuple[Optional[str], Optional[str], Optional[bigquery.QueryJob]]:
+  """Classify a query with a dry run, consulting the cache first.
+
+  Returns:
+    A tuple of the statement type, the destination dataset id and the dry run
+    job, which is None if the classification came from the cache.
+  """
+  if statement_cache is not None:
+    cached = statement_cache.get(cache_key)
+    if cached is not None:
+      return cached[0], cached[1], None
+
+  dry_run_query_job = bq_client.query(
+      query, project=project_id, job_config=job_config
+  )
+  statement_type = dry_run_query_job.statement_type
+  destination_dataset_id = (
+      dry_run_query_job.destination.dataset_id
+      if dry_run_query_job.destination
+      else None
+  )
+  if statement_cache is not None:
+    statement_cache.put(cache_key, statement_type, destination_dataset_id)
+  return statement_type, destination_dataset_id, dry_run_query_job
+
+
+def _serialize_row(row) -> tuple[dict, str]:
+  """Convert a result row to a JSON-friendly dict and its JSON encoding."""
+  row_values = dict(row.items())
+  try:
+    # if the json serialization of the row succeeds, use it as is
+    return row_values, json.dumps(row_values)
+  except:
+    pass
+  for key, val in row_values.items():
+    try:
+      json.dumps(val)
+    except:
+      row_values[key] = str(val)
+  return row_values, json.dumps(row_values)
 
 
 def _execute_sql(
@@ -40,6 +147,9 @@ def _execute_sql(
     tool_context: ToolContext,
     dry_run: bool = False,
     caller_id: Optional[str] = None,
+    client_cache: Optional[client.BigQueryClientCache] = None,
+    statement_cache: Optional[StatementTypeCache] = None,
+    result_spill: Optional[IO[bytes]] = None,
 ) -> dict:
   try:
     # Validate compute project if applicable
@@ -57,7 +167,10 @@ def _execute_sql(
       }
 
     # Get BigQuery client
-    bq_client = client.get_bigquery_client(
+    get_client = (
+        client_cache.get_client if client_cache else client.get_bigquery_client
+    )
+    bq_client = get_client(
         project=project_id,
         credentials=credentials,
         location=settings.location,
@@ -72,15 +185,20 @@ def _execute_sql(
     if caller_id:
       bq_job_labels["adk-bigquery-tool"] = caller_id
 
+    # The validation dry run, if any, can be reused to answer a dry run request
+    dry_run_query_job = None
+    query_digest = _query_digest(query)
+
     if not settings or settings.write_mode == WriteMode.BLOCKED:
-      dry_run_query_job = bq_client.query(
+      statement_type, _, dry_run_query_job = _classify_query(
+          bq_client,
           query,
-          project=project_id,
-          job_config=bigquery.QueryJobConfig(
-              dry_run=True, labels=bq_job_labels
-          ),
+          project_id,
+          bigquery.QueryJobConfig(dry_run=True, labels=bq_job_labels),
+          statement_cache,
+          (WriteMode.BLOCKED, project_id, query_digest),
       )
-      if dry_run_query_job.statement_type != "SELECT":
+      if statement_type != "SELECT":
         return {
             "status": "ERROR",
             "error_details": "Read-only mode only supports SELECT statements.",
@@ -116,19 +234,29 @@ def _execute_sql(
       )
 
       # Check the query type w.r.t. the BigQuery session
-      dry_run_query_job = bq_client.query(
-          query,
-          project=project_id,
-          job_config=bigquery.QueryJobConfig(
-              dry_run=True,
-              connection_properties=bq_connection_properties,
-              labels=bq_job_labels,
-          ),
+      statement_type, destination_dataset_id, dry_run_query_job = (
+          _classify_query(
+              bq_client,
+              query,
+              project_id,
+              bigquery.QueryJobConfig(
+                  dry_run=True,
+                  connection_properties=bq_connection_properties,
+                  labels=bq_job_labels,
+              ),
+              statement_cache,
+              (
+                  WriteMode.PROTECTED,
+                  project_id,
+                  bq_session_id,
+                  query_digest,
+              ),
+          )
       )
       if (
-          dry_run_query_job.statement_type != "SELECT"
-          and dry_run_query_job.destination
-          and dry_run_query_job.destination.dataset_id != bq_session_dataset_id
+          statement_type != "SELECT"
+          and destination_dataset_id
+          and destination_dataset_id != bq_session_dataset_id
       ):
         return {
             "status": "ERROR",
@@ -140,18 +268,25 @@ def _execute_sql(
 
     # Return the dry run characteristics of the query if requested
     if dry_run:
-      dry_run_job = bq_client.query(
-          query,
-          project=project_id,
-          job_config=bigquery.QueryJobConfig(
-              dry_run=True,
-              connection_properties=bq_connection_properties,
-              labels=bq_job_labels,
-          ),
-      )
-      return {"status": "SUCCESS", "dry_run_info": dry_run_job.to_api_repr()}
+      if dry_run_query_job is None:
+        dry_run_query_job = bq_client.query(
+            query,
+            project=project_id,
+            job_config=bigquery.QueryJobConfig(
+                dry_run=True,
+                connection_properties=bq_connection_properties,
+                labels=bq_job_labels,
+            ),
+        )
+      return {
+          "status": "SUCCESS",
+          "dry_run_info": dry_run_query_job.to_api_repr(),
+      }
 
-    # Finally execute the query, fetch the result, and return it
+    # Finally execute the query, fetch the result, and return it. When the
+    # result is spilled, all of its rows are paged through and the row limit
+    # only applies to the rows returned inline.
+    max_rows = settings.max_query_result_rows
     row_iterator = bq_client.query_and_wait(
         query,
         job_config=bigquery.QueryJobConfig(
@@ -159,24 +294,38 @@ def _execute_sql(
             labels=bq_job_labels,
         ),
         project=project_id,
-        max_results=settings.max_query_result_rows,
+        max_results=max_rows if result_spill is None else None,
     )
     rows = []
+    num_rows = 0
+    result_bytes = 0
+    inline_limit_exceeded = False
     for row in row_iterator:
-      row_values = {}
-      for key, val in row.items():
-        try:
-          # if the json serialization of the value succeeds, use it as is
-          json.dumps(val)
-        except:
-          val = str(val)
-        row_values[key] = val
-      rows.append(row_values)
+      num_rows += 1
+      if inline_limit_exceeded and result_spill is None:
+        continue
+      row_values, row_json = _serialize_row(row)
+      if not inline_limit_exceeded:
+        result_bytes += len(row_json)
+        if (
+            settings.max_query_result_bytes is not None
+            and result_bytes > settings.max_query_result_bytes
+        ) or (max_rows is not None and num_rows > max_rows):
+          inline_limit_exceeded = True
+          if result_spill is not None:
+            # Rows returned inline are part of the full result as well
+            for inline_row in rows:
+              result_spill.write(json.dumps(inline_row).encode("utf-8"))
+              result_spill.write(b"\n")
+        else:
+          rows.append(row_values)
+      if inline_limit_exceeded and result_spill is not None:
+        result_spill.write(row_json.encode("utf-8"))
+        result_spill.write(b"\n")
 
     result = {"status": "SUCCESS", "rows": rows}
-    if (
-        settings.max_query_result_rows is not None
-        and len(rows) == settings.max_query_result_rows
+    if inline_limit_exceeded or (
+        result_spill is None and max_rows is not None and num_rows == max_rows
     ):
       result["result_is_likely_truncated"] = True
     return result
@@ -715,42 +864,106 @@ def _execute_sql_protected_write_mode(*args, **kwargs) -> dict:
   return execute_sql(*args, **kwargs)
 
 
-def get_execute_sql(settings: BigQueryToolConfig) -> Callable[..., dict]:
+def get_execute_sql(
+    settings: BigQueryToolConfig,
+    *,
+    client_cache: Optional[client.BigQueryClientCache] = None,
+    statement_cache: Optional[StatementTypeCache] = None,
+) -> Callable[..., Any]:
   """Get the execute_sql tool customized as per the given tool settings.
 
   Args:
       settings: BigQuery tool settings indicating the behavior of the
         execute_sql tool.
+      client_cache: If provided, BigQuery clients are reused across tool calls
+        from this cache. Providing a cache also makes the returned tool async,
+        running the query in a worker thread instead of the event loop.
+      statement_cache: If provided, query classifications done by dry runs in
+        the blocked and protected write modes are reused from this cache.
 
   Returns:
-      callable[..., dict]: A version of the execute_sql tool respecting the tool
+      callable[..., Any]: A version of the execute_sql tool respecting the tool
       settings.
   """
 
-  if not settings or settings.write_mode == WriteMode.BLOCKED:
+  if client_cache is not None or statement_cache is not None:
+
+    async def execute_sql_wrapper(
+        project_id: str,
+        query: str,
+        credentials: Credentials,
+        settings: BigQueryToolConfig,
+        tool_context: ToolContext,
+        dry_run: bool = False,
+    ) -> dict:
+      # Rows past the inline limits are spilled to a temporary file on disk
+      # until the query is done, rather than held in memory. Without an
+      # artifact service to save them to, nothing is spilled.
+      result_spill = (
+          tempfile.TemporaryFile()
+          if settings
+          and settings.max_query_result_bytes is not None
+          and tool_context._invocation_context.artifact_service is not None
+          else None
+      )
+      try:
+        result = await asyncio.to_thread(
+            _execute_sql,
+            project_id=project_id,
+            query=query,
+            credentials=credentials,
+            settings=settings,
+            tool_context=tool_context,
+            dry_run=dry_run,
+            caller_id="execute_sql",
+            client_cache=client_cache,
+            statement_cache=statement_cache,
+            result_spill=result_spill,
+        )
+        if result_spill is not None and result_spill.tell():
+          artifact_name = f"bigquery_result_{uuid.uuid4().hex}.jsonl"
+          result_spill.seek(0)
+          await tool_context.save_artifact_stream(
+              artifact_name,
+              chunks=iter(
+                  functools.partial(
+                      result_spill.read, _RESULT_SPILL_CHUNK_SIZE
+                  ),
+                  b"",
+              ),
+              mime_type="application/jsonl",
+          )
+          result["result_artifact"] = artifact_name
+        return result
+      finally:
+        if result_spill is not None:
+          result_spill.close()
+
+    functools.update_wrapper(execute_sql_wrapper, execute_sql)
+  elif not settings or settings.write_mode == WriteMode.BLOCKED:
     return execute_sql
+  else:
+    # Create a new function object using the original function's code and
+    # globals. We pass the original code, globals, name, defaults, and closure.
+    # This creates a raw function object without copying other metadata yet.
+    execute_sql_wrapper = types.FunctionType(
+        execute_sql.__code__,
+        execute_sql.__globals__,
+        execute_sql.__name__,
+        execute_sql.__defaults__,
+        execute_sql.__closure__,
+    )
 
-  # Create a new function object using the original function's code and globals.
-  # We pass the original code, globals, name, defaults, and closure.
-  # This creates a raw function object without copying other metadata yet.
-  execute_sql_wrapper = types.FunctionType(
-      execute_sql.__code__,
-      execute_sql.__globals__,
-      execute_sql.__name__,
-      execute_sql.__defaults__,
-      execute_sql.__closure__,
-  )
-
-  # Use functools.update_wrapper to copy over other essential attributes
-  # from the original function to the new one.
-  # This includes __name__, __qualname__, __module__, __annotations__, etc.
-  # It specifically allows us to then set __doc__ separately.
-  functools.update_wrapper(execute_sql_wrapper, execute_sql)
+    # Use functools.update_wrapper to copy over other essential attributes
+    # from the original function to the new one.
+    # This includes __name__, __qualname__, __module__, __annotations__, etc.
+    # It specifically allows us to then set __doc__ separately.
+    functools.update_wrapper(execute_sql_wrapper, execute_sql)
 
   # Now, set the new docstring
-  if settings.write_mode == WriteMode.PROTECTED:
+  if settings and settings.write_mode == WriteMode.PROTECTED:
     execute_sql_wrapper.__doc__ = _execute_sql_protected_write_mode.__doc__
-  else:
+  elif settings and settings.write_mode == WriteMode.ALLOWED:
     execute_sql_wrapper.__doc__ = _execute_sql_write_mode.__doc__
 
   return execute_sql_wrapper
@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import threading
+import time
 from typing import Any
 from typing import Dict
 from typing import List
@@ -267,12 +270,53 @@ def openid_dict_to_scheme_credential(
   return openid_scheme, auth_credential
 
 
+OPENID_CONFIGURATION_CACHE_TTL_SECONDS = 3600
+"""How long fetched OpenID configurations are reused."""
+
+# openid_url -> (fetch time, configuration).
+_openid_configuration_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_openid_configuration_cache_lock = threading.Lock()
+
+
+def _fetch_openid_configuration(openid_url: str) -> Dict[str, Any]:
+  """Returns the OpenID configuration at a URL, fetching it if not cached."""
+  with _openid_configuration_cache_lock:
+    cached = _openid_configuration_cache.get(openid_url)
+  if (
+      cached is not None
+      and time.monotonic() - cached[0] < OPENID_CONFIGURATION_CACHE_TTL_SECONDS
+  ):
+    return copy.deepcopy(cached[1])
+
+  try:
+    response = requests.get(openid_url, timeout=10)
+    response.raise_for_status()
+    config_dict = response.json()
+  except requests.exceptions.RequestException as e:
+    raise ValueError(
+        f"Failed to fetch OpenID configuration from {openid_url}: {e}"
+    ) from e
+  except ValueError as e:
+    raise ValueError(
+        "Invalid JSON response from OpenID configuration endpoint"
+        f" {openid_url}: {e}"
+    ) from e
+
+  with _openid_configuration_cache_lock:
+    _openid_configuration_cache[openid_url] = (
+        time.monotonic(),
+        copy.deepcopy(config_dict),
+    )
+  return config_dict
+
+
 def openid_url_to_scheme_credential(
     openid_url: str, scopes: List[str], credential_dict: Dict[str, Any]
 ) -> Tuple[OpenIdConnectWithConfig, AuthCredential]:
   """Constructs OpenID scheme and credential from OpenID URL, scopes, and credential dictionary.
 
-  Fetches OpenID configuration from the provided URL.
+  Fetches OpenID configuration from the provided URL. Configurations are
+  cached for `OPENID_CONFIGURATION_CACHE_TTL_SECONDS`.
 
   Args:
       openid_url: The OpenID Connect discovery URL.
@@ -290,19 +334,7 @@ def openid_url_to_scheme_credential(
       requests.exceptions.RequestException:  If there's an error during the
           HTTP request.
   """
-  try:
-    response = requests.get(openid_url, timeout=10)
-    response.raise_for_status()
-    config_dict = response.json()
-  except requests.exceptions.RequestException as e:
-    raise ValueError(
-        f"Failed to fetch OpenID configuration from {openid_url}: {e}"
-    ) from e
-  except ValueError as e:
-    raise ValueError(
-        "Invalid JSON response from OpenID configuration endpoint"
-        f" {openid_url}: {e}"
-    ) from e
+  config_dict = _fetch_openid_configuration(openid_url)
 
   # Add openIdConnectUrl to config dict
   config_dict["openIdConnectUrl"] = openid_url
@@ -14,8 +14,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import collections
+from concurrent import futures
+import functools
 import json
+import threading
+import time
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -25,6 +32,7 @@ from google.adk.tools.spanner.settings import SpannerToolSettings
 from google.adk.tools.tool_context import ToolContext
 from google.auth.credentials import Credentials
 from google.cloud.spanner_admin_database_v1.types import DatabaseDialect
+from google.cloud.spanner_v1 import param_types
 from google.cloud.spanner_v1.database import Database
 
 # Embedding options
@@ -45,6 +53,8 @@ _GOOGLESQL_PARAMETER_TEXT_QUERY = "query"
 _POSTGRESQL_PARAMETER_TEXT_QUERY = "1"
 _GOOGLESQL_PARAMETER_QUERY_EMBEDDING = "embedding"
 _POSTGRESQL_PARAMETER_QUERY_EMBEDDING = "1"
+_GOOGLESQL_PARAMETER_TEXT_QUERIES = "queries"
+_POSTGRESQL_PARAMETER_TEXT_QUERIES = "1"
 
 
 def _generate_googlesql_for_embedding_query(
@@ -99,6 +109,216 @@ def _get_embedding_for_query(
     return result_set.one()[0]
 
 
+def _generate_googlesql_for_batch_embedding_query(
+    spanner_embedding_model_name: str,
+) -> str:
+  return f"""
+    SELECT content, embeddings.values
+    FROM ML.PREDICT(
+      MODEL {spanner_embedding_model_name},
+      (SELECT content FROM UNNEST(@{_GOOGLESQL_PARAMETER_TEXT_QUERIES}) AS content)
+    )
+  """
+
+
+def _generate_postgresql_for_batch_embedding_query(
+    vertex_ai_embedding_model_endpoint: str,
+) -> str:
+  return f"""
+    SELECT content, spanner.FLOAT32_ARRAY( spanner.ML_PREDICT_ROW(
+      '{vertex_ai_embedding_model_endpoint}',
+      JSONB_BUILD_OBJECT(
+        'instances',
+        JSONB_BUILD_ARRAY( JSONB_BUILD_OBJECT('content', content) )
+      )
+    ) -> 'predictions'->0->'embeddings'->'values' )
+    FROM UNNEST(${_POSTGRESQL_PARAMETER_TEXT_QUERIES}::TEXT[]) AS content
+  """
+
+
+def _get_embeddings_for_queries(
+    database: Database,
+    dialect: DatabaseDialect,
+    spanner_embedding_model_name: Optional[str],
+    vertex_ai_embedding_model_endpoint: Optional[str],
+    queries: List[str],
+) -> Dict[str, List[float]]:
+  """Gets the embeddings for several queries in one round trip."""
+  if len(queries) == 1:
+    return {
+        queries[0]: _get_embedding_for_query(
+            database,
+            dialect,
+            spanner_embedding_model_name,
+            vertex_ai_embedding_model_endpoint,
+            queries[0],
+        )
+    }
+  if dialect == DatabaseDialect.POSTGRESQL:
+    embedding_query = _generate_postgresql_for_batch_embedding_query(
+        vertex_ai_embedding_model_endpoint
+    )
+    param_name = f"p{_POSTGRESQL_PARAMETER_TEXT_QUERIES}"
+  else:
+    embedding_query = _generate_googlesql_for_batch_embedding_query(
+        spanner_embedding_model_name
+    )
+    param_name = _GOOGLESQL_PARAMETER_TEXT_QUERIES
+  with database.snapshot() as snapshot:
+    result_set = snapshot.execute_sql(
+        embedding_query,
+        params={param_name: queries},
+        param_types={param_name: param_types.Array(param_types.STRING)},
+    )
+    return {content: embedding for content, embedding in result_set}
+
+
+def _normalize_query_text(query: str) -> str:
+  return " ".join(query.split())
+
+
+class QueryEmbeddingCache:
+  """An LRU/TTL cache of query embeddings for `similarity_search`.
+
+  Entries are keyed by the database, the embedding model and the normalized
+  query text. Concurrent lookups of the same missing query share one embedding
+  request, and misses that arrive within `batch_window_seconds` of each other
+  for the same database and model are embedded together in a single
+  ML.PREDICT round trip.
+  """
+
+  def __init__(
+      self,
+      max_size: int = 256,
+      ttl_seconds: Optional[float] = 3600,
+      batch_window_seconds: float = 0.005,
+  ):
+    self._max_size = max_size
+    self._ttl_seconds = ttl_seconds
+    self._batch_window_seconds = batch_window_seconds
+    self._lock = threading.Lock()
+    self._entries: collections.OrderedDict[tuple, tuple[float, List[float]]] = (
+        collections.OrderedDict()
+    )
+    self._in_flight: Dict[tuple, futures.Future] = {}
+    self._pending_batches: Dict[tuple, List[str]] = {}
+    self.hits = 0
+    self.misses = 0
+    self.embedding_requests = 0
+
+  def stats(self) -> Dict[str, int]:
+    """Returns the hit, miss and embedding request counts of the cache."""
+    with self._lock:
+      return {
+          "hits": self.hits,
+          "misses": self.misses,
+          "embedding_requests": self.embedding_requests,
+          "size": len(self._entries),
+      }
+
+  def clear(self) -> None:
+    """Drops all cached embeddings."""
+    with self._lock:
+      self._entries.clear()
+
+  def _lookup(self, key: tuple) -> Optional[List[float]]:
+    entry = self._entries.get(key)
+    if entry is None:
+      return None
+    created_at, embedding = entry
+    if (
+        self._ttl_seconds is not None
+        and time.monotonic() - created_at > self._ttl_seconds
+    ):
+      del self._entries[key]
+      return None
+    self._entries.move_to_end(key)
+    return embedding
+
+  def _store(self, key: tuple, embedding: List[float]) -> None:
+    if self._max_size <= 0:
+      return
+    self._entries[key] = (time.monotonic(), embedding)
+    self._entries.move_to_end(key)
+    while len(self._entries) > self._max_size:
+      self._entries.popitem(last=False)
+
+  def get_embedding(
+      self,
+      database: Database,
+      dialect: DatabaseDialect,
+      spanner_embedding_model_name: Optional[str],
+      vertex_ai_embedding_model_endpoint: Optional[str],
+      query: str,
+  ) -> List[float]:
+    """Gets the embedding for the query, from the cache when possible."""
+    batch_key = (
+        database.name,
+        dialect,
+        spanner_embedding_model_name,
+        vertex_ai_embedding_model_endpoint,
+    )
+    text = _normalize_query_text(query)
+    key = batch_key + (text,)
+
+    with self._lock:
+      embedding = self._lookup(key)
+      if embedding is not None:
+        self.hits += 1
+        return embedding
+      self.misses += 1
+      future = self._in_flight.get(key)
+      if future is not None:
+        is_leader = False
+      else:
+        future = futures.Future()
+        self._in_flight[key] = future
+        pending = self._pending_batches.get(batch_key)
+        is_leader = pending is None
+        if is_leader:
+          self._pending_batches[batch_key] = [text]
+        else:
+          pending.append(text)
+
+    if is_leader:
+      # Give concurrent searches a chance to join this embedding request.
+      if self._batch_window_seconds > 0:
+        time.sleep(self._batch_window_seconds)
+      with self._lock:
+        texts = self._pending_batches.pop(batch_key)
+        self.embedding_requests += 1
+      try:
+        embeddings = _get_embeddings_for_queries(
+            database,
+            dialect,
+            spanner_embedding_model_name,
+            vertex_ai_embedding_model_endpoint,
+            texts,
+        )
+      except Exception as ex:  # pylint: disable=broad-except
+        embeddings = {}
+        error = ex
+      else:
+        error = None
+      with self._lock:
+        batch_futures = []
+        for batch_text in texts:
+          batch_future = self._in_flight.pop(batch_key + (batch_text,))
+          if batch_text in embeddings:
+            self._store(batch_key + (batch_text,), embeddings[batch_text])
+          batch_futures.append((batch_text, batch_future))
+      for batch_text, batch_future in batch_futures:
+        if batch_text in embeddings:
+          batch_future.set_result(embeddings[batch_text])
+        else:
+          batch_future.set_exception(
+              error
+              or ValueError(f"No embedding was returned for: {batch_text}")
+          )
+
+    return future.result()
+
+
 def _get_postgresql_distance_function(distance_type: str) -> str:
   return {
       "COSINE_DISTANCE": "spanner.cosine_distance",
@@ -317,6 +537,35 @@ def similarity_search(
         }
   """
   # fmt: on
+  return _similarity_search(
+      project_id=project_id,
+      instance_id=instance_id,
+      database_id=database_id,
+      table_name=table_name,
+      query=query,
+      embedding_column_to_search=embedding_column_to_search,
+      columns=columns,
+      embedding_options=embedding_options,
+      credentials=credentials,
+      additional_filter=additional_filter,
+      search_options=search_options,
+  )
+
+
+def _similarity_search(
+    project_id: str,
+    instance_id: str,
+    database_id: str,
+    table_name: str,
+    query: str,
+    embedding_column_to_search: str,
+    columns: List[str],
+    embedding_options: Dict[str, str],
+    credentials: Credentials,
+    additional_filter: Optional[str] = None,
+    search_options: Optional[Dict[str, Any]] = None,
+    embedding_cache: Optional[QueryEmbeddingCache] = None,
+) -> Dict[str, Any]:
   try:
     # Get Spanner client
     spanner_client = client.get_spanner_client(
@@ -381,7 +630,12 @@ def similarity_search(
           f" {nearest_neighbors_algorithm}"
       )
 
-    embedding = _get_embedding_for_query(
+    get_embedding = (
+        embedding_cache.get_embedding
+        if embedding_cache
+        else _get_embedding_for_query
+    )
+    embedding = get_embedding(
         database,
         database.database_dialect,
         spanner_embedding_model_name,
@@ -440,3 +694,55 @@ def similarity_search(
         "status": "ERROR",
         "error_details": str(ex),
     }
+
+
+def get_similarity_search(
+    embedding_cache: QueryEmbeddingCache,
+) -> Callable[..., Any]:
+  """Get the similarity_search tool backed by a query embedding cache.
+
+  The returned tool is async and runs the search in a worker thread, so that
+  parallel searches do not block the event loop and can share embedding
+  requests.
+
+  Args:
+      embedding_cache: The cache to look up and store query embeddings in.
+
+  Returns:
+      callable[..., Any]: A version of the similarity_search tool using the
+      embedding cache.
+  """
+
+  async def similarity_search_wrapper(
+      project_id: str,
+      instance_id: str,
+      database_id: str,
+      table_name: str,
+      query: str,
+      embedding_column_to_search: str,
+      columns: List[str],
+      embedding_options: Dict[str, str],
+      credentials: Credentials,
+      settings: SpannerToolSettings,
+      tool_context: ToolContext,
+      additional_filter: Optional[str] = None,
+      search_options: Optional[Dict[str, Any]] = None,
+  ) -> Dict[str, Any]:
+    return await asyncio.to_thread(
+        _similarity_search,
+        project_id=project_id,
+        instance_id=instance_id,
+        database_id=database_id,
+        table_name=table_name,
+        query=query,
+        embedding_column_to_search=embedding_column_to_search,
+        columns=columns,
+        embedding_options=embedding_options,
+        credentials=credentials,
+        additional_filter=additional_filter,
+        search_options=search_options,
+        embedding_cache=embedding_cache,
+    )
+
+  functools.update_wrapper(similarity_search_wrapper, similarity_search)
+  return similarity_search_wrapper
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 from enum import Enum
 from typing import List
+from typing import Optional
 
 from pydantic import BaseModel
 
@@ -44,3 +45,19 @@ class SpannerToolSettings(BaseModel):
 
   max_executed_query_result_rows: int = 50
   """Maximum number of rows to return from a query result."""
+
+  query_embedding_cache_size: int = 256
+  """Maximum number of query embeddings cached by `similarity_search`.
+
+  Set to 0 to disable caching of query embeddings.
+  """
+
+  query_embedding_cache_ttl_seconds: Optional[float] = 3600
+  """Time to live of a cached query embedding, or None to never expire."""
+
+  query_embedding_batch_window_seconds: float = 0.005
+  """How long a query embedding request waits for parallel searches to join.
+
+  Searches issued in parallel that miss the cache within this window are
+  embedded together in a single round trip to the embedding model.
+  """
@@ -66,6 +66,18 @@ class SpannerToolset(BaseToolset):
         if spanner_tool_settings
         else SpannerToolSettings()
     )
+    self._query_embedding_cache = search_tool.QueryEmbeddingCache(
+        max_size=self._tool_settings.query_embedding_cache_size,
+        ttl_seconds=self._tool_settings.query_embedding_cache_ttl_seconds,
+        batch_window_seconds=(
+            self._tool_settings.query_embedding_batch_window_seconds
+        ),
+    )
+
+  @property
+  def query_embedding_cache_stats(self) -> dict[str, int]:
+    """Hit, miss and embedding request counts of the `similarity_search` cache."""
+    return self._query_embedding_cache.stats()
 
   def _is_tool_selected(
       self, tool: BaseTool, readonly_context: ReadonlyContext
@@ -116,7 +128,9 @@ class SpannerToolset(BaseToolset):
       )
       all_tools.append(
           GoogleTool(
-              func=search_tool.similarity_search,
+              func=search_tool.get_similarity_search(
+                  self._query_embedding_cache
+              ),
               credentials_config=self._credentials_config,
               tool_settings=self._tool_settings,
           )
@@ -130,4 +144,4 @@ class SpannerToolset(BaseToolset):
 
   @override
   async def close(self):
-    pass
+    self._query_embedding_cache.clear()
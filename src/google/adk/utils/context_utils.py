@@ -20,7 +20,9 @@ Please do not rely on the implementation details.
 
 from __future__ import annotations
 
+import asyncio
 from contextlib import AbstractAsyncContextManager
+import threading
 from typing import Any
 from typing import AsyncGenerator
 
@@ -47,3 +49,17 @@ class Aclosing(AbstractAsyncContextManager):
 
   async def __aexit__(self, *exc_info):
     await self.async_generator.aclose()
+
+
+def get_loop_scope() -> Any:
+  """Returns the running event loop, or the current thread outside of one.
+
+  Objects bound to an event loop, such as async HTTP clients, can only be
+  shared within this scope. Both loops and threads are weakly referenceable,
+  so the scope can key a `weakref.WeakKeyDictionary` that forgets closed
+  loops and finished threads.
+  """
+  try:
+    return asyncio.get_running_loop()
+  except RuntimeError:
+    return threading.current_thread()
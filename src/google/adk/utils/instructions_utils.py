@@ -14,18 +14,42 @@
 
 from __future__ import annotations
 
+import asyncio
+import collections
+import dataclasses
+import functools
 import logging
 import re
+import threading
+from typing import Any
+from typing import Hashable
+from typing import Optional
+from typing import TYPE_CHECKING
+from typing import Union
+import weakref
 
 from ..agents.readonly_context import ReadonlyContext
+from ..sessions._event_index import get_event_index
 from ..sessions.state import State
 
+if TYPE_CHECKING:
+  from ..artifacts.base_artifact_service import BaseArtifactService
+  from ..sessions.session import Session
+
 __all__ = [
     'inject_session_state',
 ]
 
 logger = logging.getLogger('google_adk.' + __name__)
 
+_PLACEHOLDER_PATTERN = re.compile(r'{+[^{}]*}+')
+
+_MEMO_SIZE = 256
+
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+
+_MISSING = object()
+
 
 async def inject_session_state(
     template: str,
@@ -66,62 +90,256 @@ async def inject_session_state(
   """
 
   invocation_context = readonly_context._invocation_context
+  segments = _compile_template(template)
+  if len(segments) == 1 and isinstance(segments[0], str):
+    return segments[0]
 
-  async def _async_sub(pattern, repl_async_fn, string) -> str:
-    result = []
-    last_end = 0
-    for match in re.finditer(pattern, string):
-      result.append(string[last_end : match.start()])
-      replacement = await repl_async_fn(match)
-      result.append(replacement)
-      last_end = match.end()
-    result.append(string[last_end:])
-    return ''.join(result)
-
-  async def _replace_match(match) -> str:
-    var_name = match.group().lstrip('{').rstrip('}').strip()
-    optional = False
-    if var_name.endswith('?'):
-      optional = True
-      var_name = var_name.removesuffix('?')
-    if var_name.startswith('artifact.'):
-      var_name = var_name.removeprefix('artifact.')
-      if invocation_context.artifact_service is None:
-        raise ValueError('Artifact service is not initialized.')
-      artifact = await invocation_context.artifact_service.load_artifact(
-          app_name=invocation_context.session.app_name,
-          user_id=invocation_context.session.user_id,
-          session_id=invocation_context.session.id,
-          filename=var_name,
+  session = invocation_context.session
+  artifact_service = invocation_context.artifact_service
+  artifact_names = list(
+      dict.fromkeys(
+          segment.name
+          for segment in segments
+          if isinstance(segment, _Placeholder) and segment.is_artifact
       )
+  )
+  memo = _get_memo(artifact_service) if artifact_names else _state_memo
+  memo_key = _get_memo_key(template, segments, session, artifact_names)
+  if memo is not None and memo_key is not None:
+    rendered = memo.get(memo_key)
+    if rendered is not None:
+      return rendered
+
+  artifacts = {}
+  if artifact_names and artifact_service is not None:
+    artifacts = dict(
+        zip(
+            artifact_names,
+            await asyncio.gather(*(
+                _load_artifact_text(artifact_service, session, name, memo)
+                for name in artifact_names
+            )),
+        )
+    )
+
+  result = []
+  for segment in segments:
+    if isinstance(segment, str):
+      result.append(segment)
+    elif segment.is_artifact:
+      if artifact_service is None:
+        raise ValueError('Artifact service is not initialized.')
+      artifact = artifacts[segment.name]
       if artifact is None:
-        if optional:
+        if segment.optional:
           logger.debug(
-              'Artifact %s not found, replacing with empty string', var_name
+              'Artifact %s not found, replacing with empty string',
+              segment.name,
           )
-          return ''
+          artifact = ''
         else:
-          raise KeyError(f'Artifact {var_name} not found.')
-      return str(artifact)
+          raise KeyError(f'Artifact {segment.name} not found.')
+      result.append(artifact)
+    elif segment.name in session.state:
+      value = session.state[segment.name]
+      result.append('' if value is None else str(value))
+    elif segment.optional:
+      logger.debug(
+          'Context variable %s not found, replacing with empty string',
+          segment.name,
+      )
     else:
-      if not _is_valid_state_name(var_name):
-        return match.group()
-      if var_name in invocation_context.session.state:
-        value = invocation_context.session.state[var_name]
-        if value is None:
-          return ''
-        return str(value)
-      else:
-        if optional:
-          logger.debug(
-              'Context variable %s not found, replacing with empty string',
-              var_name,
-          )
-          return ''
-        else:
-          raise KeyError(f'Context variable not found: `{var_name}`.')
+      raise KeyError(f'Context variable not found: `{segment.name}`.')
+  rendered = ''.join(result)
+
+  if memo is not None and memo_key is not None:
+    memo.put(memo_key, rendered)
+  return rendered
+
+
+@dataclasses.dataclass(frozen=True)
+class _Placeholder:
+  """A state or artifact placeholder of a compiled instruction template."""
+
+  name: str
+  """The state key or the artifact filename."""
+
+  optional: bool
+  """Whether the placeholder is replaced with '' if the value is missing."""
+
+  is_artifact: bool
+  """Whether the placeholder refers to an artifact."""
+
+
+_Segment = Union[str, _Placeholder]
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_template(template: str) -> tuple[_Segment, ...]:
+  """Splits a template into literal text and placeholders.
+
+  Braced text that isn't a valid placeholder is kept as literal text.
+  """
+  segments: list[_Segment] = []
+  literal = []
+  last_end = 0
+  for match in _PLACEHOLDER_PATTERN.finditer(template):
+    literal.append(template[last_end : match.start()])
+    last_end = match.end()
+    var_name = match.group().lstrip('{').rstrip('}').strip()
+    optional = var_name.endswith('?')
+    var_name = var_name.removesuffix('?')
+    if var_name.startswith('artifact.'):
+      placeholder = _Placeholder(
+          var_name.removeprefix('artifact.'), optional, is_artifact=True
+      )
+    elif _is_valid_state_name(var_name):
+      placeholder = _Placeholder(var_name, optional, is_artifact=False)
+    else:
+      literal.append(match.group())
+      continue
+    segments.append(''.join(literal))
+    segments.append(placeholder)
+    literal = []
+  literal.append(template[last_end:])
+  segments.append(''.join(literal))
+  return tuple(segment for segment in segments if segment != '') or ('',)
+
+
+class _LruMemo:
+  """A bounded memo of rendered instructions or loaded artifacts.
+
+  The memos are shared by all threads, e.g. runners on worker threads, so the
+  entries are only accessed under a lock.
+  """
+
+  def __init__(self, max_size: int = _MEMO_SIZE):
+    self._max_size = max_size
+    self._lock = threading.Lock()
+    self._entries: collections.OrderedDict[Hashable, str] = (
+        collections.OrderedDict()
+    )
+
+  def get(self, key: Hashable) -> Optional[str]:
+    with self._lock:
+      value = self._entries.get(key)
+      if value is not None:
+        self._entries.move_to_end(key)
+      return value
+
+  def put(self, key: Hashable, value: str) -> None:
+    with self._lock:
+      self._entries[key] = value
+      self._entries.move_to_end(key)
+      while len(self._entries) > self._max_size:
+        self._entries.popitem(last=False)
+
+
+_state_memo = _LruMemo()
+"""Memo of the instructions referencing state values only."""
+
+_artifact_memos: weakref.WeakKeyDictionary[Any, _LruMemo] = (
+    weakref.WeakKeyDictionary()
+)
+"""Memos of the instructions and artifacts loaded, by artifact service."""
+_artifact_memos_lock = threading.Lock()
 
-  return await _async_sub(r'{+[^{}]*}+', _replace_match, template)
+
+def _get_memo(artifact_service: Any) -> Optional[_LruMemo]:
+  if artifact_service is None:
+    return None
+  try:
+    with _artifact_memos_lock:
+      memo = _artifact_memos.get(artifact_service)
+      if memo is None:
+        memo = _artifact_memos[artifact_service] = _LruMemo()
+  except TypeError:
+    # The artifact service can't be weakly referenced.
+    return None
+  return memo
+
+
+def _get_memo_key(
+    template: str,
+    segments: tuple[_Segment, ...],
+    session: Session,
+    artifact_names: list[str],
+) -> Optional[Hashable]:
+  """Returns the key of a rendered instruction, if it can be memoized.
+
+  Renderings are memoized against the values of the state keys and the
+  versions of the artifacts they reference. Only immutable state values can
+  be compared with the ones of a previous rendering, and only artifacts whose
+  version is recorded in the events of the session have a known version.
+  Values are compared along with their type, as equal values such as `True`
+  and `1` render differently.
+  """
+  state_values = []
+  for segment in segments:
+    if isinstance(segment, _Placeholder) and not segment.is_artifact:
+      value = session.state.get(segment.name, _MISSING)
+      if value is not _MISSING and type(value) not in _IMMUTABLE_TYPES:
+        return None
+      state_values.append((type(value), value))
+  artifact_versions = ()
+  if artifact_names:
+    artifact_versions = _get_artifact_versions(session, artifact_names)
+    if artifact_versions is None:
+      return None
+  return (template, tuple(state_values), artifact_versions)
+
+
+def _get_artifact_versions(
+    session: Session, artifact_names: list[str]
+) -> Optional[tuple[Hashable, ...]]:
+  """Returns the session scope and the latest version of the artifacts.
+
+  User-scoped artifacts can be saved by other sessions of the user, which
+  the events of this session don't record, so their version is unknown.
+  """
+  if any(name.startswith(State.USER_PREFIX) for name in artifact_names):
+    return None
+  event_index = get_event_index(session)
+  if event_index is None:
+    return None
+  versions = event_index.get_current_artifact_versions()
+  if any(name not in versions for name in artifact_names):
+    return None
+  return (
+      session.app_name,
+      session.user_id,
+      session.id,
+      *(versions[name] for name in artifact_names),
+  )
+
+
+async def _load_artifact_text(
+    artifact_service: BaseArtifactService,
+    session: Session,
+    filename: str,
+    memo: Optional[_LruMemo],
+) -> Optional[str]:
+  """Loads the latest version of an artifact as text."""
+  memo_key = None
+  if memo is not None:
+    versions = _get_artifact_versions(session, [filename])
+    if versions is not None:
+      memo_key = ('artifact', filename, versions)
+      text = memo.get(memo_key)
+      if text is not None:
+        return text
+  artifact = await artifact_service.load_artifact(
+      app_name=session.app_name,
+      user_id=session.user_id,
+      session_id=session.id,
+      filename=filename,
+  )
+  if artifact is None:
+    return None
+  text = str(artifact)
+  if memo_key is not None:
+    memo.put(memo_key, text)
+  return text
 
 
 def _is_valid_state_name(var_name):
@@ -16,11 +16,15 @@ from __future__ import annotations
 
 from typing import AsyncGenerator
 from typing import Optional
+from typing import TYPE_CHECKING
 
 from google.genai import types
 
 from ..models.llm_response import LlmResponse
 
+if TYPE_CHECKING:
+  from ..events.event import Event
+
 
 class StreamingResponseAggregator:
   """Aggregates partial streaming responses.
@@ -30,11 +34,23 @@ class StreamingResponseAggregator:
   """
 
   def __init__(self):
-    self._text = ''
-    self._thought_text = ''
+    # Text deltas are collected and joined once per aggregated response, as
+    # repeated string concatenation copies the text for every chunk.
+    self._text_chunks: list[str] = []
+    self._thought_text_chunks: list[str] = []
     self._usage_metadata = None
     self._response = None
 
+  def _aggregated_parts(self) -> list[types.Part]:
+    parts = []
+    if self._thought_text_chunks:
+      parts.append(
+          types.Part(text=''.join(self._thought_text_chunks), thought=True)
+      )
+    if self._text_chunks:
+      parts.append(types.Part.from_text(text=''.join(self._text_chunks)))
+    return parts
+
   async def process_response(
       self, response: types.GenerateContentResponse
   ) -> AsyncGenerator[LlmResponse, None]:
@@ -47,7 +63,6 @@ class StreamingResponseAggregator:
       The generated LlmResponse(s), for the partial response, and the aggregated
       response if needed.
     """
-    # results = []
     self._response = response
     llm_response = LlmResponse.create(response)
     self._usage_metadata = llm_response.usage_metadata
@@ -58,27 +73,22 @@ class StreamingResponseAggregator:
     ):
       part0 = llm_response.content.parts[0]
       if part0.thought:
-        self._thought_text += part0.text
+        self._thought_text_chunks.append(part0.text)
       else:
-        self._text += part0.text
+        self._text_chunks.append(part0.text)
       llm_response.partial = True
-    elif (self._thought_text or self._text) and (
+    elif (self._thought_text_chunks or self._text_chunks) and (
         not llm_response.content
         or not llm_response.content.parts
         # don't yield the merged text event when receiving audio data
         or not llm_response.content.parts[0].inline_data
     ):
-      parts = []
-      if self._thought_text:
-        parts.append(types.Part(text=self._thought_text, thought=True))
-      if self._text:
-        parts.append(types.Part.from_text(text=self._text))
       yield LlmResponse(
-          content=types.ModelContent(parts=parts),
+          content=types.ModelContent(parts=self._aggregated_parts()),
           usage_metadata=llm_response.usage_metadata,
       )
-      self._thought_text = ''
-      self._text = ''
+      self._thought_text_chunks = []
+      self._text_chunks = []
     yield llm_response
 
   def close(self) -> Optional[LlmResponse]:
@@ -90,18 +100,13 @@ class StreamingResponseAggregator:
       The aggregated LlmResponse.
     """
     if (
-        (self._text or self._thought_text)
+        (self._text_chunks or self._thought_text_chunks)
         and self._response
         and self._response.candidates
     ):
-      parts = []
-      if self._thought_text:
-        parts.append(types.Part(text=self._thought_text, thought=True))
-      if self._text:
-        parts.append(types.Part.from_text(text=self._text))
       candidate = self._response.candidates[0]
       return LlmResponse(
-          content=types.ModelContent(parts=parts),
+          content=types.ModelContent(parts=self._aggregated_parts()),
           error_code=None
           if candidate.finish_reason == types.FinishReason.STOP
           else candidate.finish_reason,
@@ -110,3 +115,15 @@ class StreamingResponseAggregator:
           else candidate.finish_message,
           usage_metadata=self._usage_metadata,
       )
+
+
+def event_to_sse(event: Event) -> str:
+  """Formats an event as a server-sent event message.
+
+  Args:
+    event: The event to send.
+
+  Returns:
+    The `data:` line of the event, terminated by a blank line.
+  """
+  return f'data: {event.model_dump_json(exclude_none=True, by_alias=True)}\n\n'
@@ -0,0 +1,191 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import sys
+from unittest.mock import AsyncMock
+from unittest.mock import patch
+
+import pytest
+
+# Skip all tests in this module if Python version is less than 3.10
+pytestmark = pytest.mark.skipif(
+    sys.version_info < (3, 10), reason="A2A requires Python 3.10+"
+)
+
+# Import dependencies with version checking
+try:
+  from a2a import types as a2a_types
+  from google.adk.a2a.converters.artifact_reference import A2A_BLOB_APP_NAME
+  from google.adk.a2a.converters.artifact_reference import A2A_BLOB_ARTIFACT_PREFIX
+  from google.adk.a2a.converters.artifact_reference import ArtifactPartReferencer
+  from google.adk.a2a.converters.part_converter import convert_genai_part_to_a2a_part
+  from google.adk.artifacts.in_memory_artifact_service import InMemoryArtifactService
+  from google.genai import types as genai_types
+except ImportError as e:
+  if sys.version_info < (3, 10):
+    # Imports are not needed since tests will be skipped due to pytestmark.
+    pass
+  else:
+    raise e
+
+_SCOPE = {"context_id": "context"}
+
+
+def _blob_part(data: bytes) -> "genai_types.Part":
+  return genai_types.Part(
+      inline_data=genai_types.Blob(data=data, mime_type="application/pdf")
+  )
+
+
+class TestArtifactPartReferencer:
+  """Test cases for ArtifactPartReferencer."""
+
+  @pytest.mark.asyncio
+  async def test_large_parts_are_stored_and_referenced(self):
+    """Large inline parts are replaced by content-addressed references."""
+    artifact_service = InMemoryArtifactService()
+    referencer = ArtifactPartReferencer(min_size_bytes=8)
+    data = b"%PDF-large-document"
+    small_part = _blob_part(b"tiny")
+    text_part = genai_types.Part(text="hello")
+
+    parts = await referencer.reference_parts(
+        [text_part, _blob_part(data), small_part],
+        artifact_service=artifact_service,
+        **_SCOPE,
+    )
+
+    assert parts[0] is text_part
+    assert parts[2] is small_part
+    sha256 = hashlib.sha256(data).hexdigest()
+    assert parts[1].file_data.file_uri == (
+        f"artifact://apps/{A2A_BLOB_APP_NAME}/users/context/sessions/context/"
+        f"artifacts/{A2A_BLOB_ARTIFACT_PREFIX}{sha256}/versions/0"
+    )
+    assert parts[1].file_data.mime_type == "application/pdf"
+    a2a_part = convert_genai_part_to_a2a_part(parts[1])
+    assert isinstance(a2a_part.root.file, a2a_types.FileWithUri)
+
+  @pytest.mark.asyncio
+  async def test_same_bytes_are_stored_once(self):
+    """Repeated and already stored blobs are not saved again."""
+    artifact_service = InMemoryArtifactService()
+    data = b"x" * 32
+    await ArtifactPartReferencer(min_size_bytes=8).reference_parts(
+        [_blob_part(data)], artifact_service=artifact_service, **_SCOPE
+    )
+
+    referencer = ArtifactPartReferencer(min_size_bytes=8)
+    with patch.object(
+        InMemoryArtifactService, "save_artifact", new_callable=AsyncMock
+    ) as mock_save:
+      for _ in range(3):
+        await referencer.reference_parts(
+            [_blob_part(data)], artifact_service=artifact_service, **_SCOPE
+        )
+
+    mock_save.assert_not_awaited()
+    assert await artifact_service.list_versions(
+        app_name=A2A_BLOB_APP_NAME,
+        user_id="context",
+        filename=(
+            f"{A2A_BLOB_ARTIFACT_PREFIX}{hashlib.sha256(data).hexdigest()}"
+        ),
+        session_id="context",
+    ) == [0]
+
+  @pytest.mark.asyncio
+  async def test_get_reference_only_for_stored_parts(self):
+    """The synchronous lookup returns references for stored blobs only."""
+    artifact_service = InMemoryArtifactService()
+    referencer = ArtifactPartReferencer(min_size_bytes=8)
+    part = _blob_part(b"y" * 32)
+
+    assert referencer.get_reference(part, **_SCOPE) is None
+    await referencer.reference_parts(
+        [part], artifact_service=artifact_service, **_SCOPE
+    )
+
+    reference = referencer.get_reference(part, **_SCOPE)
+    assert reference.file_data.file_uri.startswith("artifact://")
+    assert referencer.get_reference(part, context_id="other") is None
+
+  @pytest.mark.asyncio
+  async def test_resolve_parts_round_trip(self):
+    """References resolve back into the original inline data."""
+    artifact_service = InMemoryArtifactService()
+    referencer = ArtifactPartReferencer(min_size_bytes=8)
+    data = b"z" * 32
+    references = await referencer.reference_parts(
+        [_blob_part(data)], artifact_service=artifact_service, **_SCOPE
+    )
+
+    resolved = await ArtifactPartReferencer().resolve_parts(
+        references, artifact_service=artifact_service, **_SCOPE
+    )
+
+    assert resolved[0].inline_data.data == data
+    assert resolved[0].inline_data.mime_type == "application/pdf"
+
+  @pytest.mark.asyncio
+  async def test_resolve_parts_keeps_unresolvable_references(self):
+    """Missing blobs and other URIs are left untouched."""
+    artifact_service = InMemoryArtifactService()
+    missing = genai_types.Part(
+        file_data=genai_types.FileData(
+            file_uri=(
+                f"artifact://apps/{A2A_BLOB_APP_NAME}/users/context/sessions/"
+                f"context/artifacts/{A2A_BLOB_ARTIFACT_PREFIX}{'0' * 64}"
+                "/versions/0"
+            ),
+            mime_type="image/png",
+        )
+    )
+    other = genai_types.Part(
+        file_data=genai_types.FileData(
+            file_uri="gs://bucket/image.png", mime_type="image/png"
+        )
+    )
+
+    resolved = await ArtifactPartReferencer().resolve_parts(
+        [missing, other], artifact_service=artifact_service, **_SCOPE
+    )
+
+    assert resolved == [missing, other]
+
+  @pytest.mark.asyncio
+  async def test_resolve_parts_keeps_references_of_other_contexts(self):
+    """References to blobs of other A2A contexts are not resolved."""
+    artifact_service = InMemoryArtifactService()
+    references = await ArtifactPartReferencer(min_size_bytes=8).reference_parts(
+        [_blob_part(b"s" * 32)], artifact_service=artifact_service, **_SCOPE
+    )
+
+    resolved = await ArtifactPartReferencer().resolve_parts(
+        references, artifact_service=artifact_service, context_id="other"
+    )
+
+    assert resolved == references
+
+  def test_digest_cache_is_bounded_by_bytes(self):
+    """The digest cache keeps at most max_digest_cache_bytes of data alive."""
+    referencer = ArtifactPartReferencer(max_digest_cache_bytes=64)
+    blobs = [bytes([i]) * 32 for i in range(3)]
+    for blob in blobs:
+      referencer._sha256(blob)
+    referencer._sha256(b"l" * 65)
+
+    assert [data for data, _ in referencer._digests.values()] == blobs[1:]
+    assert referencer._digest_cache_bytes == 64
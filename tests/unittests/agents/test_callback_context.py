@@ -299,6 +299,31 @@ class TestCallbackContext:
     )
     assert version == 1
 
+  @pytest.mark.asyncio
+  async def test_save_artifact_stream(self, mock_invocation_context):
+    """Test save_artifact_stream forwards the chunks and records the delta."""
+    artifact_service = AsyncMock()
+    artifact_service.save_artifact_stream.return_value = 2
+    mock_invocation_context.artifact_service = artifact_service
+
+    context = CallbackContext(mock_invocation_context)
+    chunks = [b"first", b"second"]
+
+    version = await context.save_artifact_stream(
+        "test_file.jsonl", chunks=chunks, mime_type="application/jsonl"
+    )
+
+    artifact_service.save_artifact_stream.assert_called_once_with(
+        app_name="test-app",
+        user_id="test-user",
+        session_id="test-session-id",
+        filename="test_file.jsonl",
+        chunks=chunks,
+        mime_type="application/jsonl",
+    )
+    assert version == 2
+    assert context._event_actions.artifact_delta == {"test_file.jsonl": 2}
+
   @pytest.mark.asyncio
   async def test_load_artifact_integration(self, mock_invocation_context):
     """Test load_artifact to ensure credential methods follow same pattern."""
@@ -1001,6 +1001,68 @@ class TestRemoteA2aAgentMessageHandling:
 
     assert result is None
 
+  @pytest.mark.asyncio
+  async def test_construct_message_parts_with_artifact_references(self):
+    """Test large inline parts are sent as stored artifact references."""
+    from google.adk.a2a.converters.part_converter import convert_genai_part_to_a2a_part
+    from google.adk.artifacts.in_memory_artifact_service import InMemoryArtifactService
+
+    agent = RemoteA2aAgent(
+        name="test_agent",
+        agent_card=self.agent_card,
+        artifact_reference_min_size_bytes=16,
+    )
+    artifact_service = InMemoryArtifactService()
+    self.mock_context.artifact_service = artifact_service
+    self.mock_context.app_name = "app"
+    self.mock_context.user_id = "user"
+    image_part = genai_types.Part(
+        inline_data=genai_types.Blob(data=b"i" * 64, mime_type="image/png")
+    )
+    self.mock_session.events = [
+        Event(
+            author="user",
+            content=genai_types.Content(
+                role="user",
+                parts=[genai_types.Part(text="Describe"), image_part],
+            ),
+        )
+    ]
+
+    context_id = await agent._store_large_parts(self.mock_context)
+    parts, sent_context_id = agent._construct_message_parts_from_session(
+        self.mock_context, context_id
+    )
+
+    assert sent_context_id == context_id
+    assert parts[0].root.text == "Describe"
+    assert parts[1].root.file.uri.startswith(
+        f"artifact://apps/a2a_blobs/users/{context_id}/sessions/{context_id}/"
+        "artifacts/a2a_blob_"
+    )
+    assert await artifact_service.list_artifact_keys(
+        app_name="a2a_blobs", user_id=context_id, session_id=context_id
+    )
+
+    response_event = Event(
+        author="test_agent",
+        custom_metadata={A2A_METADATA_PREFIX + "context_id": context_id},
+        content=genai_types.Content(
+            role="model",
+            parts=[
+                genai_types.Part(
+                    file_data=genai_types.FileData(
+                        file_uri=parts[1].root.file.uri,
+                        mime_type="image/png",
+                    )
+                )
+            ],
+        ),
+    )
+    await agent._resolve_part_references(response_event, self.mock_context)
+
+    assert response_event.content.parts[0].inline_data.data == b"i" * 64
+
 
 class TestRemoteA2aAgentMessageHandlingFromFactory:
   """Test message handling functionality."""
@@ -1865,6 +1927,119 @@ class TestRemoteA2aAgentCleanup:
 class TestRemoteA2aAgentIntegration:
   """Integration tests for RemoteA2aAgent."""
 
+  @pytest.mark.asyncio
+  async def test_artifact_references_round_trip_through_executor(self):
+    """Test large parts are passed by reference to the server and back."""
+    from a2a.server.agent_execution.context import RequestContext
+    from a2a.types import FileWithUri
+    from a2a.types import MessageSendParams
+    from google.adk.a2a.executor.a2a_agent_executor import A2aAgentExecutor
+    from google.adk.a2a.executor.a2a_agent_executor import A2aAgentExecutorConfig
+    from google.adk.agents.base_agent import BaseAgent
+    from google.adk.artifacts.in_memory_artifact_service import InMemoryArtifactService
+    from google.adk.runners import Runner
+    from google.adk.sessions.in_memory_session_service import InMemorySessionService
+
+    artifact_service = InMemoryArtifactService()
+    request_image = b"q" * 64
+    reply_image = b"r" * 64
+    received_parts = []
+
+    class ImageAgent(BaseAgent):
+
+      async def _run_async_impl(self, ctx):
+        received_parts.extend(ctx.user_content.parts)
+        yield Event(
+            author=self.name,
+            invocation_id=ctx.invocation_id,
+            content=genai_types.Content(
+                role="model",
+                parts=[
+                    genai_types.Part(
+                        inline_data=genai_types.Blob(
+                            data=reply_image, mime_type="image/png"
+                        )
+                    )
+                ],
+            ),
+        )
+
+    executor = A2aAgentExecutor(
+        runner=Runner(
+            app_name="server_app",
+            agent=ImageAgent(name="server_agent"),
+            session_service=InMemorySessionService(),
+            artifact_service=artifact_service,
+        ),
+        config=A2aAgentExecutorConfig(artifact_reference_min_size_bytes=16),
+    )
+    sent_requests = []
+    reply_parts = []
+
+    async def send_message(request):
+      sent_requests.append(request)
+      event_queue = Mock()
+      event_queue.enqueue_event = AsyncMock()
+      await executor.execute(
+          RequestContext(request=MessageSendParams(message=request)),
+          event_queue,
+      )
+      artifact_update = [
+          call.args[0]
+          for call in event_queue.enqueue_event.call_args_list
+          if isinstance(call.args[0], TaskArtifactUpdateEvent)
+      ][-1]
+      reply_parts.extend(artifact_update.artifact.parts)
+      yield A2AMessage(
+          message_id="reply",
+          role="agent",
+          parts=artifact_update.artifact.parts,
+          context_id=artifact_update.context_id,
+      )
+
+    agent = RemoteA2aAgent(
+        name="test_agent",
+        agent_card=create_test_agent_card(),
+        artifact_reference_min_size_bytes=16,
+    )
+    agent._is_resolved = True
+    agent._a2a_client = Mock()
+    agent._a2a_client.send_message = send_message
+
+    mock_session = Mock(spec=Session)
+    mock_session.id = "client-session"
+    mock_session.events = [
+        Event(
+            author="user",
+            content=genai_types.Content(
+                role="user",
+                parts=[
+                    genai_types.Part(text="Edit this"),
+                    genai_types.Part(
+                        inline_data=genai_types.Blob(
+                            data=request_image, mime_type="image/png"
+                        )
+                    ),
+                ],
+            ),
+        )
+    ]
+    mock_context = Mock(spec=InvocationContext)
+    mock_context.session = mock_session
+    mock_context.app_name = "client_app"
+    mock_context.user_id = "client_user"
+    mock_context.artifact_service = artifact_service
+    mock_context.invocation_id = "invocation-123"
+    mock_context.branch = "main"
+
+    events = [event async for event in agent._run_async_impl(mock_context)]
+
+    assert sent_requests[0].context_id
+    assert isinstance(sent_requests[0].parts[1].root.file, FileWithUri)
+    assert received_parts[1].inline_data.data == request_image
+    assert isinstance(reply_parts[0].root.file, FileWithUri)
+    assert events[-1].content.parts[0].inline_data.data == reply_image
+
   @pytest.mark.asyncio
   async def test_full_workflow_with_direct_agent_card(self):
     """Test full workflow with direct agent card."""
@@ -18,8 +18,10 @@
 
 from datetime import datetime
 import enum
+import hashlib
 import json
 from pathlib import Path
+import shutil
 from typing import Any
 from typing import Optional
 from typing import Union
@@ -28,10 +30,12 @@ from unittest.mock import patch
 from urllib.parse import unquote
 from urllib.parse import urlparse
 
+from google.adk.artifacts import file_artifact_service
 from google.adk.artifacts.base_artifact_service import ArtifactVersion
 from google.adk.artifacts.file_artifact_service import FileArtifactService
 from google.adk.artifacts.gcs_artifact_service import GcsArtifactService
 from google.adk.artifacts.in_memory_artifact_service import InMemoryArtifactService
+from google.api_core import exceptions
 from google.genai import types
 import pytest
 
@@ -66,16 +70,24 @@ class MockBlob:
     self.content_type: Optional[str] = None
     self.time_created = FIXED_DATETIME
     self.metadata: dict[str, Any] = {}
+    self.metageneration = 1
 
   def upload_from_string(
-      self, data: Union[str, bytes], content_type: Optional[str] = None
+      self,
+      data: Union[str, bytes],
+      content_type: Optional[str] = None,
+      if_generation_match: Optional[int] = None,
   ) -> None:
     """Mocks uploading data to the blob (from a string or bytes).
 
     Args:
         data: The data to upload (string or bytes).
         content_type:  The content type of the data (optional).
+        if_generation_match: Only `0`, to upload if the blob doesn't exist.
     """
+    if if_generation_match == 0 and self.content is not None:
+      raise exceptions.PreconditionFailed(f"{self.name} exists")
+    self.metageneration = 1
     if isinstance(data, str):
       self.content = data.encode("utf-8")
     elif isinstance(data, bytes):
@@ -86,8 +98,10 @@ class MockBlob:
     if content_type:
       self.content_type = content_type
 
-  def download_as_bytes(self) -> bytes:
-    """Mocks downloading the blob's content as bytes.
+  def download_as_bytes(
+      self, start: Optional[int] = None, end: Optional[int] = None, **kwargs
+  ) -> bytes:
+    """Mocks downloading the blob's content, or an inclusive range of it.
 
     Returns:
         bytes: The content of the blob as bytes.
@@ -97,12 +111,57 @@ class MockBlob:
     """
     if self.content is None:
       return b""
+    if start is not None:
+      return self.content[start : end + 1]
     return self.content
 
-  def delete(self) -> None:
+  @property
+  def size(self) -> Optional[int]:
+    """Mocks the size of the blob's content."""
+    return None if self.content is None else len(self.content)
+
+  def patch(self, if_metageneration_match: Optional[int] = None) -> None:
+    """Mocks updating the metadata of the blob."""
+    if self.content is None:
+      raise exceptions.NotFound(self.name)
+    if if_metageneration_match not in (None, self.metageneration):
+      raise exceptions.PreconditionFailed(f"{self.name} changed")
+    self.metageneration += 1
+
+  @property
+  def generation(self) -> Optional[int]:
+    """Mocks the generation of the blob."""
+    return None if self.content is None else 1
+
+  def open(self, mode: str, content_type: Optional[str] = None, **kwargs):
+    """Mocks opening the blob for a resumable upload."""
+    assert mode == "wb"
+    blob = self
+
+    class MockBlobWriter:
+
+      def __init__(self):
+        self.buffer = bytearray()
+
+      def write(self, data: bytes) -> int:
+        self.buffer += data
+        return len(data)
+
+      def close(self) -> None:
+        blob.upload_from_string(bytes(self.buffer), content_type=content_type)
+
+      def terminate(self) -> None:
+        self.buffer = bytearray()
+
+    return MockBlobWriter()
+
+  def delete(self, if_metageneration_match: Optional[int] = None) -> None:
     """Mocks deleting a blob."""
+    if if_metageneration_match not in (None, self.metageneration):
+      raise exceptions.PreconditionFailed(f"{self.name} changed")
     self.content = None
     self.content_type = None
+    self.metadata = {}
 
 
 class MockBucket:
@@ -443,9 +502,9 @@ async def test_list_artifact_versions_and_get_artifact_version(
     for i in range(4):
       metadata = {"key": "value" + str(i)}
       if service_type == ArtifactServiceType.GCS:
-        uri = (
-            f"gs://test_bucket/{app_name}/{user_id}/{session_id}/{filename}/{i}"
-        )
+        # Versions point at the blob of their content.
+        digest = hashlib.sha256(versions[i].inline_data.data).hexdigest()
+        uri = f"gs://test_bucket/_adk_blobs/sha256/{digest}"
       else:
         uri = f"memory://apps/{app_name}/users/{user_id}/sessions/{session_id}/artifacts/{filename}/versions/{i}"
       expected_artifact_versions.append(
@@ -531,7 +590,9 @@ async def test_list_artifact_versions_with_user_prefix(
     for i in range(4):
       metadata = {"key": "value" + str(i)}
       if service_type == ArtifactServiceType.GCS:
-        uri = f"gs://test_bucket/{app_name}/{user_id}/user/{user_scoped_filename}/{i}"
+        # Versions point at the blob of their content.
+        digest = hashlib.sha256(versions[i].inline_data.data).hexdigest()
+        uri = f"gs://test_bucket/_adk_blobs/sha256/{digest}"
       else:
         uri = f"memory://apps/{app_name}/users/{user_id}/artifacts/{user_scoped_filename}/versions/{i}"
       expected_artifact_versions.append(
@@ -641,6 +702,7 @@ async def test_file_metadata_camelcase(tmp_path, artifact_service_factory):
       "canonicalUri": expected_canonical_uri,
       "version": 0,
       "customMetadata": {},
+      "contentSha256": hashlib.sha256(b"binary-content").hexdigest(),
   }
   parsed_canonical = urlparse(metadata["canonicalUri"])
   canonical_path = Path(unquote(parsed_canonical.path))
@@ -769,3 +831,352 @@ async def test_file_save_artifact_rejects_absolute_path_within_scope(tmp_path):
         filename=str(absolute_in_scope),
         artifact=part,
     )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
+)
+async def test_save_artifact_stream(service_type, artifact_service_factory):
+  """Tests saving an artifact from sync and async chunk iterables."""
+  artifact_service = artifact_service_factory(service_type)
+
+  async def async_chunks():
+    for chunk in [b"more_", b"", b"audio"]:
+      yield chunk
+
+  for version, chunks in enumerate([[b"audio_", b"data"], async_chunks()]):
+    assert (
+        await artifact_service.save_artifact_stream(
+            app_name="app0",
+            user_id="user0",
+            session_id="123",
+            filename="audio.pcm",
+            chunks=chunks,
+            mime_type="audio/pcm",
+        )
+        == version
+    )
+
+  for version, data in enumerate([b"audio_data", b"more_audio"]):
+    assert await artifact_service.load_artifact(
+        app_name="app0",
+        user_id="user0",
+        session_id="123",
+        filename="audio.pcm",
+        version=version,
+    ) == types.Part.from_bytes(data=data, mime_type="audio/pcm")
+
+
+@pytest.mark.asyncio
+async def test_gcs_save_artifact_stream_cancels_failed_upload():
+  """A stream that raises leaves no version behind."""
+  artifact_service = mock_gcs_artifact_service()
+
+  async def failing_chunks():
+    yield b"partial_data"
+    raise RuntimeError("stream interrupted")
+
+  with pytest.raises(RuntimeError):
+    await artifact_service.save_artifact_stream(
+        app_name="app0",
+        user_id="user0",
+        session_id="123",
+        filename="audio.pcm",
+        chunks=failing_chunks(),
+        mime_type="audio/pcm",
+    )
+
+  assert not await artifact_service.list_versions(
+      app_name="app0", user_id="user0", session_id="123", filename="audio.pcm"
+  )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
+)
+async def test_load_artifact_stream(service_type, artifact_service_factory):
+  """Tests reading artifacts in chunks."""
+  artifact_service = artifact_service_factory(service_type)
+  scope = {"app_name": "app0", "user_id": "user0", "session_id": "123"}
+  await artifact_service.save_artifact(
+      **scope,
+      filename="image.png",
+      artifact=types.Part.from_bytes(data=b"0123456789", mime_type="image/png"),
+  )
+  await artifact_service.save_artifact(
+      **scope,
+      filename="image.png",
+      artifact=types.Part.from_bytes(data=b"abcd", mime_type="image/png"),
+  )
+  await artifact_service.save_artifact(
+      **scope, filename="notes.txt", artifact=types.Part(text="hello")
+  )
+
+  stream = await artifact_service.load_artifact_stream(
+      **scope, filename="image.png", version=0, chunk_size=4
+  )
+  assert stream.mime_type == "image/png"
+  assert stream.size == 10
+  assert [chunk async for chunk in stream.chunks] == [b"0123", b"4567", b"89"]
+
+  stream = await artifact_service.load_artifact_stream(
+      **scope, filename="image.png"
+  )
+  assert [chunk async for chunk in stream.chunks] == [b"abcd"]
+
+  stream = await artifact_service.load_artifact_stream(
+      **scope, filename="notes.txt"
+  )
+  # GCS stores text artifacts as text/plain blobs.
+  assert stream.mime_type == (
+      "text/plain" if service_type == ArtifactServiceType.GCS else None
+  )
+  assert b"".join([chunk async for chunk in stream.chunks]) == b"hello"
+
+  assert not await artifact_service.load_artifact_stream(
+      **scope, filename="missing.png"
+  )
+  assert not await artifact_service.load_artifact_stream(
+      **scope, filename="image.png", version=5
+  )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "service_type",
+    [ArtifactServiceType.GCS, ArtifactServiceType.FILE],
+)
+async def test_load_artifact_stream_of_empty_artifact(
+    service_type, artifact_service_factory
+):
+  """Tests that an empty artifact streams no chunks instead of being missing."""
+  artifact_service = artifact_service_factory(service_type)
+  scope = {"app_name": "app0", "user_id": "user0", "session_id": "123"}
+  await artifact_service.save_artifact(
+      **scope,
+      filename="empty.bin",
+      artifact=types.Part.from_bytes(
+          data=b"", mime_type="application/octet-stream"
+      ),
+  )
+
+  stream = await artifact_service.load_artifact_stream(
+      **scope, filename="empty.bin"
+  )
+  assert stream is not None
+  assert stream.size == 0
+  assert [chunk async for chunk in stream.chunks] == []
+
+
+@pytest.mark.asyncio
+async def test_file_save_artifact_stream_removes_failed_version(
+    tmp_path, monkeypatch
+):
+  """A stream that raises leaves no partial version behind."""
+  monkeypatch.setattr(file_artifact_service, "_STREAM_WRITE_BUFFER_SIZE", 4)
+  artifact_service = FileArtifactService(root_dir=tmp_path / "artifacts")
+
+  async def failing_chunks():
+    yield b"partial_data"
+    raise RuntimeError("stream interrupted")
+
+  with pytest.raises(RuntimeError):
+    await artifact_service.save_artifact_stream(
+        app_name="app0",
+        user_id="user0",
+        session_id="123",
+        filename="audio.pcm",
+        chunks=failing_chunks(),
+        mime_type="audio/pcm",
+    )
+
+  assert not await artifact_service.list_versions(
+      app_name="app0",
+      user_id="user0",
+      session_id="123",
+      filename="audio.pcm",
+  )
+
+
+@pytest.mark.asyncio
+async def test_file_artifacts_share_identical_content(tmp_path):
+  """Identical payloads are stored once and collected with their last link."""
+  artifact_service = FileArtifactService(root_dir=tmp_path / "artifacts")
+  scope = {"app_name": "app0", "user_id": "user0", "session_id": "123"}
+  chart = types.Part.from_bytes(data=b"chart-bytes", mime_type="image/png")
+  await artifact_service.save_artifact(
+      **scope, filename="chart.png", artifact=chart
+  )
+  await artifact_service.save_artifact(
+      **scope, filename="chart.png", artifact=chart
+  )
+  await artifact_service.save_artifact_stream(
+      **scope,
+      filename="copy.png",
+      chunks=[b"chart-", b"bytes"],
+      mime_type="image/png",
+  )
+  await artifact_service.save_artifact(
+      **scope, filename="notes.txt", artifact=types.Part(text="notes")
+  )
+
+  blobs = list((tmp_path / "artifacts" / "blobs").rglob("*"))
+  blob_files = [path for path in blobs if path.is_file()]
+  assert len(blob_files) == 2
+  chart_blob = (
+      tmp_path
+      / "artifacts"
+      / "blobs"
+      / "sha256"
+      / hashlib.sha256(b"chart-bytes").hexdigest()[:2]
+      / hashlib.sha256(b"chart-bytes").hexdigest()
+  )
+  assert chart_blob.stat().st_nlink == 4
+  for filename, version in (("chart.png", 1), ("copy.png", 0)):
+    assert (
+        await artifact_service.load_artifact(
+            **scope, filename=filename, version=version
+        )
+        == chart
+    )
+
+  await artifact_service.delete_artifact(**scope, filename="chart.png")
+  assert chart_blob.stat().st_nlink == 2
+  await artifact_service.delete_artifact(**scope, filename="copy.png")
+  assert not chart_blob.exists()
+  assert (
+      await artifact_service.load_artifact(**scope, filename="notes.txt")
+  ).text == "notes"
+
+
+@pytest.mark.asyncio
+async def test_in_memory_artifacts_share_identical_content():
+  """Identical payloads share their bytes until the last version is deleted."""
+  artifact_service = InMemoryArtifactService()
+  scope = {"app_name": "app0", "user_id": "user0", "session_id": "123"}
+  for filename in ("a.png", "b.png"):
+    await artifact_service.save_artifact(
+        **scope,
+        filename=filename,
+        # Encoded on each iteration, so the versions start with separate
+        # bytes objects.
+        artifact=types.Part.from_bytes(
+            data="chart-bytes".encode(), mime_type="image/png"
+        ),
+    )
+
+  first = await artifact_service.load_artifact(**scope, filename="a.png")
+  second = await artifact_service.load_artifact(**scope, filename="b.png")
+  assert first.inline_data.data is second.inline_data.data
+
+  await artifact_service.delete_artifact(**scope, filename="a.png")
+  assert artifact_service._blobs
+  await artifact_service.delete_artifact(**scope, filename="b.png")
+  assert not artifact_service._blobs
+
+
+@pytest.mark.asyncio
+async def test_gcs_versions_share_identical_content():
+  """Versions with the same content point at one content-addressed blob."""
+  artifact_service = mock_gcs_artifact_service()
+  scope = {"app_name": "app0", "user_id": "user0", "session_id": "123"}
+  chart = types.Part.from_bytes(data=b"chart-bytes", mime_type="image/png")
+  content_name = (
+      "_adk_blobs/sha256/" + hashlib.sha256(b"chart-bytes").hexdigest()
+  )
+  for filename, run in (("chart.png", 1), ("chart.png", 2), ("copy.png", 3)):
+    await artifact_service.save_artifact(
+        **scope,
+        filename=filename,
+        artifact=chart,
+        custom_metadata={"run": run},
+    )
+
+  blobs = artifact_service.bucket.blobs
+  assert blobs[content_name].content == b"chart-bytes"
+  assert blobs[content_name].metadata == {"referenceCount": "3"}
+  version_blob = blobs["app0/user0/123/chart.png/1"]
+  assert version_blob.content == b""
+  # The metadata is the version's own, not carried over from other versions.
+  assert version_blob.metadata == {
+      "run": "2",
+      "contentSha256": hashlib.sha256(b"chart-bytes").hexdigest(),
+  }
+  assert (
+      await artifact_service.load_artifact(
+          **scope, filename="chart.png", version=1
+      )
+      == chart
+  )
+  artifact_version = await artifact_service.get_artifact_version(
+      **scope, filename="chart.png", version=1
+  )
+  assert artifact_version.canonical_uri == f"gs://test_bucket/{content_name}"
+  assert artifact_version.mime_type == "image/png"
+  assert artifact_version.custom_metadata == {"run": "2"}
+
+  await artifact_service.delete_artifact(**scope, filename="chart.png")
+  assert blobs[content_name].metadata == {"referenceCount": "1"}
+  stream = await artifact_service.load_artifact_stream(
+      **scope, filename="copy.png"
+  )
+  assert stream.mime_type == "image/png"
+  assert [chunk async for chunk in stream.chunks] == [b"chart-bytes"]
+
+  await artifact_service.delete_artifact(**scope, filename="copy.png")
+  assert artifact_service.bucket.get_blob(content_name) is None
+
+
+@pytest.mark.asyncio
+async def test_file_index_is_built_for_existing_trees(tmp_path):
+  """Artifacts saved before the index existed are listed after a rebuild."""
+  root_dir = tmp_path / "artifacts"
+  artifact_service = FileArtifactService(root_dir=root_dir)
+  scope = {"app_name": "app0", "user_id": "user0", "session_id": "123"}
+  for filename in ("docs/report.txt", "report.txt", "user:shared.txt"):
+    await artifact_service.save_artifact(
+        **scope, filename=filename, artifact=types.Part(text=filename)
+    )
+  await artifact_service.save_artifact(
+      **scope, filename="report.txt", artifact=types.Part(text="v1")
+  )
+  expected_keys = ["docs/report.txt", "report.txt", "user:shared.txt"]
+  assert await artifact_service.list_artifact_keys(**scope) == expected_keys
+
+  (root_dir / "artifact_index.sqlite3").unlink()
+  artifact_service = FileArtifactService(root_dir=root_dir)
+
+  assert await artifact_service.list_artifact_keys(**scope) == expected_keys
+  assert await artifact_service.list_versions(
+      **scope, filename="report.txt"
+  ) == [0, 1]
+  assert (
+      await artifact_service.load_artifact(**scope, filename="report.txt")
+  ).text == "v1"
+
+  shutil.rmtree(root_dir / "apps/app0/users/user0/sessions/123/artifacts/docs")
+  assert await artifact_service.rebuild_index() == 3
+  assert await artifact_service.list_artifact_keys(**scope) == [
+      "report.txt",
+      "user:shared.txt",
+  ]
+
+  await artifact_service.delete_artifact(**scope, filename="report.txt")
+  assert await artifact_service.list_artifact_keys(**scope) == [
+      "user:shared.txt"
+  ]
+  assert not await artifact_service.get_artifact_version(
+      **scope, filename="report.txt"
+  )
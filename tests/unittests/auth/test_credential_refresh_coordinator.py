@@ -0,0 +1,113 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+from typing import Optional
+
+from google.adk.auth.auth_credential import AuthCredential
+from google.adk.auth.auth_credential import AuthCredentialTypes
+from google.adk.auth.auth_credential import OAuth2Auth
+from google.adk.auth.auth_schemes import AuthScheme
+from google.adk.auth.credential_refresh_coordinator import CredentialRefreshCoordinator
+from google.adk.auth.refresher.base_credential_refresher import BaseCredentialRefresher
+import pytest
+
+
+class _FakeRefresher(BaseCredentialRefresher):
+
+  def __init__(self, delay: float = 0):
+    self.delay = delay
+    self.num_refreshes = 0
+
+  async def is_refresh_needed(
+      self,
+      auth_credential: AuthCredential,
+      auth_scheme: Optional[AuthScheme] = None,
+  ) -> bool:
+    return auth_credential.oauth2.expires_at < time.time()
+
+  async def refresh(
+      self,
+      auth_credential: AuthCredential,
+      auth_scheme: Optional[AuthScheme] = None,
+  ) -> AuthCredential:
+    self.num_refreshes += 1
+    await asyncio.sleep(self.delay)
+    auth_credential.oauth2.access_token = f"token_{self.num_refreshes}"
+    auth_credential.oauth2.expires_at = int(time.time()) + 3600
+    return auth_credential
+
+
+def _credential(expires_in: int) -> AuthCredential:
+  return AuthCredential(
+      auth_type=AuthCredentialTypes.OAUTH2,
+      oauth2=OAuth2Auth(
+          client_id="client_id",
+          access_token="token_0",
+          refresh_token="refresh_token",
+          expires_at=int(time.time()) + expires_in,
+      ),
+  )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refreshes_are_coalesced():
+  coordinator = CredentialRefreshCoordinator()
+  refresher = _FakeRefresher(delay=0.05)
+
+  results = await asyncio.gather(*[
+      coordinator.refresh(_credential(expires_in=-10), None, refresher)
+      for _ in range(5)
+  ])
+
+  assert refresher.num_refreshes == 1
+  for credential, was_refreshed in results:
+    assert was_refreshed
+    assert credential.oauth2.access_token == "token_1"
+  assert results[0][0] is not results[1][0]
+
+
+@pytest.mark.asyncio
+async def test_expiring_credential_is_refreshed_in_background():
+  coordinator = CredentialRefreshCoordinator(proactive_refresh_seconds=300)
+  refresher = _FakeRefresher()
+
+  credential, was_refreshed = await coordinator.refresh(
+      _credential(expires_in=60), None, refresher
+  )
+  assert not was_refreshed
+  assert credential.oauth2.access_token == "token_0"
+
+  await asyncio.sleep(0.01)
+  credential, was_refreshed = await coordinator.refresh(
+      _credential(expires_in=60), None, refresher
+  )
+
+  assert was_refreshed
+  assert credential.oauth2.access_token == "token_1"
+  assert refresher.num_refreshes == 1
+
+
+@pytest.mark.asyncio
+async def test_valid_credential_is_not_refreshed():
+  coordinator = CredentialRefreshCoordinator(proactive_refresh_seconds=300)
+  refresher = _FakeRefresher()
+  credential = _credential(expires_in=3600)
+
+  result, was_refreshed = await coordinator.refresh(credential, None, refresher)
+
+  assert result is credential
+  assert not was_refreshed
+  assert refresher.num_refreshes == 0
@@ -0,0 +1,147 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.agents.sequential_agent import SequentialAgent
+from google.adk.apps.app import App
+from google.adk.cli.conformance.cli_bench import _discover_bench_cases
+from google.adk.cli.conformance.cli_bench import BenchCaseResult
+from google.adk.cli.conformance.cli_bench import BenchReport
+from google.adk.cli.conformance.cli_bench import BenchRunner
+from google.adk.cli.conformance.cli_bench import compare_to_baseline
+from google.adk.cli.plugins.recordings_plugin import RecordingsPlugin
+from google.adk.runners import Runner
+from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from google.genai import types
+import pytest
+
+from ... import testing_utils
+
+
+def _lookup(topic: str) -> dict:
+  return {"facts": f"facts about {topic}"}
+
+
+def _create_pipeline(responses) -> SequentialAgent:
+  return SequentialAgent(
+      name="pipeline",
+      sub_agents=[
+          LlmAgent(
+              name="research",
+              model=testing_utils.MockModel.create(responses=responses[:2]),
+              tools=[_lookup],
+          ),
+          LlmAgent(
+              name="synthesis",
+              model=testing_utils.MockModel.create(responses=responses[2:]),
+          ),
+      ],
+  )
+
+
+async def _record_test_case(test_case_dir):
+  """Records a run of the pipeline as a conformance test case."""
+  test_case_dir.mkdir(parents=True)
+  (test_case_dir / "spec.yaml").write_text(
+      "description: Benchmark pipeline\n"
+      "agent: pipeline\n"
+      "user_messages:\n"
+      "  - text: Research bees\n"
+  )
+  agent = _create_pipeline([
+      types.Part.from_function_call(name="_lookup", args={"topic": "bees"}),
+      "Bees pollinate.",
+      "Summary: bees pollinate.",
+  ])
+  runner = Runner(
+      app=App(name="pipeline", root_agent=agent, plugins=[RecordingsPlugin()]),
+      session_service=InMemorySessionService(),
+  )
+  session = await runner.session_service.create_session(
+      app_name="pipeline", user_id="user"
+  )
+  async for _ in runner.run_async(
+      user_id="user",
+      session_id=session.id,
+      new_message=types.UserContent("Research bees"),
+      state_delta={
+          "_adk_recordings_config": {
+              "dir": str(test_case_dir),
+              "user_message_index": 0,
+          }
+      },
+  ):
+    pass
+
+
+@pytest.mark.asyncio
+async def test_run_case_replays_recordings(tmp_path):
+  await _record_test_case(tmp_path / "core" / "pipeline_001")
+  (tmp_path / "core" / "no_recordings").mkdir()
+  (tmp_path / "core" / "no_recordings" / "spec.yaml").write_text(
+      "description: Not recorded\nagent: pipeline\n"
+  )
+  (test_case,) = _discover_bench_cases([tmp_path])
+  # Models without responses fail if they are called instead of replayed.
+  bench_runner = BenchRunner(
+      _create_pipeline([]),
+      InMemorySessionService(),
+      model_latency=0.001,
+  )
+
+  result = await bench_runner.run_case(test_case, iterations=2, warmup=1)
+
+  assert result.name == "core/pipeline_001"
+  assert result.iterations == 2
+  assert result.events == 4
+  assert result.session_writes == 5
+  assert result.wall_ms >= 3
+  assert result.events_per_sec > 0
+  assert result.peak_alloc_kib > 0
+  assert list(result.phases) == ["pipeline", "research", "synthesis"]
+  assert result.phases["research"].events == 3
+  assert result.phases["synthesis"].events == 1
+  assert result.phases["synthesis"].wall_ms >= 1
+  assert result.phases["synthesis"].alloc_kib is not None
+
+
+def _result(**metrics) -> BenchCaseResult:
+  values = {
+      "name": "core/pipeline_001",
+      "iterations": 5,
+      "wall_ms": 100.0,
+      "cpu_ms": 50.0,
+      "events": 10,
+      "events_per_sec": 100.0,
+      "session_writes": 11,
+      "session_write_ms": 5.0,
+  }
+  values.update(metrics)
+  return BenchCaseResult(**values)
+
+
+def test_compare_to_baseline():
+  baseline = BenchReport(cases=[_result(peak_alloc_kib=100.0)])
+  report = BenchReport(
+      cases=[
+          _result(cpu_ms=60.0, events_per_sec=80.0, session_write_ms=5.4),
+          _result(name="core/new_case", cpu_ms=1000.0),
+      ]
+  )
+
+  assert compare_to_baseline(report, baseline, max_regression=0.1) == [
+      "core/pipeline_001: cpu_ms regressed by 20.0% (50.00 -> 60.00)",
+      "core/pipeline_001: events_per_sec regressed by 20.0% (100.00 -> 80.00)",
+  ]
+  assert not compare_to_baseline(report, baseline, max_regression=0.25)
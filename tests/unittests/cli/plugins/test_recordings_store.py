@@ -0,0 +1,157 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+from google.adk.cli.plugins.recordings_schema import LlmRecording
+from google.adk.cli.plugins.recordings_schema import Recording
+from google.adk.cli.plugins.recordings_schema import ToolRecording
+from google.adk.cli.plugins.recordings_store import convert_recordings
+from google.adk.cli.plugins.recordings_store import get_recordings_file
+from google.adk.cli.plugins.recordings_store import JSONL_INDEX_FILENAME
+from google.adk.cli.plugins.recordings_store import RecordingsReader
+from google.adk.cli.plugins.recordings_store import RecordingsWriter
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+
+def _llm_recording(agent_name, user_message_index, text):
+  return Recording(
+      user_message_index=user_message_index,
+      agent_name=agent_name,
+      llm_recording=LlmRecording(
+          llm_request=LlmRequest(
+              contents=[
+                  types.Content(role="user", parts=[types.Part(text=text)])
+              ]
+          ),
+          llm_response=LlmResponse(
+              content=types.Content(
+                  role="model", parts=[types.Part(text=f"re: {text}")]
+              )
+          ),
+      ),
+  )
+
+
+def _tool_recording(agent_name, user_message_index):
+  return Recording(
+      user_message_index=user_message_index,
+      agent_name=agent_name,
+      tool_recording=ToolRecording(
+          tool_call=types.FunctionCall(id="1", name="lookup", args={"q": "é"}),
+          tool_response=types.FunctionResponse(
+              id="1", name="lookup", response={"result": "ok"}
+          ),
+      ),
+  )
+
+
+_RECORDINGS = [
+    _llm_recording("research", 0, "first"),
+    _llm_recording("synthesis", 0, "second"),
+    _tool_recording("research", 0),
+    _llm_recording("research", 1, "third\nline"),
+]
+
+
+def _agent_recordings(reader):
+  return {
+      (agent_name, user_message_index): reader.get_agent_recordings(
+          user_message_index, agent_name
+      )
+      for agent_name in ("research", "synthesis", "unknown")
+      for user_message_index in (0, 1)
+  }
+
+
+def test_writer_indexes_recordings_per_agent(tmp_path):
+  writer = RecordingsWriter(tmp_path)
+  for recording in _RECORDINGS[:2]:
+    writer.append(recording)
+  writer.write_index()
+  # Later invocations append to the recordings of earlier ones.
+  writer = RecordingsWriter(tmp_path)
+  for recording in _RECORDINGS[2:]:
+    writer.append(recording)
+  writer.write_index()
+
+  reader = RecordingsReader.open(tmp_path)
+
+  assert len(reader) == 4
+  assert _agent_recordings(reader) == {
+      ("research", 0): [_RECORDINGS[0], _RECORDINGS[2]],
+      ("research", 1): [_RECORDINGS[3]],
+      ("synthesis", 0): [_RECORDINGS[1]],
+      ("synthesis", 1): [],
+      ("unknown", 0): [],
+      ("unknown", 1): [],
+  }
+  assert reader.read_all().recordings == _RECORDINGS
+
+
+def test_reader_parses_only_requested_recordings(tmp_path):
+  writer = RecordingsWriter(tmp_path)
+  for recording in _RECORDINGS:
+    writer.append(recording)
+  writer.write_index()
+  reader = RecordingsReader.open(tmp_path)
+
+  with mock.patch.object(
+      Recording, "model_validate_json", wraps=Recording.model_validate_json
+  ) as model_validate_json:
+    reader.get_agent_recordings(0, "synthesis")
+    reader.get_agent_recordings(0, "synthesis")
+
+  assert model_validate_json.call_count == 1
+
+
+def test_reader_rebuilds_missing_or_stale_index(tmp_path):
+  writer = RecordingsWriter(tmp_path)
+  writer.append(_RECORDINGS[0])
+  writer.write_index()
+  # Recorded after the index was written, e.g. by an interrupted recording.
+  writer.append(_RECORDINGS[2])
+
+  reader = RecordingsReader.open(tmp_path)
+  assert reader.get_agent_recordings(0, "research") == [
+      _RECORDINGS[0],
+      _RECORDINGS[2],
+  ]
+
+  (tmp_path / JSONL_INDEX_FILENAME).unlink()
+  assert len(RecordingsReader.open(tmp_path)) == 2
+
+
+def test_convert_recordings_both_ways(tmp_path):
+  writer = RecordingsWriter(tmp_path)
+  for recording in _RECORDINGS:
+    writer.append(recording)
+  writer.write_index()
+  expected = _agent_recordings(RecordingsReader.open(tmp_path))
+
+  yaml_file = convert_recordings(tmp_path, "yaml")
+
+  assert yaml_file.name == "generated-recordings.yaml"
+  assert get_recordings_file(tmp_path) == yaml_file
+  assert not (tmp_path / JSONL_INDEX_FILENAME).exists()
+  assert _agent_recordings(RecordingsReader.open(tmp_path)) == expected
+
+  jsonl_file = convert_recordings(tmp_path, "jsonl")
+
+  assert jsonl_file.name == "generated-recordings.jsonl"
+  assert not yaml_file.exists()
+  assert RecordingsReader.open(tmp_path).read_all().recordings == _RECORDINGS
+  assert convert_recordings(tmp_path / "missing", "yaml") is None
@@ -30,6 +30,9 @@ from fastapi.testclient import TestClient
 from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.run_config import RunConfig
 from google.adk.apps.app import App
+from google.adk.artifacts.base_artifact_service import ArtifactStream
+from google.adk.artifacts.base_artifact_service import BaseArtifactService
+from google.adk.cli.adk_web_server import _stream_blob_part_json
 from google.adk.cli.fast_api import get_fast_api_app
 from google.adk.evaluation.eval_case import EvalCase
 from google.adk.evaluation.eval_case import Invocation
@@ -208,6 +211,17 @@ def mock_artifact_service():
 
   class MockArtifactService:
 
+    async def save_artifact(
+        self, app_name, user_id, session_id, filename, artifact
+    ):
+      """Save an artifact as a new version."""
+      key = f"{app_name}:{user_id}:{session_id}:{filename}"
+      versions = artifacts.setdefault(key, [])
+      versions.append({"version": len(versions), "artifact": artifact})
+      return len(versions) - 1
+
+    load_artifact_stream = BaseArtifactService.load_artifact_stream
+
     async def load_artifact(
         self, app_name, user_id, session_id, filename, version=None
     ):
@@ -784,6 +798,61 @@ def test_list_artifact_names(test_app, create_test_session):
   logger.info(f"Listed {len(data)} artifacts")
 
 
+def test_load_artifact(test_app, create_test_session, mock_artifact_service):
+  """Test loading binary and text artifacts."""
+  info = create_test_session
+  data = os.urandom(1000)
+  for filename, artifact in (
+      ("image.png", types.Part.from_bytes(data=data, mime_type="image/png")),
+      ("notes.txt", types.Part(text="hello")),
+  ):
+    asyncio.run(
+        mock_artifact_service.save_artifact(
+            app_name=info["app_name"],
+            user_id=info["user_id"],
+            session_id=info["session_id"],
+            filename=filename,
+            artifact=artifact,
+        )
+    )
+  url = f"/apps/{info['app_name']}/users/{info['user_id']}/sessions/{info['session_id']}/artifacts"
+
+  response = test_app.get(f"{url}/image.png")
+  assert response.status_code == 200
+  assert types.Part.model_validate(response.json()).inline_data == types.Blob(
+      data=data, mime_type="image/png"
+  )
+  response = test_app.get(f"{url}/notes.txt/versions/0")
+  assert response.status_code == 200
+  assert response.json() == {"text": "hello"}
+  response = test_app.get(f"{url}/missing.txt")
+  assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [0, 1, 2, 3, 100])
+async def test_stream_blob_part_json(size):
+  """Test that streamed artifacts encode like a serialized Part."""
+  data = os.urandom(size)
+
+  async def chunks():
+    for start in range(0, size, 7):
+      yield data[start : start + 7]
+
+  encoded = b"".join([
+      chunk
+      async for chunk in _stream_blob_part_json(
+          ArtifactStream(mime_type="image/png", chunks=chunks())
+      )
+  ])
+
+  assert json.loads(encoded) == json.loads(
+      types.Part.from_bytes(data=data, mime_type="image/png").model_dump_json(
+          by_alias=True, exclude_none=True
+      )
+  )
+
+
 def test_create_eval_set(test_app, test_session_info):
   """Test creating an eval set."""
   url = f"/apps/{test_session_info['app_name']}/eval_sets/test_eval_set_id"
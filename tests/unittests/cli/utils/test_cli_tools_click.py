@@ -14,7 +14,6 @@
 
 """Tests for utilities in cli_tool_click."""
 
-
 from __future__ import annotations
 
 import builtins
@@ -30,6 +29,7 @@ from unittest import mock
 import click
 from click.testing import CliRunner
 from google.adk.agents.base_agent import BaseAgent
+from google.adk.artifacts.file_artifact_service import FileArtifactService
 from google.adk.cli import cli_tools_click
 from google.adk.evaluation.eval_case import EvalCase
 from google.adk.evaluation.eval_set import EvalSet
@@ -847,3 +847,26 @@ def test_cli_deploy_cloud_run_gcloud_arg_conflict(
       " command."
   )
   assert expected_msg in result.output
+
+
+def test_cli_artifacts_rebuild_index(tmp_path: Path):
+  artifact_root = tmp_path / "artifacts"
+  version_dir = (
+      artifact_root
+      / "apps/app/users/user/sessions/session/artifacts/notes.txt/versions/0"
+  )
+  version_dir.mkdir(parents=True)
+  (version_dir / "notes.txt").write_text("hello")
+
+  runner = CliRunner()
+  result = runner.invoke(
+      cli_tools_click.main,
+      ["artifacts", "rebuild_index", str(artifact_root)],
+  )
+
+  assert result.exit_code == 0
+  assert (artifact_root / "artifact_index.sqlite3").exists()
+  service = FileArtifactService(root_dir=artifact_root)
+  assert service._index.list_versions(
+      "apps/app/users/user/sessions/session/artifacts", "notes.txt"
+  ) == [0]
@@ -0,0 +1,222 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from google.adk.agents.base_agent import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.code_executors.code_execution_utils import CodeExecutionInput
+from google.adk.code_executors.container_code_executor import BUILD_CONTEXT_HASH_LABEL
+from google.adk.code_executors.container_code_executor import ContainerCodeExecutor
+from google.adk.sessions.base_session_service import BaseSessionService
+from google.adk.sessions.session import Session
+import pytest
+
+
+class _FakeExecResult:
+
+  def __init__(self, exit_code=0, output=None):
+    self.exit_code = exit_code
+    self.output = output
+
+
+class _FakeContainer:
+
+  def __init__(self, container_id: str, exec_delay: float = 0):
+    self.id = container_id
+    self.exec_delay = exec_delay
+    self.executed_code = []
+    self.removed = False
+
+  def exec_run(self, cmd, demux=False):
+    if cmd == ['which', 'python3']:
+      return _FakeExecResult(exit_code=0)
+    self.executed_code.append(cmd[-1])
+    time.sleep(self.exec_delay)
+    return _FakeExecResult(output=(f'{self.id}\n'.encode('utf-8'), None))
+
+  def stop(self):
+    pass
+
+  def remove(self):
+    self.removed = True
+
+
+class _FakeImage:
+
+  def __init__(self):
+    self.tags = []
+
+  def tag(self, tag):
+    self.tags.append(tag)
+
+
+class _FakeDockerClient:
+
+  def __init__(self, exec_delay: float = 0):
+    self.exec_delay = exec_delay
+    self.started = []
+    self.built_labels = []
+    self.images = MagicMock()
+    self.images.build.side_effect = self._build
+    self.images.list.side_effect = self._list
+    self.containers = MagicMock()
+    self.containers.run.side_effect = self._run
+
+  def _build(self, path, tag, rm, labels):
+    self.built_labels.append(labels)
+
+  def _list(self, filters):
+    label = filters['label']
+    for labels in self.built_labels:
+      if any(f'{key}={value}' == label for key, value in labels.items()):
+        return [_FakeImage()]
+    return []
+
+  def _run(self, image, detach, tty):
+    container = _FakeContainer(f'c{len(self.started)}', self.exec_delay)
+    self.started.append(container)
+    return container
+
+
+def _invocation_context(session_id: str) -> InvocationContext:
+  mock_session = MagicMock(spec=Session)
+  mock_session.id = session_id
+  return InvocationContext(
+      invocation_id='test_invocation',
+      agent=MagicMock(spec=BaseAgent),
+      session=mock_session,
+      session_service=MagicMock(spec=BaseSessionService),
+  )
+
+
+def _run(executor, session_id, code='print(1)'):
+  return executor.execute_code(
+      _invocation_context(session_id), CodeExecutionInput(code=code)
+  )
+
+
+class TestContainerCodeExecutor:
+
+  def test_init_starts_warm_pool(self):
+    client = _FakeDockerClient()
+    executor = ContainerCodeExecutor(image='python', client=client, pool_size=2)
+
+    assert len(client.started) == 2
+    executor.close()
+    assert all(container.removed for container in client.started)
+
+  def test_pool_size_larger_than_max_containers_raises(self):
+    with pytest.raises(ValueError, match='pool_size'):
+      ContainerCodeExecutor(
+          image='python',
+          client=_FakeDockerClient(),
+          pool_size=3,
+          max_containers=2,
+      )
+
+  def test_session_reuses_leased_container(self):
+    client = _FakeDockerClient()
+    executor = ContainerCodeExecutor(image='python', client=client)
+
+    first = _run(executor, 'session_a')
+    second = _run(executor, 'session_a', code='print(2)')
+    other = _run(executor, 'session_b')
+
+    assert first.stdout == second.stdout
+    assert other.stdout != first.stdout
+    assert client.started[0].executed_code == ['print(1)', 'print(2)']
+    executor.close()
+
+  def test_sessions_run_concurrently(self):
+    client = _FakeDockerClient(exec_delay=0.3)
+    executor = ContainerCodeExecutor(
+        image='python', client=client, pool_size=2, max_containers=2
+    )
+    threads = [
+        threading.Thread(target=_run, args=(executor, f'session_{i}'))
+        for i in range(2)
+    ]
+
+    start = time.monotonic()
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+
+    assert time.monotonic() - start < 0.55
+    executor.close()
+
+  def test_max_containers_evicts_least_recently_used_lease(self):
+    client = _FakeDockerClient()
+    executor = ContainerCodeExecutor(
+        image='python', client=client, pool_size=1, max_containers=2
+    )
+
+    _run(executor, 'session_a')
+    _run(executor, 'session_b')
+    _run(executor, 'session_c')
+
+    assert client.started[0].removed
+    assert not client.started[1].removed
+    assert len(client.started) == 3
+    executor.close()
+
+  def test_reap_idle_containers(self):
+    client = _FakeDockerClient()
+    executor = ContainerCodeExecutor(
+        image='python', client=client, idle_timeout_seconds=0
+    )
+
+    _run(executor, 'session_a')
+    executor.reap_idle_containers()
+
+    assert client.started[0].removed
+    result = _run(executor, 'session_a')
+    assert result.stdout != 'c0\n'
+    executor.close()
+
+  def test_build_skipped_for_unchanged_context(self, tmp_path):
+    (tmp_path / 'Dockerfile').write_text('FROM python:3.12-slim\n')
+    client = _FakeDockerClient()
+
+    ContainerCodeExecutor(docker_path=str(tmp_path), client=client).close()
+    ContainerCodeExecutor(docker_path=str(tmp_path), client=client).close()
+    assert client.images.build.call_count == 1
+    assert BUILD_CONTEXT_HASH_LABEL in client.built_labels[0]
+
+    (tmp_path / 'Dockerfile').write_text('FROM python:3.13-slim\n')
+    ContainerCodeExecutor(docker_path=str(tmp_path), client=client).close()
+    assert client.images.build.call_count == 2
+
+  @pytest.mark.asyncio
+  async def test_execute_code_async(self):
+    client = _FakeDockerClient()
+    executor = ContainerCodeExecutor(image='python', client=client)
+
+    result = await executor.execute_code_async(
+        _invocation_context('session_a'), CodeExecutionInput(code='print(1)')
+    )
+
+    assert result.stdout == 'c0\n'
+    executor.close()
+
+  def test_execute_after_close_raises(self):
+    executor = ContainerCodeExecutor(image='python', client=_FakeDockerClient())
+    executor.close()
+
+    with pytest.raises(RuntimeError, match='closed'):
+      _run(executor, 'session_a')
@@ -0,0 +1,168 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from unittest.mock import MagicMock
+
+from google.adk.agents.base_agent import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.code_executors.code_execution_utils import CodeExecutionInput
+from google.adk.code_executors.process_pool_code_executor import ProcessPoolCodeExecutor
+from google.adk.sessions.base_session_service import BaseSessionService
+from google.adk.sessions.session import Session
+import pytest
+
+
+@pytest.fixture
+def mock_invocation_context() -> InvocationContext:
+  """Provides a mock InvocationContext."""
+  mock_agent = MagicMock(spec=BaseAgent)
+  mock_session = MagicMock(spec=Session)
+  mock_session_service = MagicMock(spec=BaseSessionService)
+  return InvocationContext(
+      invocation_id="test_invocation",
+      agent=mock_agent,
+      session=mock_session,
+      session_service=mock_session_service,
+  )
+
+
+@pytest.fixture
+def executor():
+  executor = ProcessPoolCodeExecutor(
+      pool_size=1, max_workers=2, preload_modules=[], timeout_seconds=30
+  )
+  yield executor
+  executor.close()
+
+
+@pytest.fixture
+def stateful_executor():
+  executor = ProcessPoolCodeExecutor(
+      stateful=True, pool_size=1, max_workers=2, preload_modules=[]
+  )
+  yield executor
+  executor.close()
+
+
+class TestProcessPoolCodeExecutor:
+
+  def test_init_optimize_data_file_raises_error(self):
+    with pytest.raises(
+        ValueError,
+        match=(
+            "Cannot set `optimize_data_file=True` in ProcessPoolCodeExecutor."
+        ),
+    ):
+      ProcessPoolCodeExecutor(optimize_data_file=True)
+
+  def test_init_pool_size_larger_than_max_workers_raises_error(self):
+    with pytest.raises(ValueError, match="`pool_size` cannot be larger"):
+      ProcessPoolCodeExecutor(pool_size=4, max_workers=2)
+
+  def test_execute_code(self, executor, mock_invocation_context):
+    result = executor.execute_code(
+        mock_invocation_context,
+        CodeExecutionInput(
+            code='import sys\nprint("hello")\nprint("oops", file=sys.stderr)'
+        ),
+    )
+    assert result.stdout == "hello\n"
+    assert result.stderr == "oops\n"
+    assert result.output_files == []
+
+  def test_execute_code_with_error(self, executor, mock_invocation_context):
+    result = executor.execute_code(
+        mock_invocation_context,
+        CodeExecutionInput(code='raise ValueError("Test error")'),
+    )
+    assert result.stdout == ""
+    assert result.stderr == "Test error"
+
+  def test_stateless_executions_do_not_share_globals(
+      self, executor, mock_invocation_context
+  ):
+    executor.execute_code(
+        mock_invocation_context, CodeExecutionInput(code="x = 1")
+    )
+    result = executor.execute_code(
+        mock_invocation_context, CodeExecutionInput(code="print(x)")
+    )
+    assert result.stderr == "name 'x' is not defined"
+
+  def test_stateful_executions_are_sticky_per_session(
+      self, stateful_executor, mock_invocation_context
+  ):
+    stateful_executor.execute_code(
+        mock_invocation_context,
+        CodeExecutionInput(code="x = 1", execution_id="session_1"),
+    )
+    stateful_executor.execute_code(
+        mock_invocation_context,
+        CodeExecutionInput(code="x = 2", execution_id="session_2"),
+    )
+    result_1 = stateful_executor.execute_code(
+        mock_invocation_context,
+        CodeExecutionInput(code="print(x)", execution_id="session_1"),
+    )
+    result_2 = stateful_executor.execute_code(
+        mock_invocation_context,
+        CodeExecutionInput(code="print(x)", execution_id="session_2"),
+    )
+    assert result_1.stdout == "1\n"
+    assert result_2.stdout == "2\n"
+
+  def test_execute_code_timeout(self, mock_invocation_context):
+    executor = ProcessPoolCodeExecutor(
+        pool_size=1, preload_modules=[], timeout_seconds=1
+    )
+    try:
+      executor.warm_up()
+      result = executor.execute_code(
+          mock_invocation_context,
+          CodeExecutionInput(code="while True:\n  pass"),
+      )
+      assert result.stderr == "Code execution timed out after 1.0 seconds."
+
+      # The timed out worker is replaced by a fresh one.
+      result = executor.execute_code(
+          mock_invocation_context, CodeExecutionInput(code='print("ok")')
+      )
+      assert result.stdout == "ok\n"
+    finally:
+      executor.close()
+
+  @pytest.mark.asyncio
+  async def test_execute_code_async_runs_concurrently(
+      self, executor, mock_invocation_context
+  ):
+    results = await asyncio.gather(*[
+        executor.execute_code_async(
+            mock_invocation_context,
+            CodeExecutionInput(code=f"print({i})"),
+        )
+        for i in range(2)
+    ])
+    assert [result.stdout for result in results] == ["0\n", "1\n"]
+
+  def test_close(self, mock_invocation_context):
+    executor = ProcessPoolCodeExecutor(pool_size=1, preload_modules=[])
+    executor.execute_code(
+        mock_invocation_context, CodeExecutionInput(code="pass")
+    )
+    executor.close()
+    with pytest.raises(RuntimeError, match="is closed"):
+      executor.execute_code(
+          mock_invocation_context, CodeExecutionInput(code="pass")
+      )
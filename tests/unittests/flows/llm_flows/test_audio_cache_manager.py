@@ -16,6 +16,7 @@ import time
 from unittest.mock import AsyncMock
 from unittest.mock import Mock
 
+from google.adk.artifacts.in_memory_artifact_service import InMemoryArtifactService
 from google.adk.flows.llm_flows.audio_cache_manager import AudioCacheConfig
 from google.adk.flows.llm_flows.audio_cache_manager import AudioCacheManager
 from google.genai import types
@@ -134,7 +135,7 @@ class TestAudioCacheManager:
 
     # Set up mock artifact service
     mock_artifact_service = AsyncMock()
-    mock_artifact_service.save_artifact.return_value = 123
+    mock_artifact_service.save_artifact_stream.return_value = 123
     invocation_context.artifact_service = mock_artifact_service
 
     # Cache some audio
@@ -151,7 +152,7 @@ class TestAudioCacheManager:
     assert invocation_context.output_realtime_cache == []
 
     # Verify artifact service was called twice (once for each cache)
-    assert mock_artifact_service.save_artifact.call_count == 2
+    assert mock_artifact_service.save_artifact_stream.call_count == 2
 
   @pytest.mark.asyncio
   async def test_flush_caches_selective(self):
@@ -162,7 +163,7 @@ class TestAudioCacheManager:
 
     # Set up mock artifact service
     mock_artifact_service = AsyncMock()
-    mock_artifact_service.save_artifact.return_value = 123
+    mock_artifact_service.save_artifact_stream.return_value = 123
     invocation_context.artifact_service = mock_artifact_service
 
     # Cache some audio
@@ -181,7 +182,7 @@ class TestAudioCacheManager:
     assert len(invocation_context.output_realtime_cache) == 1
 
     # Verify artifact service was called once
-    assert mock_artifact_service.save_artifact.call_count == 1
+    assert mock_artifact_service.save_artifact_stream.call_count == 1
 
   @pytest.mark.asyncio
   async def test_flush_empty_caches(self):
@@ -198,7 +199,7 @@ class TestAudioCacheManager:
     await self.manager.flush_caches(invocation_context)
 
     # Verify artifact service was not called
-    mock_artifact_service.save_artifact.assert_not_called()
+    mock_artifact_service.save_artifact_stream.assert_not_called()
 
   @pytest.mark.asyncio
   async def test_flush_without_artifact_service(self):
@@ -229,7 +230,7 @@ class TestAudioCacheManager:
 
     # Set up mock services
     mock_artifact_service = AsyncMock()
-    mock_artifact_service.save_artifact.return_value = 456
+    mock_artifact_service.save_artifact_stream.return_value = 456
     mock_session_service = AsyncMock()
 
     invocation_context.artifact_service = mock_artifact_service
@@ -244,11 +245,10 @@ class TestAudioCacheManager:
     await self.manager.flush_caches(invocation_context)
 
     # Verify artifact was saved with correct data
-    mock_artifact_service.save_artifact.assert_called_once()
-    call_args = mock_artifact_service.save_artifact.call_args
-    saved_artifact = call_args.kwargs['artifact']
-    assert saved_artifact.inline_data.data == test_data
-    assert saved_artifact.inline_data.mime_type == 'audio/pcm'
+    mock_artifact_service.save_artifact_stream.assert_called_once()
+    call_args = mock_artifact_service.save_artifact_stream.call_args
+    assert b''.join(call_args.kwargs['chunks']) == test_data
+    assert call_args.kwargs['mime_type'] == 'audio/pcm'
 
     # Verify session event was created
     mock_session_service.append_event.assert_not_called()
@@ -310,7 +310,7 @@ class TestAudioCacheManager:
 
     # Set up mock artifact service that raises an error
     mock_artifact_service = AsyncMock()
-    mock_artifact_service.save_artifact.side_effect = Exception(
+    mock_artifact_service.save_artifact_stream.side_effect = Exception(
         'Artifact service error'
     )
     invocation_context.artifact_service = mock_artifact_service
@@ -334,7 +334,7 @@ class TestAudioCacheManager:
 
     # Set up mock services
     mock_artifact_service = AsyncMock()
-    mock_artifact_service.save_artifact.return_value = 789
+    mock_artifact_service.save_artifact_stream.return_value = 789
     mock_session_service = AsyncMock()
 
     invocation_context.artifact_service = mock_artifact_service
@@ -370,8 +370,8 @@ class TestAudioCacheManager:
     await self.manager.flush_caches(invocation_context)
 
     # Verify artifact was saved
-    mock_artifact_service.save_artifact.assert_called_once()
-    call_args = mock_artifact_service.save_artifact.call_args
+    mock_artifact_service.save_artifact_stream.assert_called_once()
+    call_args = mock_artifact_service.save_artifact_stream.call_args
     filename = call_args.kwargs['filename']
 
     # Extract timestamp from filename (format: input_audio_{timestamp}.pcm)
@@ -387,3 +387,62 @@ class TestAudioCacheManager:
     assert filename.startswith(
         f'adk_live_audio_storage_input_audio_{expected_timestamp_ms}'
     )
+
+  @pytest.mark.asyncio
+  async def test_flush_caches_if_needed_flushes_large_cache(self):
+    """Test that a cache over the size limit is flushed before turn end."""
+    manager = AudioCacheManager(AudioCacheConfig(max_cache_size_bytes=10))
+    invocation_context = await testing_utils.create_invocation_context(
+        testing_utils.create_test_agent()
+    )
+    invocation_context.artifact_service = InMemoryArtifactService()
+
+    for chunk in [b'01234', b'56789']:
+      manager.cache_audio(
+          invocation_context,
+          types.Blob(data=chunk, mime_type='audio/pcm'),
+          'input',
+      )
+      await manager.flush_caches_if_needed(invocation_context, 'input')
+    assert len(invocation_context.input_realtime_cache) == 2
+
+    manager.cache_audio(
+        invocation_context,
+        types.Blob(data=b'abc', mime_type='audio/pcm'),
+        'input',
+    )
+    await manager.flush_caches_if_needed(invocation_context, 'input')
+
+    assert invocation_context.input_realtime_cache == []
+    [filename] = await invocation_context.artifact_service.list_artifact_keys(
+        app_name=invocation_context.app_name,
+        user_id=invocation_context.user_id,
+        session_id=invocation_context.session.id,
+    )
+    artifact = await invocation_context.artifact_service.load_artifact(
+        app_name=invocation_context.app_name,
+        user_id=invocation_context.user_id,
+        session_id=invocation_context.session.id,
+        filename=filename,
+    )
+    assert artifact.inline_data.data == b'0123456789abc'
+
+  @pytest.mark.asyncio
+  async def test_flush_caches_if_needed_drops_oldest_without_service(self):
+    """Test that an unflushable cache behaves as a bounded ring buffer."""
+    manager = AudioCacheManager(AudioCacheConfig(max_cache_size_bytes=8))
+    invocation_context = await testing_utils.create_invocation_context(
+        testing_utils.create_test_agent()
+    )
+    invocation_context.artifact_service = None
+
+    for i in range(10):
+      manager.cache_audio(
+          invocation_context,
+          types.Blob(data=f'{i}{i}'.encode(), mime_type='audio/pcm'),
+          'input',
+      )
+      await manager.flush_caches_if_needed(invocation_context, 'input')
+
+    assert manager.get_cache_stats(invocation_context)['input_bytes'] <= 8
+    assert invocation_context.input_realtime_cache[-1].data.data == b'99'
@@ -0,0 +1,140 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from unittest.mock import Mock
+
+from google.adk.agents.transcription_entry import TranscriptionEntry
+from google.adk.flows.llm_flows.audio_transcriber import AudioTranscriber
+from google.adk.flows.llm_flows.audio_transcriber import BaseSpeechRecognizer
+from google.adk.flows.llm_flows.audio_transcriber import GoogleCloudSpeechRecognizer
+from google.adk.flows.llm_flows.audio_transcriber import Transcript
+from google.cloud import speech
+from google.genai import types
+import pytest
+
+
+class _FakeRecognizer(BaseSpeechRecognizer):
+  """Transcribes audio to its decoded bytes, slower for shorter audio."""
+
+  def __init__(self):
+    self.active = 0
+    self.max_active = 0
+    self.requests = []
+
+  async def recognize(self, audio):
+    self.requests.append(audio)
+    self.active += 1
+    self.max_active = max(self.max_active, self.active)
+    # Later segments are shorter and finish first.
+    await asyncio.sleep(0.001 * (10 - len(audio)))
+    self.active -= 1
+    return [audio.decode()]
+
+
+def _audio(role, data):
+  return TranscriptionEntry(
+      role=role, data=types.Blob(data=data, mime_type='audio/pcm')
+  )
+
+
+def _context(entries):
+  return Mock(transcription_cache=entries)
+
+
+@pytest.mark.asyncio
+async def test_transcribe_bundles_speakers_and_keeps_order():
+  recognizer = _FakeRecognizer()
+  transcriber = AudioTranscriber(
+      recognizer=recognizer, max_concurrent_requests=2
+  )
+  model_content = types.ModelContent('already text')
+  context = _context([
+      _audio('user', b'aaaa'),
+      _audio('user', b'a'),
+      _audio('model', b'bbb'),
+      TranscriptionEntry(role='model', data=model_content),
+      _audio('user', b'cc'),
+      _audio('model', b'd'),
+      _audio('model', b''),
+  ])
+
+  contents = await transcriber.transcribe(context)
+
+  assert [(c.role, c.parts[0].text) for c in contents] == [
+      ('user', 'aaaaa'),
+      ('model', 'bbb'),
+      ('model', 'already text'),
+      ('user', 'cc'),
+      ('model', 'd'),
+  ]
+  assert recognizer.requests[:2] == [b'aaaaa', b'bbb']
+  assert recognizer.max_active == 2
+  assert context.transcription_cache == []
+
+
+@pytest.mark.asyncio
+async def test_transcribe_stream_falls_back_to_recognize():
+  transcriber = AudioTranscriber(recognizer=_FakeRecognizer())
+
+  async def chunks():
+    for chunk in (b'he', b'', b'llo'):
+      yield chunk
+
+  transcripts = [t async for t in transcriber.transcribe_stream(chunks())]
+
+  assert transcripts == [Transcript(text='hello', is_final=True)]
+
+
+def test_max_concurrent_requests_must_be_positive():
+  with pytest.raises(ValueError):
+    AudioTranscriber(max_concurrent_requests=0)
+
+
+@pytest.mark.asyncio
+async def test_google_cloud_streaming_recognize():
+  sent_requests = []
+
+  async def streaming_recognize(requests):
+    sent_requests.extend([request async for request in requests])
+
+    async def responses():
+      for text, is_final in (('hel', False), ('hello', True)):
+        yield speech.StreamingRecognizeResponse(
+            results=[
+                speech.StreamingRecognitionResult(
+                    alternatives=[
+                        speech.SpeechRecognitionAlternative(transcript=text)
+                    ],
+                    is_final=is_final,
+                )
+            ]
+        )
+
+    return responses()
+
+  async_client = Mock(streaming_recognize=streaming_recognize)
+  recognizer = GoogleCloudSpeechRecognizer(async_client=async_client)
+
+  async def chunks():
+    yield b'audio'
+
+  transcripts = [t async for t in recognizer.streaming_recognize(chunks())]
+
+  assert transcripts == [
+      Transcript(text='hel', is_final=False),
+      Transcript(text='hello', is_final=True),
+  ]
+  assert sent_requests[0].streaming_config.interim_results
+  assert sent_requests[1].audio_content == b'audio'
@@ -162,3 +162,36 @@ async def test_run_async_breaks_on_first_partial_response():
   assert len(events) == 1
   assert events[0].partial is True
   assert events[0].content.parts[0].text == 'Partial response'
+
+
+def test_finalize_partial_event_matches_full_merge():
+  """Test that partial events are finalized like non-partial events."""
+  from google.adk.events.event import Event
+  from google.adk.models.llm_request import LlmRequest
+
+  flow = BaseLlmFlowForTesting()
+  template = Event(invocation_id='inv', author='test_agent', branch='root')
+  template.actions.state_delta['key'] = 'value'
+  llm_response = LlmResponse(
+      content=types.Content(
+          role='model', parts=[types.Part.from_text(text='Partial')]
+      ),
+      usage_metadata=types.GenerateContentResponseUsageMetadata(
+          prompt_token_count=3
+      ),
+      partial=True,
+  )
+
+  partial_event = flow._finalize_model_response_event(
+      LlmRequest(), llm_response, template
+  )
+  full_event = flow._finalize_model_response_event(
+      LlmRequest(), llm_response.model_copy(update={'partial': None}), template
+  )
+
+  assert partial_event.model_dump(exclude={'partial'}) == full_event.model_dump(
+      exclude={'partial'}
+  )
+  assert partial_event.partial is True
+  partial_event.actions.state_delta['key'] = 'changed'
+  assert template.actions.state_delta['key'] == 'value'
@@ -117,7 +117,7 @@ async def test_logs_executed_code(mock_logger):
   mock_code_executor.code_block_delimiters = [('```python\n', '\n```')]
   mock_code_executor.error_retry_attempts = 2
   mock_code_executor.stateful = False
-  mock_code_executor.execute_code.return_value = CodeExecutionResult(
+  mock_code_executor.execute_code_async.return_value = CodeExecutionResult(
       stdout='hello'
   )
 
@@ -144,7 +144,7 @@ async def test_logs_executed_code(mock_logger):
       )
   ]
 
-  mock_code_executor.execute_code.assert_called_once()
+  mock_code_executor.execute_code_async.assert_awaited_once()
   mock_logger.debug.assert_called_once_with(
       'Executed code:\n```\n%s\n```', 'print("hello")'
   )
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from google.adk.agents.context_budget_config import ContextBudgetConfig
 from google.adk.agents.llm_agent import Agent
+from google.adk.agents.run_config import RunConfig
 from google.adk.events.event import Event
 from google.adk.events.event_actions import EventActions
 from google.adk.flows.llm_flows import contents
@@ -479,3 +481,92 @@ async def test_events_with_empty_content_are_skipped():
       types.UserContent("Hello"),
       types.UserContent("How are you?"),
   ]
+
+
+@pytest.mark.asyncio
+async def test_context_budget_keeps_newest_turns():
+  """Test that a context budget drops the oldest turns of the history."""
+  agent = Agent(model="gemini-2.5-flash", name="test_agent")
+  llm_request = LlmRequest(model="gemini-2.5-flash")
+  invocation_context = await testing_utils.create_invocation_context(
+      agent=agent,
+      run_config=RunConfig(
+          context_budget_config=ContextBudgetConfig(max_tokens=11)
+      ),
+  )
+  function_call = types.Part.from_function_call(name="tool", args={})
+  function_response = types.Part.from_function_response(
+      name="tool", response={"result": "x" * 12}
+  )
+  invocation_context.session.events = [
+      Event(author="user", content=types.UserContent("a" * 16)),
+      Event(author="test_agent", content=types.ModelContent("b" * 16)),
+      Event(author="user", content=types.UserContent("c" * 4)),
+      Event(author="test_agent", content=types.ModelContent([function_call])),
+      Event(author="user", content=types.UserContent([function_response])),
+      Event(author="test_agent", content=types.ModelContent("d" * 4)),
+  ]
+
+  async for _ in contents.request_processor.run_async(
+      invocation_context, llm_request
+  ):
+    pass
+
+  # The budget is met within the tool call, so the history starts at the
+  # user turn before the function call.
+  assert llm_request.contents == [
+      types.UserContent("c" * 4),
+      types.ModelContent([function_call]),
+      types.UserContent([function_response]),
+      types.ModelContent("d" * 4),
+  ]
+  report = llm_request.context_budget_report
+  assert report.dropped_contents == 2
+  assert report.dropped_tokens == 8
+  assert report.kept_tokens == 1 + 2 + 8 + 1
+  assert report.elided_function_responses == 0
+
+
+@pytest.mark.asyncio
+async def test_context_budget_elides_oversized_function_responses():
+  """Test that oversized function responses are elided in the request only."""
+  agent = Agent(model="gemini-2.5-flash", name="test_agent")
+  llm_request = LlmRequest(model="gemini-2.5-flash")
+  invocation_context = await testing_utils.create_invocation_context(
+      agent=agent,
+      run_config=RunConfig(
+          context_budget_config=ContextBudgetConfig(
+              max_tokens=1000, max_function_response_tokens=10
+          )
+      ),
+  )
+  function_response = types.Part.from_function_response(
+      name="tool", response={"result": "x" * 400}
+  )
+  invocation_context.session.events = [
+      Event(author="user", content=types.UserContent("Go")),
+      Event(
+          author="test_agent",
+          content=types.ModelContent(
+              [types.Part.from_function_call(name="tool", args={})]
+          ),
+      ),
+      Event(author="user", content=types.UserContent([function_response])),
+  ]
+
+  async for _ in contents.request_processor.run_async(
+      invocation_context, llm_request
+  ):
+    pass
+
+  response = llm_request.contents[-1].parts[0].function_response
+  assert response.name == "tool"
+  assert response.response["elided_response"] == '{"result": "' + "x" * 28
+  report = llm_request.context_budget_report
+  assert report.elided_function_responses == 1
+  assert report.dropped_tokens == 105 - 10
+  assert report.kept_tokens == 1 + 2 + 10
+  # The session event is unchanged.
+  assert invocation_context.session.events[-1].content.parts == [
+      function_response
+  ]
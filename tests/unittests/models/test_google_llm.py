@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import os
 import sys
 from typing import Optional
@@ -549,6 +550,33 @@ async def test_generate_content_async_patches_tracking_headers(
     assert len(responses) == 2 if stream else 1
 
 
+def test_api_clients_are_shared(mock_os_environ):
+  client = Gemini(model="gemini-1.5-flash").api_client
+
+  assert Gemini(model="gemini-2.5-pro").api_client is client
+  retry_options = types.HttpRetryOptions(attempts=2)
+  assert (
+      Gemini(model="gemini-1.5-flash", retry_options=retry_options).api_client
+      is not client
+  )
+  os.environ["GOOGLE_API_KEY"] = "another_key"
+  assert Gemini(model="gemini-1.5-flash").api_client is not client
+
+
+def test_api_clients_are_not_shared_across_event_loops(mock_os_environ):
+  async def get_clients():
+    return (
+        Gemini(model="gemini-1.5-flash").api_client,
+        Gemini(model="gemini-2.5-pro").api_client,
+    )
+
+  first_client, same_loop_client = asyncio.run(get_clients())
+  second_client, _ = asyncio.run(get_clients())
+
+  assert same_loop_client is first_client
+  assert second_client is not first_client
+
+
 def test_live_api_version_vertex_ai(gemini_llm):
   """Test that _live_api_version returns 'v1beta1' for Vertex AI backend."""
   with mock.patch.object(
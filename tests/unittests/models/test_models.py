@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+
 from google.adk import models
 from google.adk.models.anthropic_llm import Claude
 from google.adk.models.google_llm import Gemini
@@ -60,3 +62,41 @@ def test_non_exist_model():
   with pytest.raises(ValueError) as e_info:
     models.LLMRegistry.resolve('non-exist-model')
   assert 'Model non-exist-model not found.' in str(e_info.value)
+
+
+def test_resolve_is_updated_by_register():
+  class CustomGemini(Gemini):
+
+    @classmethod
+    def supported_models(cls) -> list[str]:
+      return [r'custom-gemini-.*']
+
+  with pytest.raises(ValueError):
+    LLMRegistry.resolve('custom-gemini-1')
+
+  LLMRegistry.register(CustomGemini)
+
+  assert LLMRegistry.resolve('custom-gemini-1') is CustomGemini
+
+
+def test_get_llm_returns_shared_instance():
+  llm = LLMRegistry.get_llm('gemini-2.5-flash')
+
+  assert isinstance(llm, Gemini)
+  assert LLMRegistry.get_llm('gemini-2.5-flash') is llm
+  assert LLMRegistry.get_llm('gemini-2.5-pro') is not llm
+  assert LLMRegistry.new_llm('gemini-2.5-flash') is not llm
+
+
+def test_get_llm_shares_instances_within_an_event_loop():
+  async def get_llms():
+    return LLMRegistry.get_llm('gemini-2.5-flash'), LLMRegistry.get_llm(
+        'gemini-2.5-flash'
+    )
+
+  first_llm, same_loop_llm = asyncio.run(get_llms())
+  second_llm, _ = asyncio.run(get_llms())
+
+  assert same_loop_llm is first_llm
+  assert second_llm is not first_llm
+  assert LLMRegistry.get_llm('gemini-2.5-flash') is not first_llm
@@ -15,6 +15,7 @@
 """Tests for runner.rewind_async."""
 
 from google.adk.agents.base_agent import BaseAgent
+from google.adk.apps.app import App
 from google.adk.artifacts.in_memory_artifact_service import InMemoryArtifactService
 from google.adk.events.event import Event
 from google.adk.events.event import EventActions
@@ -246,3 +247,51 @@ class TestRunnerRewind:
         session_id=session_id,
         filename="f2",
     ) == types.Part.from_text(text="f2v0")
+
+  @pytest.mark.asyncio
+  async def test_rewind_async_from_state_checkpoint(self):
+    """Tests rewind_async replays state from the nearest checkpoint."""
+    runner = Runner(
+        app=App(
+            name="test_app",
+            root_agent=BaseAgent(name="test_agent"),
+            event_checkpoint_interval=2,
+        ),
+        session_service=InMemorySessionService(),
+        artifact_service=InMemoryArtifactService(),
+    )
+    user_id = "test_user"
+    session_id = "test_session"
+    session = await runner.session_service.create_session(
+        app_name=runner.app_name, user_id=user_id, session_id=session_id
+    )
+    for i in range(7):
+      await runner.session_service.append_event(
+          session=session,
+          event=Event(
+              invocation_id=f"invocation{i}",
+              author="agent",
+              actions=EventActions(
+                  state_delta={"count": i, f"k{i}": i, "k0": None if i else 0}
+              ),
+          ),
+      )
+
+    await runner.rewind_async(
+        user_id=user_id,
+        session_id=session_id,
+        rewind_before_invocation_id="invocation5",
+    )
+
+    session = await runner.session_service.get_session(
+        app_name=runner.app_name, user_id=user_id, session_id=session_id
+    )
+    assert {key: value for key, value in session.state.items() if value} == {
+        "count": 4,
+        "k1": 1,
+        "k2": 2,
+        "k3": 3,
+        "k4": 4,
+    }
+    assert session.state["k5"] is None
+    assert session.state["k6"] is None
@@ -0,0 +1,227 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import Mock
+
+from google.adk.events.event import Event
+from google.adk.events.event_actions import EventActions
+from google.adk.events.event_actions import EventCompaction
+from google.adk.sessions._event_index import EMPTY_AGENT_STATE
+from google.adk.sessions._event_index import EventIndex
+from google.adk.sessions._event_index import get_event_index
+from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from google.adk.sessions.session import Session
+from google.genai import types
+import pytest
+
+
+def _function_call_event(invocation_id, author, call_id):
+  return Event(
+      invocation_id=invocation_id,
+      author=author,
+      content=types.Content(
+          role='model',
+          parts=[
+              types.Part(
+                  function_call=types.FunctionCall(
+                      id=call_id, name='tool', args={}
+                  )
+              )
+          ],
+      ),
+  )
+
+
+def _function_response_event(invocation_id, call_id):
+  return Event(
+      invocation_id=invocation_id,
+      author='user',
+      content=types.Content(
+          role='user',
+          parts=[
+              types.Part(
+                  function_response=types.FunctionResponse(
+                      id=call_id, name='tool', response={}
+                  )
+              )
+          ],
+      ),
+  )
+
+
+def _session(events):
+  return Session(id='s', app_name='app', user_id='u', events=events)
+
+
+def test_index_lookups():
+  events = [
+      Event(invocation_id='inv_1', author='user', branch='root'),
+      _function_call_event('inv_1', 'agent_a', 'call_1'),
+      _function_response_event('inv_1', 'call_1'),
+      Event(
+          invocation_id='inv_2',
+          author='agent_b',
+          actions=EventActions(agent_state={}),
+      ),
+      Event(
+          invocation_id='inv_2',
+          author='agent_a',
+          actions=EventActions(
+              compaction=EventCompaction(
+                  start_timestamp=0,
+                  end_timestamp=1,
+                  compacted_content=types.Content(role='model'),
+              )
+          ),
+      ),
+      Event(
+          invocation_id='inv_3',
+          author='user',
+          actions=EventActions(rewind_before_invocation_id='inv_2'),
+      ),
+  ]
+
+  index = get_event_index(_session(events))
+
+  assert index.get_invocation_positions('inv_1') == [0, 1, 2]
+  assert index.get_invocation_events('inv_2') == events[3:5]
+  assert index.get_branch_events('root') == [events[0]]
+  assert index.find_function_call_position('call_1') == 1
+  assert index.find_function_call_position('call_1', before=1) is None
+  assert index.get_function_response_positions('call_1') == [2]
+  assert index.get_last_position_by_author('agent_b') == 3
+  # The agent state change of agent_b is not a reply.
+  assert index.get_authors_by_last_reply() == [('agent_a', 4)]
+  assert index.get_compaction_positions() == [4]
+  assert index.get_rewind_positions() == [5]
+
+
+def test_index_is_incremental_and_rebuilt_on_replacement():
+  session = _session([Event(invocation_id='inv_1', author='user')])
+  index = get_event_index(session)
+  assert index.get_invocation_positions('inv_1') == [0]
+
+  session.events.append(Event(invocation_id='inv_1', author='agent'))
+  assert get_event_index(session) is index
+  assert index.get_invocation_positions('inv_1') == [0, 1]
+
+  session.events = [Event(invocation_id='inv_2', author='user')]
+  assert get_event_index(session).get_invocation_positions('inv_1') == []
+  assert get_event_index(session).get_invocation_positions('inv_2') == [0]
+
+
+def test_index_does_not_affect_session_equality():
+  session = _session([Event(id='e1', invocation_id='inv_1', author='user')])
+  other = session.model_copy(deep=True)
+  get_event_index(session)
+
+  assert session == other
+
+
+def test_deep_copied_session_rebuilds_index_lazily():
+  session = _session([_function_call_event('inv_1', 'agent', 'call_1')])
+  get_event_index(session, checkpoint_interval=7)
+
+  copied = session.model_copy(deep=True)
+
+  assert copied._event_index is not session._event_index
+  assert copied._event_index.events == []
+  assert copied._event_index.checkpoint_interval == 7
+  assert get_event_index(copied).find_function_call_position('call_1') == 0
+
+
+def test_get_event_index_returns_none_without_index():
+  assert get_event_index(Mock(spec=Session, events=[])) is None
+
+
+@pytest.mark.asyncio
+async def test_append_event_updates_index():
+  session_service = InMemorySessionService()
+  session = await session_service.create_session(app_name='app', user_id='u')
+
+  await session_service.append_event(
+      session, _function_call_event('inv_1', 'agent', 'call_1')
+  )
+
+  index = session._event_index
+  assert index.find_function_call_position('call_1') == 0
+  assert get_event_index(session) is index
+
+
+def test_state_checkpoints():
+  events = [
+      Event(
+          invocation_id=f'inv_{i}',
+          author='agent',
+          actions=EventActions(
+              state_delta={'count': i, 'app:shared': i, 'dropped': None},
+              artifact_delta={'f': i} if i % 3 == 0 else {},
+          ),
+      )
+      for i in range(10)
+  ]
+  events[1].actions.state_delta['dropped'] = 'yes'
+  index = EventIndex(checkpoint_interval=4).sync(events)
+
+  for position in range(len(events) + 1):
+    expected_state = {}
+    expected_versions = {}
+    for event in events[:position]:
+      for key, value in event.actions.state_delta.items():
+        if key.startswith('app:'):
+          continue
+        if value is None:
+          expected_state.pop(key, None)
+        else:
+          expected_state[key] = value
+      expected_versions.update(event.actions.artifact_delta)
+    assert index.get_state_at(position) == expected_state
+    assert index.get_artifact_versions_at(position) == expected_versions
+  assert index.get_current_artifact_versions() == {'f': 9}
+
+
+def test_invocation_agent_states():
+  events = [
+      Event(invocation_id='inv_1', author='user'),
+      Event(
+          invocation_id='inv_1',
+          author='agent_a',
+          content=types.Content(role='model', parts=[types.Part(text='hi')]),
+      ),
+      Event(
+          invocation_id='inv_1',
+          author='agent_b',
+          actions=EventActions(agent_state={'step': 1}),
+      ),
+      Event(
+          invocation_id='inv_1',
+          author='agent_c',
+          actions=EventActions(agent_state={'step': 1}),
+      ),
+      Event(
+          invocation_id='inv_1',
+          author='agent_c',
+          actions=EventActions(end_of_agent=True),
+      ),
+  ]
+
+  agent_states, end_of_agents = (
+      EventIndex().sync(events).get_invocation_agent_states('inv_1')
+  )
+
+  assert agent_states == {
+      'agent_a': EMPTY_AGENT_STATE,
+      'agent_b': {'step': 1},
+  }
+  assert end_of_agents == {'agent_a': False, 'agent_b': False, 'agent_c': True}
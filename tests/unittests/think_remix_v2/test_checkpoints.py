@@ -0,0 +1,148 @@
+"""Unit tests for THINK Remix workflow checkpoints."""
+
+from __future__ import annotations
+
+from google.adk.events.event import Event
+from google.adk.events.event_actions import EventActions
+import pytest
+
+from contributing.samples.think_remix_v2.checkpoints import checkpoint_key
+from contributing.samples.think_remix_v2.checkpoints import PhaseCheckpointer
+from contributing.samples.think_remix_v2.workflow_graph import WorkflowGraph
+from contributing.samples.think_remix_v2.workflow_graph import WorkflowNode
+from contributing.samples.think_remix_v2.workflow_graph import WorkflowScheduler
+from tests.unittests import testing_utils
+
+
+def _graph(runs, failing=(), outputs=None):
+  """A graph of nodes writing their name (or a given output) to state."""
+  outputs = outputs or {}
+
+  def node(name, reads, writes):
+    async def run(ctx):
+      runs.append(name)
+      if name in failing:
+        raise RuntimeError(f'{name} failed')
+      yield Event(
+          author=name,
+          actions=EventActions(
+              state_delta={key: outputs.get(name, name) for key in writes}
+          ),
+      )
+
+    return WorkflowNode(name=name, run=run, reads=reads, writes=writes)
+
+  return WorkflowGraph([
+      node('audit', (), ('audit',)),
+      node('analysis', ('audit',), ('analysis',)),
+      node('nulls', ('analysis',), ('nulls',)),
+      node('personas', ('analysis',), ('analyses',)),
+      node('case_file', ('nulls', 'analyses'), ('case_file',)),
+  ])
+
+
+async def _run(ctx, graph, question='Will it rain?'):
+  checkpointer = PhaseCheckpointer(
+      graph, ctx.session.state, question, 'workflow'
+  )
+  scheduler = WorkflowScheduler(checkpointer.graph)
+  async for event in scheduler.run(ctx):
+    await ctx.session_service.append_event(ctx.session, event)
+  return checkpointer, scheduler
+
+
+async def _resume(ctx, invocation_id):
+  """Returns a context for a new invocation on the stored session."""
+  session = await ctx.session_service.get_session(
+      app_name=ctx.session.app_name,
+      user_id=ctx.session.user_id,
+      session_id=ctx.session.id,
+  )
+  return ctx.model_copy(
+      update={'invocation_id': invocation_id, 'session': session}
+  )
+
+
+@pytest.mark.asyncio
+async def test_rerun_restarts_at_failed_node():
+  ctx = await testing_utils.create_invocation_context(
+      testing_utils.create_test_agent()
+  )
+  runs = []
+  _, scheduler = await _run(ctx, _graph(runs, failing=('nulls',)))
+
+  assert runs == ['audit', 'analysis', 'nulls', 'personas', 'case_file']
+  assert scheduler.timings['nulls'].status == 'failed'
+  state = ctx.session.state
+  assert state[checkpoint_key('nulls')]['status'] == 'failed'
+  assert state[checkpoint_key('nulls')]['error'] == 'nulls failed'
+  assert state[checkpoint_key('analysis')]['outputs'] == {
+      'analysis': 'analysis'
+  }
+  # Each checkpoint event only carries the checkpoint of its node.
+  checkpoint_deltas = [
+      list(event.actions.state_delta)
+      for event in ctx.session.events
+      if any(
+          key.startswith('workflow_checkpoints')
+          for key in event.actions.state_delta
+      )
+  ]
+  assert checkpoint_deltas == [
+      [checkpoint_key(name)]
+      for name in ('audit', 'analysis', 'nulls', 'personas', 'case_file')
+  ]
+
+  ctx = await _resume(ctx, 'second')
+  runs = []
+  checkpointer, scheduler = await _run(ctx, _graph(runs))
+
+  # The case file read the missing null hypotheses, so it is invalidated.
+  assert runs == ['nulls', 'case_file']
+  assert list(checkpointer.restored) == ['audit', 'analysis', 'personas']
+  assert scheduler.timings['personas'].status == 'restored'
+  assert ctx.session.state['case_file'] == 'case_file'
+  assert all(
+      ctx.session.state[checkpoint_key(name)]['status'] == 'completed'
+      for name in ('audit', 'analysis', 'nulls', 'personas', 'case_file')
+  )
+
+  ctx = await _resume(ctx, 'third')
+  runs = []
+  await _run(ctx, _graph(runs))
+
+  assert runs == []
+
+
+@pytest.mark.asyncio
+async def test_changed_inputs_invalidate_downstream_nodes():
+  ctx = await testing_utils.create_invocation_context(
+      testing_utils.create_test_agent()
+  )
+  await _run(ctx, _graph([]))
+
+  ctx = await _resume(ctx, 'second')
+  runs = []
+  ctx.session.state[checkpoint_key('nulls')] = None
+  ctx.session.state[checkpoint_key('personas')] = None
+  # Restored outputs replace whatever later nodes left in state.
+  ctx.session.state['analysis'] = 'stale'
+  await _run(ctx, _graph(runs, outputs={'nulls': 'revised'}))
+
+  assert runs == ['nulls', 'personas', 'case_file']
+  assert ctx.session.state['analysis'] == 'analysis'
+  assert ctx.session.state['case_file'] == 'case_file'
+
+  ctx = await _resume(ctx, 'third')
+  runs = []
+  ctx.session.state[checkpoint_key('personas')] = None
+  await _run(ctx, _graph(runs, outputs={'nulls': 'revised'}))
+
+  # The personas produced the same analyses, so the case file is still valid.
+  assert runs == ['personas']
+
+  ctx = await _resume(ctx, 'fourth')
+  runs = []
+  await _run(ctx, _graph(runs), 'Will it snow?')
+
+  assert runs == ['audit', 'analysis', 'nulls', 'personas', 'case_file']
@@ -0,0 +1,130 @@
+"""Unit tests for the THINK Remix evidence cache."""
+
+from __future__ import annotations
+
+import os
+import time
+from unittest.mock import Mock
+from unittest.mock import patch
+
+from contributing.samples.think_remix_v2 import evidence_cache
+from contributing.samples.think_remix_v2.evidence_cache import EvidenceCache
+from contributing.samples.think_remix_v2.evidence_cache import normalize_query
+from contributing.samples.think_remix_v2.evidence_cache import normalize_source_url
+from contributing.samples.think_remix_v2.perplexity_tool import brave_search
+
+
+def test_normalization_matches_near_duplicates():
+  assert normalize_query('Why do bees pollinate crops?') == normalize_query(
+      '  why DO bees, pollinate crops'
+  )
+  assert normalize_query('bees pollinate crops') != normalize_query(
+      'bees pollinate flowers'
+  )
+  # Word order and small words change the meaning of a question.
+  assert normalize_query('Who will pay Alice?') != normalize_query(
+      'Will Alice pay?'
+  )
+  assert normalize_query('Does A cause B?') != normalize_query(
+      'Does B cause A?'
+  )
+  assert normalize_source_url(
+      'http://www.Example.com/report/?utm_source=x&b=2&a=1#summary'
+  ) == normalize_source_url('https://example.com/report?a=1&b=2')
+
+
+def test_cache_expires_entries(tmp_path):
+  cache = EvidenceCache(tmp_path / 'cache.sqlite3', ttl_hours=1)
+  cache.put_search('bees pollinate crops', {'results': [1]}, 0.5)
+
+  assert cache.get_search('Bees pollinate crops?') == {'results': [1]}
+  assert cache.get_search('wasps') is None
+  with patch.object(
+      evidence_cache.time, 'time', return_value=time.time() + 7200
+  ):
+    assert cache.get_search('bees pollinate crops') is None
+    assert cache.purge_expired() == 1
+
+  assert cache.stats.to_dict() == {
+      'search_hits': 1,
+      'search_misses': 2,
+      'preloaded_facts': 0,
+      'saved_latency_seconds': 0.5,
+  }
+
+
+def test_cache_facts_by_question_and_source(tmp_path):
+  cache = EvidenceCache(tmp_path / 'cache.sqlite3', ttl_hours=24)
+  fact = {
+      'fact_id': 'CER-20250101-001',
+      'statement': 'Bees pollinate a third of crops.',
+      'source': 'https://www.example.org/bees',
+      'credibility_score': 0.95,
+  }
+  cache.put_fact('Do bees pollinate crops?', fact)
+  # Registering the same fact again replaces it.
+  cache.put_fact(
+      'do bees pollinate crops',
+      {**fact, 'fact_id': 'CER-20250102-001', 'source': 'example.org/bees/'},
+  )
+  cache.put_fact(
+      'do bees pollinate crops',
+      {**fact, 'statement': 'Maybe.', 'credibility_score': 0.55},
+  )
+  cache.close()
+
+  cache = EvidenceCache(tmp_path / 'cache.sqlite3', ttl_hours=24)
+  facts = cache.get_facts('Do bees: pollinate crops', min_credibility=0.8)
+
+  assert [fact['fact_id'] for fact in facts] == ['CER-20250102-001']
+  assert len(cache.get_facts('do bees pollinate crops')) == 2
+  assert cache.get_facts('wasps') == []
+
+
+def test_brave_search_reuses_cached_results(tmp_path):
+  cache = EvidenceCache(tmp_path / 'cache.sqlite3', ttl_hours=24)
+  with (
+      patch(
+          'contributing.samples.think_remix_v2.perplexity_tool.get_evidence_cache',
+          return_value=cache,
+      ),
+      patch(
+          'contributing.samples.think_remix_v2.perplexity_tool.requests.get'
+      ) as mock_get,
+      patch.dict(os.environ, {'BRAVE_API_KEY': 'test_key'}),
+  ):
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {
+        'web': {'results': [{'title': 'Bees', 'url': 'https://bees.org'}]}
+    }
+    mock_get.return_value = mock_response
+
+    first = brave_search('bees pollinate crops')
+    second = brave_search('Bees pollinate crops?')
+    fewer = brave_search('bees pollinate crops', max_results=5)
+
+  # Asking for a different number of results is another search.
+  assert mock_get.call_count == 2
+  assert second == {**first, 'cached': True}
+  assert 'cached' not in fewer
+  assert cache.stats.search_hits == 1
+  assert cache.stats.saved_latency_seconds > 0
+
+
+def test_stats_since_snapshot(tmp_path):
+  cache = EvidenceCache(tmp_path / 'cache.sqlite3', ttl_hours=24)
+  cache.put_search('bees', {'results': []}, 0.5)
+  cache.get_search('bees')
+  snapshot = cache.stats.snapshot()
+
+  cache.get_search('bees')
+  cache.get_search('wasps')
+
+  assert cache.stats.since(snapshot).to_dict() == {
+      'search_hits': 1,
+      'search_misses': 1,
+      'preloaded_facts': 0,
+      'saved_latency_seconds': 0.5,
+  }
+  assert cache.stats.search_hits == 2
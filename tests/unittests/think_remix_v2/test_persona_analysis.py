@@ -41,3 +41,96 @@ def test_find_ignored_high_credibility_facts():
 
   fact_ids = {fact['fact_id'] for fact in results}
   assert fact_ids == {'CER-001'}
+
+
+def _persona(persona_id, answer, confidence):
+  return {
+      'persona_id': persona_id,
+      'conclusion': {
+          'answer': answer,
+          'confidence_percentage': confidence,
+          'primary_driver': 'CER-001',
+      },
+  }
+
+
+def test_evaluate_persona_convergence():
+  persona_analyses = [
+      _persona('a', 'Yes, the policy will reduce inflation', 90),
+      _persona('b', 'Yes, the policy will reduce inflation modestly', 80),
+      _persona('c', 'yes - the policy WILL reduce inflation.', 85),
+      _persona('d', 'No, supply shocks dominate', 60),
+  ]
+
+  assessment = persona_analysis.evaluate_persona_convergence(
+      persona_analyses,
+      convergence_threshold=0.75,
+      confidence_threshold=0.8,
+  )
+
+  assert assessment.converged
+  assert assessment.persona_count == 4
+  assert assessment.agreeing_persona_ids == ('a', 'b', 'c')
+  assert assessment.consensus_answer == 'Yes, the policy will reduce inflation'
+  assert assessment.convergence_score == 0.75
+  assert assessment.mean_confidence == 0.85
+
+  assert not persona_analysis.evaluate_persona_convergence(
+      persona_analyses,
+      convergence_threshold=0.85,
+      confidence_threshold=0.8,
+  ).converged
+  assert not persona_analysis.evaluate_persona_convergence(
+      persona_analyses,
+      convergence_threshold=0.75,
+      confidence_threshold=0.9,
+  ).converged
+  assert not persona_analysis.evaluate_persona_convergence(
+      persona_analyses[:1] + [{'persona_id': 'e'}],
+      convergence_threshold=0.5,
+      confidence_threshold=0.5,
+  ).converged
+
+
+def test_evaluate_persona_convergence_separates_opposing_answers():
+  persona_analyses = [
+      _persona('a', 'The policy will reduce inflation', 90),
+      _persona('b', "The policy won't reduce inflation", 90),
+      _persona('c', 'No, the policy will not reduce inflation', 90),
+  ]
+
+  assessment = persona_analysis.evaluate_persona_convergence(
+      persona_analyses,
+      convergence_threshold=0.75,
+      confidence_threshold=0.8,
+  )
+
+  assert not assessment.converged
+  assert assessment.agreeing_persona_ids == ('b', 'c')
+  assert assessment.consensus_answer == "The policy won't reduce inflation"
+  assert not persona_analysis.evaluate_persona_convergence(
+      [
+          _persona('a', 'Yes, the policy will reduce inflation', 90),
+          _persona('b', 'No, the policy will reduce inflation', 90),
+      ],
+      convergence_threshold=0.5,
+      confidence_threshold=0.5,
+  ).converged
+
+
+def test_evaluate_persona_convergence_reads_confidence_of_one_by_scale():
+  def mean_confidence(*confidences):
+    return persona_analysis.evaluate_persona_convergence(
+        [
+            _persona(str(i), 'Yes, the policy will reduce inflation', value)
+            for i, value in enumerate(confidences)
+        ],
+        convergence_threshold=0.5,
+        confidence_threshold=0.5,
+    ).mean_confidence
+
+  # Next to percentages, or on its own, 1 is 1%.
+  assert mean_confidence(99, 1) == 0.5
+  assert mean_confidence(1, 1) == 0.01
+  # Next to fractions, 1 is 100%.
+  assert mean_confidence(0.5, 1) == 0.75
@@ -0,0 +1,156 @@
+"""Unit tests for local persona divergence scoring."""
+
+from __future__ import annotations
+
+import json
+from unittest import mock
+
+from google.adk.agents.llm_agent import LlmAgent
+import pytest
+
+from contributing.samples.think_remix_v2 import agent
+from contributing.samples.think_remix_v2.persona_diversity import score_persona_diversity
+from contributing.samples.think_remix_v2.schemas import PersonaValidation
+from contributing.samples.think_remix_v2.workflow_agent import ThinkRemixWorkflowAgent
+from contributing.samples.think_remix_v2.workflow_agent import ThinkRemixWorkflowState
+from tests.unittests import testing_utils
+
+_BAYESIAN = {
+    'id': 'a',
+    'persona_name': 'Bayesian Analyst',
+    'epistemological_framework': 'Bayesian_Reasoning',
+    'analytical_focus': 'Statistical inference from base rates',
+    'worldview': 'Outcomes are probabilistic and priors matter',
+    'guiding_question': 'How likely is each outcome given the evidence?',
+    'evidence_lens': 'Quantitative data and historical frequencies',
+    'time_horizon': 'short_term',
+    'risk_orientation': 'risk_neutral',
+    'diversity_tags': ['consensus_builder'],
+}
+_SYSTEMS = {
+    'id': 'b',
+    'persona_name': 'Systems Thinker',
+    'epistemological_framework': 'Complex_Systems',
+    'analytical_focus': 'Feedback loops and tipping points',
+    'worldview': 'Interconnected actors produce emergent behavior',
+    'guiding_question': 'Which feedback mechanisms drive change?',
+    'evidence_lens': 'Network structure and second-order effects',
+    'time_horizon': 'long_term',
+    'risk_orientation': 'risk_averse',
+    'diversity_tags': ['status_quo_challenger'],
+}
+_ETHICIST = {
+    'id': 'c',
+    'persona_name': 'Duty Ethicist',
+    'epistemological_framework': 'Deontological_Ethics',
+    'analytical_focus': 'Rights and obligations of institutions',
+    'worldview': 'Some actions are wrong regardless of consequences',
+    'guiding_question': 'Which duties constrain the decision?',
+    'evidence_lens': 'Legal commitments and precedents',
+    'time_horizon': 'medium_term',
+    'risk_orientation': 'risk_seeking',
+    'diversity_tags': ['contrarian'],
+}
+
+
+def test_score_persona_diversity_approves_distinct_personas():
+  report = score_persona_diversity([_BAYESIAN, _SYSTEMS, _ETHICIST], 0.7)
+
+  assert report.approved
+  assert report.similarity.shape == (3, 3)
+  assert report.similarity[0, 0] == pytest.approx(1.0)
+  assert report.max_similarity < 0.3
+  validation = PersonaValidation.model_validate(report.to_validation())
+  assert validation.validation_status == 'approved'
+  assert [pair.pair for pair in validation.cognitive_distance_matrix] == [
+      ('a', 'b'),
+      ('a', 'c'),
+      ('b', 'c'),
+  ]
+  assert validation.diversity_checks == {
+      'unique_frameworks': True,
+      'long_term_present': True,
+      'status_quo_challenger_present': True,
+  }
+
+
+def test_score_persona_diversity_flags_redundant_personas():
+  near_copy = {
+      **_BAYESIAN,
+      'id': 'd',
+      'epistemological_framework': 'Behavioral_Economics',
+      'guiding_question': 'How likely is each outcome given the data?',
+  }
+  same_framework = {**_ETHICIST, 'epistemological_framework': 'Complex_Systems'}
+
+  validation = score_persona_diversity(
+      [_BAYESIAN, _SYSTEMS, same_framework, near_copy], 0.7
+  ).to_validation()
+
+  assert validation['validation_status'] == 'requires_regeneration'
+  flags = validation['redundancy_flags']
+  assert [flag['persona_ids'] for flag in flags] == [['a', 'd'], ['b', 'c']]
+  assert 'assumptions' in flags[0]['issue']
+  assert 'Complex_Systems' in flags[1]['issue']
+  assert not validation['diversity_checks']['unique_frameworks']
+
+
+def _allocation(*personas):
+  return json.dumps({
+      'complexity_analysis': {
+          'stakeholder_count': 2.0,
+          'temporal_dimensions': 2.0,
+          'domain_crossings': 2.0,
+          'known_unknowns': 2.0,
+          'complexity_score': 2.0,
+          'recommended_persona_count': 3,
+      },
+      'persona_count': len(personas),
+      'personas': list(personas),
+  })
+
+
+@pytest.mark.asyncio
+async def test_allocation_loop_retries_without_llm_validator():
+  allocator_model = testing_utils.MockModel.create(
+      responses=[
+          _allocation(_BAYESIAN, _SYSTEMS, {**_BAYESIAN, 'id': 'c'}),
+          _allocation(_BAYESIAN, _SYSTEMS, _ETHICIST),
+      ]
+  )
+  allocator = LlmAgent(
+      name='dynamic_persona_allocator',
+      model=allocator_model,
+      output_key='persona_allocation',
+  )
+  validator_model = testing_utils.MockModel.create(responses=[])
+  validator = LlmAgent(
+      name='persona_divergence_validator',
+      model=validator_model,
+      output_key='persona_validation',
+  )
+  workflow = ThinkRemixWorkflowAgent(name='workflow')
+  ctx = await testing_utils.create_invocation_context(
+      allocator, user_content='Will the policy work?'
+  )
+  workflow_state = ThinkRemixWorkflowState()
+
+  with (
+      mock.patch.object(agent, 'persona_allocator_agent', allocator),
+      mock.patch.object(agent, 'persona_validator_agent', validator),
+  ):
+    async for event in workflow._run_persona_allocation_phase(
+        ctx, workflow_state
+    ):
+      await ctx.session_service.append_event(ctx.session, event)
+
+  assert workflow_state.persona_allocator_attempts == 2
+  assert len(allocator_model.requests) == 2
+  assert not validator_model.requests
+  # The allocator is told which personas to regenerate.
+  assert 'PERSONA DIVERGENCE VALIDATION FAILED' in str(
+      allocator_model.requests[1].contents
+  )
+  assert ctx.session.state['persona_validation']['validation_status'] == (
+      'approved'
+  )
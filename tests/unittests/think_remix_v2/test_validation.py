@@ -0,0 +1,210 @@
+"""Unit tests for THINK Remix output validation."""
+
+from __future__ import annotations
+
+import json
+
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.events.event import Event
+from google.adk.events.event_actions import EventActions
+from google.genai import types
+import pytest
+
+from contributing.samples.think_remix_v2 import schemas
+from contributing.samples.think_remix_v2.validation import get_validator
+from contributing.samples.think_remix_v2.validation import StreamingValidator
+from contributing.samples.think_remix_v2.validation import validate_agent_output
+from contributing.samples.think_remix_v2.workflow_agent import ThinkRemixWorkflowAgent
+from tests.unittests import testing_utils
+
+
+def test_validators_are_cached_and_accept_parsed_output():
+  validator = get_validator('question_audit_result')
+  assert validator is get_validator('question_audit_result')
+  # Keys sharing a schema share its validator.
+  assert get_validator('blindspot_analysis') is get_validator(
+      'disagreement_analysis'
+  )
+  assert get_validator('unknown_key') is None
+
+  result = validator.validate({'audit_status': 'proceed'})
+
+  assert result.valid
+  assert result.model.audit_status == 'proceed'
+
+
+def test_streaming_validator_fails_on_first_invalid_field():
+  streaming_validator = StreamingValidator(
+      get_validator('question_audit_result')
+  )
+  output = (
+      '```json\n{"audit_status": "maybe", "reframed_question": "Why?"}\n```'
+  )
+
+  errors = [
+      streaming_validator.feed(output[start:end])
+      for start, end in ((0, 8), (8, 32), (32, None))
+  ]
+
+  # The value of audit_status may be incomplete until the next field starts.
+  assert errors[:2] == [None, None]
+  assert 'audit_status' in errors[2]
+
+
+@pytest.mark.parametrize(
+    'chunks',
+    [
+        ['{"audit_status": "pro', 'ceed", "reframed_question": null}'],
+        ['```json\n{"audit_status"', ': "proceed"}\n`', '``'],
+    ],
+)
+def test_streaming_validator_accepts_valid_output(chunks):
+  streaming_validator = StreamingValidator(
+      get_validator('question_audit_result')
+  )
+
+  assert [streaming_validator.feed(chunk) for chunk in chunks] == [None] * len(
+      chunks
+  )
+
+
+@pytest.mark.parametrize('output', ['Here is the JSON:', '{"audit_status" 1'])
+def test_streaming_validator_fails_on_invalid_json(output):
+  streaming_validator = StreamingValidator(
+      get_validator('question_audit_result')
+  )
+
+  assert streaming_validator.feed(output).startswith('JSON parsing error')
+
+
+def test_streaming_validator_resets_between_model_turns():
+  streaming_validator = StreamingValidator(
+      get_validator('question_audit_result'), allow_preamble=True
+  )
+
+  assert streaming_validator.feed('Let me search first.') is None
+  assert streaming_validator.feed(' {"audit_status": "maybe", ') is None
+  streaming_validator.reset()
+  assert streaming_validator.feed('{"audit_status": "maybe", "a": 1}')
+
+
+def test_repair_prompt_contains_only_failing_fields():
+  validator = get_validator('question_audit_result')
+  result = validate_agent_output(
+      json.dumps({
+          'audit_status': 'maybe',
+          'reframed_question': 'A long and valid question',
+      }),
+      schemas.AuditResult,
+  )
+
+  prompt = validator.build_repair_prompt(result)
+  repaired = validator.apply_repair(
+      result, '{"audit_status": "proceed", "reframed_question": "Ignored"}'
+  )
+
+  assert '"audit_status"' in prompt
+  assert 'A long and valid question' not in prompt
+  assert repaired.valid
+  assert repaired.model.reframed_question == 'A long and valid question'
+  assert json.loads(repaired.raw_output)['audit_status'] == 'proceed'
+
+
+def test_repair_prompt_is_not_built_for_invalid_json():
+  result = validate_agent_output('not json', schemas.AuditResult)
+
+  assert get_validator('question_audit_result').build_repair_prompt(result) is (
+      None
+  )
+
+
+@pytest.mark.asyncio
+async def test_run_agent_with_validation_repairs_failing_fields():
+  mock_model = testing_utils.MockModel.create(
+      responses=['{"audit_status": "maybe"}', '{"audit_status": "proceed"}']
+  )
+  audit_agent = LlmAgent(
+      name='audit',
+      model=mock_model,
+      instruction='Audit the question.',
+      output_key='question_audit_result',
+  )
+  workflow = ThinkRemixWorkflowAgent(name='workflow', sub_agents=[audit_agent])
+  ctx = await testing_utils.create_invocation_context(
+      audit_agent, user_content='Why?'
+  )
+
+  async for event in workflow._run_agent_with_validation(audit_agent, ctx):
+    await ctx.session_service.append_event(ctx.session, event)
+
+  assert json.loads(ctx.session.state['question_audit_result']) == {
+      'audit_status': 'proceed'
+  }
+  # The repair request only contains the failing field, not the conversation.
+  assert len(mock_model.requests) == 2
+  repair_request = mock_model.requests[1]
+  assert 'audit_status' in repair_request.config.system_instruction
+  assert 'Audit the question.' not in repair_request.config.system_instruction
+  assert repair_request.contents[-1].parts[0].text != 'Why?'
+
+
+def _lookup(query: str) -> str:
+  return query
+
+
+class _ToolCallingAgent(LlmAgent):
+  """Streams prose and a function call, then the JSON output."""
+
+  async def _run_async_impl(self, ctx: InvocationContext):
+    def event(*parts, partial=None, state_delta=None):
+      return Event(
+          invocation_id=ctx.invocation_id,
+          author=self.name,
+          content=types.Content(role='model', parts=list(parts)),
+          partial=partial,
+          actions=EventActions(state_delta=state_delta or {}),
+      )
+
+    prose = types.Part.from_text(text='Let me look this up first.')
+    call = types.Part.from_function_call(name='_lookup', args={'query': 'q'})
+    yield event(prose, partial=True)
+    yield event(prose, call)
+    yield event(
+        types.Part.from_function_response(
+            name='_lookup', response={'result': 'q'}
+        )
+    )
+    output = '{"audit_status": "proceed"}'
+    yield event(types.Part.from_text(text=output[:10]), partial=True)
+    yield event(types.Part.from_text(text=output[10:]), partial=True)
+    yield event(
+        types.Part.from_text(text=output),
+        state_delta={self.output_key: output},
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_agent_with_validation_streams_tool_call_before_json():
+  audit_agent = _ToolCallingAgent(
+      name='audit',
+      model=testing_utils.MockModel.create(responses=[]),
+      tools=[_lookup],
+      output_key='question_audit_result',
+  )
+  workflow = ThinkRemixWorkflowAgent(name='workflow', sub_agents=[audit_agent])
+  ctx = await testing_utils.create_invocation_context(
+      audit_agent, user_content='Why?'
+  )
+
+  events = []
+  async for event in workflow._run_agent_with_validation(audit_agent, ctx):
+    events.append(event)
+    await ctx.session_service.append_event(ctx.session, event)
+
+  # The agent ran once: neither the prose nor the tool call failed it.
+  assert len(events) == 6
+  assert 'question_audit_result_validation_error' not in ctx.session.state
+  assert json.loads(ctx.session.state['question_audit_result']) == {
+      'audit_status': 'proceed'
+  }
@@ -0,0 +1,188 @@
+"""Unit tests for THINK Remix workflow graph scheduling."""
+
+from __future__ import annotations
+
+import asyncio
+
+from google.adk.events.event import Event
+import pytest
+
+from contributing.samples.think_remix_v2 import agent
+from contributing.samples.think_remix_v2.workflow_agent import ThinkRemixWorkflowAgent
+from contributing.samples.think_remix_v2.workflow_agent import ThinkRemixWorkflowState
+from contributing.samples.think_remix_v2.workflow_graph import WorkflowGraph
+from contributing.samples.think_remix_v2.workflow_graph import WorkflowNode
+from contributing.samples.think_remix_v2.workflow_graph import WorkflowScheduler
+from tests.unittests import testing_utils
+
+
+def _node(name, seconds, reads=(), writes=(), fail=False, **kwargs):
+  async def run(ctx):
+    yield Event(author=name)
+    await asyncio.sleep(seconds)
+    if fail:
+      raise RuntimeError(f'{name} failed')
+    for key in writes:
+      ctx.session.state[key] = name
+
+  return WorkflowNode(name=name, run=run, reads=reads, writes=writes, **kwargs)
+
+
+async def _run(scheduler):
+  ctx = await testing_utils.create_invocation_context(
+      testing_utils.create_test_agent()
+  )
+  authors = [event.author async for event in scheduler.run(ctx)]
+  return ctx, authors
+
+
+def test_graph_dependencies_follow_state_keys():
+  graph = WorkflowGraph([
+      _node('audit', 0, writes=('audit',)),
+      _node('nulls', 0, reads=('audit',), writes=('nulls',)),
+      _node('insights', 0, reads=('audit',), writes=('cer',)),
+      _node('personas', 0, reads=('nulls', 'cer'), writes=('analyses',)),
+      _node('research', 0, reads=('analyses', 'cer'), writes=('cer',)),
+      _node('case_file', 0, reads=('cer',), writes=('case_file',)),
+  ])
+
+  assert graph.dependencies == {
+      'audit': (),
+      'nulls': ('audit',),
+      'insights': ('audit',),
+      'personas': ('nulls', 'insights'),
+      # Overwriting the registry waits for its earlier readers.
+      'research': ('personas', 'insights'),
+      'case_file': ('research',),
+  }
+  with pytest.raises(ValueError):
+    WorkflowGraph([_node('audit', 0), _node('audit', 0)])
+
+
+@pytest.mark.asyncio
+async def test_scheduler_runs_independent_nodes_concurrently():
+  scheduler = WorkflowScheduler(
+      WorkflowGraph([
+          _node('analyze', 0.01, writes=('analysis',)),
+          _node(
+              'nulls',
+              0.1,
+              reads=('analysis',),
+              writes=('nulls',),
+              phase='questions',
+          ),
+          _node(
+              'insights',
+              0.05,
+              reads=('analysis',),
+              writes=('cer',),
+              phase='research',
+          ),
+          _node('allocation', 0.05, reads=('analysis',), writes=('personas',)),
+          _node('personas', 0.01, reads=('nulls', 'cer', 'personas')),
+      ])
+  )
+
+  ctx, authors = await _run(scheduler)
+
+  assert authors == ['analyze', 'nulls', 'insights', 'allocation', 'personas']
+  timings = scheduler.timings
+  assert timings['insights'].start < timings['nulls'].end
+  assert timings['personas'].start >= timings['nulls'].end
+  assert ctx.session.state['cer'] == 'insights'
+  report = scheduler.critical_path_report()
+  assert report.path == ['analyze', 'nulls', 'personas']
+  assert report.critical_path_seconds < report.total_node_seconds
+  assert report.wall_seconds < report.total_node_seconds
+  assert report.to_dict()['nodes']['insights']['status'] == 'completed'
+  # Each of the concurrently running nodes keeps its own phase.
+  assert report.to_dict()['nodes']['insights']['phase'] == 'research'
+  assert report.to_dict()['nodes']['nulls']['phase'] == 'questions'
+
+
+@pytest.mark.asyncio
+async def test_scheduler_enforces_concurrency_limits():
+  scheduler = WorkflowScheduler(
+      WorkflowGraph([
+          _node('insights', 0.02, concurrency_group='search'),
+          _node('research', 0.02, concurrency_group='search'),
+          _node('nulls', 0.02),
+      ]),
+      max_concurrency=2,
+      group_limits={'search': 1},
+  )
+
+  await _run(scheduler)
+
+  timings = scheduler.timings
+  assert timings['research'].start >= timings['insights'].end
+  assert timings['nulls'].start < timings['insights'].end
+
+
+@pytest.mark.asyncio
+async def test_scheduler_stops_workflow_and_survives_failures():
+  scheduler = WorkflowScheduler(
+      WorkflowGraph([
+          _node('insights', 0, writes=('cer',), fail=True),
+          _node('personas', 0, reads=('cer',), writes=('analyses',)),
+          _node(
+              'audit',
+              0.01,
+              reads=('analyses',),
+              stops_workflow=lambda ctx: True,
+          ),
+          _node('final', 0, reads=('analyses',), writes=('final',)),
+          _node('qa', 0, reads=('final',)),
+      ]),
+      max_concurrency=1,
+  )
+
+  ctx, authors = await _run(scheduler)
+
+  assert authors == ['insights', 'personas', 'audit']
+  assert 'final' not in ctx.session.state
+  assert scheduler.timings['insights'].status == 'failed'
+  assert scheduler.timings['personas'].status == 'completed'
+
+
+@pytest.mark.asyncio
+async def test_scheduler_skips_to_node():
+  scheduler = WorkflowScheduler(
+      WorkflowGraph([
+          _node(
+              'personas',
+              0.01,
+              writes=('analyses',),
+              skip_to=lambda ctx: 'final',
+          ),
+          _node('disagreement', 0, reads=('analyses',), writes=('conflicts',)),
+          _node('case_file', 0, reads=('conflicts',), writes=('case_file',)),
+          _node('final', 0.01, reads=('analyses', 'case_file')),
+      ])
+  )
+
+  _, authors = await _run(scheduler)
+
+  assert authors == ['personas', 'final']
+  assert scheduler.timings['case_file'].status == 'skipped'
+  report = scheduler.critical_path_report()
+  assert report.path == ['personas', 'final']
+  assert report.to_dict()['nodes']['disagreement']['status'] == 'skipped'
+
+
+def test_audit_trail_writers_run_one_after_another():
+  graph = ThinkRemixWorkflowAgent(name='workflow')._build_workflow_graph(
+      ThinkRemixWorkflowState()
+  )
+
+  writers = [
+      node.name for node in graph.nodes if 'workflow_audit_trail' in node.writes
+  ]
+
+  assert writers == [
+      agent.gather_insights_agent.name,
+      'persona_execution',
+      agent.conduct_research_agent.name,
+  ]
+  for earlier, later in zip(writers, writers[1:]):
+    assert earlier in graph.dependencies[later]
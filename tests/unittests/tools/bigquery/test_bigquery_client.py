@@ -18,6 +18,7 @@ import os
 from unittest import mock
 
 import google.adk
+from google.adk.tools.bigquery.client import BigQueryClientCache
 from google.adk.tools.bigquery.client import get_bigquery_client
 from google.auth.exceptions import DefaultCredentialsError
 from google.oauth2.credentials import Credentials
@@ -193,3 +194,51 @@ def test_bigquery_client_location_custom():
   # Verify that the client has the desired project set
   assert client.project == "test-gcp-project"
   assert client.location == "us-central1"
+
+
+def test_bigquery_client_cache_reuses_client():
+  """Test that the client cache reuses clients for the same parameters."""
+  cache = BigQueryClientCache()
+  credentials = mock.create_autospec(Credentials, instance=True)
+
+  client1 = cache.get_client(
+      project="test-gcp-project",
+      credentials=credentials,
+      user_agent=["my-agent", "execute_sql"],
+  )
+  client2 = cache.get_client(
+      project="test-gcp-project",
+      credentials=credentials,
+      user_agent=["my-agent", "execute_sql"],
+  )
+  assert client1 is client2
+
+
+def test_bigquery_client_cache_keys():
+  """Test that the client cache separates clients by key."""
+  cache = BigQueryClientCache()
+  credentials = mock.create_autospec(Credentials, instance=True)
+  other_credentials = mock.create_autospec(Credentials, instance=True)
+
+  client = cache.get_client(project="test-gcp-project", credentials=credentials)
+  assert client is not cache.get_client(
+      project="other-gcp-project", credentials=credentials
+  )
+  assert client is not cache.get_client(
+      project="test-gcp-project", credentials=other_credentials
+  )
+  assert client is not cache.get_client(
+      project="test-gcp-project", credentials=credentials, location="EU"
+  )
+
+
+def test_bigquery_client_cache_eviction():
+  """Test that the client cache is bounded."""
+  cache = BigQueryClientCache(max_size=1)
+  credentials = mock.create_autospec(Credentials, instance=True)
+
+  client = cache.get_client(project="project-1", credentials=credentials)
+  cache.get_client(project="project-2", credentials=credentials)
+  assert client is not cache.get_client(
+      project="project-1", credentials=credentials
+  )
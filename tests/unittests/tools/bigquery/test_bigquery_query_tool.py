@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import datetime
 import decimal
+import inspect
 import os
 import textwrap
 from typing import Optional
@@ -26,12 +27,17 @@ import dateutil.relativedelta
 from google.adk.tools.base_tool import BaseTool
 from google.adk.tools.bigquery import BigQueryCredentialsConfig
 from google.adk.tools.bigquery import BigQueryToolset
+from google.adk.tools.bigquery.client import BigQueryClientCache
 from google.adk.tools.bigquery.config import BigQueryToolConfig
 from google.adk.tools.bigquery.config import WriteMode
+from google.adk.tools.bigquery.query_tool import _execute_sql
+from google.adk.tools.bigquery.query_tool import _execute_sql_write_mode
 from google.adk.tools.bigquery.query_tool import analyze_contribution
 from google.adk.tools.bigquery.query_tool import detect_anomalies
 from google.adk.tools.bigquery.query_tool import execute_sql
 from google.adk.tools.bigquery.query_tool import forecast
+from google.adk.tools.bigquery.query_tool import get_execute_sql
+from google.adk.tools.bigquery.query_tool import StatementTypeCache
 from google.adk.tools.tool_context import ToolContext
 from google.auth.exceptions import DefaultCredentialsError
 from google.cloud import bigquery
@@ -1661,10 +1667,10 @@ def test_detect_anomalies_with_invalid_id_cols():
         pytest.param(WriteMode.ALLOWED, False, 0, 1, id="write-allowed"),
         pytest.param(WriteMode.ALLOWED, True, 1, 0, id="write-allowed-dry-run"),
         pytest.param(WriteMode.BLOCKED, False, 1, 1, id="write-blocked"),
-        pytest.param(WriteMode.BLOCKED, True, 2, 0, id="write-blocked-dry-run"),
+        pytest.param(WriteMode.BLOCKED, True, 1, 0, id="write-blocked-dry-run"),
         pytest.param(WriteMode.PROTECTED, False, 2, 1, id="write-protected"),
         pytest.param(
-            WriteMode.PROTECTED, True, 3, 0, id="write-protected-dry-run"
+            WriteMode.PROTECTED, True, 2, 0, id="write-protected-dry-run"
         ),
     ],
 )
@@ -1773,3 +1779,242 @@ def test_ml_tool_job_labels(tool_call, expected_label):
         assert mock_kwargs["job_config"].labels == {
             "adk-bigquery-tool": expected_label
         }
+
+
+@pytest.mark.parametrize(
+    ("write_mode", "query_call_count"),
+    [
+        pytest.param(WriteMode.BLOCKED, 1, id="blocked"),
+        pytest.param(WriteMode.PROTECTED, 1, id="protected"),
+    ],
+)
+def test_execute_sql_statement_cache(write_mode, query_call_count):
+  """Test that repeated queries reuse the cached dry run classification."""
+  project = "my_project"
+  credentials = mock.create_autospec(Credentials, instance=True)
+  tool_settings = BigQueryToolConfig(write_mode=write_mode)
+  tool_context = mock.create_autospec(ToolContext, instance=True)
+  tool_context.state.get.return_value = (
+      "test-bq-session-id",
+      "_anonymous_dataset",
+  )
+  statement_cache = StatementTypeCache()
+
+  with mock.patch("google.cloud.bigquery.Client", autospec=False) as Client:
+    bq_client = Client.return_value
+
+    query_job = mock.create_autospec(bigquery.QueryJob)
+    query_job.statement_type = "SELECT"
+    bq_client.query.return_value = query_job
+    bq_client.query_and_wait.return_value = [{"num": 123}]
+
+    result = _execute_sql(
+        project,
+        "SELECT 123 AS num",
+        credentials,
+        tool_settings,
+        tool_context,
+        statement_cache=statement_cache,
+    )
+    assert result == {"status": "SUCCESS", "rows": [{"num": 123}]}
+    assert statement_cache.misses == 1
+
+    # The same query again is classified from the cache
+    result = _execute_sql(
+        project,
+        "SELECT 123 AS num",
+        credentials,
+        tool_settings,
+        tool_context,
+        statement_cache=statement_cache,
+    )
+    assert result == {"status": "SUCCESS", "rows": [{"num": 123}]}
+
+    assert bq_client.query.call_count == query_call_count
+    assert bq_client.query_and_wait.call_count == 2
+    assert statement_cache.hits == 1
+    assert statement_cache.misses == 1
+
+
+def test_execute_sql_statement_cache_rejects_cached_non_select():
+  """Test that a cached non-SELECT classification is still rejected."""
+  project = "my_project"
+  query = "DROP TABLE my_dataset.my_table"
+  credentials = mock.create_autospec(Credentials, instance=True)
+  tool_settings = BigQueryToolConfig(write_mode=WriteMode.BLOCKED)
+  tool_context = mock.create_autospec(ToolContext, instance=True)
+  statement_cache = StatementTypeCache()
+
+  with mock.patch("google.cloud.bigquery.Client", autospec=False) as Client:
+    bq_client = Client.return_value
+
+    query_job = mock.create_autospec(bigquery.QueryJob)
+    query_job.statement_type = "DROP_TABLE"
+    bq_client.query.return_value = query_job
+
+    for _ in range(2):
+      result = _execute_sql(
+          project,
+          query,
+          credentials,
+          tool_settings,
+          tool_context,
+          statement_cache=statement_cache,
+      )
+      assert result == {
+          "status": "ERROR",
+          "error_details": "Read-only mode only supports SELECT statements.",
+      }
+    bq_client.query.assert_called_once()
+    bq_client.query_and_wait.assert_not_called()
+
+
+def test_execute_sql_statement_cache_keys_on_exact_query():
+  """Test that queries differing only in whitespace are classified apart."""
+  project = "my_project"
+  credentials = mock.create_autospec(Credentials, instance=True)
+  tool_settings = BigQueryToolConfig(write_mode=WriteMode.BLOCKED)
+  tool_context = mock.create_autospec(ToolContext, instance=True)
+  statement_cache = StatementTypeCache()
+
+  with mock.patch("google.cloud.bigquery.Client", autospec=False) as Client:
+    bq_client = Client.return_value
+
+    select_job = mock.create_autospec(bigquery.QueryJob)
+    select_job.statement_type = "SELECT"
+    script_job = mock.create_autospec(bigquery.QueryJob)
+    script_job.statement_type = "SCRIPT"
+    bq_client.query.side_effect = [select_job, script_job]
+    bq_client.query_and_wait.return_value = [{"num": 1}]
+
+    # The newline ends the comment, so the second query drops a table.
+    result = _execute_sql(
+        project,
+        "SELECT 1 -- note DROP TABLE d.t",
+        credentials,
+        tool_settings,
+        tool_context,
+        statement_cache=statement_cache,
+    )
+    assert result["status"] == "SUCCESS"
+    result = _execute_sql(
+        project,
+        "SELECT 1 -- note\nDROP TABLE d.t",
+        credentials,
+        tool_settings,
+        tool_context,
+        statement_cache=statement_cache,
+    )
+    assert result == {
+        "status": "ERROR",
+        "error_details": "Read-only mode only supports SELECT statements.",
+    }
+    assert statement_cache.misses == 2
+    bq_client.query_and_wait.assert_called_once()
+
+
+def test_execute_sql_max_query_result_bytes():
+  """Test that the inline result is limited by max_query_result_bytes."""
+  project = "my_project"
+  query = "SELECT x FROM my_table"
+  credentials = mock.create_autospec(Credentials, instance=True)
+  tool_settings = BigQueryToolConfig(
+      write_mode=WriteMode.ALLOWED, max_query_result_bytes=25
+  )
+  tool_context = mock.create_autospec(ToolContext, instance=True)
+
+  with mock.patch("google.cloud.bigquery.Client", autospec=False) as Client:
+    bq_client = Client.return_value
+    bq_client.query_and_wait.return_value = [{"x": i} for i in range(5)]
+
+    result = execute_sql(
+        project, query, credentials, tool_settings, tool_context
+    )
+    assert result == {
+        "status": "SUCCESS",
+        "rows": [{"x": 0}, {"x": 1}, {"x": 2}],
+        "result_is_likely_truncated": True,
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_execute_sql_with_caches_spills_result_to_artifact():
+  """Test the cached execute_sql tool runs async and spills large results."""
+  project = "my_project"
+  query = "SELECT x FROM my_table"
+  credentials = mock.create_autospec(Credentials, instance=True)
+  tool_settings = BigQueryToolConfig(
+      write_mode=WriteMode.ALLOWED,
+      max_query_result_rows=4,
+      max_query_result_bytes=25,
+  )
+  tool_context = mock.create_autospec(ToolContext, instance=True)
+  tool_context._invocation_context = mock.Mock()
+  saved_chunks = []
+
+  async def save_artifact_stream(filename, *, chunks, mime_type):
+    saved_chunks.append((filename, list(chunks), mime_type))
+    return 0
+
+  tool_context.save_artifact_stream = save_artifact_stream
+  tool = get_execute_sql(
+      tool_settings,
+      client_cache=BigQueryClientCache(),
+      statement_cache=StatementTypeCache(),
+  )
+  assert inspect.iscoroutinefunction(tool)
+  assert tool.__doc__ == _execute_sql_write_mode.__doc__
+
+  with mock.patch("google.cloud.bigquery.Client", autospec=False) as Client:
+    bq_client = Client.return_value
+    bq_client.query_and_wait.return_value = [{"x": i} for i in range(5)]
+
+    result = await tool(
+        project, query, credentials, tool_settings, tool_context
+    )
+    # A second call reuses the cached client
+    await tool(project, query, credentials, tool_settings, tool_context)
+    Client.assert_called_once()
+    # The row limit only applies to the inline rows of a spilled result
+    assert bq_client.query_and_wait.call_args.kwargs["max_results"] is None
+
+  assert result["rows"] == [{"x": 0}, {"x": 1}, {"x": 2}]
+  assert result["result_is_likely_truncated"]
+  artifact_name, chunks, mime_type = saved_chunks[0]
+  assert result["result_artifact"] == artifact_name
+  assert mime_type == "application/jsonl"
+  assert b"".join(chunks) == b"".join(
+      f'{{"x": {i}}}\n'.encode() for i in range(5)
+  )
+
+
+@pytest.mark.asyncio
+async def test_get_execute_sql_with_caches_without_artifact_service():
+  """Test the row limit still caps the query when nothing can be spilled."""
+  project = "my_project"
+  query = "SELECT x FROM my_table"
+  credentials = mock.create_autospec(Credentials, instance=True)
+  tool_settings = BigQueryToolConfig(
+      write_mode=WriteMode.ALLOWED,
+      max_query_result_rows=4,
+      max_query_result_bytes=25,
+  )
+  tool_context = mock.create_autospec(ToolContext, instance=True)
+  tool_context._invocation_context = mock.Mock(artifact_service=None)
+  tool = get_execute_sql(tool_settings, client_cache=BigQueryClientCache())
+
+  with mock.patch("google.cloud.bigquery.Client", autospec=False) as Client:
+    bq_client = Client.return_value
+    bq_client.query_and_wait.return_value = [{"x": i} for i in range(4)]
+
+    result = await tool(
+        project, query, credentials, tool_settings, tool_context
+    )
+    assert bq_client.query_and_wait.call_args.kwargs["max_results"] == 4
+
+  assert result == {
+      "status": "SUCCESS",
+      "rows": [{"x": 0}, {"x": 1}, {"x": 2}],
+      "result_is_likely_truncated": True,
+  }
+  tool_context.save_artifact_stream.assert_not_called()
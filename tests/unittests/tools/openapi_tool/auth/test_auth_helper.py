@@ -28,6 +28,7 @@ from google.adk.auth.auth_credential import ServiceAccount
 from google.adk.auth.auth_credential import ServiceAccountCredential
 from google.adk.auth.auth_schemes import AuthSchemeType
 from google.adk.auth.auth_schemes import OpenIdConnectWithConfig
+from google.adk.tools.openapi_tool.auth import auth_helpers
 from google.adk.tools.openapi_tool.auth.auth_helpers import credential_to_param
 from google.adk.tools.openapi_tool.auth.auth_helpers import dict_to_auth_scheme
 from google.adk.tools.openapi_tool.auth.auth_helpers import INTERNAL_AUTH_PREFIX
@@ -40,6 +41,13 @@ import pytest
 import requests
 
 
+@pytest.fixture(autouse=True)
+def clear_openid_configuration_cache():
+  auth_helpers._openid_configuration_cache.clear()
+  yield
+  auth_helpers._openid_configuration_cache.clear()
+
+
 def test_token_to_scheme_credential_api_key_header():
   scheme, credential = token_to_scheme_credential(
       "apikey", "header", "X-API-Key", "test_key"
@@ -326,6 +334,27 @@ def test_openid_url_to_scheme_credential_no_openid_url(mock_get):
   assert scheme.openIdConnectUrl == "openid_url"
 
 
+@patch("requests.get")
+def test_openid_url_to_scheme_credential_caches_configuration(mock_get):
+  mock_get.return_value.json.return_value = {
+      "authorization_endpoint": "auth_url",
+      "token_endpoint": "token_url",
+  }
+  mock_get.return_value.raise_for_status.return_value = None
+  credential_dict = {"client_id": "client_id", "client_secret": "client_secret"}
+
+  first_scheme, _ = openid_url_to_scheme_credential(
+      "openid_url", ["scope1"], credential_dict
+  )
+  second_scheme, _ = openid_url_to_scheme_credential(
+      "openid_url", ["scope2"], credential_dict
+  )
+
+  mock_get.assert_called_once_with("openid_url", timeout=10)
+  assert second_scheme.token_endpoint == first_scheme.token_endpoint
+  assert second_scheme.scopes == ["scope2"]
+
+
 @patch("requests.get")
 def test_openid_url_to_scheme_credential_request_exception(mock_get):
   mock_get.side_effect = requests.exceptions.RequestException("Test Error")
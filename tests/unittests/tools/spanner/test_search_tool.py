@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
@@ -299,3 +300,149 @@ def test_similarity_search_missing_vertex_ai_embedding_model_endpoint_error(
       "be specified for PostgreSQL dialect."
       in result["error_details"]
   )
+
+
+def _make_cached_search_database(dialect=DatabaseDialect.GOOGLE_STANDARD_SQL):
+  mock_database = MagicMock()
+  mock_database.name = "projects/p/instances/i/databases/d"
+  mock_database.database_dialect = dialect
+  return mock_database
+
+
+@patch("google.adk.tools.spanner.search_tool._get_embedding_for_query")
+def test_query_embedding_cache_hit(mock_get_embedding):
+  """Test that repeated and re-spaced queries hit the embedding cache."""
+  mock_get_embedding.return_value = [0.1, 0.2]
+  mock_database = _make_cached_search_database()
+  cache = search_tool.QueryEmbeddingCache(batch_window_seconds=0)
+
+  for query in ["test query", "  test   query "]:
+    embedding = cache.get_embedding(
+        mock_database,
+        DatabaseDialect.GOOGLE_STANDARD_SQL,
+        "test_model",
+        None,
+        query,
+    )
+    assert embedding == [0.1, 0.2]
+
+  mock_get_embedding.assert_called_once()
+  assert cache.stats() == {
+      "hits": 1,
+      "misses": 1,
+      "embedding_requests": 1,
+      "size": 1,
+  }
+
+
+@patch("google.adk.tools.spanner.search_tool._get_embedding_for_query")
+def test_query_embedding_cache_keyed_by_model(mock_get_embedding):
+  """Test that the embedding cache is keyed by the embedding model."""
+  mock_get_embedding.side_effect = [[0.1], [0.2]]
+  mock_database = _make_cached_search_database()
+  cache = search_tool.QueryEmbeddingCache(batch_window_seconds=0)
+
+  assert cache.get_embedding(
+      mock_database, DatabaseDialect.GOOGLE_STANDARD_SQL, "model_a", None, "q"
+  ) == [0.1]
+  assert cache.get_embedding(
+      mock_database, DatabaseDialect.GOOGLE_STANDARD_SQL, "model_b", None, "q"
+  ) == [0.2]
+  assert mock_get_embedding.call_count == 2
+
+
+@patch("google.adk.tools.spanner.search_tool._get_embedding_for_query")
+def test_query_embedding_cache_ttl(mock_get_embedding):
+  """Test that expired embeddings are fetched again."""
+  mock_get_embedding.return_value = [0.1]
+  mock_database = _make_cached_search_database()
+  cache = search_tool.QueryEmbeddingCache(
+      ttl_seconds=60, batch_window_seconds=0
+  )
+
+  with patch("time.monotonic", return_value=0):
+    cache.get_embedding(
+        mock_database, DatabaseDialect.GOOGLE_STANDARD_SQL, "m", None, "q"
+    )
+  with patch("time.monotonic", return_value=61):
+    cache.get_embedding(
+        mock_database, DatabaseDialect.GOOGLE_STANDARD_SQL, "m", None, "q"
+    )
+  assert mock_get_embedding.call_count == 2
+
+
+def test_query_embedding_cache_batches_parallel_misses():
+  """Test that parallel misses are embedded in one batched query."""
+  mock_database = _make_cached_search_database()
+  mock_snapshot = MagicMock()
+  mock_snapshot.execute_sql.return_value = iter(
+      [("query a", [0.1]), ("query b", [0.2])]
+  )
+  mock_database.snapshot.return_value.__enter__.return_value = mock_snapshot
+  cache = search_tool.QueryEmbeddingCache(batch_window_seconds=0.2)
+
+  with ThreadPoolExecutor(max_workers=2) as executor:
+    results = list(
+        executor.map(
+            lambda query: cache.get_embedding(
+                mock_database,
+                DatabaseDialect.GOOGLE_STANDARD_SQL,
+                "test_model",
+                None,
+                query,
+            ),
+            ["query a", "query b"],
+        )
+    )
+
+  assert results == [[0.1], [0.2]]
+  mock_snapshot.execute_sql.assert_called_once()
+  sql = mock_snapshot.execute_sql.call_args.args[0]
+  assert "UNNEST(@queries)" in sql
+  assert mock_snapshot.execute_sql.call_args.kwargs["params"] == {
+      "queries": ["query a", "query b"]
+  }
+  assert cache.stats()["embedding_requests"] == 1
+
+
+@pytest.mark.asyncio
+@patch("google.adk.tools.spanner.client.get_spanner_client")
+async def test_get_similarity_search_uses_embedding_cache(
+    mock_get_spanner_client, mock_spanner_ids, mock_credentials
+):
+  """Test that the cached similarity_search tool reuses query embeddings."""
+  mock_database = _make_cached_search_database()
+  mock_snapshot = MagicMock()
+  mock_embedding_result = MagicMock()
+  mock_embedding_result.one.return_value = ([0.1, 0.2, 0.3],)
+  mock_snapshot.execute_sql.side_effect = [
+      mock_embedding_result,
+      iter([("result1",)]),
+      iter([("result1",)]),
+  ]
+  mock_database.snapshot.return_value.__enter__.return_value = mock_snapshot
+  mock_get_spanner_client.return_value.instance.return_value.database.return_value = (
+      mock_database
+  )
+  cache = search_tool.QueryEmbeddingCache(batch_window_seconds=0)
+  tool = search_tool.get_similarity_search(cache)
+  assert tool.__doc__ == search_tool.similarity_search.__doc__
+
+  for _ in range(2):
+    result = await tool(
+        project_id=mock_spanner_ids["project_id"],
+        instance_id=mock_spanner_ids["instance_id"],
+        database_id=mock_spanner_ids["database_id"],
+        table_name=mock_spanner_ids["table_name"],
+        query="test query",
+        embedding_column_to_search="embedding_col",
+        columns=["col1"],
+        embedding_options={"spanner_embedding_model_name": "test_model"},
+        credentials=mock_credentials,
+        settings=MagicMock(),
+        tool_context=MagicMock(),
+    )
+    assert result == {"status": "SUCCESS", "rows": [("result1",)]}
+
+  assert mock_snapshot.execute_sql.call_count == 3
+  assert cache.stats()["hits"] == 1
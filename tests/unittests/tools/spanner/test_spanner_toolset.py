@@ -184,3 +184,16 @@ async def test_spanner_toolset_without_read_capability(
   expected_tool_names = set(returned_tools)
   actual_tool_names = set([tool.name for tool in tools])
   assert actual_tool_names == expected_tool_names
+
+
+def test_spanner_toolset_query_embedding_cache_stats():
+  """Test that the query embedding cache stats are exposed on the toolset."""
+  toolset = SpannerToolset(
+      spanner_tool_settings=SpannerToolSettings(query_embedding_cache_size=8)
+  )
+  assert toolset.query_embedding_cache_stats == {
+      "hits": 0,
+      "misses": 0,
+      "embedding_requests": 0,
+      "size": 0,
+  }
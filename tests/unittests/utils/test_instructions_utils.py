@@ -12,8 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import concurrent.futures
+
 from google.adk.agents.llm_agent import Agent
 from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.events.event import Event
+from google.adk.events.event_actions import EventActions
 from google.adk.sessions.session import Session
 from google.adk.utils import instructions_utils
 import pytest
@@ -25,8 +30,16 @@ class MockArtifactService:
 
   def __init__(self, artifacts: dict):
     self.artifacts = artifacts
+    self.loads = []
+    self.active_loads = 0
+    self.max_active_loads = 0
 
   async def load_artifact(self, app_name, user_id, session_id, filename):
+    self.loads.append(filename)
+    self.active_loads += 1
+    self.max_active_loads = max(self.max_active_loads, self.active_loads)
+    await asyncio.sleep(0)
+    self.active_loads -= 1
     if filename in self.artifacts:
       return self.artifacts[filename]
     else:
@@ -267,3 +280,133 @@ async def test_inject_session_state_with_optional_missing_state_returns_empty():
       instruction_template, invocation_context
   )
   assert populated_instruction == "Optional value: "
+
+
+@pytest.mark.asyncio
+async def test_inject_session_state_loads_artifacts_concurrently():
+  mock_artifact_service = MockArtifactService({"a": "A", "b": "B", "c": "C"})
+  invocation_context = await _create_test_readonly_context(
+      artifact_service=mock_artifact_service
+  )
+
+  populated_instruction = await instructions_utils.inject_session_state(
+      "{artifact.a} {artifact.b} {artifact.c} {artifact.a}",
+      invocation_context,
+  )
+
+  assert populated_instruction == "A B C A"
+  assert sorted(mock_artifact_service.loads) == ["a", "b", "c"]
+  assert mock_artifact_service.max_active_loads == 3
+
+
+@pytest.mark.asyncio
+async def test_inject_session_state_memoizes_recorded_artifact_versions():
+  mock_artifact_service = MockArtifactService({"my_file": "v0"})
+  readonly_context = await _create_test_readonly_context(
+      state={"name": "Foo"}, artifact_service=mock_artifact_service
+  )
+  session = readonly_context._invocation_context.session
+  session.events.append(
+      Event(author="agent", actions=EventActions(artifact_delta={"my_file": 0}))
+  )
+  template = "{name} reads {artifact.my_file}"
+
+  for _ in range(2):
+    assert (
+        await instructions_utils.inject_session_state(
+            template, readonly_context
+        )
+        == "Foo reads v0"
+    )
+  assert mock_artifact_service.loads == ["my_file"]
+
+  mock_artifact_service.artifacts["my_file"] = "v1"
+  session.events.append(
+      Event(author="agent", actions=EventActions(artifact_delta={"my_file": 1}))
+  )
+  session.state["name"] = "Bar"
+
+  assert (
+      await instructions_utils.inject_session_state(template, readonly_context)
+      == "Bar reads v1"
+  )
+  assert mock_artifact_service.loads == ["my_file", "my_file"]
+
+
+@pytest.mark.asyncio
+async def test_inject_session_state_renders_mutated_state_values():
+  readonly_context = await _create_test_readonly_context(state={"items": ["a"]})
+  template = "Items: {items}"
+
+  assert (
+      await instructions_utils.inject_session_state(template, readonly_context)
+      == "Items: ['a']"
+  )
+  readonly_context._invocation_context.session.state["items"].append("b")
+  assert (
+      await instructions_utils.inject_session_state(template, readonly_context)
+      == "Items: ['a', 'b']"
+  )
+
+
+@pytest.mark.asyncio
+async def test_inject_session_state_distinguishes_equal_values_of_other_types():
+  readonly_context = await _create_test_readonly_context(state={"flag": True})
+  template = "Flag: {flag}"
+
+  assert (
+      await instructions_utils.inject_session_state(template, readonly_context)
+      == "Flag: True"
+  )
+  readonly_context._invocation_context.session.state["flag"] = 1
+  assert (
+      await instructions_utils.inject_session_state(template, readonly_context)
+      == "Flag: 1"
+  )
+  readonly_context._invocation_context.session.state["flag"] = 1.0
+  assert (
+      await instructions_utils.inject_session_state(template, readonly_context)
+      == "Flag: 1.0"
+  )
+
+
+@pytest.mark.asyncio
+async def test_inject_session_state_reloads_user_scoped_artifacts():
+  mock_artifact_service = MockArtifactService({"user:notes": "v0"})
+  readonly_context = await _create_test_readonly_context(
+      artifact_service=mock_artifact_service
+  )
+  readonly_context._invocation_context.session.events.append(
+      Event(
+          author="agent",
+          actions=EventActions(artifact_delta={"user:notes": 0}),
+      )
+  )
+  template = "Notes: {artifact.user:notes}"
+
+  assert (
+      await instructions_utils.inject_session_state(template, readonly_context)
+      == "Notes: v0"
+  )
+  # Another session of the user saved a new version.
+  mock_artifact_service.artifacts["user:notes"] = "v1"
+  assert (
+      await instructions_utils.inject_session_state(template, readonly_context)
+      == "Notes: v1"
+  )
+  assert mock_artifact_service.loads == ["user:notes", "user:notes"]
+
+
+def test_lru_memo_is_shared_safely_across_threads():
+  memo = instructions_utils._LruMemo(max_size=8)
+
+  def use_memo(thread_index: int):
+    for i in range(2000):
+      memo.put((thread_index, i), str(i))
+      memo.get((thread_index, i - 1))
+
+  with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+    for future in [executor.submit(use_memo, t) for t in range(8)]:
+      future.result()
+
+  assert len(memo._entries) == 8
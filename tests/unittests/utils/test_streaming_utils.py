@@ -200,3 +200,48 @@ class TestStreamingResponseAggregator:
 
     closed_response = aggregator.close()
     assert closed_response is None
+
+
+@pytest.mark.asyncio
+async def test_aggregates_many_chunks_once():
+  aggregator = streaming_utils.StreamingResponseAggregator()
+  for i in range(100):
+    response = types.GenerateContentResponse(
+        candidates=[
+            types.Candidate(
+                content=types.Content(
+                    parts=[types.Part(text=f"t{i}", thought=i % 2 == 0)]
+                )
+            )
+        ]
+    )
+    async for _ in aggregator.process_response(response):
+      pass
+
+  aggregator._response.candidates[0].finish_reason = types.FinishReason.STOP
+  result = aggregator.close()
+
+  assert result.content.parts[0].thought
+  assert result.content.parts[0].text == "".join(
+      f"t{i}" for i in range(0, 100, 2)
+  )
+  assert result.content.parts[1].text == "".join(
+      f"t{i}" for i in range(1, 100, 2)
+  )
+
+
+def test_event_to_sse():
+  from google.adk.events.event import Event
+
+  event = Event(
+      author="agent",
+      content=types.ModelContent("Hello"),
+      partial=True,
+  )
+
+  sse = streaming_utils.event_to_sse(event)
+
+  assert sse == (
+      f"data: {event.model_dump_json(exclude_none=True, by_alias=True)}\n\n"
+  )
+  assert Event.model_validate_json(sse[len("data: ") :]).id == event.id